@@ -8,6 +8,12 @@ django.setup()
 import socketio
 from core.socket_server import sio
 
+# [수정일: 2026-10-18] 로컬 STT 워커 풀은 서버 시작 시 띄워 모델을 미리 로드 (첫 답변의 모델 로드 대기 제거)
+from django.conf import settings
+if getattr(settings, 'STT_BACKEND', '') == 'pool':
+    from core.services.stt.worker_pool import get_stt_pool
+    get_stt_pool()
+
 # [수정일: 2026-02-23] Django ASGI 설정 및 Socket.io 미들웨어 연동
 # HTTP 요청은 Django가 처리하고, /socket.io/ 경로는 Socket.io 서버가 처리합니다.
 
@@ -5,6 +5,7 @@ Django settings for config project.
 """
 
 import os
+import tempfile
 from pathlib import Path
 import environ
 
@@ -204,9 +205,123 @@ SESSION_COOKIE_HTTPONLY = True
 
 # AI Service Settings
 OPENAI_API_KEY = env('OPENAI_API_KEY', default='')
+
+# [수정일: 2026-10-18] 공용 LLM 클라이언트 계층 (core/services/llm_client.py)
+OPENAI_BASE_URL = env('OPENAI_BASE_URL', default='')  # 비우면 api.openai.com (테스트 시 로컬 가짜 서버)
+LLM_HTTP_MAX_CONNECTIONS = env.int('LLM_HTTP_MAX_CONNECTIONS', default=100)
+LLM_HTTP_MAX_KEEPALIVE = env.int('LLM_HTTP_MAX_KEEPALIVE', default=20)
+# 모델별 동시 호출 상한 / 분당 요청 수 (없는 모델은 concurrency=32, rpm=3000)
+LLM_MODEL_LIMITS = {
+    'gpt-4o': {'concurrency': env.int('LLM_GPT4O_CONCURRENCY', default=16), 'rpm': env.int('LLM_GPT4O_RPM', default=500)},
+    'gpt-4o-mini': {'concurrency': env.int('LLM_GPT4O_MINI_CONCURRENCY', default=32), 'rpm': env.int('LLM_GPT4O_MINI_RPM', default=3000)},
+}
+LLM_QUEUE_TIMEOUT = env.int('LLM_QUEUE_TIMEOUT', default=30)  # 슬롯 대기 상한(초) → 초과 시 429
+LLM_MAX_RETRIES = env.int('LLM_MAX_RETRIES', default=3)
+LLM_RETRY_BUDGET_RATIO = env.float('LLM_RETRY_BUDGET_RATIO', default=0.1)  # 요청 대비 재시도 허용 비율
 GOOGLE_API_KEY = env('GOOGLE_API_KEY', default='')
 YOUTUBE_API_KEY = env('YOUTUBE_API_KEY', default=GOOGLE_API_KEY)
 
+# [수정일: 2026-10-18] Wars Socket.IO 방 상태 저장소
+# 비어 있으면 단일 워커용 메모리 저장소, 값이 있으면 Redis 저장소 + AsyncRedisManager 사용
+# 예: redis://localhost:6379/0
+WARS_REDIS_URL = env('WARS_REDIS_URL', default='')
+# ArchDraw 방 주기 감사(Poll) 스케줄러: 방별 감사 주기(초) / 타이머 휠 슬롯 간격(초) / 동시 감사 상한
+WARS_DRAW_TICK_INTERVAL = env.float('WARS_DRAW_TICK_INTERVAL', default=8.0)
+WARS_DRAW_TICK_RESOLUTION = env.float('WARS_DRAW_TICK_RESOLUTION', default=1.0)
+WARS_DRAW_TICK_CONCURRENCY = env.int('WARS_DRAW_TICK_CONCURRENCY', default=8)
+# 스케줄러 지표(metrics()) INFO 로그 주기(초). 0이면 끔
+WARS_DRAW_STATS_INTERVAL = env.float('WARS_DRAW_STATS_INTERVAL', default=60.0)
+# Bug-Bubble 상태 송신 프레임레이트(Hz). 0이면 배칭 없이 이벤트마다 즉시 emit
+WARS_BUBBLE_FRAME_HZ = env.float('WARS_BUBBLE_FRAME_HZ', default=20.0)
+# ArchDraw 미션 카탈로그 재구축 주기(초). unit03 PracticeDetail 저장/삭제 시에는 즉시 무효화
+MISSION_CATALOG_TTL = env.int('MISSION_CATALOG_TTL', default=600)
+
+# [수정일: 2026-10-18] STT 백엔드 (core/services/stt/transcriber.py, worker_pool.py)
+# STT_BACKEND: ''(STT_RUNPOD_URL 있으면 runpod, 없으면 local) | runpod | local | pool(로컬 워커 프로세스 풀)
+STT_BACKEND = env('STT_BACKEND', default='')
+# pool 모드: 워커 수 / 모델 / 연산 타입 / 워커당 스레드(0=코어 수÷워커 수) / 요청 내부 배치 / 전달당 최대 요청 / 대기 상한
+STT_POOL_SIZE = env.int('STT_POOL_SIZE', default=2)
+STT_MODEL_SIZE = env('STT_MODEL_SIZE', default='medium')
+STT_COMPUTE_TYPE = env('STT_COMPUTE_TYPE', default='int8')
+STT_CPU_THREADS = env.int('STT_CPU_THREADS', default=0)
+STT_BATCH_SIZE = env.int('STT_BATCH_SIZE', default=1)
+STT_BATCH_MAX = env.int('STT_BATCH_MAX', default=4)
+STT_MAX_QUEUE = env.int('STT_MAX_QUEUE', default=64)
+
+# [수정일: 2026-10-18] 면접 TTS 내용 주소 캐시 (core/services/interview/tts_cache.py)
+# TTS_CACHE_STORAGE: 여러 서버가 공유할 STORAGES 별칭 (예: django-storages S3로 'tts' 별칭 구성). 비우면 로컬 디스크만
+TTS_CACHE_DIR = env('TTS_CACHE_DIR', default=os.path.join(tempfile.gettempdir(), 'coduck_tts_cache'))
+TTS_CACHE_MAX_BYTES = env.int('TTS_CACHE_MAX_BYTES', default=512 * 1024 * 1024)
+TTS_CACHE_STORAGE = env('TTS_CACHE_STORAGE', default='')
+
+# [수정일: 2026-10-18] 모의면접 턴 파이프라인 (core/services/interview/turn_pipeline.py)
+# INTERVIEW_SPECULATIVE_DRAFTS: 증거 추출과 동시에 미리 생성할 다음 질문 초안 수 (0이면 끔)
+INTERVIEW_SPECULATIVE_DRAFTS = env.int('INTERVIEW_SPECULATIVE_DRAFTS', default=2)
+# INTERVIEW_PIPELINE_WORKERS: 질문 초안 스레드 수 / INTERVIEW_EVIDENCE_WORKERS: 증거 추출 전용 스레드 수
+INTERVIEW_PIPELINE_WORKERS = env.int('INTERVIEW_PIPELINE_WORKERS', default=16)
+INTERVIEW_EVIDENCE_WORKERS = env.int('INTERVIEW_EVIDENCE_WORKERS', default=8)
+
+# [수정일: 2026-10-18] 채용공고 크롤 엔진 (core/views/job_planner/collectors/crawl_engine.py)
+# 호스트별 동시 요청 수 / 같은 호스트 요청 시작 간격(초) / 전체 연결 풀 크기 / 조건부 GET 검증자 보관 기간(초)
+CRAWL_PER_HOST_CONCURRENCY = env.int('CRAWL_PER_HOST_CONCURRENCY', default=4)
+CRAWL_POLITENESS_DELAY = env.float('CRAWL_POLITENESS_DELAY', default=0.2)
+CRAWL_MAX_CONNECTIONS = env.int('CRAWL_MAX_CONNECTIONS', default=32)
+CRAWL_VALIDATOR_TTL = env.int('CRAWL_VALIDATOR_TTL', default=7 * 24 * 60 * 60)
+
+# [수정일: 2026-10-18] 코드 실행 샌드박스 웜 풀 (core/services/sandbox_pool.py)
+# SANDBOX_BACKEND: docker(운영) | local(Docker 없는 개발/테스트용 subprocess + rlimit, 격리 없음)
+SANDBOX_BACKEND = env('SANDBOX_BACKEND', default='docker')
+SANDBOX_POOL_SIZE = env.int('SANDBOX_POOL_SIZE', default=4)
+SANDBOX_PYTORCH_POOL_SIZE = env.int('SANDBOX_PYTORCH_POOL_SIZE', default=2)
+SANDBOX_MAX_RUNS_PER_WORKER = env.int('SANDBOX_MAX_RUNS_PER_WORKER', default=50)
+SANDBOX_MAX_QUEUE = env.int('SANDBOX_MAX_QUEUE', default=100)
+# 비동기 실행 API(execute-code/jobs/) 실행기 스레드 수 / 대기 작업 상한
+SANDBOX_JOB_WORKERS = env.int('SANDBOX_JOB_WORKERS', default=8)
+SANDBOX_JOB_MAX_PENDING = env.int('SANDBOX_JOB_MAX_PENDING', default=100)
+
+# [수정일: 2026-10-18] 캐시 설정
+# - default: 기존과 동일한 프로세스 메모리 캐시 (YouTube 검증 결과 등)
+# - evaluations: 의사코드 LLM 평가 결과 2차 캐시 (파일 기반 → 재시작 후에도 유지, 같은 호스트 워커 간 공유)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'evaluations': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': env('EVALUATION_CACHE_DIR', default=os.path.join(tempfile.gettempdir(), 'coduck_eval_cache')),
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    },
+    # [수정일: 2026-10-18] PDF 서류 페이지 단위 캐시 (텍스트/렌더링 이미지/Vision 결과, core/services/pdf_ingest.py)
+    'documents': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': env('DOCUMENT_CACHE_DIR', default=os.path.join(tempfile.gettempdir(), 'coduck_document_cache')),
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+    # [수정일: 2026-10-18] 크롤 엔진 조건부 GET 검증자(ETag/Last-Modified + 본문)
+    'crawl': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': env('CRAWL_CACHE_DIR', default=os.path.join(tempfile.gettempdir(), 'coduck_crawl_cache')),
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    },
+    # [수정일: 2026-10-18] 프로세스 메모리 인덱스의 세대(generation) 값 — default(LocMem)는 프로세스별이라
+    # import_questions 같은 별도 프로세스의 무효화가 웹 워커에 보이지 않음 → 워커 간 공유되는 파일 캐시 사용
+    # (서버가 여러 대면 Redis 등 공유 백엔드로 교체)
+    'invalidation': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': env('INVALIDATION_CACHE_DIR', default=os.path.join(tempfile.gettempdir(), 'coduck_invalidation_cache')),
+    },
+}
+PDF_INGEST_CACHE_TTL = env.int('PDF_INGEST_CACHE_TTL', default=24 * 60 * 60)
+# 스캔본 페이지 렌더링 프로세스 수 / 서류 1개당 동시 Vision 호출 수
+PDF_RENDER_WORKERS = env.int('PDF_RENDER_WORKERS', default=2)
+PDF_VISION_CONCURRENCY = env.int('PDF_VISION_CONCURRENCY', default=4)
+PSEUDOCODE_EVAL_CACHE_TTL = env.int('PSEUDOCODE_EVAL_CACHE_TTL', default=7 * 24 * 60 * 60)
+# 동시에 진행되는 gpt-4o 평가 호출 수 상한 (수업 중 제출 폭주 시 rate limit 방지)
+PSEUDOCODE_EVAL_MAX_CONCURRENCY = env.int('PSEUDOCODE_EVAL_MAX_CONCURRENCY', default=8)
+# 면접 질문 샘플링 인덱스 재구축 주기(초). import_questions 실행 시에는 'invalidation' 캐시의 세대 값이 바뀌어
+# 같은 캐시를 보는 워커는 다음 조회 때 재구축 (캐시를 공유하지 않는 서버는 TTL 이내 반영)
+QUESTION_INDEX_TTL = env.int('QUESTION_INDEX_TTL', default=600)
+
 # Admin Settings
 ADMIN_USERNAME = env('ADMIN_USERNAME', default='')
 ADMIN_PASSWORD = env('ADMIN_PASSWORD', default='')
@@ -6,3 +6,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # [추가 2026-10-18] 모델 변경 시 캐시 무효화 리시버 등록
+        from core import signals  # noqa: F401
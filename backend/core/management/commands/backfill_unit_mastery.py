@@ -0,0 +1,74 @@
+# 생성일: 2026-10-18
+# 설명: UserProgress 리더보드 집계 필드(solved_count, perfect_count) 백필 커맨드
+#
+# 사용법:
+#   python manage.py backfill_unit_mastery
+#   python manage.py backfill_unit_mastery --dry-run          # 변경 건수만 확인
+#   python manage.py backfill_unit_mastery --batch-size 500
+
+import time
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Max
+from core.models import PracticeDetail, UserSolvedProblem, UserProgress
+
+
+class Command(BaseCommand):
+    help = 'UserSolvedProblem 이력으로 UserProgress의 solved_count/perfect_count를 재계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='실제 저장하지 않고 변경 건수만 출력')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_update 배치 크기 (기본: 1000)')
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        batch_size = options['batch_size']
+        start = time.time()
+
+        # 1. (유저, 문제)별 최고 점수를 한 번의 group-by로 조회한 뒤 (유저, 유닛) 단위로 합산
+        self.stdout.write('📊 문제별 최고 점수 집계 중...')
+        summary = {}
+        best_rows = (
+            UserSolvedProblem.objects
+            .values('user_id', 'practice_detail_id', 'practice_detail__practice_id')
+            .annotate(best=Max('score'))
+            .values_list('user_id', 'practice_detail__practice_id', 'best')
+        )
+        for user_id, practice_id, best in best_rows.iterator():
+            solved, perfect = summary.get((user_id, practice_id), (0, 0))
+            summary[(user_id, practice_id)] = (solved + 1, perfect + (1 if best >= 90 else 0))
+        self.stdout.write(f'  대상 (유저, 유닛): {len(summary)}건')
+
+        # 2. 기존 UserProgress 갱신 (값이 달라진 행만)
+        changed = []
+        for progress in UserProgress.objects.all().iterator():
+            solved, perfect = summary.pop((progress.user_id, progress.practice_id), (0, 0))
+            if progress.solved_count != solved or progress.perfect_count != perfect:
+                progress.solved_count = solved
+                progress.perfect_count = perfect
+                changed.append(progress)
+
+        # 3. 제출 이력은 있으나 UserProgress 행이 없는 경우 새로 생성 (진행률은 save_user_problem_record와 동일 기준)
+        unit_totals = dict(
+            PracticeDetail.objects.values('practice_id').annotate(total=Count('id')).values_list('practice_id', 'total')
+        )
+        missing = []
+        for (user_id, practice_id), (solved, perfect) in summary.items():
+            total = unit_totals.get(practice_id, 0)
+            missing.append(UserProgress(
+                user_id=user_id,
+                practice_id=practice_id,
+                solved_count=solved,
+                perfect_count=perfect,
+                progress_rate=(solved / total) * 100 if total else 0.0,
+            ))
+
+        self.stdout.write(f'  갱신 대상: {len(changed)}건, 신규 생성: {len(missing)}건')
+        if dry_run:
+            self.stdout.write(self.style.WARNING('\n🔍 DRY RUN 모드 - 실제 저장하지 않습니다'))
+            return
+
+        UserProgress.objects.bulk_update(changed, ['solved_count', 'perfect_count'], batch_size=batch_size)
+        UserProgress.objects.bulk_create(missing, batch_size=batch_size)
+
+        elapsed = time.time() - start
+        self.stdout.write(self.style.SUCCESS(f'\n✅ 백필 완료 ({elapsed:.1f}초)'))
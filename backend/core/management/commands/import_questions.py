@@ -10,6 +10,7 @@ import json
 import time
 from django.core.management.base import BaseCommand
 from core.models import InterviewQuestion
+from core.services.interview.question_index import invalidate_question_index
 
 
 class Command(BaseCommand):
@@ -47,6 +48,7 @@ class Command(BaseCommand):
         if clear:
             count = InterviewQuestion.objects.count()
             InterviewQuestion.objects.all().delete()
+            invalidate_question_index()
             self.stdout.write(self.style.WARNING(f'\n🗑️  기존 데이터 {count}건 삭제'))
 
         # 3. 배치 임포트
@@ -103,6 +105,9 @@ class Command(BaseCommand):
 
         elapsed = time.time() - start
 
+        # [2026-10-18] 질문 샘플링 인덱스 무효화 (웹 워커는 다음 조회 때 재구축)
+        invalidate_question_index()
+
         self.stdout.write(self.style.SUCCESS(
             f'\n🎉 임포트 완료!'
             f'\n  저장: {created}건'
@@ -0,0 +1,78 @@
+# 생성일: 2026-10-18
+# 설명: 면접관이 그대로 말하는 고정 멘트를 TTS 캐시에 미리 합성해 두는 커맨드
+#       (모의면접 중 TTS 대기 시간 제거, core/services/interview/tts_cache.py)
+# [수정일: 2026-10-18] 질문 뱅크(InterviewQuestion.question_text) 합성 제거
+#       - 면접관은 뱅크 질문을 그대로 읽지 않고 LLM이 다시 쓴 문장을 스트리밍하므로 캐시 키가 맞지 않음
+#       - 문장 그대로 송신되는 멘트만 FIXED_LINES에 등록 (현재 CLOSING_MESSAGE)
+#
+# 사용법:
+#   python manage.py prerender_tts                          # 고정 멘트, nova 음성
+#   python manage.py prerender_tts --voice nova --voice alloy --workers 8
+#   python manage.py prerender_tts --dry-run                # 합성 대상 개수만 확인
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.interview.constants import CLOSING_MESSAGE
+from core.services.interview.tts_cache import (
+    CONTENT_TYPES, get_tts_cache, normalize_text, synthesize_speech, tts_cache_key,
+)
+
+VALID_VOICES = {"alloy", "echo", "fable", "onyx", "nova", "shimmer"}
+# answer_view 등에서 문장 그대로 TTS로 재생되는 멘트만 (LLM이 생성/변형하는 문장은 캐시 적중 불가)
+FIXED_LINES = [CLOSING_MESSAGE]
+
+
+class Command(BaseCommand):
+    help = '면접관 고정 멘트 음성을 TTS 캐시에 미리 합성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--voice', action='append', help='음성 (여러 번 지정 가능, 기본: nova — 프론트 기본 음성)')
+        parser.add_argument('--format', default='mp3', choices=sorted(CONTENT_TYPES), help='오디오 형식 (기본: mp3)')
+        parser.add_argument('--workers', type=int, default=4, help='동시 합성 수 (기본: 4)')
+        parser.add_argument('--dry-run', action='store_true', help='합성하지 않고 대상 개수만 출력')
+
+    def handle(self, *args, **options):
+        voices = options['voice'] or ['nova']
+        invalid = set(voices) - VALID_VOICES
+        if invalid:
+            raise CommandError(f'지원하지 않는 음성: {", ".join(sorted(invalid))}')
+        fmt = options['format']
+
+        # 1. 대상 문장 수집 (정규화 후 중복 제거)
+        texts = list(dict.fromkeys(
+            t for t in (normalize_text(x) for x in FIXED_LINES) if t and len(t) <= 4096
+        ))
+
+        # 2. 이미 캐시된 항목 제외
+        cache = get_tts_cache()
+        jobs = [(text, voice) for voice in voices for text in texts
+                if not cache.lookup(tts_cache_key(text, voice, fmt), fmt)]
+        self.stdout.write(f'📋 문장 {len(texts)}개 × 음성 {len(voices)}개 → 합성 필요 {len(jobs)}건')
+        if options['dry_run'] or not jobs:
+            return
+
+        # 3. 병렬 합성
+        start = time.time()
+        done = failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            futures = {
+                executor.submit(cache.get_or_synthesize, text, voice, fmt,
+                                lambda text=text, voice=voice: synthesize_speech(text, voice, fmt)): text
+                for text, voice in jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    done += 1
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f'  ✗ {futures[future][:40]}… — {e}')
+                if (done + failed) % 100 == 0:
+                    self.stdout.write(f'  {done + failed}/{len(jobs)}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 완료: 합성 {done}건, 실패 {failed}건 ({time.time() - start:.1f}초) | 캐시 {cache.metrics()}'
+        ))
@@ -0,0 +1,24 @@
+# Generated manually on 2026-10-18
+# 리더보드 유닛 마스터 집계용 비정규화 필드 추가 (UserProgress)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_userwarsscore'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprogress',
+            name='solved_count',
+            field=models.IntegerField(default=0, help_text='한 번 이상 제출한 고유 문제 수'),
+        ),
+        migrations.AddField(
+            model_name='userprogress',
+            name='perfect_count',
+            field=models.IntegerField(default=0, help_text='최고 점수 90점 이상인 고유 문제 수'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated manually on 2026-10-18
+# 문제별/Wars game_type별 최고 점수 요약 테이블 추가 및 기존 제출 이력으로 초기값 채움
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def backfill_best_scores(apps, schema_editor):
+    UserSolvedProblem = apps.get_model('core', 'UserSolvedProblem')
+    UserProblemBest = apps.get_model('core', 'UserProblemBest')
+    UserWarsScore = apps.get_model('core', 'UserWarsScore')
+    UserWarsBest = apps.get_model('core', 'UserWarsBest')
+
+    problem_rows = (
+        UserSolvedProblem.objects
+        .values('user_id', 'practice_detail_id')
+        .annotate(best=Max('score'), attempts=Count('id'))
+    )
+    UserProblemBest.objects.bulk_create([
+        UserProblemBest(
+            user_id=row['user_id'],
+            practice_detail_id=row['practice_detail_id'],
+            best_score=row['best'],
+            attempt_count=row['attempts'],
+        )
+        for row in problem_rows.iterator()
+    ], batch_size=1000)
+
+    wars_rows = UserWarsScore.objects.values('user_id', 'game_type').annotate(best=Max('score'))
+    UserWarsBest.objects.bulk_create([
+        UserWarsBest(user_id=row['user_id'], game_type=row['game_type'], best_score=row['best'])
+        for row in wars_rows.iterator()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_userprogress_mastery_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserProblemBest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('create_id', models.CharField(blank=True, help_text='생성자 ID', max_length=50, null=True)),
+                ('update_id', models.CharField(blank=True, help_text='수정자 ID', max_length=50, null=True)),
+                ('create_date', models.DateTimeField(auto_now_add=True, help_text='생성 일시')),
+                ('update_date', models.DateTimeField(auto_now=True, help_text='수정 일시')),
+                ('use_yn', models.CharField(default='Y', help_text='사용 여부 (Y/N)', max_length=1)),
+                ('best_score', models.IntegerField(default=0, help_text='해당 문제 최고 점수')),
+                ('attempt_count', models.IntegerField(default=0, help_text='누적 제출 횟수')),
+                ('practice_detail', models.ForeignKey(help_text='세부 문제', on_delete=django.db.models.deletion.CASCADE, to='core.practicedetail')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='problem_bests', to='core.userprofile')),
+            ],
+            options={
+                'verbose_name': '문제별 최고 점수',
+                'verbose_name_plural': '문제별 최고 점수 목록',
+                'db_table': 'gym_user_problem_best',
+                'unique_together': {('user', 'practice_detail')},
+            },
+        ),
+        migrations.CreateModel(
+            name='UserWarsBest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('create_id', models.CharField(blank=True, help_text='생성자 ID', max_length=50, null=True)),
+                ('update_id', models.CharField(blank=True, help_text='수정자 ID', max_length=50, null=True)),
+                ('create_date', models.DateTimeField(auto_now_add=True, help_text='생성 일시')),
+                ('update_date', models.DateTimeField(auto_now=True, help_text='수정 일시')),
+                ('use_yn', models.CharField(default='Y', help_text='사용 여부 (Y/N)', max_length=1)),
+                ('game_type', models.CharField(help_text='미니게임 종류 (logic_run, code_typing 등)', max_length=30)),
+                ('best_score', models.IntegerField(default=0, help_text='해당 게임 최고 점수')),
+                ('user', models.ForeignKey(help_text='점수 소유자', on_delete=django.db.models.deletion.CASCADE, related_name='wars_bests', to='core.userprofile')),
+            ],
+            options={
+                'verbose_name': 'Wars 게임 최고 점수',
+                'verbose_name_plural': 'Wars 게임 최고 점수 목록',
+                'db_table': 'gym_wars_best',
+                'unique_together': {('user', 'game_type')},
+            },
+        ),
+        migrations.RunPython(backfill_best_scores, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated manually on 2026-10-18
+# UserActivity.total_points를 최고 점수 요약 테이블(UserProblemBest + UserWarsBest) 합계로 다시 맞춤
+# - 0013 이후 total_points는 최고 점수 상승분만 증분 반영하므로, 그 이전에 쌓인 오차가 영구히 남지 않도록 1회 재계산
+
+from django.db import migrations
+from django.db.models import Sum
+
+
+def rank_for_points(total_points):
+    # core.services.activity_service._rank_for_points와 같은 기준 (마이그레이션은 서비스 코드에 의존하지 않음)
+    if total_points > 3000:
+        return 'ENGINEER'
+    elif total_points > 1000:
+        return 'GOLD'
+    elif total_points > 500:
+        return 'SILVER'
+    return 'BRONZE'
+
+
+def recompute_total_points(apps, schema_editor):
+    UserActivity = apps.get_model('core', 'UserActivity')
+    UserProblemBest = apps.get_model('core', 'UserProblemBest')
+    UserWarsBest = apps.get_model('core', 'UserWarsBest')
+
+    totals = {}
+    for model in (UserProblemBest, UserWarsBest):
+        for row in model.objects.values('user_id').annotate(total=Sum('best_score')).iterator():
+            totals[row['user_id']] = totals.get(row['user_id'], 0) + (row['total'] or 0)
+
+    changed = []
+    for activity in UserActivity.objects.only('user_id', 'total_points', 'current_rank').iterator():
+        total = totals.get(activity.user_id, 0)
+        rank = rank_for_points(total)
+        if activity.total_points != total or activity.current_rank != rank:
+            activity.total_points = total
+            activity.current_rank = rank
+            changed.append(activity)
+    UserActivity.objects.bulk_update(changed, ['total_points', 'current_rank'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_best_score_tables'),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_total_points, migrations.RunPython.noop),
+    ]
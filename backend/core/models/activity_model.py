@@ -91,6 +91,31 @@ class UserSolvedProblem(BaseModel):
         verbose_name = '문제 해결 기록'
         verbose_name_plural = '문제 해결 기록 목록'
 
+# [수정일: 2026-10-18] 문제별 최고 점수 요약 테이블
+# - 제출 시 전체 이력을 재집계하지 않고 (new_best - old_best) 증분으로 포인트를 갱신하기 위함
+class UserProblemBest(BaseModel):
+    """
+    사용자별 세부 문제 최고 점수 및 시도 횟수
+    """
+    user = models.ForeignKey(
+        UserProfile,
+        on_delete=models.CASCADE,
+        related_name='problem_bests'
+    )
+    practice_detail = models.ForeignKey(
+        PracticeDetail,
+        on_delete=models.CASCADE,
+        help_text="세부 문제"
+    )
+    best_score = models.IntegerField(default=0, help_text="해당 문제 최고 점수")
+    attempt_count = models.IntegerField(default=0, help_text="누적 제출 횟수")
+
+    class Meta:
+        db_table = 'gym_user_problem_best'
+        unique_together = ('user', 'practice_detail')
+        verbose_name = '문제별 최고 점수'
+        verbose_name_plural = '문제별 최고 점수 목록'
+
 class UserProgress(BaseModel):
     """
     연습 과정(Unit)별 진행 상태 및 해금 노드 관리
@@ -107,6 +132,10 @@ class UserProgress(BaseModel):
     )
     unlocked_nodes = models.JSONField(default=list, help_text="해금된 문제 인덱스 목록 (예: [0, 1, 2])")
     progress_rate = models.FloatField(default=0.0, help_text="해당 유닛 진행률 (%)")
+    # [수정일: 2026-10-18] 리더보드 유닛 마스터 집계용 비정규화 필드
+    # - save_user_problem_record()에서 제출 시마다 증분 갱신 (기존 데이터는 backfill_unit_mastery 커맨드로 채움)
+    solved_count = models.IntegerField(default=0, help_text="한 번 이상 제출한 고유 문제 수")
+    perfect_count = models.IntegerField(default=0, help_text="최고 점수 90점 이상인 고유 문제 수")
 
     class Meta:
         db_table = 'gym_user_progress'
@@ -160,3 +189,27 @@ class UserWarsScore(BaseModel):
 
     def __str__(self):
         return f"{self.user.username}: {self.game_type} {self.score}pts"
+
+
+# [수정일: 2026-10-18] Wars game_type별 최고 점수 요약 테이블 (UserProblemBest와 동일한 증분 갱신용)
+class UserWarsBest(BaseModel):
+    user = models.ForeignKey(
+        UserProfile,
+        on_delete=models.CASCADE,
+        related_name='wars_bests',
+        help_text="점수 소유자"
+    )
+    game_type = models.CharField(
+        max_length=30,
+        help_text="미니게임 종류 (logic_run, code_typing 등)"
+    )
+    best_score = models.IntegerField(default=0, help_text="해당 게임 최고 점수")
+
+    class Meta:
+        db_table = 'gym_wars_best'
+        unique_together = ('user', 'game_type')
+        verbose_name = 'Wars 게임 최고 점수'
+        verbose_name_plural = 'Wars 게임 최고 점수 목록'
+
+    def __str__(self):
+        return f"{self.user.username}: {self.game_type} best {self.best_score}pts"
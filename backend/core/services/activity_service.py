@@ -1,13 +1,47 @@
 import logging
-from django.db.models import Sum, Max
+from django.db.models import Sum
 from django.db import transaction
-from core.models import UserActivity, UserSolvedProblem, UserProgress, PracticeDetail, UserWarsScore
+from core.models import (
+    UserActivity, UserSolvedProblem, UserProblemBest, UserProgress, PracticeDetail,
+    UserWarsScore, UserWarsBest,
+)
 
 logger = logging.getLogger(__name__)
 
+
+def _rank_for_points(total_points):
+    """
+    [2026-02-18 상세] 획득 점수에 따른 사용자 등급(Rank) 자동 조정 로직
+    - ENGINEER(3000초과), GOLD(1000초과), SILVER(500초과), BRONZE(기본)
+    """
+    if total_points > 3000:
+        return 'ENGINEER'
+    elif total_points > 1000:
+        return 'GOLD'
+    elif total_points > 500:
+        return 'SILVER'
+    return 'BRONZE'
+
+
+def _apply_points_delta(user_profile, delta):
+    """
+    [수정일: 2026-10-18] UserActivity.total_points에 최고 점수 상승분(delta)만 반영
+    - 행을 select_for_update로 잠근 뒤 증분 갱신하므로 제출 이력 길이와 무관하게 O(1)
+    - 반드시 transaction.atomic() 블록 안에서 호출해야 함
+    """
+    UserActivity.objects.get_or_create(user=user_profile)
+    activity = UserActivity.objects.select_for_update().get(user=user_profile)
+    if delta:
+        activity.total_points += delta
+    activity.current_rank = _rank_for_points(activity.total_points)
+    activity.save()
+    return activity
+
+
 # [2026-02-18 수정] 사용자 활동 기록 및 포인트 정산 공통 서비스 정의 (Antigravity)
 # - Unit 1과 Unit 3에서 공통으로 사용하여 코드 중복을 제거하고 데이터 일관성을 보장함
 # - 각 문제별 최고 점수를 합산하여 전체 포인트를 계산하는 로직을 포함함
+# [수정일: 2026-10-18] 전체 이력 재집계(group-by Max → Sum) 대신 UserProblemBest 기반 증분 갱신으로 변경
 def save_user_problem_record(user_profile, detail_id, score, submitted_data):
     """
     Args:
@@ -15,71 +49,62 @@ def save_user_problem_record(user_profile, detail_id, score, submitted_data):
         detail_id: PracticeDetail ID (예: unit0101, unit0301)
         score: 획득 점수 (0-100)
         submitted_data: 사용자가 제출한 상세 데이터 (JSON)
-        
+
     Returns:
         dict: 업데이트된 활동 정보 (total_points, current_rank, progress_rate)
     """
     try:
         # [2026-02-18 상세] 제공된 ID를 통해 상세 문제 정보를 데이터베이스에서 조회함
         detail = PracticeDetail.objects.get(id=detail_id)
-        
+
         with transaction.atomic():
+            # [수정일: 2026-10-18] 유닛 진행도 행과 문제별 최고 점수 행을 잠그고 기존 최고 점수를 확인함
+            # - 리더보드 집계 필드(solved_count, perfect_count)와 포인트를 증분 갱신하기 위함
+            practice = detail.practice
+            UserProgress.objects.get_or_create(user=user_profile, practice=practice)
+            progress = UserProgress.objects.select_for_update().get(user=user_profile, practice=practice)
+
+            new_score = max(score, 0)
+            best, created = UserProblemBest.objects.select_for_update().get_or_create(
+                user=user_profile,
+                practice_detail=detail,
+                defaults={'best_score': new_score, 'attempt_count': 0},
+            )
+            prev_best = None if created else best.best_score
+
             # [2026-02-18 상세] 1. 새로운 문제 해결 기록을 UserSolvedProblem 모델에 생성함
             # - score는 0점 미만이 되지 않도록 보호 처리함
             # - 90점 이상인 경우 완벽 수행(is_perfect)으로 간주함
+            best.attempt_count += 1
             UserSolvedProblem.objects.create(
                 user=user_profile,
                 practice_detail=detail,
-                score=max(score, 0),
+                score=new_score,
                 submitted_data=submitted_data,
-                is_perfect=score >= 90
+                is_perfect=score >= 90,
+                attempt_number=best.attempt_count,
             )
-            
+
             # [2026-02-18 상세] 2. 누적 포인트 업데이트
             # - 단순 합산이 아닌, 동일 문제에 대해 여러 번 기록이 있을 경우 '최고 점수'만 반영함
-            # - values('practice_detail')로 그룹화하여 문제별 Max 점수를 구한 뒤 최종 합산(Sum)함
-            practice_points_data = UserSolvedProblem.objects.filter(user=user_profile) \
-                .values('practice_detail') \
-                .annotate(max_score=Max('score')) \
-                .aggregate(total=Sum('max_score'))
-            practice_points = practice_points_data['total'] or 0
-
-            # [2026-03-04] Wars 게임 점수도 합산 (game_type별 최고점)
-            wars_points_data = UserWarsScore.objects.filter(user=user_profile) \
-                .values('game_type') \
-                .annotate(max_score=Max('score')) \
-                .aggregate(total=Sum('max_score'))
-            wars_points = wars_points_data['total'] or 0
-
-            total_points = practice_points + wars_points
-            
-            # [2026-02-18 상세] 유저 활동 정보(UserActivity) 갱신 또는 생성
-            activity, _ = UserActivity.objects.get_or_create(user=user_profile)
-            activity.total_points = total_points
-            
-            # [2026-02-18 상세] 획득 점수에 따른 사용자 등급(Rank) 자동 조정 로직
-            # - ENGINEER(3000초과), GOLD(1000초과), SILVER(500초과), BRONZE(기본)
-            if total_points > 3000:
-                activity.current_rank = 'ENGINEER'
-            elif total_points > 1000:
-                activity.current_rank = 'GOLD'
-            elif total_points > 500:
-                activity.current_rank = 'SILVER'
-            else:
-                activity.current_rank = 'BRONZE'
-            
-            activity.save()
-            
+            # - [수정일: 2026-10-18] 최고 점수가 오른 만큼(new_best - old_best)만 total_points에 더함
+            delta = new_score if prev_best is None else max(new_score - prev_best, 0)
+            best.best_score = max(best.best_score, new_score)
+            best.save()
+
+            activity = _apply_points_delta(user_profile, delta)
+            total_points = activity.total_points
+
             # [2026-02-18 상세] 3. 해당 유닛(Practice)의 진행도(UserProgress) 업데이트
-            practice = detail.practice
-            progress, _ = UserProgress.objects.get_or_create(user=user_profile, practice=practice)
-            
-            # [2026-02-18 상세] 해결한 '고유' 문제 수를 계산하여 진행률 산출에 활용함
-            solved_count = UserSolvedProblem.objects.filter(
-                user=user_profile, 
-                practice_detail__practice=practice
-            ).values('practice_detail').distinct().count()
-            
+            # [수정일: 2026-10-18] 해결한 '고유' 문제 수와 90점 이상 문제 수를 재집계 없이 증분 반영함
+            if prev_best is None:
+                progress.solved_count += 1
+                if new_score >= 90:
+                    progress.perfect_count += 1
+            elif prev_best < 90 <= new_score:
+                progress.perfect_count += 1
+            solved_count = progress.solved_count
+
             # [2026-02-18 상세] 해금된 노드 리스트 업데이트
             # - 문제 ID의 마지막 두 자리를 인덱스로 사용하여 unlocked_nodes 배열을 구성함
             try:
@@ -94,18 +119,64 @@ def save_user_problem_record(user_profile, detail_id, score, submitted_data):
             total_unit_problems = PracticeDetail.objects.filter(practice=practice).count()
             if total_unit_problems > 0:
                 progress.progress_rate = (solved_count / total_unit_problems) * 100
-            
+
             progress.save()
-            
+
             return {
                 'total_points': total_points,
                 'current_rank': activity.current_rank,
                 'progress_rate': progress.progress_rate
             }
-            
+
     except PracticeDetail.DoesNotExist:
         logger.error(f"PracticeDetail not found: {detail_id}")
         raise ValueError(f"Invalid detail_id: {detail_id}")
     except Exception as e:
         logger.error(f"Error in save_user_problem_record: {str(e)}")
         raise e
+
+
+# [수정일: 2026-10-18] Wars 미니게임 점수 저장 공통 서비스 (WarsScoreSubmitView에서 이동)
+# - game_type별 최고 점수(UserWarsBest) 상승분만 total_points에 반영
+def save_user_wars_score(user_profile, game_type, score, submitted_data):
+    """
+    Args:
+        user_profile: UserProfile 객체
+        game_type: 미니게임 종류 (logic_run, code_typing 등)
+        score: 획득 점수 (0-100으로 보정된 값)
+        submitted_data: 게임 결과 상세 데이터 (JSON)
+
+    Returns:
+        dict: total_points, current_rank, wars_points, practice_points
+    """
+    with transaction.atomic():
+        best, created = UserWarsBest.objects.select_for_update().get_or_create(
+            user=user_profile,
+            game_type=game_type,
+            defaults={'best_score': score},
+        )
+        delta = score if created else max(score - best.best_score, 0)
+        if not created and delta:
+            best.best_score = score
+            best.save()
+
+        UserWarsScore.objects.create(
+            user=user_profile,
+            game_type=game_type,
+            score=score,
+            submitted_data=submitted_data,
+            is_perfect=score >= 90,
+        )
+
+        activity = _apply_points_delta(user_profile, delta)
+
+        # game_type 수만큼의 소규모 합산 (제출 이력 길이와 무관)
+        wars_points = UserWarsBest.objects.filter(user=user_profile) \
+            .aggregate(total=Sum('best_score'))['total'] or 0
+
+    return {
+        'total_points': activity.total_points,
+        'current_rank': activity.current_rank,
+        'wars_points': wars_points,
+        'practice_points': max(activity.total_points - wars_points, 0),
+    }
@@ -2,12 +2,7 @@ import os
 import json
 import logging
 from typing import Dict, Any, List, Optional
-try:
-    import openai
-except ImportError:
-    openai = None
-
-from django.conf import settings
+from core.services.llm_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +17,8 @@ class ArchEvaluator:
     """
 
     def __init__(self):
-        if openai and getattr(settings, 'OPENAI_API_KEY', None):
-            self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-        else:
-            self.client = None
+        # [수정일: 2026-10-18] 공용 LLM 클라이언트 (키/SDK 없으면 None)
+        self.client = get_openai_client('wars.arch_evaluator')
 
     def evaluate_comparison(
         self,
@@ -0,0 +1,167 @@
+"""
+code_jobs.py — 비동기 코드 실행 작업(Job) 관리
+수정일: 2026-10-18
+
+[배경]
+CodeExecutionView.post는 실행이 끝날 때까지(최대 TIMEOUT_SECONDS) 요청 스레드를 붙잡아
+긴 PyTorch 실행 중에는 나머지 API가 워커 부족으로 밀리는 문제가 있었다.
+
+[흐름]
+    POST /execute-code/jobs/               → job_id 즉시 반환 (202)
+    GET  /execute-code/jobs/<id>/          → 상태/결과 조회 (폴링)
+    GET  /execute-code/jobs/<id>/stream/   → stdout/stderr 조각을 SSE로 실시간 전달
+
+- 실행은 크기가 제한된 ThreadPoolExecutor에서 샌드박스 풀(core.services.sandbox_pool)로 위임
+- 대기 중인 작업이 SANDBOX_JOB_MAX_PENDING을 넘으면 CodeJobQueueFull (백프레셔)
+- 작업 기록은 프로세스 메모리에 보관하며 완료 후 JOB_TTL_SECONDS가 지나면 정리
+  (다중 워커 배포 시 SSE/조회 요청은 제출한 워커로 라우팅되어야 함 — sticky session)
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from core.services.sandbox_pool import get_sandbox_pool, SandboxPoolBusy
+
+logger = logging.getLogger(__name__)
+
+
+class CodeJobQueueFull(Exception):
+    """대기 중인 작업 수가 상한을 넘은 경우"""
+    pass
+
+
+class CodeJob:
+    """실행 작업 1건 — 출력 조각(events)과 최종 결과를 보관"""
+
+    QUEUED, RUNNING, DONE = "queued", "running", "done"
+
+    def __init__(self, code: str, docker_image: str, memory_limit: str, cpu_limit: str, timeout: float):
+        self.id = uuid.uuid4().hex
+        self.code = code
+        self.docker_image = docker_image
+        self.memory_limit = memory_limit
+        self.cpu_limit = cpu_limit
+        self.timeout = timeout
+        self.status = self.QUEUED
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.result: Optional[dict] = None
+        self.events: List[dict] = []
+        self._lock = threading.Lock()
+
+    def append_output(self, stream: str, data: str):
+        with self._lock:
+            self.events.append({"type": "output", "stream": stream, "data": data})
+
+    def finish(self, result: dict):
+        with self._lock:
+            self.result = result
+            self.status = self.DONE
+            self.finished_at = time.time()
+
+    def events_since(self, offset: int) -> List[dict]:
+        with self._lock:
+            return self.events[offset:]
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "result": self.result,
+        }
+
+
+class CodeJobManager:
+    """크기가 제한된 실행기 + 메모리 작업 저장소"""
+
+    JOB_TTL_SECONDS = 10 * 60
+
+    def __init__(self, max_workers: int = 8, max_pending: int = 100):
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='code-job')
+        self._jobs: Dict[str, CodeJob] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def submit(self, code: str, docker_image: str, memory_limit: str, cpu_limit: str, timeout: float) -> CodeJob:
+        self._cleanup()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise CodeJobQueueFull("실행 대기 작업이 너무 많습니다")
+            self._pending += 1
+            job = CodeJob(code, docker_image, memory_limit, cpu_limit, timeout)
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[CodeJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: CodeJob):
+        job.status = CodeJob.RUNNING
+        start_time = time.time()
+        try:
+            pool = get_sandbox_pool(job.docker_image, memory_limit=job.memory_limit, cpu_limit=job.cpu_limit)
+            raw = pool.run(job.code, timeout=job.timeout, on_output=job.append_output)
+            if raw["timed_out"]:
+                result = {
+                    "success": False,
+                    "stdout": raw["stdout"],
+                    "stderr": f"실행 시간 초과 ({int(job.timeout)}초)",
+                    "exit_code": -1,
+                    "error_type": "timeout",
+                }
+            else:
+                result = {
+                    "success": raw["exit_code"] == 0,
+                    "stdout": raw["stdout"],
+                    "stderr": raw["stderr"],
+                    "exit_code": raw["exit_code"],
+                    "error_type": None if raw["exit_code"] == 0 else "runtime",
+                }
+        except FileNotFoundError:
+            result = {
+                "success": False, "stdout": "",
+                "stderr": "Docker가 설치되어 있지 않습니다. Docker Desktop을 설치해주세요.",
+                "exit_code": -1, "error_type": "docker_not_found",
+            }
+        except SandboxPoolBusy as e:
+            result = {"success": False, "stdout": "", "stderr": str(e), "exit_code": -1, "error_type": "busy"}
+        except Exception as e:
+            logger.error(f"[CodeJob] 실행 실패 ({job.id}): {e}", exc_info=True)
+            result = {"success": False, "stdout": "", "stderr": str(e), "exit_code": -1, "error_type": "system"}
+        finally:
+            with self._lock:
+                self._pending -= 1
+        result["execution_time"] = round(time.time() - start_time, 2)
+        job.finish(result)
+
+    def _cleanup(self):
+        cutoff = time.time() - self.JOB_TTL_SECONDS
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+_manager: Optional[CodeJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_code_job_manager() -> CodeJobManager:
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = CodeJobManager(
+                max_workers=getattr(settings, "SANDBOX_JOB_WORKERS", 8),
+                max_pending=getattr(settings, "SANDBOX_JOB_MAX_PENDING", 100),
+            )
+        return _manager
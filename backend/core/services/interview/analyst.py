@@ -4,8 +4,8 @@ analyst.py — L1 Analyst (증거 추출기)
 LLM이 "좋다/나쁘다" 판단하는 것을 절대 금지한다.
 """
 import json
-import openai
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 
 
 def extract_evidence(answer: str, evidence_keys: list) -> dict:
@@ -29,7 +29,7 @@ def extract_evidence(answer: str, evidence_keys: list) -> dict:
             print("[Analyst] OPENAI_API_KEY 없음 — 모든 evidence False 반환")
             return {key: False for key in evidence_keys}
 
-        client = openai.OpenAI(api_key=api_key)
+        client = get_openai_client('interview.analyst')
 
         evidence_descriptions = _build_evidence_descriptions(evidence_keys)
         prompt = _build_analyst_prompt(answer, evidence_descriptions)
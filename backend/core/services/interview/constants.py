@@ -31,3 +31,6 @@ SLOT_REQUIRED = {
     "motivation": ["reason", "alignment"],
     "growth": ["challenge", "effort", "change"],
 }
+
+# [2026-10-18] 면접 종료 인사말 (answer_view가 그대로 송신 → TTS 캐시/prerender_tts 대상)
+CLOSING_MESSAGE = "오늘 면접은 여기까지입니다. 시간 내주셔서 감사합니다. 수고하셨습니다."
@@ -4,8 +4,8 @@ feedback_generator.py — 최종 피드백 생성기
 점수나 합격/불합격 판정 금지. 증거 기반 정성적 피드백만 제공.
 """
 import json
-import openai
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 from core.services.interview.constants import EVIDENCE_LABELS, SLOT_REQUIRED
 
 
@@ -29,7 +29,7 @@ def generate_feedback(session) -> dict:
     if not api_key:
         return _build_fallback_feedback(slot_summary)
 
-    client = openai.OpenAI(api_key=api_key)
+    client = get_openai_client('interview.feedback')
     prompt = _build_feedback_prompt(slot_summary, session)
 
     try:
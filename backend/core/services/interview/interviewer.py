@@ -20,8 +20,8 @@ interviewer.py -- L4 Interviewer (대화 생성기 + 말투 보정 통합)
     humanizer_context["bank_questions"]에서 현재 슬롯의 기출 질문을 가져와
     시스템 프롬프트에 주입. LLM이 실제 면접 데이터를 참고하여 질문을 생성하도록 함.
 """
-import openai
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 
 
 def generate_question(intent: str, humanizer_context: dict, previous_answer: str = '', conversation_history: list = None):
@@ -42,7 +42,7 @@ def generate_question(intent: str, humanizer_context: dict, previous_answer: str
         yield "다음 경험에 대해 좀 더 말씀해 주시겠어요?"
         return
 
-    client = openai.OpenAI(api_key=api_key)
+    client = get_openai_client('interview.interviewer')
     prompt = _build_interviewer_prompt(intent, humanizer_context)
 
     # 디버그: covered_topics 확인
@@ -62,6 +62,7 @@ def generate_question(intent: str, humanizer_context: dict, previous_answer: str
     else:
         messages.append({"role": "user", "content": "질문을 생성하라."})
 
+    stream = None
     try:
         stream = client.chat.completions.create(
             model="gpt-4o",
@@ -80,6 +81,10 @@ def generate_question(intent: str, humanizer_context: dict, previous_answer: str
     except Exception as e:
         print(f"[Interviewer] 오류: {e}")
         yield "조금 더 구체적으로 말씀해 주시겠어요?"
+    finally:
+        # [수정 2026-10-18] 추측 초안이 취소되면(generator.close) HTTP 스트림도 바로 반납
+        if stream is not None and hasattr(stream, "close"):
+            stream.close()
 
 
 def generate_question_sync(intent: str, humanizer_context: dict, previous_answer: str = '', conversation_history: list = None) -> str:
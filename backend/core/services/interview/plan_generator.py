@@ -11,8 +11,8 @@ plan_generator.py -- 면접 계획 생성기
   - _build_plan_prompt() 중복 코드 정리 (채용공고 파싱 블록 1회로 통합)
 """
 import json
-import openai
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 
 # job_role 코드 → 프롬프트용 라벨 매핑 (common_data.json JOB_ROLE과 동기화)
 JOB_ROLE_LABELS = {
@@ -64,7 +64,7 @@ def generate_plan(job_posting, user_weakness: dict, user_job_roles: list = None)
     if not api_key:
         return _get_default_plan(job_posting, user_weakness, user_job_roles)
 
-    client = openai.OpenAI(api_key=api_key)
+    client = get_openai_client('interview.plan')
 
     # [2026-03-01] DB에서 기업/직무 기출 질문 조회
     real_questions = _fetch_real_questions(job_posting)
@@ -11,6 +11,11 @@ question_bank_service.py -- 면접 질문 뱅크 검색 서비스
   - 변경 후: 인덱스 필터 → ID만 조회 → Python에서 랜덤 선택 → PK 조회 (~0.1초)
   - 결과 품질: 동일 (균등 분포 랜덤, 기업 우선순위 유지)
 
+[2026-10-18] 랜덤 샘플링 인덱스(question_index.py) 도입
+  - 변경 전: 호출마다 조건에 맞는 ID 전체를 values_list로 가져옴 (슬롯 수만큼 반복)
+  - 변경 후: 메모리 인덱스에서 O(k) 샘플링 → 세션 생성 시 PK 조회 1회로 끝
+             (질문 뱅크 크기와 무관, import_questions 실행 시 인덱스 무효화)
+
 사용처:
   1. plan_generator.py  -- generate_plan() 호출 시 기출 질문을 프롬프트에 주입
   2. session_view.py    -- 세션 생성 시 슬롯별 질문 묶음(bank_questions)을 interview_plan에 저장
@@ -23,11 +28,8 @@ question_bank_service.py -- 면접 질문 뱅크 검색 서비스
   - get_questions_for_plan()    : 면접 계획 생성용 기출 질문 요약 반환
   - map_slot_to_type()          : interview_plan 슬롯명 → DB slot_type 매핑
 """
-import random
-
-from django.db.models import Q
-
 from core.models import InterviewQuestion
+from core.services.interview.question_index import get_question_index
 
 
 # ============================================================================
@@ -54,6 +56,29 @@ def map_slot_to_type(slot_name: str) -> str:
     return slot_name
 
 
+def _fetch_questions(ids: list) -> list:
+    """선택된 ID를 PK 1회 조회로 가져와 선택 순서대로 반환한다.
+
+    인덱스 구축 이후 삭제된 질문은 조회되지 않으므로 자연히 빠진다.
+    """
+    if not ids:
+        return []
+    q_map = {q.id: q for q in InterviewQuestion.objects.filter(id__in=ids)}
+    return [q_map[pk] for pk in ids if pk in q_map]
+
+
+def _to_dict(q) -> dict:
+    return {
+        "id": q.id,
+        "question_text": q.question_text,
+        "slot_type": q.slot_type,
+        "company": q.company,
+        "job": q.job,
+        "source": q.source,
+        "answer_summary": q.answer_summary or "",
+    }
+
+
 # ============================================================================
 # 질문 검색 (공통)
 # ============================================================================
@@ -68,11 +93,10 @@ def search_questions(slot_type=None, company="", job="", limit=10) -> list:
     검색 우선순위:
       1) company가 지정되면 해당 기업 질문 우선 → 부족하면 범용(company='') 질문으로 보충
       2) job이 지정되면 직무명 부분 매치(icontains) 또는 범용(job='') 질문 포함
-      3) Python random.sample()로 같은 조건이라도 매번 다른 질문 제공
+      3) 랜덤 샘플링으로 같은 조건이라도 매번 다른 질문 제공
 
-    DB 인덱스 활용:
-      - idx_company_slot_job (company, slot_type, job) 복합 인덱스
-      - values_list('id', 'company')로 최소 데이터만 조회하여 인덱스 커버링 극대화
+    [2026-10-18] ID 후보는 DB가 아닌 메모리 인덱스(question_index.py)에서 O(k)로 샘플링하고,
+    DB에는 선택된 ID의 PK 조회 1회만 보낸다.
 
     Args:
         slot_type: InterviewQuestion.SlotType 값
@@ -97,57 +121,13 @@ def search_questions(slot_type=None, company="", job="", limit=10) -> list:
             ...
         ]
     """
-    qs = InterviewQuestion.objects.all()
-
-    # 슬롯 필터 (인덱스: idx_company_slot_job의 slot_type 컬럼)
-    if slot_type:
-        qs = qs.filter(slot_type=slot_type)
-
-    # 직무 필터: 부분 매치 또는 범용
-    if job:
-        qs = qs.filter(Q(job__icontains=job) | Q(job=''))
-
-    # ── [2026-03-02] Python 랜덤 샘플링 (기업 우선순위 유지) ────────────
-    # 1단계: ID + company만 가져옴 (인덱스 커버링, 전체 행 로드 안 함)
-    if company:
-        qs = qs.filter(Q(company=company) | Q(company=''))
-        id_pairs = list(qs.values_list('id', 'company'))
-
-        # 기업 매치 ID와 범용 ID를 분리
-        company_ids = [pk for pk, c in id_pairs if c == company]
-        general_ids = [pk for pk, c in id_pairs if c != company]
-
-        # 기업 질문 우선 선택 → 부족하면 범용으로 보충
-        selected = random.sample(company_ids, min(limit, len(company_ids)))
-        remaining = limit - len(selected)
-        if remaining > 0 and general_ids:
-            selected += random.sample(general_ids, min(remaining, len(general_ids)))
-    else:
-        id_list = list(qs.values_list('id', flat=True))
-        selected = random.sample(id_list, min(limit, len(id_list)))
-
-    if not selected:
-        return []
-
-    # 2단계: 선택된 ID로 전체 데이터 조회 (PK 인덱스, 즉시 반환)
-    results = InterviewQuestion.objects.filter(id__in=selected)
+    # [2026-10-18] 메모리 인덱스에서 ID 샘플링 (기업 우선 → 범용 보충 규칙 동일)
+    selected = get_question_index().sample(
+        slot_type=slot_type, company=company, job=job, limit=limit,
+    )
 
-    # 선택 순서 유지 (기업 우선순위 반영)
-    id_order = {pk: idx for idx, pk in enumerate(selected)}
-    results = sorted(results, key=lambda q: id_order.get(q.id, 0))
-
-    return [
-        {
-            "id": q.id,
-            "question_text": q.question_text,
-            "slot_type": q.slot_type,
-            "company": q.company,
-            "job": q.job,
-            "source": q.source,
-            "answer_summary": q.answer_summary or "",
-        }
-        for q in results
-    ]
+    # 선택된 ID로 전체 데이터 조회 (PK 인덱스, 선택 순서 유지)
+    return [_to_dict(q) for q in _fetch_questions(selected)]
 
 
 # ============================================================================
@@ -181,31 +161,29 @@ def get_questions_for_session(company="", job="", slot_types=None) -> dict:
     if not slot_types:
         return {}
 
-    result = {}
-    seen_ids = set()  # 슬롯 간 질문 중복 방지
-
+    # [2026-10-18] 슬롯별 ID를 인덱스에서 먼저 모두 고른 뒤 PK 조회 1회
+    index = get_question_index()
+    picked = {}
     for slot_name in slot_types:
         db_type = map_slot_to_type(slot_name)
 
         # 이미 같은 DB 타입으로 가져온 적 있으면 스킵
         # (technical_depth와 technical_depth_2가 모두 "technical"이므로)
-        if db_type in result:
+        if db_type in picked:
             continue
+        picked[db_type] = index.sample(slot_type=db_type, company=company, job=job, limit=5)
 
-        questions = search_questions(
-            slot_type=db_type,
-            company=company,
-            job=job,
-            limit=5,
-        )
+    all_ids = [pk for ids in picked.values() for pk in ids]
+    q_map = {q.id: q for q in _fetch_questions(all_ids)}
 
-        # 중복 질문 제거
+    result = {}
+    seen_ids = set()  # 슬롯 간 질문 중복 방지
+    for db_type, ids in picked.items():
         unique = []
-        for q in questions:
-            if q["id"] not in seen_ids:
-                seen_ids.add(q["id"])
-                unique.append(q)
-
+        for pk in ids:
+            if pk in q_map and pk not in seen_ids:
+                seen_ids.add(pk)
+                unique.append(_to_dict(q_map[pk]))
         result[db_type] = unique
 
     return result
@@ -238,53 +216,18 @@ def get_questions_for_plan(company="", job="") -> list:
             ...
         ]
     """
-    # ── 기본 필터 (기업 + 직무) ──────────────────────────────────────────
-    qs = InterviewQuestion.objects.all()
-
-    if company:
-        qs = qs.filter(Q(company=company) | Q(company=''))
-    if job:
-        qs = qs.filter(Q(job__icontains=job) | Q(job=''))
-
-    # ── [2026-03-02] 슬롯별 Python 랜덤 샘플링 (기업 우선) ─────────────
+    # ── [2026-10-18] 슬롯별 인덱스 샘플링 (기업 우선) → PK 배치 조회 1회 ──
     slot_types = ['technical', 'motivation', 'collaboration', 'problem_solving', 'growth', 'general']
+    index = get_question_index()
     selected_ids = []
-
     for st in slot_types:
-        # ID + company만 조회 (인덱스 커버링)
-        id_pairs = list(
-            qs.filter(slot_type=st).values_list('id', 'company')
-        )
-
-        if company:
-            # 기업 매치 우선 → 부족하면 범용 보충
-            company_ids = [pk for pk, c in id_pairs if c == company]
-            general_ids = [pk for pk, c in id_pairs if c != company]
-            picked = random.sample(company_ids, min(4, len(company_ids)))
-            remaining = 4 - len(picked)
-            if remaining > 0 and general_ids:
-                picked += random.sample(general_ids, min(remaining, len(general_ids)))
-        else:
-            all_ids = [pk for pk, _ in id_pairs]
-            picked = random.sample(all_ids, min(4, len(all_ids)))
-
-        selected_ids.extend(picked)
-
-    if not selected_ids:
-        return []
+        selected_ids.extend(index.sample(slot_type=st, company=company, job=job, limit=4))
 
-    # PK 배치 조회 (1회 쿼리로 전체 가져옴)
-    questions = InterviewQuestion.objects.filter(id__in=selected_ids)
-    q_map = {q.id: q for q in questions}
-
-    result = []
-    for pk in selected_ids:
-        q = q_map.get(pk)
-        if q:
-            result.append({
-                "slot_type": q.slot_type,
-                "question_text": q.question_text,
-                "source": q.source,
-            })
-
-    return result[:20]
+    return [
+        {
+            "slot_type": q.slot_type,
+            "question_text": q.question_text,
+            "source": q.source,
+        }
+        for q in _fetch_questions(selected_ids)
+    ][:20]
@@ -0,0 +1,191 @@
+"""
+question_index.py -- 면접 질문 뱅크 랜덤 샘플링 인덱스
+
+생성일: 2026-10-18
+설명: search_questions()가 호출될 때마다 조건에 맞는 ID 전체(13K+건)를 values_list로
+      가져온 뒤 random.sample 하던 방식을 대체하는 프로세스 메모리 인덱스.
+
+[구조]
+  - 버킷: (slot_type, company) → {정규화된 job: [id, ...]}
+    * job 정규화: 소문자 + 앞뒤 공백 제거 (icontains 매칭을 파이썬에서 재현)
+  - 직무 부분 매치: 버킷의 고유 job 키(수백 개)만 훑어 해당 ID 목록들을 고르고,
+    조회 조건별로 (ID 목록들, 누적 크기)를 메모이즈
+  - 샘플링: random.sample(range(전체 개수), k) → 누적 크기에서 bisect로 ID 역참조
+    → 목록을 합치지 않으므로 O(k) (질문 수와 무관)
+
+[갱신]
+  - QUESTION_INDEX_TTL(기본 10분)마다 재구축
+  - import_questions 커맨드가 invalidate_question_index() 호출
+    → 현재 프로세스 즉시 무효화 + 'invalidation' 캐시의 세대(generation) 값 갱신
+    → 다른 워커는 다음 조회 때 세대 변경을 보고 재구축
+      [수정 2026-10-18] default(LocMem)는 프로세스마다 따로라 커맨드 프로세스의 갱신이 워커에 보이지
+      않았음 → 워커 간 공유되는 캐시 별칭(settings.CACHES['invalidation'], 기본 파일 캐시)에 기록
+  - 인덱스 구축 이후 삭제된 질문은 PK 조회 단계에서 자연히 빠짐
+"""
+import bisect
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+from core.models import InterviewQuestion
+
+GENERATION_CACHE_KEY = 'question_index:generation'
+GENERATION_CACHE_ALIAS = 'invalidation'
+
+
+def generation_cache():
+    """세대 값 저장소 (워커/관리 커맨드 프로세스 간 공유). 별칭이 없으면 default"""
+    try:
+        return caches[getattr(settings, 'GENERATION_CACHE_ALIAS', GENERATION_CACHE_ALIAS)]
+    except InvalidCacheBackendError:
+        return caches['default']
+
+
+def normalize_job(job: str) -> str:
+    return (job or '').strip().lower()
+
+
+class _Pool:
+    """여러 ID 목록을 합치지 않고 하나처럼 샘플링"""
+
+    def __init__(self, lists: List[List[int]]):
+        self.lists = [ids for ids in lists if ids]
+        self.offsets = []
+        total = 0
+        for ids in self.lists:
+            total += len(ids)
+            self.offsets.append(total)
+        self.total = total
+
+    def sample(self, k: int) -> List[int]:
+        k = min(k, self.total)
+        if k <= 0:
+            return []
+        picked = []
+        for pos in random.sample(range(self.total), k):
+            idx = bisect.bisect_right(self.offsets, pos)
+            start = self.offsets[idx - 1] if idx else 0
+            picked.append(self.lists[idx][pos - start])
+        return picked
+
+
+class _Snapshot:
+    """한 번 구축된 인덱스 (재구축 시 통째로 교체)"""
+
+    ANY = '*'
+    MAX_POOLS = 4096  # 조회 API의 임의 job 문자열로 메모가 무한히 커지지 않도록
+
+    def __init__(self, buckets: Dict[Tuple[str, str], Dict[str, List[int]]], generation):
+        self.buckets = buckets
+        self.generation = generation
+        self.built_at = time.time()
+        self.size = sum(len(ids) for jobs in buckets.values() for ids in jobs.values())
+        self._pools: Dict[Tuple[str, str, str], _Pool] = {}
+
+    def pool(self, slot_type: str, company: str, job: str) -> _Pool:
+        """slot_type/company가 ANY이면 전체 대상. 조회 조건별로 메모이즈"""
+        key = (slot_type, company, job)
+        pool = self._pools.get(key)
+        if pool is None:
+            lists = []
+            for (st, c), jobs in self.buckets.items():
+                if slot_type != self.ANY and st != slot_type:
+                    continue
+                if company != self.ANY and c != company:
+                    continue
+                if job:
+                    # job__icontains=job OR job=''
+                    lists.extend(ids for name, ids in jobs.items() if not name or job in name)
+                else:
+                    lists.extend(jobs.values())
+            if len(self._pools) >= self.MAX_POOLS:
+                self._pools.clear()
+            pool = self._pools[key] = _Pool(lists)
+        return pool
+
+
+class QuestionIndex:
+    """(slot_type, company, job) 버킷별 질문 ID 인덱스"""
+
+    def __init__(self, ttl: int = 600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+
+    @property
+    def size(self) -> int:
+        return self._snapshot.size if self._snapshot else 0
+
+    # ── 구축/무효화 ─────────────────────────────────────────────────
+
+    def _is_stale(self, snapshot: Optional[_Snapshot]) -> bool:
+        if snapshot is None or time.time() - snapshot.built_at > self.ttl:
+            return True
+        return generation_cache().get(GENERATION_CACHE_KEY) != snapshot.generation
+
+    def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if not self._is_stale(snapshot):
+            return snapshot
+        with self._lock:
+            if self._is_stale(self._snapshot):
+                self._snapshot = self._build()
+            return self._snapshot
+
+    def _build(self) -> _Snapshot:
+        generation = generation_cache().get(GENERATION_CACHE_KEY)
+        buckets: Dict[Tuple[str, str], Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        rows = InterviewQuestion.objects.values_list('id', 'slot_type', 'company', 'job').order_by()
+        for pk, slot_type, company, job in rows.iterator(chunk_size=5000):
+            buckets[(slot_type, company or '')][normalize_job(job)].append(pk)
+        return _Snapshot({key: dict(jobs) for key, jobs in buckets.items()}, generation)
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+
+    # ── 샘플링 ─────────────────────────────────────────────────────
+
+    def sample(self, slot_type: Optional[str] = None, company: str = '', job: str = '',
+               limit: int = 10) -> List[int]:
+        """
+        search_questions()와 같은 규칙으로 ID를 고른다.
+          - company 지정 시 해당 기업 질문 우선 → 부족하면 범용(company='') 보충
+          - company 미지정 시 모든 기업 대상
+        """
+        snapshot = self._current()
+        slot_type = slot_type or _Snapshot.ANY
+        job = normalize_job(job)
+
+        if not company:
+            return snapshot.pool(slot_type, _Snapshot.ANY, job).sample(limit)
+        selected = snapshot.pool(slot_type, company, job).sample(limit)
+        remaining = limit - len(selected)
+        if remaining > 0:
+            selected += snapshot.pool(slot_type, '', job).sample(remaining)
+        return selected
+
+
+_index: Optional[QuestionIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_question_index() -> QuestionIndex:
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = QuestionIndex(ttl=getattr(settings, 'QUESTION_INDEX_TTL', 600))
+        return _index
+
+
+def invalidate_question_index():
+    """질문 뱅크가 바뀐 뒤 호출 (import_questions 등)"""
+    generation_cache().set(GENERATION_CACHE_KEY, time.time(), timeout=None)
+    if _index is not None:
+        _index.invalidate()
@@ -0,0 +1,218 @@
+"""
+tts_cache.py -- 면접관 음성(TTS) 내용 주소 캐시
+
+생성일: 2026-10-18
+설명: TTSSynthesizeView가 요청마다 OpenAI TTS를 호출하던 방식을 대체.
+      면접 종료 인사말처럼 여러 사용자에게 같은 문장이 반복되므로
+      sha256(model, voice, format, 정규화된 text)를 키로 한 번 합성한 오디오를 재사용한다.
+
+[계층]
+  1. 로컬 디스크 (TTS_CACHE_DIR) — LRU 크기 제한(TTS_CACHE_MAX_BYTES)
+     * 적중 시 mtime 갱신 → 상한 초과 시 mtime 오래된 파일부터 삭제 (상한의 90%까지)
+  2. 공유 스토리지 (선택, TTS_CACHE_STORAGE = settings.STORAGES 별칭. 예: django-storages S3)
+     * 로컬 미스 시 조회 → 있으면 로컬로 내려받아 이후는 디스크에서 서빙
+     * 워커/서버가 여러 대여도 한 번 합성한 문장은 다시 합성하지 않음
+  3. 미스 → synthesize() 호출 (같은 키 동시 요청은 1회만 합성)
+
+[키]
+  내용 주소이므로 ETag로 그대로 사용 (바이트가 바뀌면 키도 바뀜 → 무효화 불필요)
+"""
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import Counter
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+logger = logging.getLogger(__name__)
+
+TTS_MODEL = "tts-1"
+CONTENT_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav"}
+KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def normalize_text(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def tts_cache_key(text: str, voice: str, fmt: str, model: str = TTS_MODEL) -> str:
+    raw = "\x1f".join((model, voice, fmt, normalize_text(text)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024, storage=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.storage = storage
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._total: Optional[int] = None
+        self.stats = Counter()
+        os.makedirs(directory, exist_ok=True)
+
+    # ── 경로 ───────────────────────────────────────────────────────
+
+    def path(self, key: str, fmt: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.{fmt}")
+
+    @staticmethod
+    def storage_name(key: str, fmt: str) -> str:
+        return f"tts/{key[:2]}/{key}.{fmt}"
+
+    # ── 조회/저장 ───────────────────────────────────────────────────
+
+    def lookup(self, key: str, fmt: str) -> Optional[str]:
+        """로컬 → 공유 스토리지 순으로 찾아 로컬 파일 경로 반환 (없으면 None)"""
+        path = self.path(key, fmt)
+        try:
+            os.utime(path)  # LRU 순서 갱신
+            self.stats["disk_hits"] += 1
+            return path
+        except FileNotFoundError:
+            pass
+        if self.storage is not None:
+            name = self.storage_name(key, fmt)
+            try:
+                if self.storage.exists(name):
+                    with self.storage.open(name, "rb") as f:
+                        self._write_local(path, f.read())
+                    self.stats["storage_hits"] += 1
+                    return path
+            except Exception as e:
+                logger.warning(f"[TTSCache] 공유 스토리지 조회 실패: {e}")
+        return None
+
+    def get_or_synthesize(self, text: str, voice: str, fmt: str,
+                          synthesize: Callable[[], bytes]) -> Tuple[str, str, bool]:
+        """
+        Returns:
+            (key, 로컬 파일 경로, 캐시 적중 여부)
+        """
+        key = tts_cache_key(text, voice, fmt)
+        path = self.lookup(key, fmt)
+        if path:
+            return key, path, True
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                # 같은 문장을 먼저 합성한 요청이 있으면 그 결과 사용
+                path = self.lookup(key, fmt)
+                if path:
+                    return key, path, True
+                audio = synthesize()
+                self.stats["misses"] += 1
+                path = self.path(key, fmt)
+                self._write_local(path, audio)
+                self._upload(key, fmt, audio)
+        finally:
+            # 합성 실패(예외)여도 키별 락 항목을 남기지 않음
+            with self._lock:
+                self._key_locks.pop(key, None)
+        return key, path, False
+
+    def _upload(self, key: str, fmt: str, audio: bytes):
+        if self.storage is None:
+            return
+        name = self.storage_name(key, fmt)
+        try:
+            if not self.storage.exists(name):
+                self.storage.save(name, ContentFile(audio))
+        except Exception as e:
+            logger.warning(f"[TTSCache] 공유 스토리지 저장 실패: {e}")
+
+    def _write_local(self, path: str, audio: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(audio)
+        os.replace(tmp, path)  # 읽는 쪽이 반쯤 쓴 파일을 보지 않도록
+        with self._lock:
+            if self._total is None:
+                self._total = self._scan_total()
+            else:
+                self._total += len(audio)
+            over = self._total > self.max_bytes
+        if over:
+            self.evict()
+
+    # ── LRU 정리 ───────────────────────────────────────────────────
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def _scan_total(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """mtime이 오래된 파일부터 지워 상한의 90%까지 줄인다"""
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda e: e[2])
+            total = sum(size for _, size, _ in entries)
+            target = int(self.max_bytes * 0.9)
+            for path, size, _ in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    self.stats["evicted"] += 1
+                except FileNotFoundError:
+                    pass
+            self._total = total
+
+    def metrics(self) -> dict:
+        return {"bytes": self._total, "max_bytes": self.max_bytes,
+                "shared_storage": self.storage is not None, **self.stats}
+
+
+_cache: Optional[TTSCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            storage = None
+            alias = getattr(settings, "TTS_CACHE_STORAGE", "")
+            if alias:
+                from django.core.files.storage import storages
+                storage = storages[alias]
+            _cache = TTSCache(
+                directory=getattr(settings, "TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "coduck_tts_cache")),
+                max_bytes=getattr(settings, "TTS_CACHE_MAX_BYTES", 512 * 1024 * 1024),
+                storage=storage,
+            )
+        return _cache
+
+
+def synthesize_speech(text: str, voice: str, fmt: str) -> bytes:
+    """OpenAI TTS 호출 (캐시 미스 시에만)"""
+    from core.services.llm_client import get_openai_client
+
+    client = get_openai_client("interview.tts")
+    if client is None:
+        raise RuntimeError("OPENAI_API_KEY가 설정되지 않았습니다.")
+    response = client.audio.speech.create(
+        model=TTS_MODEL,
+        voice=voice,
+        input=normalize_text(text),
+        response_format=fmt,
+    )
+    return response.content
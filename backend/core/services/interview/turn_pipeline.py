@@ -0,0 +1,262 @@
+"""
+turn_pipeline.py -- 모의면접 한 턴 파이프라인 (증거 추출 + 다음 질문 초안 병렬 실행)
+
+생성일: 2026-10-18
+설명: _stream_answer는 L1 Analyst(LLM) → L2 Engine → L4 Interviewer(LLM)를 순서대로 실행해
+      첫 질문 토큰까지 LLM 두 번의 지연이 그대로 쌓였다.
+      L2 Engine은 규칙 기반이고 그 결과는 이번 답변의 증거가
+      "새 required 없음 / 일부 확인 / 전부 확인" 중 어느 쪽이냐에 의해서만 갈린다.
+      → 증거 추출(L1)과 동시에 세 가설로 L2를 미리 돌려 다음 질문 초안을 먼저 생성한다.
+
+[가설]
+  no_gain : 새 required evidence 없음 (missing 그대로 → continue면 의도도 그대로)
+  partial : 일부만 확인 (미확인 required가 2개 이상일 때만 존재)
+  clear   : required 전부 확인 → CLEAR
+  * move_slot의 다음 슬롯/의도는 현재 슬롯 증거와 무관 → 초안이 그대로 정답
+
+[흐름]
+  start()
+    - extract_evidence를 전용 스레드 풀(get_evidence_executor)에서 시작
+      * 초안 생성과 같은 풀을 쓰면 동시 세션이 많을 때 추측성 초안이 워커를 모두 차지해
+        정작 기다려야 하는 증거 추출이 큐에서 밀린다
+    - 세 가설의 결과 키(슬롯, 의도, 전환 여부, 시도 횟수 / finish)가 모두 같으면 action 확정
+      → 증거 추출을 기다리지 않고 바로 종료 인사말 또는 질문 스트리밍 (decided)
+    - 아니면 no_gain / clear 가설의 질문 초안을 최대 INTERVIEW_SPECULATIVE_DRAFTS개 미리 생성
+  outcome()          → 실제 증거로 L2 결과 계산 (session은 변경하지 않음)
+  question_tokens()  → 키가 같은 초안이 있으면 채택(버퍼된 토큰부터), 나머지 초안은 취소
+"""
+import copy
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
+
+from core.services.interview.analyst import extract_evidence
+from core.services.interview.humanizer import build_context
+from core.services.interview.interviewer import generate_question
+from core.services.interview.planner import decide_intent
+from core.services.interview.state_engine import StateEngine
+
+logger = logging.getLogger(__name__)
+
+engine = StateEngine()
+_END = object()
+
+
+class TurnOutcome:
+    """답변 증거를 반영한 L2 Engine 결과. state는 slot_states/current_slot이 갱신된 session 사본"""
+
+    def __init__(self, state, evidence_map: dict, slot_status_after: str, action: str):
+        self.state = state
+        self.evidence_map = evidence_map
+        self.slot_status_after = slot_status_after
+        self.action = action
+
+    @property
+    def intent(self) -> str:
+        missing = self.state.slot_states.get(self.state.current_slot, {}).get('missing_required', [])
+        return decide_intent(missing, self.state.question_history)['intent']
+
+    @property
+    def key(self) -> tuple:
+        """다음 질문을 결정하는 입력 — 키가 같으면 같은 초안을 쓸 수 있다"""
+        if self.action == 'finish':
+            return ('finish',)
+        slot = self.state.current_slot
+        attempt_count = self.state.slot_states.get(slot, {}).get('attempt_count', 1)
+        return (slot, self.intent, self.state.just_moved_slot, attempt_count)
+
+
+def advance(session, evidence_map: dict) -> TurnOutcome:
+    """
+    L2 Engine: 증거 병합 → 슬롯 상태 갱신 → 행동 결정 → (move_slot이면) 다음 슬롯 이동.
+    session 사본에 적용하므로 가설 계산에도 그대로 사용한다.
+    이동할 슬롯이 없으면 action은 finish.
+    """
+    state = copy.copy(session)
+    state.slot_states = copy.deepcopy(session.slot_states)
+    current_slot = session.current_slot
+    current_slot_state = state.slot_states.get(current_slot, {})
+    required = state.get_slot_required(current_slot)
+
+    # 기존 evidence와 병합 (True는 유지, False는 덮어쓰기 안 함)
+    existing_evidence = current_slot_state.get('evidence', {})
+    merged_evidence = {k: existing_evidence.get(k, False) or evidence_map.get(k, False)
+                       for k in set(existing_evidence) | set(evidence_map)}
+
+    # 새 required evidence 증가 여부 감지
+    existing_confirmed_count = sum(1 for k in required if existing_evidence.get(k))
+    new_confirmed_count = sum(1 for k in required if merged_evidence.get(k))
+    no_gain = (new_confirmed_count <= existing_confirmed_count)
+    prev_no_gain = current_slot_state.get('consecutive_no_gain', 0)
+
+    slot_state = state.slot_states[current_slot]
+    slot_state['evidence'] = merged_evidence
+    slot_state['attempt_count'] = current_slot_state.get('attempt_count', 0) + 1
+    slot_state['consecutive_no_gain'] = prev_no_gain + 1 if no_gain else 0
+
+    update_result = engine.update_slot(current_slot, merged_evidence, required)
+    slot_state['status'] = update_result['status']
+    slot_state['confirmed_required'] = update_result['confirmed_required']
+    slot_state['missing_required'] = update_result['missing_required']
+
+    action = engine.decide_action(state)
+    if action != 'continue' and update_result['status'] != 'CLEAR':
+        engine.mark_uncertain(state, current_slot)
+    if action == 'move_slot':
+        next_slot = engine.move_to_next_slot(state)
+        if next_slot:
+            state.current_slot = next_slot
+            state.just_moved_slot = True
+        else:
+            action = 'finish'  # 이동할 슬롯 없음
+    elif action == 'continue':
+        state.just_moved_slot = False
+
+    return TurnOutcome(state, evidence_map, update_result['status'], action)
+
+
+class QuestionDraft:
+    """generate_question 스트림을 백그라운드 스레드에서 미리 받아 두는 질문 초안"""
+
+    def __init__(self, executor: ThreadPoolExecutor, intent: str, ctx: dict,
+                 previous_answer: str, conversation_history: list):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._cancelled = threading.Event()
+        executor.submit(self._run, intent, ctx, previous_answer, conversation_history)
+
+    def _run(self, intent, ctx, previous_answer, conversation_history):
+        stream = generate_question(intent, ctx, previous_answer=previous_answer,
+                                   conversation_history=conversation_history)
+        try:
+            for token in stream:
+                if self._cancelled.is_set():
+                    break
+                self._queue.put(token)
+        except Exception as e:
+            logger.warning(f"[TurnPipeline] 질문 초안 생성 오류: {e}")
+        finally:
+            stream.close()  # 취소 시 LLM 스트림 즉시 반납
+            self._queue.put(_END)
+
+    def tokens(self) -> Iterator[str]:
+        while True:
+            token = self._queue.get()
+            if token is _END:
+                return
+            yield token
+
+    def cancel(self):
+        self._cancelled.set()
+
+
+class TurnPipeline:
+    """
+    한 턴의 L1/L2/L4 병렬 실행기.
+
+    Attributes:
+        decided: 증거와 무관하게 확정된 결과 (없으면 None). action이 finish면 종료 인사말을 바로 보낼 수 있다.
+    """
+
+    def __init__(self, session, answer: str, conversation_history: list,
+                 executor: Optional[ThreadPoolExecutor] = None, max_drafts: Optional[int] = None,
+                 evidence_executor: Optional[ThreadPoolExecutor] = None):
+        self.session = session
+        self.answer = answer
+        self.conversation_history = conversation_history
+        self.executor = executor or get_turn_executor()
+        self.evidence_executor = evidence_executor or get_evidence_executor()
+        self.max_drafts = getattr(settings, 'INTERVIEW_SPECULATIVE_DRAFTS', 2) if max_drafts is None else max_drafts
+        self.decided: Optional[TurnOutcome] = None
+        self._evidence = None
+        self._drafts: Dict[tuple, QuestionDraft] = {}
+
+    def _hypotheses(self) -> List[Optional[dict]]:
+        """[no_gain, partial, clear] 가설 evidence_map (partial이 불가능하면 None)"""
+        slot_state = self.session.slot_states.get(self.session.current_slot, {})
+        existing = slot_state.get('evidence', {})
+        required = self.session.get_slot_required(self.session.current_slot)
+        missing = [k for k in required if not existing.get(k)]
+        partial = {missing[0]: True} if len(missing) >= 2 else None
+        return [{}, partial, {k: True for k in required}]
+
+    def start(self):
+        current_slot_state = self.session.slot_states.get(self.session.current_slot, {})
+        evidence_keys = list(current_slot_state.get('evidence', {}).keys())
+        self._evidence = self.evidence_executor.submit(extract_evidence, self.answer, evidence_keys)
+
+        no_gain, partial, clear = [
+            advance(self.session, ev) if ev is not None else None for ev in self._hypotheses()
+        ]
+        # partial 가설이 continue면 어떤 키가 확인될지에 따라 의도가 달라지므로 확정 불가
+        partial_open = partial is not None and partial.action == 'continue'
+        keys = {o.key for o in (no_gain, partial, clear) if o is not None}
+        if len(keys) == 1 and not partial_open:
+            self.decided = no_gain
+
+        for outcome in (no_gain, clear):
+            if len(self._drafts) >= self.max_drafts:
+                break
+            if outcome.action != 'finish' and outcome.key not in self._drafts:
+                self._drafts[outcome.key] = QuestionDraft(
+                    self.executor, outcome.intent, self._context(outcome),
+                    self.answer, self.conversation_history,
+                )
+        return self
+
+    def outcome(self) -> TurnOutcome:
+        """L1 증거 추출 완료를 기다려 실제 결과 계산"""
+        return advance(self.session, self._evidence.result())
+
+    @staticmethod
+    def _context(outcome: TurnOutcome) -> dict:
+        return build_context(outcome.state, outcome.state.get_current_slot_plan())
+
+    def question_tokens(self, outcome: TurnOutcome) -> Iterator[str]:
+        """결과에 맞는 초안이 있으면 채택, 없으면 새로 생성해 토큰 스트리밍"""
+        draft = self._drafts.pop(outcome.key, None)
+        self.close()
+        if draft is not None:
+            yield from draft.tokens()
+            return
+        yield from generate_question(outcome.intent, self._context(outcome), previous_answer=self.answer,
+                                     conversation_history=self.conversation_history)
+
+    def close(self):
+        """채택되지 않은 초안 취소"""
+        for draft in self._drafts.values():
+            draft.cancel()
+        self._drafts.clear()
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_evidence_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_turn_executor() -> ThreadPoolExecutor:
+    """질문 초안(추측 실행) 전용 풀"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'INTERVIEW_PIPELINE_WORKERS', 16),
+                thread_name_prefix='interview-turn',
+            )
+        return _executor
+
+
+
+def get_evidence_executor() -> ThreadPoolExecutor:
+    """증거 추출(L1, 턴의 임계 경로) 전용 풀 — 초안이 밀려 있어도 바로 실행된다"""
+    global _evidence_executor
+    with _executor_lock:
+        if _evidence_executor is None:
+            _evidence_executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'INTERVIEW_EVIDENCE_WORKERS', 8),
+                thread_name_prefix='interview-evidence',
+            )
+        return _evidence_executor
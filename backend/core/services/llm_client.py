@@ -0,0 +1,507 @@
+"""
+llm_client.py — 프로세스 공용 OpenAI 클라이언트 계층
+수정일: 2026-10-18
+
+[배경]
+OpenAI 클라이언트를 호출/요청/인스턴스마다 새로 만들면서 (architecture_view, ArchEvaluator,
+job_planner, tts_view, interview 서비스 등) 부하가 몰리면 TLS 연결이 수백 개 열리고,
+429가 터지면 SDK 재시도가 겹쳐 연쇄 타임아웃이 발생했다.
+
+[구조]
+    get_openai_client("호출 위치")        → 동기 openai.OpenAI (프로세스 전체 1개의 HTTP 연결 풀 공유)
+    get_async_openai_client("호출 위치")  → openai.AsyncOpenAI (이벤트 루프별 1개의 연결 풀 공유)
+
+두 클라이언트 모두 HTTP 전송 계층(_GatewayTransport)을 거치며, 여기서 일괄 처리한다.
+- 모델별 동시 호출 상한 + 토큰 버킷(분당 요청 수). 대기가 LLM_QUEUE_TIMEOUT을 넘으면
+  로컬에서 429를 반환 → 호출부는 기존과 같이 openai.RateLimitError로 처리
+- 재시도: 429/5xx에 대해 지수 백오프(Retry-After 우선). 프로세스 전체 재시도 예산
+  (요청 1건당 LLM_RETRY_BUDGET_RATIO 적립, 재시도 1회당 1 차감)을 넘으면 즉시 실패 → 재시도 폭주 방지
+  (SDK 자체 재시도는 끄고 이 계층에서만 재시도)
+- 호출 위치(call site) × 모델별 지연시간/토큰/에러 지표 (get_llm_metrics)
+  호출 위치는 내부 헤더로 전달되며 OpenAI로 보내기 전에 제거한다.
+
+설정 (settings):
+    OPENAI_BASE_URL, LLM_HTTP_MAX_CONNECTIONS, LLM_HTTP_MAX_KEEPALIVE,
+    LLM_MODEL_LIMITS, LLM_QUEUE_TIMEOUT, LLM_MAX_RETRIES, LLM_RETRY_BUDGET_RATIO
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
+from typing import Dict, Optional
+
+from django.conf import settings
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+if openai is not None and hasattr(openai, "DefaultHttpx2Client"):
+    # openai 3.x는 httpx2 기반
+    import httpx2 as httpx
+    _default_http_client = openai.DefaultHttpx2Client
+    _default_async_http_client = openai.DefaultAsyncHttpx2Client
+else:
+    import httpx
+    _default_http_client = getattr(openai, "DefaultHttpxClient", httpx.Client)
+    _default_async_http_client = getattr(openai, "DefaultAsyncHttpxClient", httpx.AsyncClient)
+
+logger = logging.getLogger(__name__)
+
+CALL_SITE_HEADER = "x-coduck-call-site"
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+DEFAULT_MODEL_LIMIT = {"concurrency": 32, "rpm": 3000}
+
+
+# ============================================================================
+# 동시성 / 속도 제한
+# ============================================================================
+
+class _ModelLimiter:
+    """모델별 동시 호출 상한 + 토큰 버킷. 스레드와 이벤트 루프 양쪽에서 공유한다."""
+
+    def __init__(self, concurrency: int, rpm: int):
+        self.concurrency = concurrency
+        self.rate = rpm / 60.0
+        self.capacity = float(max(1, min(rpm, concurrency)))  # 순간 허용량
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._active = 0
+        self._cond = threading.Condition()
+
+    def _try_acquire(self) -> float:
+        """획득하면 0, 아니면 다시 시도할 때까지의 대기 시간(초)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._active >= self.concurrency:
+            return 0.05
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+        self._tokens -= 1
+        self._active += 1
+        return 0.0
+
+    def acquire(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                wait = self._try_acquire()
+                if wait == 0:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(min(wait, remaining))
+
+    async def aacquire(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                wait = self._try_acquire()
+            if wait == 0:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(wait, remaining, 0.05))
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+
+class RetryBudget:
+    """요청마다 ratio만큼 적립, 재시도 1회에 1 차감 (최소 min_tokens는 항상 허용)"""
+
+    def __init__(self, ratio: float = 0.1, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+# ============================================================================
+# 지표
+# ============================================================================
+
+class LLMMetrics:
+    """(호출 위치, 모델)별 호출 수/에러/재시도/지연시간/토큰"""
+
+    def __init__(self, window: int = 512):
+        self._lock = threading.Lock()
+        self._window = window
+        self._stats = defaultdict(lambda: {
+            "calls": 0, "errors": 0, "retries": 0, "rejected": 0,
+            "prompt_tokens": 0, "completion_tokens": 0,
+            "latencies": deque(maxlen=self._window),
+        })
+
+    def record(self, call_site: str, model: str, latency: float, status: Optional[int],
+               retries: int = 0, usage: Optional[dict] = None, rejected: bool = False):
+        with self._lock:
+            s = self._stats[(call_site, model)]
+            s["calls"] += 1
+            s["retries"] += retries
+            if rejected:
+                s["rejected"] += 1
+            if status is None or status >= 400:
+                s["errors"] += 1
+            if usage:
+                s["prompt_tokens"] += usage.get("prompt_tokens", 0) or 0
+                s["completion_tokens"] += usage.get("completion_tokens", 0) or 0
+            s["latencies"].append(latency)
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            result = {}
+            for (call_site, model), s in self._stats.items():
+                lat = sorted(s["latencies"])
+                result[f"{call_site}:{model}"] = {
+                    **{k: v for k, v in s.items() if k != "latencies"},
+                    "p50_ms": round(lat[len(lat) // 2] * 1000, 1) if lat else None,
+                    "p95_ms": round(lat[max(0, int(len(lat) * 0.95) - 1)] * 1000, 1) if lat else None,
+                }
+            return result
+
+
+# ============================================================================
+# HTTP 전송 계층
+# ============================================================================
+
+def _model_of(request) -> str:
+    try:
+        return json.loads(request.content).get("model") or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def _backoff(response, attempt: int) -> float:
+    retry_after = response.headers.get("retry-after")
+    try:
+        if retry_after is not None:
+            return min(float(retry_after), 20.0)
+    except ValueError:
+        pass
+    return min(0.5 * (2 ** (attempt - 1)), 8.0) * (0.5 + random.random() / 2)
+
+
+def _local_rate_limited(request, model: str):
+    return httpx.Response(
+        429,
+        json={"error": {
+            "message": f"로컬 LLM 동시 호출 상한 초과 ({model}) — 잠시 후 다시 시도해 주세요.",
+            "type": "rate_limit_exceeded", "code": "local_rate_limit",
+        }},
+        request=request,
+    )
+
+
+class _CallRecorder:
+    """응답 스트림을 닫을 때 동시성 슬롯을 반납하고 지표를 기록"""
+
+    def __init__(self, gateway, limiter, call_site, model, started, retries, response):
+        self.gateway = gateway
+        self.limiter = limiter
+        self.call_site = call_site
+        self.model = model
+        self.started = started
+        self.retries = retries
+        self.status = response.status_code
+        self.headers = response.headers
+        # 스트리밍(SSE)이 아닌 JSON 응답만 usage를 파싱
+        self.capture = "application/json" in response.headers.get("content-type", "")
+        self.chunks = []
+        self.closed = False
+
+    def feed(self, chunk: bytes):
+        if self.capture:
+            self.chunks.append(chunk)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.limiter.release()
+        usage = None
+        if self.chunks:
+            try:
+                body = httpx.Response(self.status, headers=self.headers, content=b"".join(self.chunks)).json()
+                usage = body.get("usage") if isinstance(body, dict) else None
+            except Exception:
+                pass
+        self.gateway.metrics.record(
+            self.call_site, self.model, time.monotonic() - self.started, self.status,
+            retries=self.retries, usage=usage,
+        )
+
+
+class _RecordingStream(httpx.SyncByteStream):
+    def __init__(self, inner, recorder: _CallRecorder):
+        self.inner = inner
+        self.recorder = recorder
+
+    def __iter__(self):
+        for chunk in self.inner:
+            self.recorder.feed(chunk)
+            yield chunk
+
+    def close(self):
+        try:
+            self.inner.close()
+        finally:
+            self.recorder.close()
+
+
+class _AsyncRecordingStream(httpx.AsyncByteStream):
+    def __init__(self, inner, recorder: _CallRecorder):
+        self.inner = inner
+        self.recorder = recorder
+
+    async def __aiter__(self):
+        async for chunk in self.inner:
+            self.recorder.feed(chunk)
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self.inner.aclose()
+        finally:
+            self.recorder.close()
+
+
+class _GatewayTransportMixin:
+    def _prepare(self, request):
+        call_site = request.headers.get(CALL_SITE_HEADER, "default")
+        if CALL_SITE_HEADER in request.headers:
+            del request.headers[CALL_SITE_HEADER]
+        model = _model_of(request)
+        self.gateway.retry_budget.deposit()
+        return call_site, model, self.gateway.limiter(model)
+
+    def _should_retry(self, request, response, attempt: int) -> bool:
+        return (
+            response.status_code in RETRYABLE_STATUS
+            and attempt < self.gateway.max_retries
+            and isinstance(request.stream, httpx.ByteStream)  # 본문을 다시 보낼 수 있는 요청만
+            and self.gateway.retry_budget.withdraw()
+        )
+
+    def _rejected(self, request, call_site, model, started, attempt):
+        self.gateway.metrics.record(call_site, model, time.monotonic() - started, 429,
+                                    retries=attempt, rejected=True)
+        return _local_rate_limited(request, model)
+
+    def _wrap(self, request, response, stream_cls, limiter, call_site, model, started, attempt):
+        recorder = _CallRecorder(self.gateway, limiter, call_site, model, started, attempt, response)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=stream_cls(response.stream, recorder),
+            extensions=response.extensions,
+            request=request,
+        )
+
+
+class _GatewayTransport(_GatewayTransportMixin, httpx.BaseTransport):
+    def __init__(self, gateway: "LLMClientPool", inner):
+        self.gateway = gateway
+        self.inner = inner
+
+    def handle_request(self, request):
+        call_site, model, limiter = self._prepare(request)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            if not limiter.acquire(self.gateway.queue_timeout):
+                return self._rejected(request, call_site, model, started, attempt)
+            try:
+                response = self.inner.handle_request(request)
+            except BaseException:
+                limiter.release()
+                self.gateway.metrics.record(call_site, model, time.monotonic() - started, None, retries=attempt)
+                raise
+            if self._should_retry(request, response, attempt):
+                response.close()
+                limiter.release()
+                attempt += 1
+                time.sleep(_backoff(response, attempt))
+                continue
+            return self._wrap(request, response, _RecordingStream, limiter, call_site, model, started, attempt)
+
+    def close(self):
+        self.inner.close()
+
+
+class _AsyncGatewayTransport(_GatewayTransportMixin, httpx.AsyncBaseTransport):
+    def __init__(self, gateway: "LLMClientPool", inner):
+        self.gateway = gateway
+        self.inner = inner
+
+    async def handle_async_request(self, request):
+        call_site, model, limiter = self._prepare(request)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            if not await limiter.aacquire(self.gateway.queue_timeout):
+                return self._rejected(request, call_site, model, started, attempt)
+            try:
+                response = await self.inner.handle_async_request(request)
+            except BaseException:
+                # 취소(CancelledError) 포함 — 슬롯은 반드시 반납
+                limiter.release()
+                self.gateway.metrics.record(call_site, model, time.monotonic() - started, None, retries=attempt)
+                raise
+            if self._should_retry(request, response, attempt):
+                await response.aclose()
+                limiter.release()
+                attempt += 1
+                await asyncio.sleep(_backoff(response, attempt))
+                continue
+            return self._wrap(request, response, _AsyncRecordingStream, limiter, call_site, model, started, attempt)
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+
+# ============================================================================
+# 클라이언트 풀
+# ============================================================================
+
+class LLMClientPool:
+    """공용 연결 풀 + 모델별 제한 + 재시도 예산 + 지표"""
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 model_limits: Optional[dict] = None, max_connections: int = 100,
+                 max_keepalive: int = 20, queue_timeout: float = 30.0, max_retries: int = 3,
+                 retry_budget_ratio: float = 0.1, timeout: float = 60.0):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.model_limits = model_limits or {}
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.queue_timeout = queue_timeout
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.retry_budget = RetryBudget(ratio=retry_budget_ratio)
+        self.metrics = LLMMetrics()
+        self._limiters: Dict[str, _ModelLimiter] = {}
+        self._lock = threading.Lock()
+        self._sync_client = None
+        self._sync_sites: Dict[str, object] = {}
+        # 이벤트 루프별 AsyncOpenAI (httpx 비동기 연결 풀은 생성된 루프에 묶임)
+        self._async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def limiter(self, model: str) -> _ModelLimiter:
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(model)
+                if limiter is None:
+                    conf = {**DEFAULT_MODEL_LIMIT, **self.model_limits.get(model, {})}
+                    limiter = self._limiters[model] = _ModelLimiter(conf["concurrency"], conf["rpm"])
+        return limiter
+
+    def _limits(self):
+        return httpx.Limits(max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_keepalive)
+
+    def _client_kwargs(self) -> dict:
+        kwargs = {"api_key": self.api_key, "max_retries": 0, "timeout": self.timeout}
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        return kwargs
+
+    def client(self, call_site: str = "default"):
+        """동기 OpenAI 클라이언트 (호출 위치별 헤더만 다른 얕은 복사본, 연결 풀은 공유)"""
+        with self._lock:
+            if self._sync_client is None:
+                http_client = _default_http_client(
+                    transport=_GatewayTransport(self, httpx.HTTPTransport(limits=self._limits())),
+                )
+                self._sync_client = openai.OpenAI(http_client=http_client, **self._client_kwargs())
+            site_client = self._sync_sites.get(call_site)
+            if site_client is None:
+                site_client = self._sync_sites[call_site] = self._sync_client.with_options(
+                    default_headers={CALL_SITE_HEADER: call_site},
+                )
+            return site_client
+
+    def async_client(self, call_site: str = "default"):
+        """현재 이벤트 루프용 AsyncOpenAI 클라이언트"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._async_clients.get(loop)
+            if entry is None:
+                http_client = _default_async_http_client(
+                    transport=_AsyncGatewayTransport(self, httpx.AsyncHTTPTransport(limits=self._limits())),
+                )
+                base = openai.AsyncOpenAI(http_client=http_client, **self._client_kwargs())
+                entry = self._async_clients[loop] = (base, {})
+            base, sites = entry
+            site_client = sites.get(call_site)
+            if site_client is None:
+                site_client = sites[call_site] = base.with_options(
+                    default_headers={CALL_SITE_HEADER: call_site},
+                )
+            return site_client
+
+
+_pool: Optional[LLMClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_llm_client_pool() -> Optional[LLMClientPool]:
+    """OpenAI SDK 또는 API 키가 없으면 None"""
+    global _pool
+    api_key = getattr(settings, "OPENAI_API_KEY", None) or os.environ.get("OPENAI_API_KEY")
+    if openai is None or not api_key:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = LLMClientPool(
+                api_key=api_key,
+                base_url=getattr(settings, "OPENAI_BASE_URL", None) or None,
+                model_limits=getattr(settings, "LLM_MODEL_LIMITS", {}),
+                max_connections=getattr(settings, "LLM_HTTP_MAX_CONNECTIONS", 100),
+                max_keepalive=getattr(settings, "LLM_HTTP_MAX_KEEPALIVE", 20),
+                queue_timeout=getattr(settings, "LLM_QUEUE_TIMEOUT", 30),
+                max_retries=getattr(settings, "LLM_MAX_RETRIES", 3),
+                retry_budget_ratio=getattr(settings, "LLM_RETRY_BUDGET_RATIO", 0.1),
+            )
+        return _pool
+
+
+def get_openai_client(call_site: str = "default"):
+    """공용 동기 OpenAI 클라이언트. 사용할 수 없으면 None"""
+    pool = get_llm_client_pool()
+    return pool.client(call_site) if pool else None
+
+
+def get_async_openai_client(call_site: str = "default"):
+    """공용 AsyncOpenAI 클라이언트 (실행 중인 이벤트 루프 안에서 호출). 사용할 수 없으면 None"""
+    pool = get_llm_client_pool()
+    return pool.async_client(call_site) if pool else None
+
+
+def get_llm_metrics() -> Dict[str, dict]:
+    return _pool.metrics.snapshot() if _pool else {}
@@ -0,0 +1,283 @@
+"""
+pdf_ingest.py — PDF 서류 수집 파이프라인 (한 번 디코드 + 페이지 단위 병렬 렌더링/Vision + 캐시)
+생성일: 2026-10-18
+
+[배경]
+JobPlannerParseResumeView는 서류마다 같은 base64를 여러 번 디코드하고(pdfplumber 텍스트, PyMuPDF 렌더),
+모든 페이지를 2배 해상도로 직렬 렌더링해 base64 JPEG을 메모리에 쌓은 뒤 gpt-4o 한 번에 보냈다.
+이력서 + 자기소개서 + 포트폴리오를 함께 올리면 30~60초, 요청당 수백 MB RSS.
+
+[흐름]
+  open_pdf(pdf_base64)     : data URL/base64 → bytes 1회 디코드, PyMuPDF로 페이지별 텍스트 추출
+  PdfDocument.render()     : 텍스트가 부족한 페이지(스캔본/이미지)만 JPEG 렌더링
+      * 긴 변이 MAX_IMAGE_SIDE px를 넘지 않도록 배율 자동 조정 (작은 페이지는 최대 MAX_ZOOM배)
+      * INLINE_PAGES보다 많으면 프로세스 풀에서 페이지 묶음 단위로 병렬 렌더링 (요청 프로세스 RSS 절감)
+  vision_extract()         : 렌더링된 페이지마다 Vision 호출을 동시에 실행
+  combine_partial_profiles(): 페이지별 부분 결과 → 서류 단위 결과 (이후 _merge_results)
+
+[캐시]  Django 캐시 'documents' 별칭 (없으면 캐시 없이 동작)
+  pdf:<PDF sha256>:text                 — 페이지별 텍스트
+  pdf:<PDF sha256>:<page>:img:<버전>     — 렌더링된 JPEG
+  pdf:<PDF sha256>:<page>:vision:<태그>  — 페이지 Vision 결과
+  같은 파일을 다시 올리면(부분 업데이트, 재시도) 디코드 외 작업 없이 결과를 재사용한다.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGES = 10
+PAGE_MIN_TEXT_CHARS = 50     # 이보다 텍스트가 적은 페이지는 이미지로 처리
+MAX_IMAGE_SIDE = 1600        # Vision 고해상도 처리 한도(2048) 안쪽으로 축소
+MAX_ZOOM = 2.0
+JPEG_QUALITY = 80
+INLINE_PAGES = 2             # 이하이면 프로세스 풀 없이 현재 스레드에서 렌더링
+RENDER_VERSION = f"{MAX_IMAGE_SIDE}-{MAX_ZOOM}-{JPEG_QUALITY}"
+CACHE_ALIAS = "documents"
+CACHE_TTL = 24 * 60 * 60
+
+
+def _cache():
+    try:
+        return caches[getattr(settings, "PDF_INGEST_CACHE_ALIAS", CACHE_ALIAS)]
+    except InvalidCacheBackendError:
+        return None
+
+
+def _cache_get(key: str):
+    cache = _cache()
+    return cache.get(key) if cache is not None else None
+
+
+def _cache_set(key: str, value):
+    cache = _cache()
+    if cache is not None:
+        try:
+            cache.set(key, value, timeout=getattr(settings, "PDF_INGEST_CACHE_TTL", CACHE_TTL))
+        except Exception as e:
+            logger.warning(f"[PdfIngest] 캐시 저장 실패: {e}")
+
+
+# ──────────────────────────────────────────────
+# 프로세스 풀 작업 (모듈 최상위 함수여야 pickle 가능)
+# ──────────────────────────────────────────────
+
+def _render_pages(pdf_bytes: bytes, indices: List[int]) -> Dict[int, bytes]:
+    import fitz
+
+    images = {}
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for i in indices:
+            page = doc[i]
+            zoom = min(MAX_ZOOM, MAX_IMAGE_SIDE / max(page.rect.width, page.rect.height, 1))
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+            images[i] = pix.tobytes("jpeg", jpg_quality=JPEG_QUALITY)
+    return images
+
+
+def _extract_texts(pdf_bytes: bytes, max_pages: int) -> List[str]:
+    import fitz
+
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return [doc[i].get_text("text", sort=True).strip() for i in range(min(len(doc), max_pages))]
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """렌더링 프로세스 풀 (spawn: 요청 스레드가 도는 서버 프로세스를 fork하지 않음)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=getattr(settings, "PDF_RENDER_WORKERS", 2),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _reset_render_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+# ──────────────────────────────────────────────
+# 문서
+# ──────────────────────────────────────────────
+
+@dataclass
+class PdfPage:
+    index: int
+    text: str
+    image: Optional[bytes] = None  # JPEG (render() 후)
+
+    @property
+    def text_poor(self) -> bool:
+        return len(self.text) < PAGE_MIN_TEXT_CHARS
+
+    def data_url(self) -> str:
+        return f"data:image/jpeg;base64,{base64.b64encode(self.image).decode()}"
+
+
+@dataclass
+class PdfDocument:
+    digest: str
+    data: bytes = field(repr=False)
+    pages: List[PdfPage]
+
+    @property
+    def text(self) -> str:
+        return "\n".join(page.text for page in self.pages).strip()
+
+    def key(self, *parts) -> str:
+        return ":".join(("pdf", self.digest) + tuple(str(p) for p in parts))
+
+    def render(self, pages: Optional[List[PdfPage]] = None) -> List[PdfPage]:
+        """
+        페이지 이미지 렌더링 (기본: 텍스트가 부족한 페이지만)
+        Returns:
+            이미지가 채워진 페이지 목록
+        """
+        targets = [p for p in self.pages if p.text_poor] if pages is None else pages
+        missing = []
+        for page in targets:
+            if page.image is None:
+                page.image = _cache_get(self.key(page.index, "img", RENDER_VERSION))
+            if page.image is None:
+                missing.append(page.index)
+        if missing:
+            for index, image in self._render(missing).items():
+                self.pages[index].image = image
+                _cache_set(self.key(index, "img", RENDER_VERSION), image)
+        return [p for p in targets if p.image]
+
+    def _render(self, indices: List[int]) -> Dict[int, bytes]:
+        if len(indices) <= INLINE_PAGES:
+            return _render_pages(self.data, indices)
+        pool = get_render_pool()
+        workers = getattr(settings, "PDF_RENDER_WORKERS", 2)
+        chunks = [indices[i::workers] for i in range(workers) if indices[i::workers]]
+        try:
+            images = {}
+            for part in pool.map(_render_pages, [self.data] * len(chunks), chunks):
+                images.update(part)
+            return images
+        except BrokenProcessPool:
+            logger.warning("[PdfIngest] 렌더링 프로세스 풀 비정상 종료 → 재생성 후 현재 스레드에서 렌더링")
+            _reset_render_pool()
+            return _render_pages(self.data, indices)
+
+
+def decode_pdf(pdf_base64: str) -> bytes:
+    """'data:application/pdf;base64,...' 또는 순수 base64 → bytes"""
+    return base64.b64decode(pdf_base64.split(',')[-1])
+
+
+def open_pdf(pdf_base64: str, max_pages: int = MAX_PAGES) -> PdfDocument:
+    """한 번만 디코드하고 페이지별 텍스트를 추출 (캐시 적중 시 PDF 파싱 생략)"""
+    data = decode_pdf(pdf_base64)
+    digest = hashlib.sha256(data).hexdigest()
+    text_key = f"pdf:{digest}:text:{max_pages}"
+    texts = _cache_get(text_key)
+    if texts is None:
+        texts = _extract_texts(data, max_pages)
+        _cache_set(text_key, texts)
+    return PdfDocument(digest, data, [PdfPage(i, text) for i, text in enumerate(texts)])
+
+
+# ──────────────────────────────────────────────
+# Vision / 결과 합치기
+# ──────────────────────────────────────────────
+
+def parse_json_response(raw: str) -> dict:
+    """코드 블록(```json)으로 감싼 응답도 파싱"""
+    if '```json' in raw:
+        raw = raw.split('```json')[1].split('```')[0].strip()
+    elif '```' in raw:
+        raw = raw.split('```')[1].split('```')[0].strip()
+    return json.loads(raw)
+
+
+def vision_extract(doc: PdfDocument, pages: List[PdfPage], prompt: str, call_site: str, tag: str,
+                   max_tokens: int = 2000) -> List[dict]:
+    """
+    페이지마다 Vision 호출을 동시에 실행 (페이지 결과는 캐시).
+    tag는 프롬프트 종류 — 프롬프트를 바꾸면 태그도 바꿔 캐시를 무효화할 것.
+    """
+    from core.services.llm_client import get_openai_client
+
+    total = len(doc.pages)
+
+    def extract(page: PdfPage) -> dict:
+        key = doc.key(page.index, "vision", tag)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        client = get_openai_client(call_site)
+        response = client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": [
+                {"type": "text", "text": f"{prompt}\n\n(문서 {total}페이지 중 {page.index + 1}페이지입니다. 이 페이지에 있는 정보만 추출하세요.)"},
+                {"type": "image_url", "image_url": {"url": page.data_url()}},
+            ]}],
+            max_tokens=max_tokens,
+            temperature=0.1,
+        )
+        result = parse_json_response(response.choices[0].message.content)
+        _cache_set(key, result)
+        return result
+
+    if not pages:
+        return []
+    concurrency = getattr(settings, "PDF_VISION_CONCURRENCY", 4)
+    results = []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(pages))) as executor:
+        for page, future in [(p, executor.submit(extract, p)) for p in pages]:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"[PdfIngest] {page.index + 1}페이지 Vision 실패: {e}")
+    return results
+
+
+def combine_partial_profiles(parts: List[dict]) -> dict:
+    """
+    페이지별 부분 결과를 하나로 합친다 (LLM 없음).
+    - 목록: 페이지 순서대로 이어 붙이고 중복 제거
+    - 그 외 값: 처음 나온 비어 있지 않은 값
+    """
+    combined: dict = {}
+    seen: Dict[str, set] = {}
+    for part in parts:
+        for key, value in (part or {}).items():
+            if isinstance(value, list):
+                bucket = combined.setdefault(key, [])
+                marks = seen.setdefault(key, set())
+                for item in value:
+                    mark = json.dumps(item, ensure_ascii=False, sort_keys=True)
+                    if mark not in marks:
+                        marks.add(mark)
+                        bucket.append(item)
+            elif value not in (None, "", {}) and combined.get(key) in (None, "", {}):
+                combined[key] = value
+            else:
+                combined.setdefault(key, value)
+    return combined
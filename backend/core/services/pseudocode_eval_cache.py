@@ -0,0 +1,296 @@
+"""
+의사코드 LLM 평가 캐시 & 동시 요청 병합
+수정일: 2026-10-18
+
+[배경]
+수업 시간에 60명 이상이 1분 안에 제출하면서, 복사·붙여넣기로 사실상 동일한 의사코드를
+매번 gpt-4o로 다시 채점 → rate limit(429) 및 10초 이상 지연이 발생.
+
+[구조]
+- 지문(fingerprint): 미션 + 정규화된 의사코드 + 꼬리/심화 답변 + 모델 + 루브릭 버전의 SHA-256
+    * 정규화: 유니코드 NFKC, 줄바꿈 통일, 줄 끝 공백/빈 줄/연속 공백 제거, 소문자화
+    * 루브릭 버전: PROMPT_VERSION + 미션별 루브릭 텍스트 해시 → 루브릭 수정 시 자동 무효화
+- 1차 캐시: 프로세스 메모리 LRU (TTL)
+- 2차 캐시: Django 캐시 'evaluations' 별칭 (settings.CACHES, 기본 파일 기반 → 재시작/워커 간 공유)
+- 동시 요청 병합(single-flight): 같은 지문의 평가가 진행 중이면 새 LLM 호출 없이 그 결과를 함께 사용
+- 동시 LLM 호출 수 상한(세마포어)으로 한꺼번에 몰리는 요청의 rate limit 초과를 방지
+- 리더가 취소되면(SSE 연결 끊김 → task.cancel()) 슬롯을 반납하고, 취소를 대기자에게 전파하지 않고
+  대기자 중 하나가 새 리더로 다시 계산한다
+
+성공(SUCCESS) 결과만 캐시하며, 캐시에서 꺼낸 결과는 깊은 복사본을 반환한다
+(PseudocodeEvaluator가 tail_question/deep_dive 폴백을 결과 객체에 직접 대입하기 때문).
+"""
+
+import asyncio
+import copy
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, fields
+from typing import Awaitable, Callable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+from core.services.quest_rubrics import get_rubric_for_prompt, extract_quest_id_from_title
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트(_build_prompts)나 채점 기준을 바꾸면 이 값을 올려 기존 캐시를 무효화
+PROMPT_VERSION = "2026-02-24"
+
+_WS_RE = re.compile(r"[ \t ]+")
+
+
+def normalize_pseudocode(text: str) -> str:
+    """공백/줄바꿈/대소문자 차이만 있는 답안이 같은 지문을 갖도록 정규화"""
+    text = unicodedata.normalize("NFKC", text or "").replace("\r\n", "\n").replace("\r", "\n")
+    lines = (_WS_RE.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line).lower()
+
+
+def rubric_version(quest_title: str) -> str:
+    quest_id = extract_quest_id_from_title(quest_title)
+    rubric_text = get_rubric_for_prompt(quest_id) if quest_id > 0 else ""
+    digest = hashlib.sha256(rubric_text.encode("utf-8")).hexdigest()[:12]
+    return f"{PROMPT_VERSION}:{digest}"
+
+
+def evaluation_fingerprint(quest_title: str, pseudocode: str, tail_answer: str = "",
+                           deep_answer: str = "", model: str = "") -> str:
+    parts = [
+        rubric_version(quest_title),
+        model,
+        (quest_title or "").strip(),
+        normalize_pseudocode(pseudocode),
+        normalize_pseudocode(tail_answer),
+        normalize_pseudocode(deep_answer),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class _InFlight:
+    """진행 중인 평가 1건 — 같은 지문의 후속 요청이 결과를 기다림"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[Exception] = None
+        # 리더가 결과 없이 중단됨(취소/KeyboardInterrupt 등) → 대기자 중 하나가 새 리더로 다시 계산
+        self.abandoned = False
+
+
+class EvaluationCache:
+    """
+    LLMEvaluationResult 2계층 캐시 + single-flight.
+    result_type은 dataclass(LLMEvaluationResult)이며 2차 캐시에는 dict로 저장한다.
+    """
+
+    def __init__(self, result_type, memory_size: int = 512, memory_ttl: int = 60 * 60,
+                 persistent_ttl: int = 7 * 24 * 60 * 60, cache_alias: Optional[str] = "evaluations",
+                 max_concurrency: int = 8):
+        self.result_type = result_type
+        self.memory_size = memory_size
+        self.memory_ttl = memory_ttl
+        self.persistent_ttl = persistent_ttl
+        self.cache_alias = cache_alias
+        self._memory: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._llm_slots = threading.BoundedSemaphore(max_concurrency)
+        self._slot_waiters = ThreadPoolExecutor(thread_name_prefix="eval-slot")
+        self.stats = {"memory_hits": 0, "persistent_hits": 0, "coalesced": 0, "misses": 0}
+
+    # ──────────────────────────────────────────────
+    # 저장소 계층
+    # ──────────────────────────────────────────────
+
+    def _persistent(self):
+        if not self.cache_alias:
+            return None
+        try:
+            return caches[self.cache_alias]
+        except InvalidCacheBackendError:
+            return None
+
+    def _memory_get(self, key: str):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return value
+
+    def _memory_put(self, key: str, value):
+        with self._lock:
+            self._memory[key] = (time.time() + self.memory_ttl, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _lookup(self, key: str):
+        value = self._memory_get(key)
+        if value is not None:
+            self.stats["memory_hits"] += 1
+            return value
+        backend = self._persistent()
+        if backend is None:
+            return None
+        try:
+            data = backend.get(f"pseudo_eval:{key}")
+        except Exception as e:
+            logger.warning(f"[EvalCache] 2차 캐시 조회 실패: {e}")
+            return None
+        if not data:
+            return None
+        known = {f.name for f in fields(self.result_type)}
+        value = self.result_type(**{k: v for k, v in data.items() if k in known})
+        self._memory_put(key, value)
+        self.stats["persistent_hits"] += 1
+        return value
+
+    def _store(self, key: str, value):
+        self._memory_put(key, value)
+        backend = self._persistent()
+        if backend is None:
+            return
+        try:
+            backend.set(f"pseudo_eval:{key}", asdict(value), timeout=self.persistent_ttl)
+        except Exception as e:
+            logger.warning(f"[EvalCache] 2차 캐시 저장 실패: {e}")
+
+    # ──────────────────────────────────────────────
+    # 조회 + 계산
+    # ──────────────────────────────────────────────
+
+    def _join(self, key: str) -> Tuple[_InFlight, bool]:
+        """진행 중인 평가에 합류하거나 새 리더가 됨. Returns: (flight, is_leader)"""
+        with self._lock:
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = self._inflight[key] = _InFlight()
+                return flight, True
+            return flight, False
+
+    def _finish(self, key: str, flight: _InFlight, result=None, error: Optional[BaseException] = None):
+        """
+        리더 종료 처리. Exception만 대기자에게 전파하고, CancelledError 같은 BaseException은
+        abandoned로 표시해 대기자가 다시 계산하게 한다 (끊긴 클라이언트의 취소가 퍼지지 않도록).
+        """
+        flight.result = result
+        if isinstance(error, Exception):
+            flight.error = error
+        elif error is not None:
+            flight.abandoned = True
+        with self._lock:
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
+        flight.done.set()
+
+    def get_or_compute(self, key: str, compute: Callable[[], object]) -> Tuple[object, bool]:
+        """
+        Returns:
+            (결과 복사본, 캐시/병합 여부)
+        compute()에서 발생한 예외(LLMTimeoutError 등)는 병합된 모든 요청에 그대로 전파된다.
+        """
+        while True:
+            cached = self._lookup(key)
+            if cached is not None:
+                return copy.deepcopy(cached), True
+
+            flight, is_leader = self._join(key)
+            if is_leader:
+                break
+            self.stats["coalesced"] += 1
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if not flight.abandoned:
+                return copy.deepcopy(flight.result), True
+
+        self.stats["misses"] += 1
+        try:
+            with self._llm_slots:
+                result = compute()
+            if getattr(result, "status", None) == "SUCCESS":
+                self._store(key, copy.deepcopy(result))
+        except BaseException as e:
+            self._finish(key, flight, error=e)
+            raise
+        self._finish(key, flight, result)
+        return result, False
+
+    async def _acquire_slot(self):
+        """
+        LLM 호출 슬롯 획득 (동기 경로와 같은 threading 세마포어).
+        대기 중 취소되면 — SSE 클라이언트 연결 끊김 등 — 대기 스레드가 뒤늦게 얻은 슬롯을 즉시 반납한다.
+        """
+        if self._llm_slots.acquire(blocking=False):
+            return
+        waiter = self._slot_waiters.submit(self._llm_slots.acquire)
+        try:
+            await asyncio.wrap_future(waiter)
+        except asyncio.CancelledError:
+            waiter.add_done_callback(lambda f: f.cancelled() or self._llm_slots.release())
+            raise
+
+    async def aget_or_compute(self, key: str, acompute: Callable[[], Awaitable[object]]) -> Tuple[object, bool]:
+        """
+        get_or_compute()의 비동기 버전. 동기 경로와 같은 캐시/진행 중 목록/동시 호출 상한을 공유한다.
+        대기(2차 캐시 조회, 세마포어, 병합 대기)는 스레드로 넘겨 이벤트 루프를 막지 않는다.
+        """
+        while True:
+            cached = await asyncio.to_thread(self._lookup, key)
+            if cached is not None:
+                return copy.deepcopy(cached), True
+
+            flight, is_leader = self._join(key)
+            if is_leader:
+                break
+            self.stats["coalesced"] += 1
+            await asyncio.to_thread(flight.done.wait)
+            if flight.error is not None:
+                raise flight.error
+            if not flight.abandoned:
+                return copy.deepcopy(flight.result), True
+
+        self.stats["misses"] += 1
+        try:
+            await self._acquire_slot()
+            try:
+                result = await acompute()
+            finally:
+                self._llm_slots.release()
+            if getattr(result, "status", None) == "SUCCESS":
+                await asyncio.to_thread(self._store, key, copy.deepcopy(result))
+        except BaseException as e:
+            self._finish(key, flight, error=e)
+            raise
+        self._finish(key, flight, result)
+        return result, False
+
+
+_cache: Optional[EvaluationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_evaluation_cache(result_type) -> EvaluationCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EvaluationCache(
+                result_type,
+                persistent_ttl=getattr(settings, "PSEUDOCODE_EVAL_CACHE_TTL", 7 * 24 * 60 * 60),
+                max_concurrency=getattr(settings, "PSEUDOCODE_EVAL_MAX_CONCURRENCY", 8),
+            )
+        return _cache
@@ -9,10 +9,12 @@
 - LowEffortDetector 단일 진입점으로 통합
 - 에러 타입별 커스텀 예외 도입
 - [수정 2026-02-22] 억지 긍정(마스킹) 로직 제거 및 채점 공식 단순화
+- [수정 2026-10-18] 비동기 평가(aevaluate, AsyncOpenAI 스트리밍) 추가 — Rule 결과/차원 점수를 생성 즉시 콜백으로 전달
 """
 
 import os
 import json
+import asyncio
 import time
 import re
 import logging
@@ -20,16 +22,12 @@ from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
-try:
-    import openai
-except ImportError:
-    openai = None
-
-from django.conf import settings
 from core.utils.pseudocode_validator import PseudocodeValidator
 from core.utils.mission_rules import VALIDATION_RULES
 from core.utils.low_effort_detector import LowEffortDetector
 from core.services.quest_rubrics import get_rubric_for_prompt, extract_quest_id_from_title
+from core.services.pseudocode_eval_cache import get_evaluation_cache, evaluation_fingerprint
+from core.services.llm_client import get_openai_client, get_async_openai_client
 from core.services.quest_resources import (
     validate_tail_question,
     validate_deep_dive,
@@ -226,13 +224,29 @@ class RuleValidationEngine:
 # 5. LLM 평가 엔진
 # ============================================================================
 
+# [수정일: 2026-10-18] 스트리밍 응답에서 완성된 차원 점수 객체를 찾는 패턴
+# 예) "design": {"score": 18.0, "comment": "..."}
+_DIMENSION_RE = re.compile(
+    r'"(design|consistency|abstraction|edgeCase|implementation)"\s*:\s*\{\s*'
+    r'"score"\s*:\s*(-?\d+(?:\.\d+)?)\s*,\s*"comment"\s*:\s*"((?:[^"\\]|\\.)*)"\s*\}'
+)
+
+
 class LLMEvaluationEngine:
 
     def __init__(self):
-        if openai and getattr(settings, 'OPENAI_API_KEY', None):
-            self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-        else:
-            self.client = None
+        # [수정일: 2026-10-18] 공용 LLM 클라이언트 (연결 풀/동시성 제한 공유)
+        self.client = get_openai_client('pseudocode.evaluate')
+        self._async_client = None
+
+    @property
+    def async_client(self):
+        """AsyncOpenAI 클라이언트 (이벤트 루프별 공용 클라이언트, 테스트에서는 주입 가능)"""
+        if self._async_client is not None:
+            return self._async_client
+        if self.client is None:
+            return None
+        return get_async_openai_client('pseudocode.evaluate')
 
     def evaluate(
         self,
@@ -264,30 +278,60 @@ class LLMEvaluationEngine:
                 timeout=timeout,
             )
             raw_text = response.choices[0].message.content
-            parsed = self._safe_parse(raw_text)
-            latency = int((time.time() - start) * 1000)
+            return self._to_result(raw_text, model, start)
 
+        except Exception as e:
+            latency = int((time.time() - start) * 1000)
+            err_str = str(e)
+            if "timeout" in err_str.lower() or "timed out" in err_str.lower():
+                raise LLMTimeoutError(f"LLM 응답 시간 초과 ({timeout}s)") from e
+            logger.error(f"[LLMEvaluation] 호출 실패: {e}", exc_info=True)
             return LLMEvaluationResult(
                 model=model,
-                status="SUCCESS",
-                internal_reasoning=parsed.get("internal_reasoning", ""),
-                raw_score=parsed.get("overall_score"),
-                dimension_scores=parsed.get("dimension_scores", {}),
-                feedback=parsed.get("feedback", {}),
-                converted_python=parsed.get("converted_python", ""),
-                python_feedback=parsed.get("python_feedback", ""),
-                tail_question=parsed.get("tail_question"),
-                deep_dive=parsed.get("deep_dive"),
-                senior_advice=parsed.get("senior_advice", ""),
+                status="ERROR",
+                error_message=err_str,
                 latency_ms=latency,
             )
 
+    async def aevaluate(
+        self,
+        pseudocode: str,
+        rule_result: RuleValidationResult,
+        quest_title: str,
+        tail_answer: str = "",
+        deep_answer: str = "",
+        model: str = ModelConfig.PRIMARY_MODEL,
+        timeout: int = 40,
+        on_dimension=None,
+    ) -> LLMEvaluationResult:
+        """
+        [수정일: 2026-10-18] evaluate()의 비동기 버전 (AsyncOpenAI 스트리밍).
+        - on_dimension(dim, score, comment): 응답 JSON에서 차원 점수가 완성될 때마다 호출
+        - timeout은 전체 응답 기준이며 초과 시 LLMTimeoutError
+        - 호출 태스크가 취소되면(클라이언트 연결 종료 등) 스트림을 닫고 CancelledError를 그대로 전파
+        """
+        if not self.client:
+            raise LLMUnavailableError("OpenAI 클라이언트를 초기화할 수 없습니다. API 키를 확인해 주세요.")
+
+        start = time.time()
+        try:
+            system_prompt, user_prompt = self._build_prompts(
+                pseudocode, rule_result, quest_title, tail_answer, deep_answer
+            )
+            raw_text = await asyncio.wait_for(
+                self._astream_completion(system_prompt, user_prompt, model, on_dimension),
+                timeout=timeout,
+            )
+            return self._to_result(raw_text, model, start)
+
+        except asyncio.TimeoutError as e:
+            raise LLMTimeoutError(f"LLM 응답 시간 초과 ({timeout}s)") from e
         except Exception as e:
             latency = int((time.time() - start) * 1000)
             err_str = str(e)
             if "timeout" in err_str.lower() or "timed out" in err_str.lower():
                 raise LLMTimeoutError(f"LLM 응답 시간 초과 ({timeout}s)") from e
-            logger.error(f"[LLMEvaluation] 호출 실패: {e}", exc_info=True)
+            logger.error(f"[LLMEvaluation] 비동기 호출 실패: {e}", exc_info=True)
             return LLMEvaluationResult(
                 model=model,
                 status="ERROR",
@@ -295,6 +339,62 @@ class LLMEvaluationEngine:
                 latency_ms=latency,
             )
 
+    async def _astream_completion(self, system_prompt: str, user_prompt: str, model: str, on_dimension=None) -> str:
+        stream = await self.async_client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.3,
+            stream=True,
+        )
+        pieces = []
+        emitted = set()
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                pieces.append(delta)
+                # 차원 객체는 '}'로 끝나므로 닫는 괄호가 들어온 조각에서만 재검사
+                if on_dimension and "}" in delta:
+                    for match in _DIMENSION_RE.finditer("".join(pieces)):
+                        dim = match.group(1)
+                        if dim in emitted:
+                            continue
+                        emitted.add(dim)
+                        try:
+                            comment = json.loads(f'"{match.group(3)}"')
+                        except ValueError:
+                            comment = match.group(3)
+                        on_dimension(dim, float(match.group(2)), comment)
+        finally:
+            await stream.close()
+        return "".join(pieces)
+
+    def _to_result(self, raw_text: str, model: str, start: float) -> LLMEvaluationResult:
+        parsed = self._safe_parse(raw_text)
+        latency = int((time.time() - start) * 1000)
+
+        return LLMEvaluationResult(
+            model=model,
+            status="SUCCESS",
+            internal_reasoning=parsed.get("internal_reasoning", ""),
+            raw_score=parsed.get("overall_score"),
+            dimension_scores=parsed.get("dimension_scores", {}),
+            feedback=parsed.get("feedback", {}),
+            converted_python=parsed.get("converted_python", ""),
+            python_feedback=parsed.get("python_feedback", ""),
+            tail_question=parsed.get("tail_question"),
+            deep_dive=parsed.get("deep_dive"),
+            senior_advice=parsed.get("senior_advice", ""),
+            latency_ms=latency,
+        )
+
     def _build_prompts(
         self,
         pseudocode: str,
@@ -682,6 +782,8 @@ class PseudocodeEvaluator:
         self.llm_engine = LLMEvaluationEngine()
         self.scoring_engine = ScoringEngine()
         self.feedback_engine = FeedbackEngine()
+        # [수정일: 2026-10-18] 프로세스 전역 평가 캐시 (요청마다 evaluator를 생성해도 공유됨)
+        self.eval_cache = get_evaluation_cache(LLMEvaluationResult)
 
     def evaluate(self, request: EvaluationRequest) -> FinalEvaluationResult:
         """
@@ -693,6 +795,59 @@ class PseudocodeEvaluator:
         5. 점수 계산 (Rule 페널티 적용)
         6. 피드백 생성
         """
+        rule_result = self._validate_rules(request)
+
+        # ── Step 3: LLM 평가 ──────────────────────────────────────
+        # LLMTimeoutError / LLMUnavailableError 는 뷰 레이어로 전파
+        # [수정일: 2026-10-18] 동일(정규화 기준) 답안은 캐시 결과 재사용, 동시 제출은 1회 호출로 병합
+        llm_result, llm_cache_hit = self.eval_cache.get_or_compute(
+            self._cache_key(request),
+            lambda: self.llm_engine.evaluate(
+                pseudocode=request.pseudocode,
+                rule_result=rule_result,
+                quest_title=request.quest_title,
+                tail_answer=request.tail_answer,
+                deep_answer=request.deep_answer,
+            ),
+        )
+        return self._finalize(request, rule_result, llm_result, llm_cache_hit)
+
+    async def aevaluate(self, request: EvaluationRequest, on_event=None) -> FinalEvaluationResult:
+        """
+        [수정일: 2026-10-18] evaluate()의 비동기 버전 (ASGI 이벤트 루프에서 워커 스레드를 점유하지 않음)
+
+        on_event(kind, payload)로 중간 결과를 즉시 전달한다.
+            'rule_validation' : RuleValidationResult (LLM 호출 전)
+            'dimension'       : {'dimension', 'score', 'max', 'percentage', 'comment'} (LLM이 생성하는 대로)
+        캐시 적중 시에는 차원 점수를 한 번에 전달한다.
+        """
+        emit = on_event or (lambda kind, payload: None)
+        rule_result = self._validate_rules(request)
+        emit('rule_validation', rule_result)
+
+        def on_dimension(dim, score, comment):
+            emit('dimension', self._dimension_event(dim, score, comment))
+
+        llm_result, llm_cache_hit = await self.eval_cache.aget_or_compute(
+            self._cache_key(request),
+            lambda: self.llm_engine.aevaluate(
+                pseudocode=request.pseudocode,
+                rule_result=rule_result,
+                quest_title=request.quest_title,
+                tail_answer=request.tail_answer,
+                deep_answer=request.deep_answer,
+                on_dimension=on_dimension,
+            ),
+        )
+        if llm_cache_hit:
+            for dim, data in (llm_result.dimension_scores or {}).items():
+                if isinstance(data, dict):
+                    on_dimension(dim, data.get('score', 0), data.get('comment', ''))
+
+        # 영상 큐레이션(YouTube/LLM 동기 호출)이 포함되어 있으므로 스레드에서 실행
+        return await asyncio.to_thread(self._finalize, request, rule_result, llm_result, llm_cache_hit)
+
+    def _validate_rules(self, request: EvaluationRequest) -> RuleValidationResult:
         # ── Step 1: Low Effort 감지 ────────────────────────────────
         # [수정 2026-02-23] 청사진 모드 진입을 위한 첫 제출일 때만 LowEffortError 발생
         # 이미 꼬리질문(tail_answer)이나 심화 답변(deep_answer)을 한 상태라면 평가를 진행함
@@ -701,18 +856,40 @@ class PseudocodeEvaluator:
             raise LowEffortError(reason or "입력이 부실합니다.")
 
         # ── Step 2: Rule 검증 ──────────────────────────────────────
-        rule_result = self.rule_engine.validate(request.pseudocode, request.detail_id)
+        return self.rule_engine.validate(request.pseudocode, request.detail_id)
 
-        # ── Step 3: LLM 평가 ──────────────────────────────────────
-        # LLMTimeoutError / LLMUnavailableError 는 뷰 레이어로 전파
-        llm_result = self.llm_engine.evaluate(
-            pseudocode=request.pseudocode,
-            rule_result=rule_result,
-            quest_title=request.quest_title,
-            tail_answer=request.tail_answer,
-            deep_answer=request.deep_answer,
+    def _cache_key(self, request: EvaluationRequest) -> str:
+        return evaluation_fingerprint(
+            request.quest_title, request.pseudocode, request.tail_answer,
+            request.deep_answer, ModelConfig.PRIMARY_MODEL,
         )
 
+    @staticmethod
+    def _dimension_event(dim: str, score, comment: str) -> Dict[str, Any]:
+        """스트리밍용 차원 점수 (FeedbackEngine과 같은 스케일링/클램핑 규칙)"""
+        max_val = SCORE_CONFIG['dimension_weights'].get(dim, 25)
+        try:
+            val = float(score)
+        except (TypeError, ValueError):
+            val = 0.0
+        if val > max_val:
+            val = val * max_val / 100
+        val = min(val, max_val)
+        return {
+            'dimension': dim,
+            'score': int(round(val)),
+            'max': max_val,
+            'percentage': MathUtils.calculate_percentage(val, max_val),
+            'comment': comment,
+        }
+
+    def _finalize(
+        self,
+        request: EvaluationRequest,
+        rule_result: RuleValidationResult,
+        llm_result: LLMEvaluationResult,
+        llm_cache_hit: bool,
+    ) -> FinalEvaluationResult:
         # ── Step 4: LLM 결과 검증 + 폴백 ────────────────────────────
         if llm_result.status == "SUCCESS":
             # tail_question 검증
@@ -809,6 +986,7 @@ class PseudocodeEvaluator:
                 'latency_ms': llm_result.latency_ms,
                 'model': llm_result.model,
                 'llm_status': llm_result.status,
+                'llm_cache_hit': llm_cache_hit,
                 'rule_passed': rule_result.passed,
                 'rule_critical_errors': rule_result.critical_error_count,
             },
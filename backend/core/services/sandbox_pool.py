@@ -0,0 +1,690 @@
+"""
+sandbox_pool.py — 코드 실행 샌드박스 웜 풀
+수정일: 2026-10-18
+
+[배경]
+CodeExecutionView가 요청마다 `docker run --rm`을 실행하면서 매번 컨테이너 콜드 스타트
+(basic 수백 ms, pytorch 이미지는 수 초)를 부담하던 문제를 해결하기 위한 모듈.
+
+[구조]
+- 워커 = 미리 띄워 둔 러너 프로세스 1개 (RUNNER_SOURCE)
+    러너는 stdin으로 JSON 한 줄(code, timeout)을 받아 fork한 자식에서 코드를 실행하고
+    stdout/stderr/exit_code를 JSON 한 줄로 돌려준다. 실행 후 작업 디렉토리(/tmp)를 비운다.
+    stream 요청이면 실행 중 출력 조각을 {"event": "chunk"} 줄로 먼저 보낸다 (code_jobs SSE용).
+    실행 코드는 전역 함수 __sandbox_result__(obj)로 구조화된 결과를 넘길 수 있다
+    → 응답의 "result" 필드 (사용자 print 출력과 섞이지 않음, pseudocode 테스트 하네스용)
+    [수정 2026-10-18] 러너는 child subreaper(PR_SET_CHILD_SUBREAPER)로 동작 → 실행 코드가
+    setsid/이중 fork로 분리한 프로세스도 러너의 자손으로 남는다. 매 실행 후 남은 자손을 전부
+    SIGKILL/회수한 뒤 작업 디렉토리를 비우고, 끝까지 남는 프로세스가 있으면(또는 자손 추적이
+    불가능한 환경이면) 응답에 "clean": false → 풀이 워커(컨테이너)를 재사용하지 않고 교체.
+- DockerSandboxWorker : `docker run -i` 컨테이너 안에서 러너 실행 (운영용, 기존 격리 옵션 유지)
+- LocalSandboxWorker  : 로컬 subprocess + rlimit로 러너 실행 (개발/테스트용 — 네트워크 격리 없음)
+- SandboxPool         : 이미지별 워커 풀
+    * N회 실행 후 워커 교체(recycle), 유휴 워커 헬스 체크(ping)
+    * 대기열 상한 초과 시 SandboxPoolBusy (백프레셔)
+    * 교체/보충은 백그라운드 스레드에서 수행하여 요청 경로에서 콜드 스타트를 제거
+
+[관련 설정]
+    SANDBOX_BACKEND            : docker(기본) | local
+    SANDBOX_POOL_SIZE          : basic 이미지 워커 수
+    SANDBOX_PYTORCH_POOL_SIZE  : pytorch 이미지 워커 수
+    SANDBOX_MAX_RUNS_PER_WORKER: 워커 교체 주기 (실행 횟수)
+    SANDBOX_MAX_QUEUE          : 워커 대기 요청 상한
+"""
+
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SandboxPoolBusy(Exception):
+    """대기열이 가득 찼거나 제한 시간 내에 워커를 얻지 못한 경우"""
+    pass
+
+
+class SandboxWorkerError(Exception):
+    """러너 프로세스가 시작되지 않았거나 비정상 종료된 경우"""
+    pass
+
+
+# 워커 내부에서 실행되는 러너 스크립트 (`python -u -c RUNNER_SOURCE [preload 모듈...]`)
+# - 컨테이너 이미지에 별도 파일을 넣지 않아도 되도록 소스 문자열로 전달
+# - fork가 없는 환경(Windows 로컬 개발)에서는 실행마다 subprocess로 대체
+RUNNER_SOURCE = r'''
+import codecs, json, os, shutil, signal, subprocess, sys, time, traceback
+
+for _mod in sys.argv[1:]:
+    try:
+        __import__(_mod)
+    except Exception:
+        pass
+
+WORK = os.environ.get("SANDBOX_WORKDIR") or "/tmp"
+MAX_OUTPUT = 1024 * 1024
+RESULT_NAME = ".sandbox_result"
+PROTO_OUT = sys.stdout
+STREAM_INTERVAL = 0.05
+
+
+def send(message):
+    PROTO_OUT.write(json.dumps(message) + "\n")
+    PROTO_OUT.flush()
+
+
+def reset_workdir():
+    for name in os.listdir(WORK):
+        path = os.path.join(WORK, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def enable_subreaper():
+    # 실행 코드가 setsid/이중 fork로 분리한 프로세스도 init이 아닌 러너로 재부모화되게 한다 (Linux)
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.prctl(36, 1, 0, 0, 0) == 0  # PR_SET_CHILD_SUBREAPER
+    except Exception:
+        return False
+
+
+SUBREAPER = enable_subreaper() and os.path.isdir("/proc")
+
+
+def descendants():
+    # /proc에서 러너의 모든 자손 (pid, 상태)
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open("/proc/%s/stat" % name) as f:
+                stat = f.read()
+        except OSError:
+            continue
+        fields = stat[stat.rfind(")") + 2:].split()
+        children.setdefault(int(fields[1]), []).append((int(name), fields[0]))
+    found, stack = [], [os.getpid()]
+    while stack:
+        for pid, state in children.get(stack.pop(), []):
+            found.append((pid, state))
+            stack.append(pid)
+    return found
+
+
+def reap():
+    while True:
+        try:
+            wpid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if not wpid:
+            return
+
+
+def kill_strays():
+    # 실행이 끝난 뒤 남은 자손 프로세스를 모두 종료/회수. 끝까지 남으면 False (워커 교체 필요)
+    if not SUBREAPER:
+        return False
+    for _ in range(100):
+        live = [pid for pid, state in descendants() if state != "Z"]
+        for pid in live:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+        reap()
+        if not live and not descendants():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def read_capped(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(MAX_OUTPUT).decode("utf-8", "replace")
+    except OSError:
+        return ""
+
+
+def sandbox_result(obj):
+    # 실행 코드가 구조화된 결과를 넘기는 통로 (stdout 마지막 줄 파싱 대신)
+    with open(os.path.join(WORK, RESULT_NAME), "w", encoding="utf-8") as f:
+        json.dump(obj, f)
+
+
+def read_result():
+    path = os.path.join(WORK, RESULT_NAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def child_main(code, timeout, memory_bytes, out_path, err_path):
+    exit_code = 0
+    try:
+        os.setpgid(0, 0)
+        os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+        os.dup2(os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 1)
+        os.dup2(os.open(err_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 2)
+        os.chdir(WORK)
+        try:
+            import resource
+            cpu = int(timeout) + 1
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+            if memory_bytes:
+                resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+        except Exception:
+            pass
+        sys.argv = ["-c"]
+        try:
+            exec(compile(code, "<string>", "exec"),
+                 {"__name__": "__main__", "__builtins__": __builtins__, "__sandbox_result__": sandbox_result})
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except BaseException:
+        exit_code = 1
+    os._exit(exit_code & 0xFF)
+
+
+class OutputTail:
+    # 실행 중 출력 파일에서 새로 쓰인 부분만 읽어 chunk 메시지로 전달 (스트리밍 모드)
+    def __init__(self, path, name):
+        self.path, self.name, self.offset = path, name, 0
+        self.decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def flush(self, final=False):
+        if self.offset >= MAX_OUTPUT:
+            return
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                data = f.read(MAX_OUTPUT - self.offset)
+        except OSError:
+            return
+        self.offset += len(data)
+        text = self.decoder.decode(data, final)
+        if text:
+            send({"event": "chunk", "stream": self.name, "data": text})
+
+
+def run_forked(code, timeout, memory_bytes, stream=False):
+    out_path = os.path.join(WORK, ".sandbox_stdout")
+    err_path = os.path.join(WORK, ".sandbox_stderr")
+    pid = os.fork()
+    if pid == 0:
+        child_main(code, timeout, memory_bytes, out_path, err_path)
+    tails = [OutputTail(out_path, "stdout"), OutputTail(err_path, "stderr")] if stream else []
+    next_flush = time.monotonic() + STREAM_INTERVAL
+    deadline = time.monotonic() + timeout
+    timed_out = False
+    while True:
+        wpid, status = os.waitpid(pid, os.WNOHANG)
+        if wpid:
+            break
+        if tails and time.monotonic() >= next_flush:
+            for tail in tails:
+                tail.flush()
+            next_flush = time.monotonic() + STREAM_INTERVAL
+        if time.monotonic() >= deadline:
+            timed_out = True
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                pass
+            _, status = os.waitpid(pid, 0)
+            break
+        time.sleep(0.002)
+    for tail in tails:
+        tail.flush(final=True)
+    exit_code = os.waitstatus_to_exitcode(status)
+    return read_capped(out_path), read_capped(err_path), exit_code, timed_out
+
+
+SUBPROCESS_WRAPPER = (
+    "import json, os, sys\n"
+    "def __sandbox_result__(obj):\n"
+    "    with open(%r, 'w', encoding='utf-8') as f:\n"
+    "        json.dump(obj, f)\n"
+    "code = open(sys.argv[1], encoding='utf-8').read()\n"
+    "sys.argv = ['-c']\n"
+    "exec(compile(code, '<string>', 'exec'), {'__name__': '__main__', '__sandbox_result__': __sandbox_result__})\n"
+)
+
+
+def run_subprocess(code, timeout, memory_bytes, stream=False):
+    code_path = os.path.join(WORK, ".sandbox_code.py")
+    with open(code_path, "w", encoding="utf-8") as f:
+        f.write(code)
+    wrapper = SUBPROCESS_WRAPPER % os.path.join(WORK, RESULT_NAME)
+    try:
+        proc = subprocess.run([sys.executable, "-c", wrapper, code_path], cwd=WORK, capture_output=True,
+                              stdin=subprocess.DEVNULL, timeout=timeout)
+    except subprocess.TimeoutExpired as e:
+        return (e.stdout or b"").decode("utf-8", "replace"), (e.stderr or b"").decode("utf-8", "replace"), -9, True
+    return (proc.stdout[:MAX_OUTPUT].decode("utf-8", "replace"),
+            proc.stderr[:MAX_OUTPUT].decode("utf-8", "replace"), proc.returncode, False)
+
+
+run_code = run_forked if hasattr(os, "fork") else run_subprocess
+
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    request = json.loads(line)
+    if request.get("ping"):
+        response = {"pong": True}
+    else:
+        result = None
+        try:
+            stdout, stderr, exit_code, timed_out = run_code(
+                request["code"], float(request.get("timeout", 30)), request.get("memory_bytes"),
+                bool(request.get("stream")))
+            result = read_result()
+        except Exception as e:
+            stdout, stderr, exit_code, timed_out = "", "sandbox error: %s" % e, -1, False
+        finally:
+            # 분리된 프로세스가 다음 실행의 파일을 보거나 고치지 못하도록 정리 후 디렉토리 비움
+            clean = kill_strays()
+            reset_workdir()
+        response = {"stdout": stdout, "stderr": stderr, "exit_code": exit_code, "timed_out": timed_out,
+                    "result": result, "clean": clean}
+    send(response)
+'''
+
+
+def _parse_memory(limit: Optional[str]) -> Optional[int]:
+    """'256m', '1g' 형식의 Docker 메모리 표기를 바이트로 변환"""
+    if not limit:
+        return None
+    units = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+    limit = str(limit).strip().lower()
+    if limit[-1] in units:
+        return int(float(limit[:-1]) * units[limit[-1]])
+    return int(limit)
+
+
+class _SandboxWorker:
+    """러너 프로세스 1개를 감싸는 공통 구현 (요청/응답은 JSON 한 줄)"""
+
+    START_TIMEOUT = 10.0
+    # 러너 자체가 응답하지 않을 때를 대비한 여유 시간 (초)
+    RESPONSE_GRACE = 5.0
+
+    def __init__(self, preload=()):
+        self.preload = tuple(preload)
+        self.proc: Optional[subprocess.Popen] = None
+        self.runs = 0
+        self.last_used = time.monotonic()
+        self._responses: queue.Queue = queue.Queue()
+
+    def command(self) -> list:
+        raise NotImplementedError
+
+    def env(self) -> Optional[dict]:
+        return None
+
+    def start(self):
+        self.proc = subprocess.Popen(
+            self.command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+            env=self.env(),
+        )
+        # Windows 파이프는 select를 지원하지 않으므로 읽기 전용 스레드로 응답을 수신
+        threading.Thread(target=self._read_loop, daemon=True).start()
+        if not self.ping(timeout=self.START_TIMEOUT):
+            self.close()
+            raise SandboxWorkerError("샌드박스 워커가 시작되지 않았습니다")
+        return self
+
+    def _read_loop(self):
+        for line in self.proc.stdout:
+            self._responses.put(line)
+        self._responses.put(None)
+
+    def _request(self, payload: dict, timeout: float, on_output=None) -> dict:
+        try:
+            self.proc.stdin.write(json.dumps(payload) + "\n")
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise SandboxWorkerError(f"러너 연결 끊김: {e}")
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._responses.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(self.command()[:2], timeout)
+            if line is None:
+                raise SandboxWorkerError("러너 프로세스가 종료되었습니다")
+            message = json.loads(line)
+            # 스트리밍 모드: 최종 응답 전까지 chunk 메시지를 콜백으로 전달
+            if message.get("event") == "chunk":
+                if on_output:
+                    on_output(message["stream"], message["data"])
+                continue
+            return message
+
+    def is_alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def ping(self, timeout: float = 2.0) -> bool:
+        try:
+            return bool(self._request({"ping": True}, timeout).get("pong"))
+        except Exception:
+            return False
+
+    def run(self, code: str, timeout: float, memory_bytes: Optional[int] = None, on_output=None) -> dict:
+        """on_output(stream, text)을 넘기면 실행 중 stdout/stderr를 조각 단위로 전달받는다"""
+        payload = {"code": code, "timeout": timeout, "memory_bytes": memory_bytes, "stream": on_output is not None}
+        result = self._request(payload, timeout + self.RESPONSE_GRACE, on_output)
+        self.runs += 1
+        self.last_used = time.monotonic()
+        return result
+
+    def close(self):
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=2)
+        except Exception:
+            self.proc.kill()
+            try:
+                self.proc.wait(timeout=2)
+            except Exception:
+                pass
+
+
+class LocalSandboxWorker(_SandboxWorker):
+    """
+    로컬 subprocess 러너 (Docker 없이 풀 동작을 개발/테스트하기 위한 백엔드).
+    자식 프로세스에 RLIMIT_CPU/RLIMIT_AS만 적용되며 네트워크/파일시스템 격리는 없다.
+    """
+
+    def __init__(self, memory_limit: Optional[str] = None, preload=()):
+        super().__init__(preload)
+        self.memory_bytes = _parse_memory(memory_limit)
+        self.workdir = tempfile.mkdtemp(prefix='sandbox-')
+
+    def command(self) -> list:
+        return [sys.executable, '-u', '-c', RUNNER_SOURCE, *self.preload]
+
+    def env(self) -> dict:
+        env = dict(os.environ)
+        env['SANDBOX_WORKDIR'] = self.workdir
+        return env
+
+    def run(self, code: str, timeout: float, memory_bytes: Optional[int] = None, on_output=None) -> dict:
+        return super().run(code, timeout, memory_bytes or self.memory_bytes, on_output)
+
+    def close(self):
+        super().close()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+class DockerSandboxWorker(_SandboxWorker):
+    """
+    `docker run -i` 컨테이너 안에서 러너를 실행 (기존 `docker run --rm` 격리 옵션 그대로 유지).
+    메모리/CPU 제한은 컨테이너(cgroup) 단위로 적용된다.
+    """
+
+    START_TIMEOUT = 60.0
+
+    def __init__(self, image: str, memory_limit: str = "256m", cpu_limit: str = "0.5", preload=()):
+        super().__init__(preload)
+        self.image = image
+        self.memory_limit = memory_limit
+        self.cpu_limit = cpu_limit
+        self.name = f"sandbox-{uuid.uuid4().hex[:12]}"
+
+    def command(self) -> list:
+        # --rm: 러너 종료 시 컨테이너 자동 삭제
+        # --network none / --read-only: 기존 CodeExecutionView와 동일한 격리 옵션
+        # --tmpfs /tmp: 러너가 매 실행 후 비우는 작업 디렉토리
+        return [
+            "docker", "run",
+            "--rm",
+            "--name", self.name,
+            "--network", "none",
+            "--memory", self.memory_limit,
+            "--cpus", self.cpu_limit,
+            "--read-only",
+            "--tmpfs", "/tmp:rw,noexec,nosuid,size=128m",
+            "-e", "SANDBOX_WORKDIR=/tmp",
+            "-i",
+            self.image,
+            "python", "-u", "-c", RUNNER_SOURCE, *self.preload,
+        ]
+
+    def close(self):
+        super().close()
+        # 러너가 응답하지 않아 교체되는 경우 컨테이너가 남지 않도록 강제 삭제
+        subprocess.run(["docker", "rm", "-f", self.name],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+
+class SandboxPool:
+    """
+    이미지 1종에 대한 웜 워커 풀.
+
+    - 유휴 워커는 LIFO로 꺼내 최근에 사용된(캐시가 따뜻한) 워커를 우선 사용
+    - max_runs_per_worker회 실행한 워커와 오류/타임아웃 워커는 폐기 후 백그라운드에서 보충
+    - 실행 중 + 대기 중인 요청이 size + max_queue를 넘으면 즉시 SandboxPoolBusy
+    """
+
+    def __init__(
+        self,
+        worker_factory: Callable[[], _SandboxWorker],
+        size: int = 4,
+        max_runs_per_worker: int = 50,
+        max_queue: int = 100,
+        acquire_timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+    ):
+        self.worker_factory = worker_factory
+        self.size = size
+        self.max_runs_per_worker = max_runs_per_worker
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size + max_queue)
+        self._lock = threading.Lock()
+        self._live = 0  # 시작 중 + 유휴 + 사용 중 워커 수
+        self._closed = False
+        self.stats = {"runs": 0, "recycled": 0, "spawn_failures": 0, "rejected": 0}
+
+    # ──────────────────────────────────────────────
+    # 워커 수명 관리
+    # ──────────────────────────────────────────────
+
+    def start(self):
+        """풀 크기만큼 워커를 미리 띄운다 (비동기)"""
+        self._ensure_capacity()
+        return self
+
+    def _ensure_capacity(self):
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.size - self._live
+            self._live += max(missing, 0)
+        for _ in range(max(missing, 0)):
+            threading.Thread(target=self._spawn, daemon=True).start()
+
+    def _spawn(self):
+        try:
+            worker = self.worker_factory().start()
+        except Exception as e:
+            logger.error(f"[SandboxPool] 워커 시작 실패: {e}")
+            with self._lock:
+                self._live -= 1
+                self.stats["spawn_failures"] += 1
+            # 대기 중인 요청이 acquire_timeout까지 막히지 않도록 오류를 전달
+            self._idle.put(e)
+            return
+        self._idle.put(worker)
+
+    def _discard(self, worker: _SandboxWorker):
+        with self._lock:
+            self._live -= 1
+            self.stats["recycled"] += 1
+        threading.Thread(target=worker.close, daemon=True).start()
+        self._ensure_capacity()
+
+    def _acquire_worker(self) -> _SandboxWorker:
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            self._ensure_capacity()
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._idle.get(timeout=max(remaining, 0))
+            except queue.Empty:
+                raise SandboxPoolBusy("사용 가능한 샌드박스 워커가 없습니다")
+            if isinstance(item, BaseException):
+                raise item
+            if not item.is_alive():
+                self._discard(item)
+                continue
+            # 오래 쉬고 있던 워커만 ping (매 요청 ping은 dispatch 지연을 늘림)
+            if time.monotonic() - item.last_used > self.health_check_interval:
+                if not item.ping():
+                    self._discard(item)
+                    continue
+                item.last_used = time.monotonic()
+            return item
+
+    def _release(self, worker: _SandboxWorker):
+        if self._closed or worker.runs >= self.max_runs_per_worker:
+            self._discard(worker)
+        else:
+            self._idle.put(worker)
+
+    # ──────────────────────────────────────────────
+    # 실행
+    # ──────────────────────────────────────────────
+
+    def run(self, code: str, timeout: float, on_output=None) -> dict:
+        """
+        Args:
+            on_output: 선택. on_output(stream, text) — 실행 중 출력 스트리밍 콜백
+        Returns:
+            dict: stdout, stderr, exit_code, timed_out, dispatch_ms(워커 확보까지 걸린 시간),
+                  result(코드가 __sandbox_result__로 넘긴 값, 없으면 None)
+        Raises:
+            SandboxPoolBusy: 대기열 초과 또는 acquire_timeout 내 워커 확보 실패
+            subprocess.TimeoutExpired: 러너 자체가 응답하지 않은 경우 (워커는 폐기됨)
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.stats["rejected"] += 1
+            raise SandboxPoolBusy("샌드박스 실행 대기열이 가득 찼습니다")
+        try:
+            queued_at = time.perf_counter()
+            worker = self._acquire_worker()
+            dispatch_ms = (time.perf_counter() - queued_at) * 1000
+            try:
+                result = worker.run(code, timeout, on_output=on_output)
+            except Exception:
+                self._discard(worker)
+                raise
+            # 러너가 남은 프로세스를 정리하지 못했으면 다른 요청에 재사용하지 않음
+            if result.pop("clean", True):
+                self._release(worker)
+            else:
+                logger.warning("[SandboxPool] 실행 후 남은 프로세스 정리 실패 → 워커 교체")
+                self._discard(worker)
+            with self._lock:
+                self.stats["runs"] += 1
+            result["dispatch_ms"] = round(dispatch_ms, 2)
+            return result
+        finally:
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                item = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _SandboxWorker):
+                item.close()
+
+
+_pools: Dict[str, SandboxPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_sandbox_pool(docker_image: str, memory_limit: str = "256m", cpu_limit: str = "0.5",
+                     preload: Optional[tuple] = None) -> SandboxPool:
+    """
+    이미지별 프로세스 전역 풀 (첫 요청 시 생성 및 워밍업 시작)
+
+    preload: 러너가 미리 import할 모듈 (기본: pytorch 이미지면 torch). 풀 생성 시점에만 적용
+    """
+    with _pools_lock:
+        pool = _pools.get(docker_image)
+        if pool is not None:
+            return pool
+
+        is_pytorch = "pytorch" in docker_image
+        # pytorch 이미지는 러너가 torch를 미리 import → fork된 실행 프로세스가 로드 비용 없이 공유
+        if preload is None:
+            preload = ("torch",) if is_pytorch else ()
+        backend = getattr(settings, "SANDBOX_BACKEND", "docker")
+        if backend == "local":
+            factory = lambda: LocalSandboxWorker(memory_limit=memory_limit, preload=preload)
+        else:
+            factory = lambda: DockerSandboxWorker(docker_image, memory_limit, cpu_limit, preload=preload)
+
+        size = getattr(settings, "SANDBOX_PYTORCH_POOL_SIZE" if is_pytorch else "SANDBOX_POOL_SIZE", 2 if is_pytorch else 4)
+        pool = SandboxPool(
+            factory,
+            size=size,
+            max_runs_per_worker=getattr(settings, "SANDBOX_MAX_RUNS_PER_WORKER", 50),
+            max_queue=getattr(settings, "SANDBOX_MAX_QUEUE", 100),
+        ).start()
+        _pools[docker_image] = pool
+        logger.info(f"[SandboxPool] 풀 생성: image={docker_image}, backend={backend}, size={size}")
+        return pool
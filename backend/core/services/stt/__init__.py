@@ -1,3 +1,4 @@
 from .stt_service import process_audio
+from .streaming import StreamingTranscription
 
-__all__ = ['process_audio']
+__all__ = ['process_audio', 'StreamingTranscription']
@@ -0,0 +1,205 @@
+"""
+streaming.py — 청크 단위 스트리밍 STT (증분 VAD + 구간별 변환)
+
+생성일: 2026-10-18
+설명: process_audio()는 녹음이 끝난 뒤 전체 파일을 한 번에 VAD/변환하므로
+      답변 길이만큼 기다려야 텍스트가 나온다. 스트리밍 모드는 녹음 중에 들어오는
+      PCM 청크를 바로 VAD에 흘려 발화 구간이 닫히는 즉시 그 구간만 변환한다.
+      → 녹음 종료 후 대기 시간 ≈ 마지막 구간 1개 변환 시간
+
+[입력]
+  16kHz mono 16bit little-endian PCM 바이트 (청크 크기 자유, 홀수 바이트도 이어 붙임)
+
+[흐름]
+  feed(chunk) → SpeechSegmenter가 512샘플 창 단위로 StreamingVAD 실행
+              → 발화 끝(또는 MAX_SEGMENT_SEC 초과)마다 구간 확정
+              → 구간별 transcribe_pcm을 스레드에서 실행, 끝나면 on_partial 콜백
+  finish()    → 열린 구간을 닫고 남은 변환을 기다려 process_audio()와 같은 형식으로 합산
+
+[조기 거절]
+  발화가 한 번도 감지되지 않으면 변환 호출 없이 has_speech=False
+  MIN_SPEECH_MS보다 짧은 구간(기침, 클릭음)은 변환하지 않음
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .transcriber import transcribe_pcm
+from .vad import SAMPLE_RATE, WINDOW_SAMPLES, StreamingVAD
+
+MAX_SEGMENT_SEC = 20.0      # 쉬지 않고 길게 말해도 이 길이마다 끊어서 변환
+MIN_SPEECH_MS = 250
+MAX_STREAM_SEC = 600.0      # 세션당 최대 수신 길이 (초과분 무시)
+KEEP_BEFORE_SPEECH_SEC = 0.5  # 발화 시작 전 보관하는 오디오 (VAD 패딩 여유)
+
+Segment = Tuple[int, int, np.ndarray]  # (시작 샘플, 끝 샘플, float32 samples)
+
+
+class SpeechSegmenter:
+    """PCM 청크 → 확정된 발화 구간 목록 (동기, 스레드에서 호출)"""
+
+    def __init__(self, vad: Optional[StreamingVAD] = None, max_segment_sec: float = MAX_SEGMENT_SEC,
+                 min_speech_ms: int = MIN_SPEECH_MS):
+        self.vad = vad or StreamingVAD()
+        self.max_segment = int(max_segment_sec * SAMPLE_RATE)
+        self.min_speech = min_speech_ms * SAMPLE_RATE // 1000
+        self.received = 0              # 수신한 전체 샘플 수
+        self._carry = b''              # 샘플 경계에 걸친 홀수 바이트
+        self._pending = np.zeros(0, dtype=np.float32)  # 아직 VAD 창을 채우지 못한 샘플
+        self._audio = np.zeros(0, dtype=np.float32)    # 보관 중인 오디오
+        self._audio_start = 0          # _audio[0]의 절대 샘플 위치
+        self._speech_start: Optional[int] = None
+
+    @property
+    def in_speech(self) -> bool:
+        return self._speech_start is not None
+
+    def push(self, pcm: bytes) -> List[Segment]:
+        data = self._carry + pcm
+        usable = len(data) - len(data) % 2
+        self._carry = data[usable:]
+        samples = np.frombuffer(data[:usable], dtype='<i2').astype(np.float32) / 32768.0
+        self.received += len(samples)
+        self._audio = np.concatenate((self._audio, samples))
+        self._pending = np.concatenate((self._pending, samples))
+
+        segments = []
+        offset = 0
+        while len(self._pending) - offset >= WINDOW_SAMPLES:
+            window = self._pending[offset:offset + WINDOW_SAMPLES]
+            offset += WINDOW_SAMPLES
+            position = self.received - (len(self._pending) - offset)
+            event = self.vad.process(window) or {}
+            if 'start' in event and self._speech_start is None:
+                self._speech_start = max(int(event['start']), self._audio_start)
+            if 'end' in event and self._speech_start is not None:
+                self._close(min(int(event['end']), position), segments)
+            elif self._speech_start is not None and position - self._speech_start >= self.max_segment:
+                # 쉬지 않는 긴 발화: 현재 위치에서 끊고 바로 다음 구간 시작
+                self._close(position, segments)
+                self._speech_start = position
+        self._pending = self._pending[offset:]
+        self._trim()
+        return segments
+
+    def flush(self) -> List[Segment]:
+        """스트림 종료: 열린 구간을 수신한 끝까지로 닫는다"""
+        segments = []
+        if self._speech_start is not None:
+            self._close(self.received, segments)
+        self.vad.reset()
+        return segments
+
+    def _close(self, end: int, segments: List[Segment]):
+        start, self._speech_start = self._speech_start, None
+        if end - start < self.min_speech:
+            return
+        samples = self._audio[start - self._audio_start:end - self._audio_start]
+        segments.append((start, end, samples.copy()))
+
+    def _trim(self):
+        """구간에 더 이상 쓰이지 않을 오디오는 버린다 (메모리 = 현재 발화 + 여유분)"""
+        keep_from = self._speech_start
+        if keep_from is None:
+            keep_from = self.received - int(KEEP_BEFORE_SPEECH_SEC * SAMPLE_RATE)
+        drop = keep_from - self._audio_start
+        if drop > 0:
+            self._audio = self._audio[drop:]
+            self._audio_start = keep_from
+
+
+class StreamingTranscription:
+    """
+    한 번의 답변 녹음에 대한 스트리밍 STT 세션 (async).
+
+    on_partial(index, result, transcript_so_far): 구간 변환이 끝날 때마다 호출
+        transcript_so_far는 앞 구간부터 빈틈없이 끝난 것들만 이어 붙인 텍스트
+    """
+
+    def __init__(
+        self,
+        on_partial: Optional[Callable[[int, dict, str], Awaitable[None]]] = None,
+        transcribe: Callable[..., dict] = transcribe_pcm,
+        segmenter: Optional[SpeechSegmenter] = None,
+        max_stream_sec: float = MAX_STREAM_SEC,
+    ):
+        self.on_partial = on_partial
+        self.transcribe = transcribe
+        self.segmenter = segmenter
+        self.max_samples = int(max_stream_sec * SAMPLE_RATE)
+        self.results: Dict[int, dict] = {}
+        self.durations: Dict[int, float] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._lock = asyncio.Lock()  # 청크 순서 보장 (핸들러가 동시에 실행될 수 있음)
+        self.finished = False
+
+    async def feed(self, pcm: bytes):
+        async with self._lock:
+            if self.finished:
+                return
+            if self.segmenter is None:
+                # silero 모델 로드는 블로킹이므로 첫 청크에서 스레드로
+                self.segmenter = await asyncio.to_thread(SpeechSegmenter)
+            if self.segmenter.received >= self.max_samples:
+                return
+            segments = await asyncio.to_thread(self.segmenter.push, pcm)
+            self._dispatch(segments)
+
+    async def finish(self) -> dict:
+        async with self._lock:
+            if not self.finished:
+                self.finished = True
+                if self.segmenter is not None:
+                    self._dispatch(self.segmenter.flush())
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        return self.combined()
+
+    def _dispatch(self, segments: List[Segment]):
+        for start, end, samples in segments:
+            index = len(self.durations)
+            self.durations[index] = (end - start) / SAMPLE_RATE
+            self._tasks.append(asyncio.get_running_loop().create_task(self._run(index, samples)))
+
+    async def _run(self, index: int, samples: np.ndarray):
+        try:
+            result = await asyncio.to_thread(self.transcribe, samples, SAMPLE_RATE)
+        except Exception as e:
+            result = {"transcript": "", "confidence": 0.0, "language": "ko", "error": str(e)}
+        self.results[index] = result
+        if self.on_partial:
+            try:
+                await self.on_partial(index, result, self.transcript_so_far())
+            except Exception as e:
+                print(f"[STT] partial 전달 실패: {e}")
+
+    def transcript_so_far(self) -> str:
+        texts = []
+        for index in range(len(self.durations)):
+            if index not in self.results:
+                break
+            text = (self.results[index].get("transcript") or "").strip()
+            if text:
+                texts.append(text)
+        return " ".join(texts)
+
+    def combined(self) -> dict:
+        """process_audio()와 같은 응답 형식 (+ segments 수)"""
+        if not self.durations:
+            return {"transcript": "", "confidence": 0.0, "language": "ko", "has_speech": False, "segments": 0}
+        ordered = [self.results.get(i, {}) for i in range(len(self.durations))]
+        voiced = [(r, self.durations[i]) for i, r in enumerate(ordered) if (r.get("transcript") or "").strip()]
+        weight = sum(d for _, d in voiced)
+        confidence = sum(r.get("confidence", 0.0) * d for r, d in voiced) / weight if weight else 0.0
+        errors = [r["error"] for r in ordered if r.get("error")]
+        result = {
+            "transcript": " ".join(r["transcript"].strip() for r, _ in voiced),
+            "confidence": round(confidence, 3),
+            "language": next((r.get("language") for r, _ in voiced if r.get("language")), "ko"),
+            "has_speech": True,
+            "segments": len(ordered),
+        }
+        if errors and not voiced:
+            result["error"] = errors[0]
+        return result
@@ -4,7 +4,7 @@ STT 서비스 — VAD + Transcriber 통합 파이프라인
 """
 import os
 from .vad import is_speech_present
-from .transcriber import transcribe, _RUNPOD_URL
+from .transcriber import transcribe, stt_backend
 
 
 def process_audio(audio_bytes: bytes) -> dict:
@@ -12,6 +12,7 @@ def process_audio(audio_bytes: bytes) -> dict:
     오디오 바이트 → 텍스트 변환 파이프라인
 
     RunPod URL 설정 시: VAD 스킵 → RunPod로 직접 전송 (RunPod 서버 내부에서 VAD 처리)
+    [2026-10-18] STT_BACKEND=pool: VAD 스킵 → 워커 풀 (워커의 vad_filter가 처리)
     미설정 시: 로컬 VAD → 로컬 faster-whisper
 
     Returns:
@@ -22,8 +23,8 @@ def process_audio(audio_bytes: bytes) -> dict:
             "has_speech": True
         }
     """
-    if _RUNPOD_URL:
-        # RunPod 서버가 내부적으로 vad_filter=True로 VAD 처리
+    if stt_backend() in ("runpod", "pool"):
+        # RunPod 서버 / 워커 풀이 내부적으로 vad_filter=True로 VAD 처리
         result = transcribe(audio_bytes)
         result["has_speech"] = bool(result.get("transcript"))
         return result
@@ -5,7 +5,11 @@ transcriber.py -- STT (Speech-to-Text) 변환 모듈 (faster-whisper large-v3 
 변경 내용: RunPod 호출 방식을 기존 Pod 직접 호출(FastAPI)에서
           Serverless + Network Volume 방식(/runsync JSON API)으로 전환
 
-동작 모드:
+동작 모드: (STT_BACKEND 설정으로 강제 가능 — 미설정 시 아래 자동 선택)
+    0. [2026-10-18] 워커 풀 모드 (STT_BACKEND=pool)
+       - worker_pool.py의 상주 프로세스 풀(모델 사전 로드, 코어 고정, 요청 배칭)로 전달
+       - CPU 서버 자체 호스팅용
+
     1. RunPod Serverless 모드 (STT_RUNPOD_URL + RUNPOD_API_KEY 설정 시)
        - 오디오를 base64 인코딩하여 RunPod Serverless 엔드포인트로 POST
        - Authorization Bearer 헤더로 인증
@@ -17,6 +21,7 @@ transcriber.py -- STT (Speech-to-Text) 변환 모듈 (faster-whisper large-v3 
 
 사용처:
     - stt_service.py의 process_audio()에서 호출
+    - [2026-10-18] streaming.py가 VAD로 잘라낸 발화 구간을 transcribe_pcm()으로 변환
     - _RUNPOD_URL 값을 stt_service.py에서 import하여 VAD 분기 판단에 사용
 
 환경변수:
@@ -38,6 +43,7 @@ import base64
 import io
 import math
 import os
+import wave
 
 import requests as _requests
 
@@ -98,7 +104,52 @@ def _get_local_model() -> 'WhisperModel':
     return _model_instance
 
 
-def _transcribe_local(audio_bytes: bytes) -> dict:
+def run_whisper(model, audio) -> dict:
+    """로드된 faster-whisper 모델로 변환 (로컬 모드 / worker_pool 워커 프로세스 공용)
+
+    Args:
+        model: WhisperModel 또는 BatchedInferencePipeline
+        audio: 오디오 파일 바이트 또는 16kHz mono float32 numpy 배열
+    """
+    audio_io = io.BytesIO(audio) if isinstance(audio, (bytes, bytearray)) else audio
+
+    segments, info = model.transcribe(
+        audio_io,
+        language="ko",
+        beam_size=5,
+        best_of=5,
+        temperature=0.0,
+        condition_on_previous_text=False,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500),
+    )
+
+    texts = []
+    logprobs = []
+    for segment in segments:
+        text = segment.text.strip()
+        if text:
+            texts.append(text)
+            logprobs.append(segment.avg_logprob)
+
+    transcript = " ".join(texts).strip()
+
+    # avg_logprob → 확률 변환: exp(logprob), 0.0~1.0 범위로 클램핑
+    if logprobs:
+        avg_logprob = sum(logprobs) / len(logprobs)
+        confidence = round(min(1.0, max(0.0, math.exp(avg_logprob))), 3)
+    else:
+        confidence = 0.0
+
+    return {
+        "transcript": transcript,
+        "confidence": confidence,
+        "language": info.language,
+        "error": None,
+    }
+
+
+def _transcribe_local(audio_bytes) -> dict:
     """로컬 faster-whisper 모델로 음성 → 텍스트 변환
 
     RunPod 미설정 시(개발/테스트 환경) 사용.
@@ -106,6 +157,7 @@ def _transcribe_local(audio_bytes: bytes) -> dict:
 
     Args:
         audio_bytes: 오디오 파일 바이트 데이터 (webm, wav 등)
+                     또는 16kHz mono float32 numpy 배열 (스트리밍 구간, 디코딩 생략)
 
     Returns:
         dict: {
@@ -124,43 +176,7 @@ def _transcribe_local(audio_bytes: bytes) -> dict:
         }
 
     try:
-        model = _get_local_model()
-        audio_io = io.BytesIO(audio_bytes)
-
-        segments, info = model.transcribe(
-            audio_io,
-            language="ko",
-            beam_size=5,
-            best_of=5,
-            temperature=0.0,
-            condition_on_previous_text=False,
-            vad_filter=True,
-            vad_parameters=dict(min_silence_duration_ms=500),
-        )
-
-        texts = []
-        logprobs = []
-        for segment in segments:
-            text = segment.text.strip()
-            if text:
-                texts.append(text)
-                logprobs.append(segment.avg_logprob)
-
-        transcript = " ".join(texts).strip()
-
-        # avg_logprob → 확률 변환: exp(logprob), 0.0~1.0 범위로 클램핑
-        if logprobs:
-            avg_logprob = sum(logprobs) / len(logprobs)
-            confidence = round(min(1.0, max(0.0, math.exp(avg_logprob))), 3)
-        else:
-            confidence = 0.0
-
-        return {
-            "transcript": transcript,
-            "confidence": confidence,
-            "language": info.language,
-            "error": None,
-        }
+        return run_whisper(_get_local_model(), audio_bytes)
 
     except Exception as e:
         print(f"[STT] 로컬 변환 오류: {e}")
@@ -291,11 +307,25 @@ def _transcribe_remote(audio_bytes: bytes) -> dict:
 # 메인 진입점
 # =============================================================================
 
+def stt_backend() -> str:
+    """[2026-10-18] 사용할 STT 백엔드: runpod | local | pool
+
+    STT_BACKEND(settings)가 있으면 그 값, 없으면 기존처럼 RunPod URL 유무로 결정.
+    """
+    from django.conf import settings
+
+    backend = (getattr(settings, "STT_BACKEND", "") or "").lower()
+    if backend:
+        return backend
+    return "runpod" if _RUNPOD_URL else "local"
+
+
 def transcribe(audio_bytes: bytes) -> dict:
     """음성 바이트 → 한국어 텍스트 변환 (메인 진입점)
 
     STT_RUNPOD_URL + RUNPOD_API_KEY 환경변수 설정 시 RunPod Serverless GPU 사용.
     미설정 시 로컬 faster-whisper 모델(CPU) 사용.
+    [2026-10-18] STT_BACKEND=pool 이면 로컬 STT 워커 풀 사용 (SttPoolBusy 전파)
 
     stt_service.py의 process_audio()에서 호출.
 
@@ -305,9 +335,45 @@ def transcribe(audio_bytes: bytes) -> dict:
     Returns:
         dict: {"transcript", "confidence", "language", "error"}
     """
-    if _RUNPOD_URL:
+    backend = stt_backend()
+    if backend == "pool":
+        from .worker_pool import get_stt_pool
+        return get_stt_pool().transcribe(audio_bytes)
+    if backend == "runpod":
         print(f"[STT] RunPod Serverless 사용: {_RUNPOD_URL}")
         return _transcribe_remote(audio_bytes)
     else:
         print("[STT] 로컬 모델 사용 (STT_RUNPOD_URL 미설정)")
         return _transcribe_local(audio_bytes)
+
+
+def _encode_wav(samples, sample_rate: int) -> bytes:
+    """float32 [-1, 1] 샘플 → 16bit PCM WAV 바이트 (RunPod 전송용)"""
+    import numpy as np
+
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2').tobytes()
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buf.getvalue()
+
+
+def transcribe_pcm(samples, sample_rate: int = 16000) -> dict:
+    """[2026-10-18] 디코딩된 mono float32 구간 → 텍스트 (스트리밍 STT용)
+
+    로컬 모드는 배열을 그대로 faster-whisper에 넘기고(컨테이너 디코딩 없음),
+    RunPod 모드는 구간만 WAV로 감싸 기존 Serverless 요청 형식으로 전송한다.
+
+    Returns:
+        dict: {"transcript", "confidence", "language", "error"}
+    """
+    backend = stt_backend()
+    if backend == "pool":
+        from .worker_pool import get_stt_pool
+        return get_stt_pool().transcribe(samples)
+    if backend == "runpod":
+        return _transcribe_remote(_encode_wav(samples, sample_rate))
+    return _transcribe_local(samples)
@@ -1,17 +1,27 @@
 """
 VAD (Voice Activity Detection) — silero-vad 기반
 음성 파일에서 실제 발화 구간이 존재하는지 감지한다.
+
+[추가 2026-10-18] StreamingVAD — 스트리밍 STT용 증분 VAD
+    전체 파형을 한 번에 로드/리샘플링하지 않고 16kHz 512샘플 창 단위로 발화 시작/끝을 판정.
+    silero-vad 미설치 시 에너지(RMS) 기반 판정으로 대체.
 """
 import io
+from typing import Optional
+
+import numpy as np
 
 try:
     import torch
     import torchaudio
-    from silero_vad import load_silero_vad, get_speech_timestamps
+    from silero_vad import load_silero_vad, get_speech_timestamps, VADIterator
     _VAD_AVAILABLE = True
 except ImportError:
     _VAD_AVAILABLE = False
 
+SAMPLE_RATE = 16000
+WINDOW_SAMPLES = 512  # silero-vad 16kHz 입력 창 크기
+
 _vad_model = None
 
 
@@ -65,3 +75,67 @@ def is_speech_present(audio_bytes: bytes) -> bool:
     except Exception as e:
         print(f"[VAD] 오류 발생, 발화 있다고 처리: {e}")
         return True  # 오류 시 Whisper에 위임
+
+
+class StreamingVAD:
+    """
+    [추가 2026-10-18] 512샘플 창을 순서대로 넣으면 발화 경계 이벤트를 돌려주는 증분 VAD
+
+    process(window) → None | {"start": 샘플 위치} | {"end": 샘플 위치}
+    위치는 스트림 처음부터의 절대 샘플 인덱스 (16kHz).
+
+    silero 모델은 RNN 상태를 모델 객체 안에 들고 있으므로 스트림마다 별도 인스턴스를 로드한다.
+    (is_speech_present의 공용 _vad_model을 여러 스트림이 번갈아 쓰면 상태가 섞임)
+    """
+
+    def __init__(self, threshold: float = 0.5, min_silence_ms: int = 500, speech_pad_ms: int = 100,
+                 energy_threshold: float = 0.01, use_silero: bool = True):
+        self._iterator = None
+        if use_silero and _VAD_AVAILABLE:
+            try:
+                self._iterator = VADIterator(
+                    load_silero_vad(),
+                    threshold=threshold,
+                    sampling_rate=SAMPLE_RATE,
+                    min_silence_duration_ms=min_silence_ms,
+                    speech_pad_ms=speech_pad_ms,
+                )
+            except Exception as e:
+                print(f"[VAD] silero 로드 실패, 에너지 기반으로 대체: {e}")
+        # 에너지 기반 판정 상태
+        self.energy_threshold = energy_threshold
+        self._silence_windows = max(1, min_silence_ms * SAMPLE_RATE // 1000 // WINDOW_SAMPLES)
+        self._pad = speech_pad_ms * SAMPLE_RATE // 1000
+        self._position = 0
+        self._speaking = False
+        self._quiet = 0
+
+    def process(self, window: np.ndarray) -> Optional[dict]:
+        if self._iterator is not None:
+            return self._iterator(torch.from_numpy(window), return_seconds=False)
+        return self._process_energy(window)
+
+    def _process_energy(self, window: np.ndarray) -> Optional[dict]:
+        start = self._position
+        self._position += len(window)
+        loud = float(np.sqrt(np.mean(np.square(window)))) >= self.energy_threshold
+        if loud:
+            self._quiet = 0
+            if not self._speaking:
+                self._speaking = True
+                return {"start": max(0, start - self._pad)}
+            return None
+        if self._speaking:
+            self._quiet += 1
+            if self._quiet >= self._silence_windows:
+                self._speaking = False
+                self._quiet = 0
+                return {"end": self._position - (self._silence_windows * WINDOW_SAMPLES) + self._pad}
+        return None
+
+    def reset(self):
+        if self._iterator is not None:
+            self._iterator.reset_states()
+        self._position = 0
+        self._speaking = False
+        self._quiet = 0
@@ -0,0 +1,418 @@
+"""
+worker_pool.py — 로컬 STT 워커 프로세스 풀 (faster-whisper 상주 + 요청 배칭)
+
+생성일: 2026-10-18
+설명: transcriber._get_local_model()은 첫 요청이 들어온 Django 워커 안에서 medium 모델을
+      지연 로드하므로 배포 직후 첫 답변이 수 GB 로드를 기다리고, 동시 요청은 모델 하나에
+      줄을 선다. RunPod 대신 CPU 서버에서 STT를 직접 돌릴 때 쓰는 전용 워커 풀.
+
+[구조]
+  - 워커 = 모델을 미리 로드해 둔 자식 프로세스 (spawn). 프로세스마다
+      * CPU 코어 고정 (os.sched_setaffinity, 코어를 워커 수로 나눠 겹치지 않게)
+      * cpu_threads = 할당 코어 수 (CTranslate2 / OpenMP 스레드)
+      * batch_size > 1 이면 BatchedInferencePipeline으로 한 요청의 음성 구간들을 묶어 디코딩
+  - 디스패처 스레드: 유휴 워커마다 요청 1개씩 전달 (그 워커 전용 큐 → 어느 워커가 어떤 요청을
+    처리 중인지 부모가 앎). 다른 유휴 워커가 없을 때(모두 바쁨)만 대기열의 몫
+    (대기 요청 수 ÷ 준비된 워커 수, 최대 batch_max개)을 묶어 전달한다.
+    묶음은 워커 안에서 순서대로 처리되므로 병렬 처리가 아니라 전달 왕복만 줄이는 용도.
+  - 수집 스레드: 워커 결과를 Future에 전달, 죽은 워커는 진행 중이던 요청을 실패 처리하고 재시작
+    (결과 파이프와 프로세스 sentinel을 함께 기다림 → 다른 워커 결과가 계속 들어와도 종료를 바로 감지)
+  - 부모 ↔ 워커 통신은 워커별 단방향 Pipe 2개 (요청/결과). 쓰는 쪽이 하나뿐이라 프로세스 간 락이 없다
+    (공유 mp.Queue는 쓰던 워커가 죽으면 쓰기 락이 잡힌 채 남아 재시작된 워커까지 멈출 수 있음)
+  - 대기열 상한(max_queue) 초과 시 SttPoolBusy (백프레셔, stt_view에서 503)
+
+[관련 설정]
+    STT_BACKEND       : '' (기존: RunPod URL 있으면 RunPod, 없으면 프로세스 내 로컬) | runpod | local | pool
+    STT_POOL_SIZE     : 워커 프로세스 수
+    STT_MODEL_SIZE    : faster-whisper 모델 (tiny/base/small/medium/large-v3 ...)
+    STT_COMPUTE_TYPE  : int8 | int8_float32 | float32 ...
+    STT_CPU_THREADS   : 워커당 스레드 수 (0이면 코어 수 / 워커 수)
+    STT_BATCH_SIZE    : 요청 내부 구간 배치 크기 (1이면 일반 WhisperModel)
+    STT_BATCH_MAX     : 워커 1회 전달당 최대 요청 수
+    STT_MAX_QUEUE     : 대기 요청 상한
+"""
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from multiprocessing.connection import wait
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+CHECK_INTERVAL = 0.5  # 워커 생존 확인 주기 (초)
+
+
+class SttPoolBusy(Exception):
+    """대기열이 가득 찼거나 제한 시간 내에 결과를 받지 못한 경우"""
+    pass
+
+
+class SttWorkerError(Exception):
+    """워커 프로세스가 모델 로드에 실패했거나 처리 중 종료된 경우"""
+    pass
+
+
+# =============================================================================
+# 워커 프로세스
+# =============================================================================
+
+class _BatchedModel:
+    """BatchedInferencePipeline을 run_whisper()가 쓰는 transcribe 시그니처로 감싼다"""
+
+    def __init__(self, pipeline, batch_size: int):
+        self.pipeline = pipeline
+        self.batch_size = batch_size
+
+    def transcribe(self, audio, **kwargs):
+        return self.pipeline.transcribe(audio, batch_size=self.batch_size, **kwargs)
+
+
+def load_whisper_engine(config: dict) -> Callable[[Any], dict]:
+    """워커 안에서 모델을 로드하고 audio → 결과 dict 함수를 돌려준다"""
+    from faster_whisper import WhisperModel
+    from core.services.stt.transcriber import run_whisper
+
+    model = WhisperModel(
+        config["model_size"],
+        device=config["device"],
+        compute_type=config["compute_type"],
+        cpu_threads=config["cpu_threads"],
+        num_workers=1,
+    )
+    if config["batch_size"] > 1:
+        from faster_whisper import BatchedInferencePipeline
+        model = _BatchedModel(BatchedInferencePipeline(model=model), config["batch_size"])
+    return lambda audio: run_whisper(model, audio)
+
+
+def _worker_main(index: int, config: dict, tasks, results, engine_factory=None):
+    """자식 프로세스 진입점: 코어 고정 → 모델 로드 → 배치 처리 루프"""
+    threads = str(config["cpu_threads"])
+    os.environ["OMP_NUM_THREADS"] = threads
+    os.environ["MKL_NUM_THREADS"] = threads
+    cores = config.get("cores")
+    if cores and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, cores)
+        except OSError:
+            pass
+
+    started = time.perf_counter()
+    try:
+        transcribe = (engine_factory or load_whisper_engine)(config)
+    except Exception as e:
+        results.send(("failed", index, str(e)))
+        return
+    results.send(("ready", index, round(time.perf_counter() - started, 2)))
+
+    while True:
+        try:
+            batch = tasks.recv()
+        except EOFError:
+            break  # 부모 프로세스 종료
+        if batch is None:
+            break
+        for job_id, audio in batch:
+            try:
+                result = transcribe(audio)
+            except Exception as e:
+                result = {"transcript": "", "confidence": 0.0, "language": "ko", "error": str(e)}
+            results.send(("result", index, job_id, result))
+        results.send(("done", index, len(batch)))
+
+
+# =============================================================================
+# 풀
+# =============================================================================
+
+class SttWorkerPool:
+    def __init__(
+        self,
+        size: int = 2,
+        model_size: str = "medium",
+        device: str = "cpu",
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        batch_size: int = 1,
+        batch_max: int = 4,
+        max_queue: int = 64,
+        request_timeout: float = 120.0,
+        engine_factory: Optional[Callable[[dict], Callable[[Any], dict]]] = None,
+        start_method: str = "spawn",
+    ):
+        self.size = size
+        self.batch_max = max(1, batch_max)
+        self.request_timeout = request_timeout
+        self.engine_factory = engine_factory
+        self._ctx = mp.get_context(start_method)
+
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+        threads = cpu_threads or max(1, len(cpus) // size)
+        self.config = {
+            "model_size": model_size,
+            "device": device,
+            "compute_type": compute_type,
+            "cpu_threads": threads,
+            "batch_size": batch_size,
+        }
+        # 코어가 충분할 때만 워커별로 겹치지 않게 고정 (부족하면 OS 스케줄러에 맡김)
+        self._cores = [cpus[i * threads:(i + 1) * threads] if threads * size <= len(cpus) else None
+                       for i in range(size)]
+
+        self._pending: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._idle: queue.Queue = queue.Queue()  # 유휴 워커 index
+        self._futures: Dict[int, Future] = {}
+        self._inflight: Dict[int, Set[int]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._procs: List[Optional[mp.Process]] = [None] * size
+        self._tasks: List[Any] = [None] * size    # 워커별 요청 Pipe (부모 쪽 쓰기 끝)
+        self._results: List[Any] = [None] * size  # 워커별 결과 Pipe (부모 쪽 읽기 끝)
+        self._ready: Set[int] = set()
+        self._failed: Set[int] = set()
+        self._ready_event = threading.Event()
+        self._closed = False
+        self.stats = Counter()
+        self.load_seconds: Dict[int, float] = {}
+
+    # ── 수명 관리 ───────────────────────────────────────────────────
+
+    def start(self):
+        """워커 프로세스를 띄우고 모델 로드를 시작 (로드 완료를 기다리지 않음)"""
+        for index in range(self.size):
+            self._spawn(index)
+        threading.Thread(target=self._dispatch_loop, name="stt-dispatch", daemon=True).start()
+        threading.Thread(target=self._collect_loop, name="stt-collect", daemon=True).start()
+        logger.info(f"[SttPool] 워커 {self.size}개 시작: {self.config}")
+        return self
+
+    def _spawn(self, index: int):
+        config = dict(self.config, cores=self._cores[index])
+        task_reader, task_writer = self._ctx.Pipe(duplex=False)
+        result_reader, result_writer = self._ctx.Pipe(duplex=False)
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(index, config, task_reader, result_writer, self.engine_factory),
+            name=f"stt-worker-{index}",
+            daemon=True,
+        )
+        proc.start()
+        # 워커 쪽 끝은 부모에서 닫아야 워커가 죽었을 때 결과 Pipe에서 EOF를 받는다
+        task_reader.close()
+        result_writer.close()
+        self._tasks[index] = task_writer
+        self._results[index] = result_reader
+        self._procs[index] = proc
+        self._inflight[index] = set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """워커 1개 이상이 모델 로드를 마칠 때까지 대기"""
+        return self._ready_event.wait(timeout)
+
+    def close(self):
+        self._closed = True
+        for tasks in self._tasks:
+            try:
+                with self._send_lock:
+                    tasks.send(None)
+            except (OSError, AttributeError):
+                pass
+        for proc in self._procs:
+            if proc is not None:
+                proc.join(timeout=5)
+                if proc.is_alive():
+                    proc.terminate()
+        self._fail_all(SttWorkerError("STT 워커 풀이 종료되었습니다"))
+
+    # ── 요청 ───────────────────────────────────────────────────────
+
+    def submit(self, audio) -> Future:
+        if len(self._failed) >= self.size:
+            raise SttWorkerError("STT 워커가 모두 모델 로드에 실패했습니다")
+        job_id = next(self._ids)
+        future: Future = Future()
+        with self._lock:
+            self._futures[job_id] = future
+        try:
+            self._pending.put_nowait((job_id, audio, time.perf_counter()))
+        except queue.Full:
+            with self._lock:
+                self._futures.pop(job_id, None)
+                self.stats["rejected"] += 1
+            raise SttPoolBusy("STT 대기열이 가득 찼습니다")
+        return future
+
+    def transcribe(self, audio, timeout: Optional[float] = None) -> dict:
+        """
+        Args:
+            audio: 오디오 파일 바이트 또는 16kHz mono float32 numpy 배열
+        Returns:
+            dict: {"transcript", "confidence", "language", "error"}
+        Raises:
+            SttPoolBusy: 대기열 초과 또는 제한 시간 초과
+            SttWorkerError: 모든 워커가 모델 로드에 실패했거나 처리 중 워커가 죽은 경우
+        """
+        future = self.submit(audio)
+        try:
+            return future.result(timeout=timeout or self.request_timeout)
+        except TimeoutError:
+            raise SttPoolBusy("STT 처리 시간이 초과되었습니다")
+
+    # ── 디스패치/수집 ───────────────────────────────────────────────
+
+    def _dispatch_loop(self):
+        while not self._closed:
+            index = self._idle.get()
+            if index not in self._ready:
+                continue  # 유휴 상태에서 죽은 워커 (재시작되면 ready로 다시 들어옴)
+            first = self._pending.get()
+            batch = [first]
+            # 쉬는 워커가 더 있으면 1개씩 나눠 주고, 모두 바쁠 때만 대기열의 몫을 묶어서 전달
+            limit = 1
+            if self._idle.empty():
+                share = -(-self._pending.qsize() // max(len(self._ready), 1))
+                limit = min(self.batch_max, 1 + share)
+            while len(batch) < limit:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            now = time.perf_counter()
+            with self._lock:
+                self.stats["batches"] += 1
+                self.stats["dispatched"] += len(batch)
+                self.stats["queue_ms"] += sum((now - queued_at) * 1000 for _, _, queued_at in batch)
+            self._inflight[index] = {job_id for job_id, _, _ in batch}
+            try:
+                with self._send_lock:
+                    self._tasks[index].send([(job_id, audio) for job_id, audio, _ in batch])
+            except OSError:
+                # 전달 직전에 워커가 죽음 → 재시작은 수집 스레드가 처리
+                for job_id, _, _ in batch:
+                    self._resolve(job_id, error=SttWorkerError("STT 워커가 처리 중 종료되었습니다"))
+
+    def _collect_loop(self):
+        while not self._closed:
+            readers = {conn: index for index, conn in enumerate(self._results) if conn is not None}
+            sentinels = [proc.sentinel for proc in self._procs if proc is not None]
+            # 결과와 프로세스 종료를 함께 기다림 → 다른 워커 결과가 끊임없이 들어와도 죽은 워커를 바로 감지
+            ready = wait(list(readers) + sentinels, timeout=CHECK_INTERVAL)
+            for conn in ready:
+                if conn in readers:
+                    self._drain(readers[conn])
+            if any(conn not in readers for conn in ready):
+                self._check_workers()
+
+    def _drain(self, index: int):
+        """워커 index의 결과 Pipe에 도착한 메시지를 모두 처리 (EOF면 Pipe를 닫고 생존 확인에 맡김)"""
+        conn = self._results[index]
+        try:
+            while conn.poll():
+                self._handle(conn.recv())
+        except (EOFError, OSError):
+            conn.close()
+            self._results[index] = None
+
+    def _handle(self, message):
+        kind, index = message[0], message[1]
+        if kind == "ready":
+            self._ready.add(index)
+            self.load_seconds[index] = message[2]
+            self._ready_event.set()
+            self._idle.put(index)
+            logger.info(f"[SttPool] 워커 {index} 준비 완료 ({message[2]}초)")
+        elif kind == "failed":
+            self._failed.add(index)
+            self.stats["load_failures"] += 1
+            logger.error(f"[SttPool] 워커 {index} 모델 로드 실패: {message[2]}")
+            if len(self._failed) >= self.size:
+                self._fail_all(SttWorkerError(f"STT 모델 로드 실패: {message[2]}"))
+        elif kind == "result":
+            job_id, result = message[2], message[3]
+            self._inflight[index].discard(job_id)
+            self._resolve(job_id, result=result)
+        elif kind == "done":
+            self._idle.put(index)
+
+    def _check_workers(self):
+        for index, proc in enumerate(self._procs):
+            if proc is None or proc.is_alive() or self._closed:
+                continue
+            if self._results[index] is not None:
+                self._drain(index)  # 죽기 전에 보낸 결과/로드 실패 메시지부터 처리
+            # 로드 실패한 워커는 재시작하지 않음 (설정 오류로 재시작이 반복되지 않도록)
+            if index in self._failed:
+                self._procs[index] = None
+                continue
+            self._ready.discard(index)
+            lost = self._inflight.get(index, set())
+            logger.error(f"[SttPool] 워커 {index} 종료 (exit={proc.exitcode}) → 재시작, 실패 처리 {len(lost)}건")
+            for job_id in list(lost):
+                self._resolve(job_id, error=SttWorkerError("STT 워커가 처리 중 종료되었습니다"))
+            self.stats["restarts"] += 1
+            with self._send_lock:
+                self._tasks[index].close()
+            self._spawn(index)
+
+    def _resolve(self, job_id: int, result: Optional[dict] = None, error: Optional[Exception] = None):
+        with self._lock:
+            future = self._futures.pop(job_id, None)
+            if result is not None:
+                self.stats["completed"] += 1
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _fail_all(self, error: Exception):
+        with self._lock:
+            futures, self._futures = self._futures, {}
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def metrics(self) -> Dict[str, Any]:
+        batches = self.stats["batches"] or 1
+        return {
+            "workers": self.size,
+            "ready": len(self._ready),
+            "queued": self._pending.qsize(),
+            "config": dict(self.config),
+            "load_seconds": dict(self.load_seconds),
+            "avg_batch": round(self.stats["dispatched"] / batches, 2),
+            "avg_queue_ms": round(self.stats["queue_ms"] / max(self.stats["dispatched"], 1), 2),
+            **{k: v for k, v in self.stats.items() if k != "queue_ms"},
+        }
+
+
+_pool: Optional[SttWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_stt_pool() -> SttWorkerPool:
+    """프로세스 전역 STT 워커 풀 (ASGI 시작 시 미리 생성해 모델을 로드)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SttWorkerPool(
+                size=getattr(settings, "STT_POOL_SIZE", 2),
+                model_size=getattr(settings, "STT_MODEL_SIZE", "medium"),
+                compute_type=getattr(settings, "STT_COMPUTE_TYPE", "int8"),
+                cpu_threads=getattr(settings, "STT_CPU_THREADS", 0),
+                batch_size=getattr(settings, "STT_BATCH_SIZE", 1),
+                batch_max=getattr(settings, "STT_BATCH_MAX", 4),
+                max_queue=getattr(settings, "STT_MAX_QUEUE", 64),
+            ).start()
+        return _pool
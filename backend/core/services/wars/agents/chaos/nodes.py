@@ -19,12 +19,7 @@ import random
 import logging
 from typing import Dict, Any, List
 
-from django.conf import settings
-
-try:
-    import openai
-except ImportError:
-    openai = None
+from core.services.llm_client import get_openai_client
 
 from core.services.wars.agents.chaos.state import ChaosAgentState
 
@@ -90,9 +85,8 @@ VULNERABILITY_RULES = [
 
 
 def _get_client():
-    if openai and getattr(settings, "OPENAI_API_KEY", None):
-        return openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-    return None
+    # [수정일: 2026-10-18] 공용 LLM 클라이언트 (연결 풀/동시성 제한 공유)
+    return get_openai_client("wars.chaos")
 
 
 def _fallback_by_nodes(deployed_nodes: List[str]) -> Dict[str, Any]:
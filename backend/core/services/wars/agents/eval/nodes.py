@@ -16,12 +16,7 @@ import json
 import logging
 from typing import Dict, Any
 
-from django.conf import settings
-
-try:
-    import openai
-except ImportError:
-    openai = None
+from core.services.llm_client import get_openai_client
 
 from core.services.wars.agents.eval.state import EvalAgentState
 from core.services.arch_evaluator import ArchEvaluator
@@ -67,9 +62,8 @@ def _node_label(node: Dict[str, Any]) -> str:
 
 
 def _get_client():
-    if openai and getattr(settings, "OPENAI_API_KEY", None):
-        return openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-    return None
+    # [수정일: 2026-10-18] 공용 LLM 클라이언트 (연결 풀/동시성 제한 공유)
+    return get_openai_client("wars.eval")
 
 
 # ─────────────────────────────────────────────────────────
@@ -14,12 +14,7 @@ import logging
 import time
 from typing import Dict, Any, List
 
-from django.conf import settings
-
-try:
-    import openai
-except ImportError:
-    openai = None
+from core.services.llm_client import get_openai_client
 
 from core.services.wars.agents.orchestrator.state import OrchestratorState
 from core.services.wars.trigger_policy import (
@@ -33,9 +28,8 @@ logger = logging.getLogger(__name__)
 
 
 def _get_client():
-    if openai and getattr(settings, "OPENAI_API_KEY", None):
-        return openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-    return None
+    # [수정일: 2026-10-18] 공용 LLM 클라이언트 (연결 풀/동시성 제한 공유)
+    return get_openai_client("wars.orchestrator")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -6,22 +6,21 @@ openai 직접 호출 → JSON 파싱 → 검증 → 반환
 """
 
 import json
-import os
 import random
 import logging
 from typing import List, Dict, Any
 
-from openai import AsyncOpenAI
+from core.services.llm_client import get_async_openai_client
 
 logger = logging.getLogger(__name__)
 
-_client: AsyncOpenAI = None
 
-def _get_client() -> AsyncOpenAI:
-    global _client
-    if _client is None:
-        _client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    return _client
+def _get_client():
+    # [수정일: 2026-10-18] 공용 LLM 클라이언트 (이벤트 루프별로 공유, 키 없으면 RuntimeError → 폴백)
+    client = get_async_openai_client("wars.bug_problem")
+    if client is None:
+        raise RuntimeError("OPENAI_API_KEY가 설정되지 않았습니다.")
+    return client
 
 
 PROMPT_TEMPLATE = """당신은 AI 부트캠프의 실무 디버깅 문제 출제자입니다.
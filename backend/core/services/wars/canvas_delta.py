@@ -0,0 +1,86 @@
+"""
+canvas_delta.py — ArchDraw 캔버스 델타 동기화 프로토콜
+
+draw_canvas_sync가 변경 때마다 nodes/arrows 전체를 주고받던 방식을 대체한다.
+(기존 전체 전송 형식도 계속 받는다 — ops/snapshot 키가 없으면 레거시)
+
+[클라이언트 → 서버] draw_canvas_sync
+    델타:     {"room_id", "seq": n, "ops": [op, ...]}
+    스냅샷:   {"room_id", "seq": n, "snapshot": {"nodes": [...], "arrows": [...]}}
+              - 라운드 시작 직후, SNAPSHOT_EVERY번째 델타마다, 서버가 draw_canvas_resync를 보냈을 때
+
+    op 형식 (kind: "node" | "arrow")
+        {"op": "add",    "kind": "node",  "item": {"id": 3, "compId": "lb", "x": 10, "y": 20, ...}}
+        {"op": "move",   "kind": "node",  "id": 3, "x": 40, "y": 50}
+        {"op": "move",   "kind": "arrow", "id": "3-5", "x1": .., "y1": .., "x2": .., "y2": ..}
+        {"op": "remove", "kind": "arrow", "id": "3-5"}
+    노드 id는 클라이언트 캔버스의 node.id, 화살표 id는 "{fid}-{tid}"
+
+[서버 → 상대 클라이언트]
+    draw_canvas_patch  {"sender_sid", "sender_name", "seq", "ops"}
+    draw_canvas_update {"sender_sid", "sender_name", "seq", "nodes", "arrows"}  (스냅샷/레거시)
+    상대 쪽에서 seq가 건너뛰면 draw_canvas_fetch {"room_id", "sid"} → 서버가 전체 상태를 draw_canvas_update로 응답
+
+[서버 → 보낸 클라이언트]
+    draw_canvas_resync {"seq": 서버가 가진 마지막 seq}  — seq 불연속/잘못된 op → 다음 전송을 스냅샷으로
+"""
+
+from typing import Any, Dict, List
+
+SNAPSHOT_EVERY = 30
+
+# move op로 바꿀 수 있는 좌표 필드 (그 외 필드는 add/remove로만 변경)
+POSITION_FIELDS = {
+    "node": ("x", "y"),
+    "arrow": ("x1", "y1", "x2", "y2"),
+}
+
+
+class CanvasDeltaError(ValueError):
+    """적용할 수 없는 op (클라이언트에 스냅샷 재전송 요청)"""
+
+
+def item_key(kind: str, item: Dict[str, Any]):
+    if kind == "arrow":
+        return item.get("id") or f"{item.get('fid')}-{item.get('tid')}"
+    return item.get("id")
+
+
+def _index_of(items: List[dict], kind: str, key) -> int:
+    for i, item in enumerate(items):
+        if item_key(kind, item) == key:
+            return i
+    return -1
+
+
+def apply_ops(nodes: List[dict], arrows: List[dict], ops: List[dict]) -> None:
+    """ops를 nodes/arrows에 제자리(in-place) 적용. 형식 오류 시 CanvasDeltaError"""
+    if not isinstance(ops, list):
+        raise CanvasDeltaError("ops must be a list")
+    for op in ops:
+        kind = op.get("kind") if isinstance(op, dict) else None
+        if kind not in POSITION_FIELDS:
+            raise CanvasDeltaError(f"unknown kind: {kind!r}")
+        items = nodes if kind == "node" else arrows
+        action = op.get("op")
+
+        if action == "add":
+            item = op.get("item")
+            if not isinstance(item, dict):
+                raise CanvasDeltaError("add requires item")
+            idx = _index_of(items, kind, item_key(kind, item))
+            if idx >= 0:
+                items[idx] = item
+            else:
+                items.append(item)
+        elif action == "move":
+            idx = _index_of(items, kind, op.get("id"))
+            if idx < 0:
+                raise CanvasDeltaError(f"move target not found: {kind} {op.get('id')!r}")
+            items[idx] = {**items[idx], **{f: op[f] for f in POSITION_FIELDS[kind] if f in op}}
+        elif action == "remove":
+            idx = _index_of(items, kind, op.get("id"))
+            if idx >= 0:
+                del items[idx]
+        else:
+            raise CanvasDeltaError(f"unknown op: {action!r}")
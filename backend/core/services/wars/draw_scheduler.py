@@ -0,0 +1,234 @@
+"""
+draw_scheduler.py — ArchDraw 방 주기 감사(Poll) 통합 스케줄러
+
+[배경]
+  기존 run_draw_room_tick은 방마다 asyncio task 하나가 8초씩 잠들었다 깨어나
+  플레이어마다 WarsOrchestrator.on_canvas_update(→ asyncio.to_thread)를 호출했다.
+  방이 수백 개면 잠든 task 수백 개 + 스레드 풀 포화.
+
+[구조]
+  - 타이머 휠: interval(기본 8초)을 resolution(기본 1초) 단위 슬롯으로 나누고,
+    task 하나가 매 tick마다 현재 슬롯의 방들만 묶어서 처리한다.
+    방은 등록 시점의 슬롯에 머물며 한 바퀴(interval)마다 한 번씩 차례가 온다.
+  - 동시 실행 상한: handler 실행을 세마포어(max_concurrency)로 제한
+    → Orchestrator 그래프가 점유하는 스레드 수가 방 수와 무관하게 일정
+  - 합치기: 이전 감사가 아직 진행 중인 방은 이번 차례를 건너뜀(busy)
+  - lease: 차례가 온 방들의 lease를 tick마다 한꺼번에 갱신, 실패한 방은 휠에서 제거
+    (다른 워커가 소유권을 가져간 경우)
+  - 지표: tick마다 last_tick/totals 갱신, stats_interval(초)마다 metrics()를 INFO 로그로 남김 (0이면 끔)
+    stats_sources로 받은 외부 지표(예: Orchestrator 사전 게이트 카운터)도 같은 로그에 포함
+
+[handler 계약]
+  async handler(room_id, ctx) -> POLLED | SKIPPED | STOP
+    ctx: 방별로 유지되는 dict (설계 변경 감지용 기록 등, 휠에서 빠지면 폐기)
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from core.services.wars.room_store import WORKER_ID
+from core.services.wars.state_machine import DrawRoomState
+from core.services.wars.trigger_policy import can_trigger_coach, can_trigger_chaos
+
+logger = logging.getLogger(__name__)
+
+POLLED = "polled"
+SKIPPED = "skipped"
+STOP = "stopped"
+
+
+class DrawTickScheduler:
+    """모든 draw 방의 주기 감사를 task 하나로 처리하는 타이머 휠"""
+
+    def __init__(
+        self,
+        handler: Callable[[str, Dict[str, Any]], Awaitable[str]],
+        store,
+        interval: float = 8.0,
+        resolution: float = 1.0,
+        max_concurrency: int = 8,
+        lease_ttl: float = 20.0,
+        owner: str = WORKER_ID,
+        stats_interval: float = 60.0,
+        stats_sources: Optional[Dict[str, Callable[[], Dict[str, Any]]]] = None,
+    ):
+        self.handler = handler
+        self.store = store
+        self.interval = interval
+        self.slots = max(1, round(interval / resolution))
+        self.resolution = interval / self.slots
+        self.max_concurrency = max_concurrency
+        self.lease_ttl = lease_ttl
+        self.owner = owner
+        self.stats_interval = stats_interval
+        self.stats_sources = stats_sources or {}
+
+        self._wheel = [dict() for _ in range(self.slots)]  # 슬롯 → {room_id: ctx}
+        self._slot_of: Dict[str, int] = {}
+        self._cursor = 0
+        self._ticks = 0
+        self._inflight: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._runner: Optional[asyncio.Task] = None
+
+        self.last_tick: Dict[str, Any] = {}
+        self.totals = Counter()
+        self._stats_logged_at = time.monotonic()
+
+    @staticmethod
+    def lease_name(room_id: str) -> str:
+        return f"draw_tick:{room_id}"
+
+    def __contains__(self, room_id: str) -> bool:
+        return room_id in self._slot_of
+
+    # ── 등록/해제 ────────────────────────────────────────────────────
+
+    async def schedule(self, room_id: str, autostart: bool = True) -> bool:
+        """방을 휠에 등록. lease를 얻지 못하면(다른 워커 소유) False"""
+        if room_id in self._slot_of:
+            return True
+        if not await self.store.acquire_lease(self.lease_name(room_id), self.owner, self.lease_ttl):
+            return False
+        # 현재 슬롯에 넣으면 정확히 한 바퀴(interval) 뒤 첫 차례
+        self._wheel[self._cursor][room_id] = {}
+        self._slot_of[room_id] = self._cursor
+        logger.info(f"[DrawTick] 주기적 체크 등록: {room_id} (slot={self._cursor}, rooms={len(self._slot_of)})")
+        if autostart and (self._runner is None or self._runner.done()):
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+        return True
+
+    async def unschedule(self, room_id: str):
+        if self._drop(room_id):
+            await self.store.release_lease(self.lease_name(room_id), self.owner)
+
+    def _drop(self, room_id: str) -> bool:
+        slot = self._slot_of.pop(room_id, None)
+        if slot is None:
+            return False
+        self._wheel[slot].pop(room_id, None)
+        return True
+
+    # ── 실행 루프 ────────────────────────────────────────────────────
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while self._slot_of:
+            next_at += self.resolution
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+            lag = loop.time() - next_at
+            try:
+                await self.tick(lag)
+            except Exception:
+                logger.exception("[DrawTick] tick 처리 실패")
+            if lag > self.resolution:
+                # 이벤트 루프가 크게 밀렸으면 밀린 tick을 몰아서 돌리지 않고 기준 시각을 재설정
+                next_at = loop.time()
+        logger.info("[DrawTick] 등록된 방 없음 → 스케줄러 대기")
+
+    async def tick(self, lag: float = 0.0):
+        """휠을 한 칸 전진시키고 차례가 온 방들을 한 번에 처리"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.perf_counter()
+        self._ticks += 1
+        self._cursor = (self._cursor + 1) % self.slots
+        due = list(self._wheel[self._cursor])
+
+        renewed = await asyncio.gather(*(
+            self.store.renew_lease(self.lease_name(room_id), self.owner, self.lease_ttl) for room_id in due
+        ))
+        lost = busy = dispatched = 0
+        for room_id, ok in zip(due, renewed):
+            if not ok:
+                lost += 1
+                self._drop(room_id)
+                logger.info(f"[DrawTick] lease 상실 → 등록 해제: {room_id}")
+            elif room_id in self._inflight:
+                busy += 1
+            else:
+                dispatched += 1
+                self._inflight.add(room_id)
+                task = asyncio.get_running_loop().create_task(self._visit(room_id, self._wheel[self._cursor][room_id]))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        self.totals.update(ticks=1, due=len(due), dispatched=dispatched, busy=busy, lease_lost=lost)
+        self.last_tick = {
+            "tick": self._ticks,
+            "at": time.time(),
+            "rooms": len(self._slot_of),
+            "due": len(due),
+            "dispatched": dispatched,
+            "busy": busy,
+            "lease_lost": lost,
+            "in_flight": len(self._inflight),
+            "lag_ms": round(max(lag, 0.0) * 1000, 1),
+            "tick_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        if due:
+            logger.debug(f"[DrawTick] {self.last_tick}")
+        now = time.monotonic()
+        if self.stats_interval and now - self._stats_logged_at >= self.stats_interval:
+            self._stats_logged_at = now
+            logger.info(f"[DrawTick] 통계 {self.metrics()}")
+
+    async def _visit(self, room_id: str, ctx: Dict[str, Any]):
+        try:
+            async with self._semaphore:
+                outcome = await self.handler(room_id, ctx)
+        except Exception:
+            logger.exception(f"[DrawTick] 감사 실패: {room_id}")
+            outcome = "error"
+        finally:
+            self._inflight.discard(room_id)
+        self.totals[outcome] += 1
+        if outcome == STOP:
+            await self.unschedule(room_id)
+            logger.info(f"[DrawTick] 주기적 체크 종료: {room_id}")
+
+    async def drain(self):
+        """진행 중인 감사가 모두 끝날 때까지 대기 (테스트/종료용)"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "rooms": len(self._slot_of),
+            "in_flight": len(self._inflight),
+            "slots": self.slots,
+            "interval": self.interval,
+            "max_concurrency": self.max_concurrency,
+            "last_tick": dict(self.last_tick),
+            "totals": dict(self.totals),
+            **{name: source() for name, source in self.stats_sources.items()},
+        }
+
+
+def poll_targets(room_state: DrawRoomState, sids: list, seen: Dict[str, Any]) -> tuple:
+    """
+    이번 차례에 Orchestrator를 돌릴 플레이어와 Chaos 가능 여부를 고른다 (LLM 없음).
+
+    플레이어별로 아래 중 하나라도 해당할 때만 대상:
+      - 지난 감사 이후 설계(player_designs)가 바뀜
+      - can_trigger_coach 가 True
+    방 전체로 can_trigger_chaos 가 True면 첫 번째 플레이어를 대상에 포함.
+
+    seen: 플레이어별 마지막으로 본 설계 갱신 시각 (호출 후 갱신됨)
+    """
+    chaos_ready = can_trigger_chaos(room_state)
+    targets = []
+    for sid in sids:
+        updated_at = room_state.player_designs.get(sid, {}).get("last_updated")
+        changed = seen.get(sid) != updated_at
+        seen[sid] = updated_at
+        if changed or can_trigger_coach(room_state, sid):
+            targets.append(sid)
+    if chaos_ready and sids and sids[0] not in targets:
+        targets.insert(0, sids[0])
+    return targets, chaos_ready
@@ -0,0 +1,99 @@
+"""
+emit_batcher.py — 방 단위 Socket.IO 송신 배칭 (고정 프레임레이트)
+
+Bug-Bubble 핸들러(bubble_sync / bubble_send_monster / bubble_monster_update / bubble_fever_attack)가
+클라이언트 이벤트마다 sio.emit을 개별 호출하던 방식을 대체한다.
+
+[구조]
+  - 방별 송신 큐: 다음 프레임까지 보낼 이벤트를 모아 둔다.
+      push()     : 개별 이벤트 (몬스터 전송, 피버 공격 — 버리면 안 되는 것)
+      supersede(): 같은 키의 이전 항목을 덮어쓰는 상태 갱신 (플레이어 위치, 몬스터 수)
+  - task 하나가 hz 주기로 대기 중인 방마다 프레임 1개를 emit
+      {frame_event}: {"f": 프레임 번호, "events": [{"e": 이벤트명, "d": payload, "skip": sid|None}, ...]}
+    skip은 기존 skip_sid와 같은 의미 — 해당 sid의 클라이언트는 그 항목을 무시한다.
+  - hz <= 0 이면 배칭 없이 즉시 개별 emit (기존 동작)
+"""
+
+import asyncio
+import itertools
+import logging
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RoomEmitBatcher:
+    def __init__(self, emit: Callable[..., Awaitable[Any]], hz: float = 20.0, frame_event: str = "frame"):
+        self.emit = emit
+        self.hz = hz
+        self.frame_event = frame_event
+        self._pending: Dict[str, "OrderedDict[Any, tuple]"] = {}
+        self._ids = itertools.count()
+        self._frames = itertools.count(1)
+        self._runner: Optional[asyncio.Task] = None
+        self.stats = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.hz > 0
+
+    # ── 적재 ─────────────────────────────────────────────────────────
+
+    async def push(self, room_id: str, event: str, data: Any, skip_sid: Optional[str] = None):
+        """버리면 안 되는 개별 이벤트"""
+        await self._enqueue(room_id, ("event", next(self._ids)), event, data, skip_sid)
+
+    async def supersede(self, room_id: str, key: Any, event: str, data: Any, skip_sid: Optional[str] = None):
+        """같은 (event, key)의 이전 항목은 버리고 최신 값만 다음 프레임에 보냄"""
+        await self._enqueue(room_id, (event, key), event, data, skip_sid)
+
+    async def _enqueue(self, room_id, key, event, data, skip_sid):
+        if not room_id:
+            return
+        self.stats["events_in"] += 1
+        if not self.enabled:
+            self.stats["packets"] += 1
+            await self.emit(event, data, room=room_id, skip_sid=skip_sid)
+            return
+        pending = self._pending.setdefault(room_id, OrderedDict())
+        if pending.pop(key, None) is not None:
+            self.stats["superseded"] += 1
+        pending[key] = (event, data, skip_sid)
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+
+    # ── 송신 ─────────────────────────────────────────────────────────
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self.hz
+        next_at = loop.time()
+        while self._pending:
+            next_at = max(next_at + interval, loop.time())
+            await asyncio.sleep(next_at - loop.time())
+            await self.flush_all()
+
+    async def flush_all(self):
+        rooms = list(self._pending)
+        await asyncio.gather(*(self.flush(room_id) for room_id in rooms), return_exceptions=True)
+
+    async def flush(self, room_id: str):
+        """방의 대기 이벤트를 프레임 1개로 즉시 송신 (게임 종료 직전 등)"""
+        pending = self._pending.pop(room_id, None)
+        if not pending:
+            return
+        events = [{"e": event, "d": data, "skip": skip_sid} for event, data, skip_sid in pending.values()]
+        self.stats["frames"] += 1
+        self.stats["packets"] += 1
+        self.stats["events_out"] += len(events)
+        try:
+            await self.emit(self.frame_event, {"f": next(self._frames), "events": events}, room=room_id)
+        except Exception:
+            logger.exception(f"[EmitBatcher] 프레임 송신 실패: {room_id}")
+
+    def discard(self, room_id: str):
+        self._pending.pop(room_id, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"hz": self.hz, "rooms_pending": len(self._pending), **self.stats}
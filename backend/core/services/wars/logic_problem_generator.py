@@ -2,20 +2,20 @@
 [생성일: 2026-03-04] LogicRun AI 문제 생성기
 - Phase1: speedRounds (빈칸 채우기 5라운드)
 - Phase2: designSprint (설계 체크리스트 5항목)
-- openai AsyncOpenAI 직접 호출 (langchain 미사용)
+- openai AsyncOpenAI 직접 호출 (langchain 미사용, 공용 LLM 클라이언트 경유)
 """
-import os
 import json
 import asyncio
-from openai import AsyncOpenAI
 
-_client = None
+from core.services.llm_client import get_async_openai_client
+
 
 def _get_client():
-    global _client
-    if _client is None:
-        _client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    return _client
+    # [수정일: 2026-10-18] 공용 LLM 클라이언트 (이벤트 루프별로 공유)
+    client = get_async_openai_client("wars.logic_quest")
+    if client is None:
+        raise RuntimeError("OPENAI_API_KEY가 설정되지 않았습니다.")
+    return client
 
 # ── 주제 풀 (랜덤 다양성 확보) ──────────────────────────
 TOPIC_POOL = [
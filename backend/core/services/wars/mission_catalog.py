@@ -0,0 +1,250 @@
+"""
+mission_catalog.py — Wars ArchDraw 미션 카탈로그 (사전 계산 + 핫 리로드)
+
+생성일: 2026-10-18
+설명: socket_server._get_missions가 첫 로드 결과(실패 시 빈 목록까지)를 프로세스 수명 동안
+      캐싱하고, draw_start/draw_next_round가 라운드마다 미션 복사 + 하드코딩 목록으로
+      팔레트를 다시 만들던 방식을 대체한다.
+
+[구조]
+  - 스냅샷: unit03 PracticeDetail(PROBLEM, 활성) → _transform_to_wars_mission 결과와 함께
+    required 집합, 팔레트 extra 후보(PALETTE_COMPONENT_IDS - required)를 미리 계산
+  - 인덱스
+      difficulty: content_data['difficulty'] 우선, 없으면 problem_id 접두어(jr_ / adv_)
+      topic     : content_data['topic'/'topics'] + required 컴포넌트 ID (예: 'queue', 'cache')
+  - 라운드 시작 시 하는 일은 후보 필터 + random.choice + extra 4개 샘플링뿐 (DB/변환 없음)
+  - 방별 중복 방지: 호출자가 넘긴 exclude(이미 출제한 미션 ID)를 빼고 고르며,
+    전부 출제했으면 처음부터 다시 돈다
+
+[갱신]
+  - MISSION_CATALOG_TTL(기본 10분)마다 재구축
+  - PracticeDetail(unit03) 저장/삭제 시 core.signals가 invalidate_mission_catalog() 호출
+    → 현재 프로세스 즉시 무효화 + 'invalidation' 캐시의 세대(generation) 값 갱신
+    → 다른 워커는 다음 조회 때 세대 변경을 보고 재구축
+      [수정 2026-10-18] default(LocMem)는 프로세스마다 따로라 다른 워커/관리 커맨드의 갱신이 보이지
+      않았음 → 워커 간 공유되는 캐시 별칭(settings.CACHES['invalidation'], 기본 파일 캐시)에 기록
+  - 구축 실패 시 이전 스냅샷을 유지하고 RETRY_AFTER초 뒤 재시도 (빈 목록을 영구 캐싱하지 않음)
+"""
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+from core.views.wars.wars_mission_view import _transform_to_wars_mission
+
+logger = logging.getLogger(__name__)
+
+GENERATION_CACHE_KEY = 'mission_catalog:generation'
+GENERATION_CACHE_ALIAS = 'invalidation'
+MISSION_PRACTICE_ID = 'unit03'
+RETRY_AFTER = 30
+
+# 팔레트에 올릴 수 있는 전체 컴포넌트 ID (클라이언트에 아이콘/파일이 있는 것만)
+PALETTE_COMPONENT_IDS = (
+    'client', 'user', 'lb', 'server', 'cdn', 'origin', 'cache', 'db',
+    'producer', 'queue', 'consumer', 'api', 'apigw', 'writesvc', 'readsvc',
+    'writedb', 'readdb', 'auth', 'order', 'payment', 'waf', 'dns',
+)
+PALETTE_EXTRA_COUNT = 4
+
+DIFFICULTY_PREFIXES = {
+    'jr': 'junior',
+    'adv': 'advanced',
+}
+
+
+def generation_cache():
+    """세대 값 저장소 (워커 프로세스 간 공유). 별칭이 없으면 default"""
+    try:
+        return caches[getattr(settings, 'GENERATION_CACHE_ALIAS', GENERATION_CACHE_ALIAS)]
+    except InvalidCacheBackendError:
+        return caches['default']
+
+
+def load_mission_details() -> List:
+    """동기 DB 쿼리 (카탈로그 구축 시에만 호출)"""
+    from core.models import PracticeDetail
+
+    return list(
+        PracticeDetail.objects
+        .filter(practice_id=MISSION_PRACTICE_ID, detail_type='PROBLEM', is_active=True)
+        .order_by('display_order')
+    )
+
+
+def _difficulty_of(mission: dict, data: dict) -> str:
+    if data.get('difficulty'):
+        return str(data['difficulty']).strip().lower()
+    prefix = str(mission.get('id', '')).split('_', 1)[0].lower()
+    return DIFFICULTY_PREFIXES.get(prefix, 'standard')
+
+
+def _topics_of(mission: dict, data: dict) -> set:
+    topics = data.get('topics') or ([data['topic']] if data.get('topic') else [])
+    return {str(t).strip().lower() for t in topics} | set(mission['required'])
+
+
+class _Entry:
+    """미션 1개 + 라운드 시작에 필요한 사전 계산 값"""
+
+    __slots__ = ('mission', 'required_set', 'extra_pool', 'difficulty', 'topics')
+
+    def __init__(self, detail):
+        data = detail.content_data or {}
+        self.mission = _transform_to_wars_mission(detail)
+        self.required_set = frozenset(self.mission['required'])
+        self.extra_pool = tuple(c for c in PALETTE_COMPONENT_IDS if c not in self.required_set)
+        self.difficulty = _difficulty_of(self.mission, data)
+        self.topics = frozenset(_topics_of(self.mission, data))
+
+    @property
+    def id(self) -> str:
+        return self.mission['id']
+
+    def question(self, round_no: int) -> dict:
+        """라운드 출제용 사본: required + 랜덤 extra 4개 팔레트"""
+        question = dict(self.mission)
+        question['required'] = list(self.mission['required'])
+        question['round'] = round_no
+        question['palette_ids'] = question['required'] + random.sample(
+            self.extra_pool, min(PALETTE_EXTRA_COUNT, len(self.extra_pool))
+        )
+        return question
+
+
+class _Snapshot:
+    """한 번 구축된 카탈로그 (재구축 시 통째로 교체)"""
+
+    def __init__(self, entries: List[_Entry], generation):
+        self.entries = entries
+        self.generation = generation
+        self.built_at = time.time()
+        self.by_id = {e.id: e for e in entries}
+        self.by_difficulty: Dict[str, List[_Entry]] = defaultdict(list)
+        self.by_topic: Dict[str, List[_Entry]] = defaultdict(list)
+        for entry in entries:
+            self.by_difficulty[entry.difficulty].append(entry)
+            for topic in entry.topics:
+                self.by_topic[topic].append(entry)
+
+    def candidates(self, difficulty: str = '', topic: str = '') -> List[_Entry]:
+        """조건에 맞는 미션. 조건에 맞는 게 없으면 전체"""
+        pool = self.entries
+        if difficulty:
+            pool = self.by_difficulty.get(difficulty.strip().lower()) or pool
+        if topic:
+            topic_ids = {id(e) for e in self.by_topic.get(topic.strip().lower(), ())}
+            pool = [e for e in pool if id(e) in topic_ids] or pool
+        return pool
+
+
+_EMPTY = _Snapshot([], None)
+
+
+class MissionCatalog:
+    """unit03 미션의 프로세스 메모리 카탈로그"""
+
+    def __init__(self, ttl: int = 600, loader: Callable[[], Iterable] = load_mission_details):
+        self.ttl = ttl
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._failed_at = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self._snapshot.entries) if self._snapshot else 0
+
+    # ── 구축/무효화 ─────────────────────────────────────────────────
+
+    def _needs_rebuild(self, snapshot: Optional[_Snapshot], generation) -> bool:
+        if snapshot is not None and time.time() - snapshot.built_at <= self.ttl \
+                and generation == snapshot.generation:
+            return False
+        # 직전 구축이 실패했으면 RETRY_AFTER 동안은 DB를 다시 두드리지 않음
+        return time.time() - self._failed_at > RETRY_AFTER
+
+    def current(self) -> _Snapshot:
+        """동기 컨텍스트용 (뷰/관리 커맨드). 필요하면 DB에서 재구축"""
+        snapshot = self._snapshot
+        if not self._needs_rebuild(snapshot, generation_cache().get(GENERATION_CACHE_KEY)):
+            return snapshot or _EMPTY
+        return self._rebuild()
+
+    async def acurrent(self) -> _Snapshot:
+        """async 컨텍스트용 (Socket.IO 핸들러). 재구축할 때만 스레드로 DB 조회"""
+        snapshot = self._snapshot
+        if not self._needs_rebuild(snapshot, await generation_cache().aget(GENERATION_CACHE_KEY)):
+            return snapshot or _EMPTY
+        return await sync_to_async(self._rebuild)()
+
+    def _rebuild(self) -> _Snapshot:
+        with self._lock:
+            generation = generation_cache().get(GENERATION_CACHE_KEY)
+            if not self._needs_rebuild(self._snapshot, generation):
+                return self._snapshot or _EMPTY
+            try:
+                self._snapshot = _Snapshot([_Entry(d) for d in self.loader()], generation)
+                self._failed_at = 0.0
+                logger.info(f'[MissionCatalog] 미션 {self.size}개 로드 (generation={generation})')
+            except Exception:
+                self._failed_at = time.time()
+                logger.exception('[MissionCatalog] 미션 로드 실패 — 이전 카탈로그 유지')
+            return self._snapshot or _EMPTY
+
+    def invalidate(self):
+        """다음 조회 때 재구축 (재구축이 실패해도 지금 스냅샷으로 계속 출제)"""
+        with self._lock:
+            if self._snapshot is not None:
+                self._snapshot.built_at = 0.0
+            self._failed_at = 0.0
+
+    # ── 출제 ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def pick(snapshot: _Snapshot, round_no: int, exclude: Iterable[str] = (),
+             difficulty: str = '', topic: str = '') -> Optional[dict]:
+        """
+        exclude(방에서 이미 출제한 미션 ID)를 제외하고 하나를 골라 라운드 문제로 반환.
+        후보를 모두 출제했으면 exclude를 무시하고 다시 고른다. 미션이 없으면 None.
+        """
+        pool = snapshot.candidates(difficulty, topic)
+        if not pool:
+            return None
+        used = set(exclude or ())
+        fresh = [e for e in pool if e.id not in used]
+        return random.choice(fresh or pool).question(round_no)
+
+    async def asample(self, round_no: int, exclude: Iterable[str] = (),
+                      difficulty: str = '', topic: str = '') -> Optional[dict]:
+        return self.pick(await self.acurrent(), round_no, exclude, difficulty, topic)
+
+    def missions(self) -> List[dict]:
+        """변환된 미션 목록 (WarsMissionsView 응답용)"""
+        return [entry.mission for entry in self.current().entries]
+
+
+_catalog: Optional[MissionCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_mission_catalog() -> MissionCatalog:
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = MissionCatalog(ttl=getattr(settings, 'MISSION_CATALOG_TTL', 600))
+        return _catalog
+
+
+def invalidate_mission_catalog():
+    """unit03 미션 데이터가 바뀐 뒤 호출 (core.signals)"""
+    generation_cache().set(GENERATION_CACHE_KEY, time.time(), timeout=None)
+    if _catalog is not None:
+        _catalog.invalidate()
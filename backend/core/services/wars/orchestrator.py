@@ -10,20 +10,43 @@ orchestrator.py — WarsOrchestrator (LangGraph 버전)
 [수정 이력]
   2026-03-02  on_canvas_update → asyncio.to_thread 래핑으로 이벤트 루프 블로킹 해결
               StateMachine에서 can_trigger_* 제거 → trigger_policy 모듈로 이전 반영
+  2026-10-18  LangGraph 진입 전 룰 기반 사전 게이트(_pre_gate) 추가
+              → 개입이 불가능한 상황에서는 decide_action(LLM)을 호출하지 않음
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import time
+from collections import Counter, OrderedDict
 from typing import Dict, Any, Optional
 
 from core.services.wars.state_machine import StateMachine, DrawRoomState, GameState
 from core.services.wars.eval_agent import EvalAgent
 from core.services.wars.agents.orchestrator.graph import get_orchestrator_graph
+from core.services.wars.trigger_policy import can_trigger_coach, can_trigger_chaos, in_round_start_grace
 
 logger = logging.getLogger(__name__)
 
 
+def design_fingerprint(room_state: DrawRoomState) -> str:
+    """
+    [수정일: 2026-10-18] 개입 판단에 영향을 주는 설계 상태의 지문.
+    플레이어별 노드/화살표 + 힌트 횟수 + Chaos 발동 여부만 반영한다 (시각 정보 제외).
+    """
+    designs = {
+        sid: [design.get("nodes", []), design.get("arrows", [])]
+        for sid, design in room_state.player_designs.items()
+    }
+    hints = {sid: len(history) for sid, history in room_state.hint_history.items()}
+    payload = json.dumps(
+        [designs, hints, room_state.chaos_triggered_at > 0],
+        sort_keys=True, default=str, separators=(",", ":"),
+    )
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
 class WarsOrchestrator:
     """
     ArchDrawQuiz Wars 미니게임 Orchestrator.
@@ -31,9 +54,17 @@ class WarsOrchestrator:
     CoachAgent / ChaosAgent 개입 여부와 타이밍을 AI가 결정한다.
     """
 
+    # [수정일: 2026-10-18] 사전 게이트 — 같은 상황에서 "개입 없음" 판정을 받은 뒤 다시 LLM에 묻기까지의 간격 (초)
+    # 설계/힌트/발동 가능 플레이어가 바뀌면 즉시 다시 묻는다.
+    GATE_REASK_SEC = 30.0
+    GATE_MAX_ROOMS = 4096
+
     def __init__(self):
         self.state_machine = StateMachine()
         self.eval_agent    = EvalAgent()
+        # 방별 마지막 "개입 없음" 판정 {room_id: (지문, 시각)} — 프로세스 메모리 (최적화 용도)
+        self._noop_decisions: "OrderedDict[str, tuple]" = OrderedDict()
+        self.gate_stats = Counter()
 
     # ──────────────────────────────────────────────────────────
     # 라운드 시작
@@ -54,6 +85,7 @@ class WarsOrchestrator:
         room_state.player_designs     = {}
         room_state.hint_history       = {}
         room_state.past_event_ids     = []
+        self._noop_decisions.pop(room_state.room_id, None)
 
         return self.state_machine.transition(room_state, GameState.PLAYING)
 
@@ -96,9 +128,17 @@ class WarsOrchestrator:
         cooldown = self.AGENT_CALL_COOLDOWN if not is_poll else 1.0 # 폴링 시에는 조금 더 유연하게(1s)
         
         if now - last_called < cooldown:
+            self.gate_stats["skipped_cooldown"] += 1
             return {"coach_hint": None, "chaos_event": None}
         room_state._last_agent_call_per_sid[sid] = now
 
+        # 2-1. [수정일: 2026-10-18] 사전 게이트 — 개입 불가능하면 LangGraph(LLM) 진입 생략
+        skip_reason, fingerprint = self._pre_gate(room_state, sid)
+        if skip_reason:
+            self.gate_stats[f"skipped_{skip_reason}"] += 1
+            return {"coach_hint": None, "chaos_event": None}
+        self.gate_stats["graph_runs"] += 1
+
         # 3. OrchestratorAgent에 넘길 player_snapshots 빌드
         player_snapshots = {}
         for player_sid, design in room_state.player_designs.items():
@@ -148,6 +188,10 @@ class WarsOrchestrator:
 
         result = {"coach_hint": None, "chaos_event": None}
 
+        if not final_state.get("dispatched"):
+            # 개입 없음 판정 → 같은 상황이면 GATE_REASK_SEC 동안 다시 묻지 않음
+            self._remember_noop(room_state.room_id, fingerprint)
+
         # 5. CoachAgent 결과 처리
         coach_hint = final_state.get("coach_hint")
         if coach_hint and coach_hint.get("message"):
@@ -195,6 +239,77 @@ class WarsOrchestrator:
 
         return result
 
+    def _pre_gate(self, room_state: DrawRoomState, sid: str):
+        """
+        [수정일: 2026-10-18] LangGraph 진입 전 룰 기반 판단 (LLM 없음).
+        decide_action의 하드 가드와 trigger_policy를 먼저 적용해, 어떤 개입도 불가능한 상황이면
+        건너뛸 사유를 반환한다. 반환: (사유 또는 None, 상황 지문)
+        """
+        if room_state.state != GameState.PLAYING:
+            return "not_playing", None
+        if in_round_start_grace(room_state):
+            return "grace", None
+
+        # Coach 대상은 LLM/룰 폴백 모두 요청자 외 플레이어(격차 시 뒤처진 쪽)도 될 수 있으므로 전원 확인
+        sids = set(room_state.player_designs) | {sid}
+        coach_sids = sorted(s for s in sids if can_trigger_coach(room_state, s))
+        chaos_ready = can_trigger_chaos(room_state)
+        if not coach_sids and not chaos_ready:
+            return "no_trigger", None
+
+        fingerprint = f"{design_fingerprint(room_state)}:{','.join(coach_sids)}:{int(chaos_ready)}"
+        noop = self._noop_decisions.get(room_state.room_id)
+        if noop and noop[0] == fingerprint and time.time() - noop[1] < self.GATE_REASK_SEC:
+            return "unchanged", fingerprint
+        return None, fingerprint
+
+    def _remember_noop(self, room_id: str, fingerprint: Optional[str]):
+        if not fingerprint:
+            return
+        self._noop_decisions[room_id] = (fingerprint, time.time())
+        self._noop_decisions.move_to_end(room_id)
+        while len(self._noop_decisions) > self.GATE_MAX_ROOMS:
+            self._noop_decisions.popitem(last=False)
+
+    def gate_metrics(self) -> Dict[str, Any]:
+        """사전 게이트 카운터 — llm_avoided: 게이트 덕분에 생략된 그래프(LLM) 실행 수"""
+        stats = dict(self.gate_stats)
+        avoided = sum(v for k, v in stats.items() if k.startswith("skipped_") and k != "skipped_cooldown")
+        return {**stats, "llm_avoided": avoided}
+
+    def merge_result(
+        self,
+        target: DrawRoomState,
+        source: DrawRoomState,
+        result: Dict[str, Any],
+    ) -> None:
+        """
+        [수정일: 2026-10-18] 다른 워커/이벤트가 그 사이 갱신한 최신 상태(target)에
+        스냅샷(source)에서 실행한 on_canvas_update 결과만 반영한다.
+        (공유 저장소 사용 시 LLM 대기 동안 방 잠금을 잡지 않기 위함)
+        """
+        if target is source:
+            return
+
+        last_calls = dict(getattr(target, "_last_agent_call_per_sid", {}))
+        last_calls.update(getattr(source, "_last_agent_call_per_sid", {}))
+        target._last_agent_call_per_sid = last_calls
+
+        coach_hint = result.get("coach_hint")
+        if coach_hint:
+            target_sid = coach_hint.get("_target_sid")
+            target.coach_triggered_at = source.coach_triggered_at
+            if target_sid:
+                target.hint_history[target_sid] = source.hint_history.get(target_sid, [])
+
+        chaos_event = result.get("chaos_event")
+        if chaos_event:
+            target.chaos_triggered_at = source.chaos_triggered_at
+            target.chaos_event_id = source.chaos_event_id
+            target.past_event_ids = list(source.past_event_ids)
+            if target.state != GameState.IN_BASKET:
+                self.state_machine.transition(target, GameState.IN_BASKET)
+
     # ──────────────────────────────────────────────────────────
     # 장애 이벤트 만료 — IN_BASKET → PLAYING 복귀
     # ──────────────────────────────────────────────────────────
@@ -0,0 +1,226 @@
+"""
+room_store.py — Wars Socket.IO 방 상태 저장소
+
+socket_server.py의 방 상태(draw/run/bubble 방, 방장, 타이머 상태, DrawRoomState)를
+모듈 전역 dict 대신 이 저장소를 통해 읽고 쓴다.
+
+[백엔드]
+    InMemoryRoomStore : 단일 워커용 (기본값). 객체를 참조 그대로 보관하므로 기존 동작과 동일.
+    RedisRoomStore    : 다중 워커용. WARS_REDIS_URL 설정 시 사용.
+                        값은 JSON으로 직렬화하며, 방 단위 잠금과 tick 루프 lease를 Redis 키로 관리한다.
+
+[사용 규칙]
+    - 읽기-수정-쓰기는 반드시 `async with store.lock(kind, room_id):` 안에서 get → 수정 → set 순서로 수행
+    - 주기 루프(타이머/폴링)는 acquire_lease()로 소유권을 얻은 워커 한 곳에서만 실행하고,
+      매 주기마다 renew_lease()로 갱신한다. 갱신 실패 시 루프를 종료한다.
+    - [수정 2026-10-18] 잠금을 LOCK_ACQUIRE_TIMEOUT초 안에 얻지 못하면 RoomLockTimeout
+
+[관련 설정]
+    WARS_REDIS_URL : 비어 있으면 InMemoryRoomStore, 값이 있으면 RedisRoomStore + AsyncRedisManager
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any
+
+from django.conf import settings
+
+from core.services.wars.state_machine import DrawRoomState
+
+logger = logging.getLogger(__name__)
+
+# 워커(프로세스) 고유 ID — lease 소유자 식별용
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+# DrawRoomState는 dataclass이므로 종류별로 직렬화 방식을 구분
+_DRAW_STATE_KIND = "draw_state"
+
+# 방 데이터 기본 만료 시간 (초) — 비정상 종료로 정리되지 않은 방의 누수 방지
+ROOM_TTL_SECONDS = 6 * 60 * 60
+
+# 방 잠금 획득 대기 상한 (초) — 잠금을 쥔 채 멈춘 핸들러 때문에 다른 이벤트가 무한정 대기하지 않도록
+LOCK_ACQUIRE_TIMEOUT = 10.0
+
+
+class RoomLockTimeout(TimeoutError):
+    """방 잠금을 제한 시간 안에 얻지 못한 경우"""
+    pass
+
+
+class InMemoryRoomStore:
+    """단일 프로세스용 저장소 — 값을 참조 그대로 보관 (직렬화 없음)"""
+
+    def __init__(self):
+        self._data: dict = {}
+        self._locks: dict = {}  # (kind, room_id) → [asyncio.Lock, 사용 중인 코루틴 수]
+        self._leases: dict = {}
+
+    async def get(self, kind: str, room_id: str, default: Any = None) -> Any:
+        return self._data.get((kind, room_id), default)
+
+    async def set(self, kind: str, room_id: str, value: Any):
+        self._data[(kind, room_id)] = value
+
+    async def delete(self, kind: str, room_id: str):
+        self._data.pop((kind, room_id), None)
+
+    async def exists(self, kind: str, room_id: str) -> bool:
+        return (kind, room_id) in self._data
+
+    @contextlib.asynccontextmanager
+    async def lock(self, kind: str, room_id: str, timeout: float = LOCK_ACQUIRE_TIMEOUT):
+        key = (kind, room_id)
+        entry = self._locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            try:
+                await asyncio.wait_for(entry[0].acquire(), timeout)
+            except asyncio.TimeoutError:
+                raise RoomLockTimeout(f"방 잠금 대기 시간 초과: {kind}:{room_id}")
+            try:
+                yield
+            finally:
+                entry[0].release()
+        finally:
+            # 기다리는 코루틴이 없으면 항목 제거 (삭제된 방의 잠금이 계속 쌓이지 않도록)
+            entry[1] -= 1
+            if entry[1] == 0 and self._locks.get(key) is entry:
+                del self._locks[key]
+
+    async def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        holder, expires_at = self._leases.get(name, (None, 0.0))
+        if holder in (None, owner) or expires_at < time.monotonic():
+            self._leases[name] = (owner, time.monotonic() + ttl)
+            return True
+        return False
+
+    async def renew_lease(self, name: str, owner: str, ttl: float) -> bool:
+        holder, _ = self._leases.get(name, (None, 0.0))
+        if holder != owner:
+            return False
+        self._leases[name] = (owner, time.monotonic() + ttl)
+        return True
+
+    async def release_lease(self, name: str, owner: str):
+        if self._leases.get(name, (None, 0.0))[0] == owner:
+            del self._leases[name]
+
+
+class RedisRoomStore:
+    """
+    Redis 프로토콜 기반 저장소 (redis.asyncio 클라이언트 또는 호환 가짜 클라이언트 사용).
+
+    키 구조:
+        wars:{kind}:{room_id}        방 데이터 (JSON)
+        wars:lock:{kind}:{room_id}   방 단위 잠금 (SET NX PX)
+        wars:lease:{name}            tick 루프 소유권 lease (SET NX PX)
+    """
+
+    LOCK_TIMEOUT_MS = 30_000
+    LOCK_POLL_SECONDS = 0.02
+
+    # 값이 자신의 토큰/owner일 때만 삭제·만료 갱신 (GET 후 DEL/PEXPIRE 사이에 새 소유자가 생기는 경쟁 방지)
+    COMPARE_AND_DELETE = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+    )
+    COMPARE_AND_PEXPIRE = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) end return 0"
+    )
+
+    def __init__(self, client, prefix: str = "wars", ttl: int = ROOM_TTL_SECONDS):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, kind: str, room_id: str) -> str:
+        return f"{self.prefix}:{kind}:{room_id}"
+
+    @staticmethod
+    def _dumps(kind: str, value: Any) -> str:
+        if kind == _DRAW_STATE_KIND and isinstance(value, DrawRoomState):
+            value = value.to_dict()
+        return json.dumps(value, ensure_ascii=False)
+
+    @staticmethod
+    def _loads(kind: str, raw) -> Any:
+        value = json.loads(raw)
+        if kind == _DRAW_STATE_KIND and value is not None:
+            return DrawRoomState.from_dict(value)
+        return value
+
+    async def get(self, kind: str, room_id: str, default: Any = None) -> Any:
+        raw = await self.client.get(self._key(kind, room_id))
+        return default if raw is None else self._loads(kind, raw)
+
+    async def set(self, kind: str, room_id: str, value: Any):
+        await self.client.set(self._key(kind, room_id), self._dumps(kind, value), ex=self.ttl)
+
+    async def delete(self, kind: str, room_id: str):
+        await self.client.delete(self._key(kind, room_id))
+
+    async def exists(self, kind: str, room_id: str) -> bool:
+        return bool(await self.client.exists(self._key(kind, room_id)))
+
+    @contextlib.asynccontextmanager
+    async def lock(self, kind: str, room_id: str, timeout: float = LOCK_ACQUIRE_TIMEOUT):
+        key = f"{self.prefix}:lock:{kind}:{room_id}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + timeout
+        while not await self.client.set(key, token, nx=True, px=self.LOCK_TIMEOUT_MS):
+            if time.monotonic() >= deadline:
+                raise RoomLockTimeout(f"방 잠금 대기 시간 초과: {kind}:{room_id}")
+            await asyncio.sleep(self.LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            await self.client.eval(self.COMPARE_AND_DELETE, 1, key, token)
+
+    async def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        key = f"{self.prefix}:lease:{name}"
+        if await self.client.set(key, owner, nx=True, px=int(ttl * 1000)):
+            return True
+        # 이미 소유 중인 경우 재진입 허용
+        return await self.renew_lease(name, owner, ttl)
+
+    async def renew_lease(self, name: str, owner: str, ttl: float) -> bool:
+        key = f"{self.prefix}:lease:{name}"
+        return bool(await self.client.eval(self.COMPARE_AND_PEXPIRE, 1, key, owner, int(ttl * 1000)))
+
+    async def release_lease(self, name: str, owner: str):
+        key = f"{self.prefix}:lease:{name}"
+        await self.client.eval(self.COMPARE_AND_DELETE, 1, key, owner)
+
+
+_room_store = None
+
+
+def get_room_store():
+    """프로세스 전역 방 상태 저장소 (WARS_REDIS_URL 설정 여부로 백엔드 선택)"""
+    global _room_store
+    if _room_store is None:
+        redis_url = getattr(settings, "WARS_REDIS_URL", "")
+        if redis_url:
+            import redis.asyncio as aioredis
+            _room_store = RedisRoomStore(aioredis.from_url(redis_url))
+            logger.info(f"[RoomStore] Redis 백엔드 사용 (worker={WORKER_ID})")
+        else:
+            _room_store = InMemoryRoomStore()
+    return _room_store
+
+
+def get_client_manager():
+    """
+    Socket.IO 클라이언트 매니저.
+    Redis 사용 시 AsyncRedisManager(pub/sub)로 워커 간 emit을 전파하고, 아니면 기본 매니저(None)를 사용.
+    """
+    redis_url = getattr(settings, "WARS_REDIS_URL", "")
+    if not redis_url:
+        return None
+    import socketio
+    return socketio.AsyncRedisManager(redis_url, channel="wars-socketio")
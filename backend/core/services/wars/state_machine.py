@@ -26,7 +26,7 @@ LLM 없음. 순수 Python 규칙으로만 동작.
 import time
 import logging
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, fields
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -84,19 +84,56 @@ class DrawRoomState:
     # ChaosAgent 이번 게임에서 발동된 이벤트 ID 이력 (중복 방지용)
     past_event_ids: list = field(default_factory=list)
 
+    # [수정일: 2026-10-18] 다중 워커 공유 저장소(room_store.RedisRoomStore)용 직렬화
+    # - WarsOrchestrator가 동적으로 붙이는 _last_agent_call_per_sid(쿨다운 기록)도 함께 보존
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["state"] = self.state.value
+        data["_last_agent_call_per_sid"] = dict(getattr(self, "_last_agent_call_per_sid", {}))
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DrawRoomState":
+        data = dict(data)
+        last_calls = data.pop("_last_agent_call_per_sid", None)
+        data["state"] = GameState(data.get("state", GameState.WAITING.value))
+        known = {f.name for f in fields(cls)}
+        room_state = cls(**{k: v for k, v in data.items() if k in known})
+        if last_calls is not None:
+            room_state._last_agent_call_per_sid = last_calls
+        return room_state
+
     def elapsed(self) -> float:
         """현재 상태 진입 후 경과 시간 (초)"""
         return time.time() - self.entered_at
 
-    def update_design(self, sid: str, nodes: list, arrows: list):
-        """플레이어 설계 스냅샷 갱신"""
+    def update_design(self, sid: str, nodes: list, arrows: list, seq: Optional[int] = None):
+        """플레이어 설계 스냅샷 갱신 (seq: 델타 동기화 버전, 생략 시 기존 값 유지)"""
+        prev_seq = self.player_designs.get(sid, {}).get("seq", 0)
         self.player_designs[sid] = {
             "nodes": nodes,
             "arrows": arrows,
             "node_count": len(nodes),
             "last_updated": time.time(),
+            "seq": prev_seq if seq is None else seq,
         }
 
+    def apply_design_patch(self, sid: str, seq: int, ops: list) -> bool:
+        """
+        [수정일: 2026-10-18] 델타(canvas_delta op 목록)를 설계에 제자리 적용.
+        seq가 마지막 버전 + 1이 아니면 적용하지 않고 False (클라이언트에 스냅샷 요청).
+        잘못된 op는 CanvasDeltaError — 부분 적용을 막기 위해 사본에 적용 후 교체한다.
+        """
+        from core.services.wars.canvas_delta import apply_ops
+
+        design = self.player_designs.get(sid) or {"nodes": [], "arrows": [], "seq": 0}
+        if design.get("seq", 0) + 1 != seq:
+            return False
+        nodes, arrows = list(design["nodes"]), list(design["arrows"])
+        apply_ops(nodes, arrows, ops)
+        self.update_design(sid, nodes, arrows, seq=seq)
+        return True
+
     def get_node_count(self, sid: str) -> int:
         return self.player_designs.get(sid, {}).get("node_count", 0)
 
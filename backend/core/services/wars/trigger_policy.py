@@ -7,7 +7,8 @@ StateMachine은 상태 전환만 담당하고,
 
 사용처:
   - orchestrator/nodes.py (_rule_based_action_plan 폴백)
-  - orchestrator.py (직접 호출 없음 — nodes.py 를 통해 간접 사용)
+  - orchestrator.py (_pre_gate: LangGraph 진입 전 개입 가능 여부 사전 판단)
+  - draw_scheduler.py (poll_targets: 주기 감사 대상 플레이어 선별)
 """
 
 import time
@@ -28,6 +29,11 @@ _COACH_MISSING_ELAPSED = 25   # 이 시간이 지나도 필수 컴포넌트 50%
 _CHAOS_MIN_NODES       = 2    # Chaos 발동 최소 배치 노드 수 (3 -> 2 하향)
 
 
+def in_round_start_grace(room_state: "DrawRoomState") -> bool:
+    """[수정일: 2026-10-18] 라운드 시작 직후 자유 탐색 시간이면 True (Coach/Chaos 모두 개입 불가)"""
+    return room_state.elapsed() < _ROUND_START_GRACE
+
+
 def can_trigger_coach(room_state: "DrawRoomState", sid: str) -> bool:
     """
     CoachAgent 개입 가능 여부 판단.
@@ -109,7 +115,7 @@ def can_trigger_chaos(room_state: "DrawRoomState") -> bool:
     if room_state.state != GameState.PLAYING:
         return False
 
-    if room_state.elapsed() < _ROUND_START_GRACE:
+    if in_round_start_grace(room_state):
         return False
 
     if room_state.chaos_triggered_at > 0:
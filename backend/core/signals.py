@@ -0,0 +1,20 @@
+"""
+core/signals.py — 모델 변경 시 프로세스 캐시/인덱스 무효화
+[작성일: 2026-10-18]
+
+CoreConfig.ready()에서 임포트되어 리시버가 등록된다.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import PracticeDetail
+from core.services.wars.mission_catalog import MISSION_PRACTICE_ID, invalidate_mission_catalog
+
+
+@receiver(post_save, sender=PracticeDetail, dispatch_uid='wars_mission_catalog_save')
+@receiver(post_delete, sender=PracticeDetail, dispatch_uid='wars_mission_catalog_delete')
+def invalidate_wars_missions(sender, instance, **kwargs):
+    """unit03 문제가 저장/삭제되면 Wars 미션 카탈로그 재구축 (커밋 이후)"""
+    if instance.practice_id == MISSION_PRACTICE_ID and not kwargs.get('raw'):
+        transaction.on_commit(invalidate_mission_catalog)
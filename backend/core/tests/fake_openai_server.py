@@ -0,0 +1,128 @@
+"""
+테스트용 로컬 가짜 OpenAI 서버 (HTTP/1.1 keep-alive).
+
+    with FakeOpenAIServer(delay=0.05) as server:
+        pool = LLMClientPool(api_key="test", base_url=server.base_url)
+
+- POST /v1/chat/completions : 고정 JSON 응답 (stream=true면 SSE 청크)
+- POST /v1/embeddings       : 입력 개수만큼 3차원 벡터
+- fail_next(n, status)로 다음 n건을 실패시켜 재시도 동작을 확인
+- connections / max_in_flight / requests 로 연결 재사용과 동시성 상한을 검증
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeOpenAIServer:
+    def __init__(self, delay: float = 0.0, content: str = '{"ok": true}'):
+        self.delay = delay
+        self.content = content
+        self.requests = []
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._failures = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def fail_next(self, count: int, status: int = 429, retry_after: str = "0"):
+        with self._lock:
+            self._failures.extend([(status, retry_after)] * count)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def _send_json(self, status, payload, headers=None):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server.requests.append({"path": self.path, "headers": dict(self.headers), "body": body})
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    failure = server._failures.pop(0) if server._failures else None
+                try:
+                    time.sleep(server.delay)
+                    if failure:
+                        status, retry_after = failure
+                        self._send_json(status, {"error": {"message": "fake failure", "type": "rate_limit_exceeded"}},
+                                        headers={"Retry-After": retry_after})
+                    elif self.path.endswith("/embeddings"):
+                        inputs = body.get("input") or []
+                        inputs = [inputs] if isinstance(inputs, str) else inputs
+                        self._send_json(200, {
+                            "object": "list",
+                            "model": body.get("model"),
+                            "data": [{"object": "embedding", "index": i, "embedding": [0.1, 0.2, 0.3]}
+                                     for i in range(len(inputs))],
+                            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+                        })
+                    elif body.get("stream"):
+                        self._stream_chat(body)
+                    else:
+                        self._send_json(200, {
+                            "id": "chatcmpl-fake", "object": "chat.completion", "created": int(time.time()),
+                            "model": body.get("model"),
+                            "choices": [{"index": 0, "finish_reason": "stop",
+                                         "message": {"role": "assistant", "content": server.content}}],
+                            "usage": {"prompt_tokens": 11, "completion_tokens": 7, "total_tokens": 18},
+                        })
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def _stream_chat(self, body):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for piece in (server.content[:len(server.content) // 2], server.content[len(server.content) // 2:]):
+                    chunk = {"id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": int(time.time()),
+                             "model": body.get("model"),
+                             "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+                    self._write_chunk(f"data: {json.dumps(chunk)}\n\n".encode())
+                self._write_chunk(b"data: [DONE]\n\n")
+                self._write_chunk(b"")
+
+            def _write_chunk(self, data: bytes):
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+        return Handler
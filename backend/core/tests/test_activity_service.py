@@ -0,0 +1,214 @@
+import importlib
+from io import StringIO
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Max
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from core.models import (
+    Practice, PracticeDetail, UserActivity, UserProblemBest, UserProfile, UserProgress,
+    UserSolvedProblem, UserWarsBest,
+)
+from core.services.activity_service import save_user_problem_record, save_user_wars_score
+from core.views.activity_view import LeaderboardView
+
+
+def make_unit(unit_id, problems):
+    practice = Practice.objects.create(id=unit_id, unit_number=int(unit_id[-2:]), level=1,
+                                       title=unit_id, subtitle='')
+    for i in range(1, problems + 1):
+        PracticeDetail.objects.create(id=f'{unit_id}{i:02d}', practice=practice,
+                                      detail_title=f'문제 {i}', content_data={})
+    return practice
+
+
+def make_profile(username):
+    return UserProfile.objects.create(username=username, user_name=username,
+                                      email=f'{username}@example.com', password='x')
+
+
+def legacy_mastery(profile, practice):
+    """비정규화 이전 LeaderboardView의 행별 집계 (고유 문제 수, 최고점 90점 이상 고유 문제 수)"""
+    solved = UserSolvedProblem.objects.filter(user=profile, practice_detail__practice=practice)
+    return (
+        solved.values('practice_detail').distinct().count(),
+        solved.values('practice_detail').annotate(best=Max('score')).filter(best__gte=90).count(),
+    )
+
+
+class ActivityPointsTests(TestCase):
+    def setUp(self):
+        self.profile = make_profile('points_tester')
+        make_unit('unit01', 3)
+
+    def points(self):
+        return UserActivity.objects.get(user=self.profile).total_points
+
+    def test_first_solve_adds_score(self):
+        result = save_user_problem_record(self.profile, 'unit0101', 60, {})
+
+        self.assertEqual(result['total_points'], 60)
+        self.assertEqual(self.points(), 60)
+
+    def test_improved_score_adds_only_the_difference(self):
+        save_user_problem_record(self.profile, 'unit0101', 60, {})
+        result = save_user_problem_record(self.profile, 'unit0101', 85, {})
+
+        self.assertEqual(result['total_points'], 85)
+        self.assertEqual(UserProblemBest.objects.get(user=self.profile).attempt_count, 2)
+
+    def test_lower_score_does_not_change_points(self):
+        save_user_problem_record(self.profile, 'unit0101', 85, {})
+        result = save_user_problem_record(self.profile, 'unit0101', 40, {})
+
+        self.assertEqual(result['total_points'], 85)
+        self.assertEqual(UserProblemBest.objects.get(user=self.profile).best_score, 85)
+
+    def test_wars_and_practice_points_are_split(self):
+        save_user_problem_record(self.profile, 'unit0101', 70, {})
+        save_user_wars_score(self.profile, 'logic_run', 50, {})
+        result = save_user_wars_score(self.profile, 'logic_run', 30, {})  # 최고 점수 미만 → 변화 없음
+
+        self.assertEqual(
+            (result['total_points'], result['wars_points'], result['practice_points']), (120, 50, 70))
+
+    def test_migration_recomputes_drifted_total(self):
+        save_user_problem_record(self.profile, 'unit0101', 70, {})
+        save_user_wars_score(self.profile, 'code_typing', 40, {})
+        UserActivity.objects.filter(user=self.profile).update(total_points=5, current_rank='GOLD')
+
+        migration = importlib.import_module('core.migrations.0014_recompute_total_points')
+        migration.recompute_total_points(apps, None)
+
+        activity = UserActivity.objects.get(user=self.profile)
+        self.assertEqual((activity.total_points, activity.current_rank), (110, 'BRONZE'))
+        self.assertEqual(save_user_wars_score(self.profile, 'code_typing', 40, {})['practice_points'], 70)
+
+
+class UnitMasteryCountTests(TestCase):
+    def setUp(self):
+        self.profile = make_profile('mastery_tester')
+        self.unit1 = make_unit('unit01', 3)
+        self.unit2 = make_unit('unit02', 2)
+
+    def counts(self, practice):
+        progress = UserProgress.objects.get(user=self.profile, practice=practice)
+        counts = (progress.solved_count, progress.perfect_count)
+        self.assertEqual(counts, legacy_mastery(self.profile, practice))
+        return counts
+
+    def test_first_solve_counts_problem_once(self):
+        save_user_problem_record(self.profile, 'unit0101', 95, {})
+        self.assertEqual(self.counts(self.unit1), (1, 1))
+
+        save_user_problem_record(self.profile, 'unit0102', 60, {})
+        self.assertEqual(self.counts(self.unit1), (2, 1))
+
+    def test_resolve_updates_perfect_only_when_crossing_90(self):
+        save_user_problem_record(self.profile, 'unit0101', 60, {})
+        save_user_problem_record(self.profile, 'unit0101', 80, {})
+        self.assertEqual(self.counts(self.unit1), (1, 0))
+
+        save_user_problem_record(self.profile, 'unit0101', 92, {})
+        self.assertEqual(self.counts(self.unit1), (1, 1))
+
+        # 90점 이상 재제출 / 더 낮은 점수는 변화 없음
+        save_user_problem_record(self.profile, 'unit0101', 100, {})
+        save_user_problem_record(self.profile, 'unit0101', 30, {})
+        self.assertEqual(self.counts(self.unit1), (1, 1))
+
+    def test_next_unit_keeps_counts_separate(self):
+        for detail_id in ('unit0101', 'unit0102', 'unit0103'):
+            result = save_user_problem_record(self.profile, detail_id, 90, {})
+        self.assertEqual(result['progress_rate'], 100)
+
+        result = save_user_problem_record(self.profile, 'unit0201', 70, {})
+        self.assertEqual(result['progress_rate'], 50)
+        self.assertEqual(self.counts(self.unit1), (3, 3))
+        self.assertEqual(self.counts(self.unit2), (1, 0))
+
+
+class LeaderboardMasteryTests(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.unit1 = make_unit('unit01', 2)
+        self.unit2 = make_unit('unit02', 2)
+
+    def leaderboard(self):
+        response = LeaderboardView.as_view()(self.factory.get('/api/core/leaderboard/'))
+        self.assertEqual(response.status_code, 200)
+        return {row['nickname']: {u['unit_id']: u for u in row['mastered_units']}
+                for row in response.data['leaderboard']}
+
+    def test_unit_status_matches_legacy_counts(self):
+        master, learner = make_profile('master'), make_profile('learner')
+        for detail_id in ('unit0101', 'unit0102'):
+            save_user_problem_record(master, detail_id, 95, {})
+        save_user_problem_record(master, 'unit0201', 95, {})
+        save_user_problem_record(learner, 'unit0101', 95, {})
+        save_user_problem_record(learner, 'unit0102', 50, {})
+
+        board = self.leaderboard()
+        self.assertEqual(board['master']['unit01']['unit_status'], 'MASTERED')
+        self.assertEqual(board['master']['unit02']['unit_status'], 'ADVANCED')
+        self.assertEqual(board['learner']['unit01']['unit_status'], 'COMPLETED')
+        self.assertFalse(board['learner']['unit01']['is_perfect'])
+        for profile in (master, learner):
+            for unit in board[profile.username].values():
+                practice = Practice.objects.get(id=unit['unit_id'])
+                self.assertEqual((unit['solved_count'], unit['perfect_count']),
+                                 legacy_mastery(profile, practice))
+                self.assertEqual(unit['total_count'], 2)
+
+    def test_query_count_does_not_grow_with_users(self):
+        def queries():
+            with CaptureQueriesContext(connection) as ctx:
+                self.leaderboard()
+            return len(ctx.captured_queries)
+
+        save_user_problem_record(make_profile('user0'), 'unit0101', 95, {})
+        single = queries()
+        for n in range(1, 5):
+            profile = make_profile(f'user{n}')
+            save_user_problem_record(profile, 'unit0101', 95, {})
+            save_user_problem_record(profile, 'unit0201', 40, {})
+
+        self.assertEqual(queries(), single)
+
+
+class BackfillUnitMasteryTests(TestCase):
+    def test_backfill_matches_legacy_aggregation(self):
+        unit1, unit2 = make_unit('unit01', 3), make_unit('unit02', 2)
+        alice, bob = make_profile('alice'), make_profile('bob')
+        history = [
+            (alice, 'unit0101', 60), (alice, 'unit0101', 95), (alice, 'unit0102', 91),
+            (alice, 'unit0201', 40), (bob, 'unit0101', 100), (bob, 'unit0103', 89),
+        ]
+        for profile, detail_id, score in history:
+            save_user_problem_record(profile, detail_id, score, {})
+        # 증분 필드 도입 이전 데이터: 집계 필드는 0, 진행도 행이 없는 제출 이력도 존재
+        UserProgress.objects.update(solved_count=0, perfect_count=0)
+        UserSolvedProblem.objects.create(user=bob, practice_detail_id='unit0202', score=90)
+
+        call_command('backfill_unit_mastery', stdout=StringIO())
+
+        for profile in (alice, bob):
+            for practice in (unit1, unit2):
+                progress = UserProgress.objects.filter(user=profile, practice=practice).first()
+                counts = (progress.solved_count, progress.perfect_count) if progress else (0, 0)
+                self.assertEqual(counts, legacy_mastery(profile, practice))
+        self.assertEqual(UserProgress.objects.get(user=bob, practice=unit2).progress_rate, 50)
+
+    def test_dry_run_does_not_write(self):
+        make_unit('unit01', 1)
+        profile = make_profile('dry')
+        save_user_problem_record(profile, 'unit0101', 95, {})
+        UserProgress.objects.update(solved_count=0, perfect_count=0)
+
+        call_command('backfill_unit_mastery', '--dry-run', stdout=StringIO())
+
+        self.assertEqual(UserProgress.objects.get(user=profile).solved_count, 0)
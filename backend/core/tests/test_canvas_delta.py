@@ -0,0 +1,36 @@
+from django.test import SimpleTestCase
+
+from core.services.wars.canvas_delta import CanvasDeltaError
+from core.services.wars.state_machine import DrawRoomState
+
+
+class DrawDesignPatchTests(SimpleTestCase):
+    def setUp(self):
+        self.state = DrawRoomState(room_id="r1")
+        self.state.update_design("a", [{"id": 1, "compId": "lb", "x": 0, "y": 0}], [], seq=1)
+
+    def test_ops_are_applied_in_sequence(self):
+        ok = self.state.apply_design_patch("a", 2, [
+            {"op": "add", "kind": "node", "item": {"id": 2, "compId": "db", "x": 5, "y": 5}},
+            {"op": "add", "kind": "arrow", "item": {"id": "1-2", "fid": 1, "tid": 2, "x1": 0, "y1": 0, "x2": 5, "y2": 5}},
+            {"op": "move", "kind": "node", "id": 1, "x": 40, "y": 50, "compId": "ignored"},
+        ])
+        self.assertTrue(ok)
+        self.assertTrue(self.state.apply_design_patch("a", 3, [{"op": "remove", "kind": "arrow", "id": "1-2"}]))
+
+        design = self.state.player_designs["a"]
+        self.assertEqual(design["seq"], 3)
+        self.assertEqual(design["node_count"], 2)
+        self.assertEqual(design["nodes"][0], {"id": 1, "compId": "lb", "x": 40, "y": 50})
+        self.assertEqual(design["arrows"], [])
+
+    def test_gap_or_invalid_op_leaves_design_untouched(self):
+        self.assertFalse(self.state.apply_design_patch("a", 3, [{"op": "remove", "kind": "node", "id": 1}]))
+        with self.assertRaises(CanvasDeltaError):
+            self.state.apply_design_patch("a", 2, [
+                {"op": "remove", "kind": "node", "id": 1},
+                {"op": "move", "kind": "node", "id": 99, "x": 1},
+            ])
+
+        design = self.state.player_designs["a"]
+        self.assertEqual((design["seq"], design["node_count"]), (1, 1))
@@ -0,0 +1,105 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from core.views.job_planner.collectors.crawl_engine import CrawlEngine, CrawlError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_seen = []
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.requests_seen.append((self.path, self.headers.get('If-None-Match')))
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            time.sleep(0.05)
+            if self.path == '/missing':
+                self.send_response(404)
+                self.end_headers()
+                return
+            etag = f'"{self.path}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = f'<html>page {self.path}</html>'.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'crawl': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'crawl-engine-tests'},
+})
+class CrawlEngineTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        _Handler.requests_seen = []
+        _Handler.peak = 0
+        caches['crawl'].clear()
+        self.engine = CrawlEngine(per_host_concurrency=2, politeness_delay=0.0)
+
+    def tearDown(self):
+        self.engine.close()
+
+    def test_fetch_many_keeps_order_and_limits_per_host(self):
+        urls = [f'{self.base}/p{i}' for i in range(6)]
+        responses = self.engine.fetch_many(urls)
+        self.assertEqual([r.url for r in responses], urls)
+        self.assertTrue(all(r.ok for r in responses))
+        self.assertEqual(responses[3].text, '<html>page /p3</html>')
+        self.assertLessEqual(_Handler.peak, 2)
+
+    def test_conditional_get_reuses_stored_body(self):
+        first = self.engine.fetch(f'{self.base}/job')
+        second = self.engine.fetch(f'{self.base}/job')
+        self.assertFalse(first.revalidated)
+        self.assertTrue(second.revalidated)
+        self.assertEqual(second.text, first.text)
+        self.assertEqual(_Handler.requests_seen[-1], ('/job', '"/job"'))
+
+    def test_politeness_delay_spaces_requests(self):
+        engine = CrawlEngine(per_host_concurrency=4, politeness_delay=0.1, conditional=False)
+        try:
+            started = time.monotonic()
+            engine.fetch_many([f'{self.base}/d{i}' for i in range(4)])
+            self.assertGreaterEqual(time.monotonic() - started, 0.3)
+        finally:
+            engine.close()
+
+    def test_error_status(self):
+        response = self.engine.fetch(f'{self.base}/missing')
+        self.assertFalse(response.ok)
+        with self.assertRaises(CrawlError):
+            response.raise_for_status()
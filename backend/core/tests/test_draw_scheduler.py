@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from django.test import SimpleTestCase
+
+from core.services.wars.draw_scheduler import DrawTickScheduler, poll_targets, POLLED, STOP
+from core.services.wars.room_store import InMemoryRoomStore
+from core.services.wars.state_machine import DrawRoomState, GameState
+
+
+class DrawTickSchedulerTests(SimpleTestCase):
+    def test_each_room_polled_once_per_revolution_with_bounded_concurrency(self):
+        visits = {}
+        active = peak = 0
+
+        async def handler(room_id, ctx):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            visits[room_id] = visits.get(room_id, 0) + 1
+            return POLLED
+
+        async def scenario():
+            scheduler = DrawTickScheduler(handler, InMemoryRoomStore(), interval=8, resolution=1, max_concurrency=4)
+            for i in range(1000):
+                await scheduler.schedule(f"room-{i}", autostart=False)
+            for _ in range(scheduler.slots):
+                await scheduler.tick()
+            await scheduler.drain()
+            return scheduler
+
+        scheduler = asyncio.run(scenario())
+        self.assertEqual(len(visits), 1000)
+        self.assertEqual(set(visits.values()), {1})
+        self.assertLessEqual(peak, 4)
+        self.assertEqual(scheduler.metrics()["totals"]["polled"], 1000)
+        self.assertEqual(scheduler.last_tick["due"], 1000)
+
+    def test_busy_room_is_coalesced_and_stop_releases_lease(self):
+        async def scenario():
+            gate = asyncio.Event()
+            store = InMemoryRoomStore()
+
+            async def handler(room_id, ctx):
+                await gate.wait()
+                return STOP
+
+            scheduler = DrawTickScheduler(handler, store, interval=1, resolution=1)
+            await scheduler.schedule("r1", autostart=False)
+            await scheduler.tick()
+            await asyncio.sleep(0)
+            await scheduler.tick()  # 이전 감사가 아직 진행 중
+            busy = scheduler.last_tick["busy"]
+            gate.set()
+            await scheduler.drain()
+            other_worker = await store.acquire_lease(DrawTickScheduler.lease_name("r1"), "other", 5)
+            return busy, "r1" in scheduler, other_worker
+
+        self.assertEqual(asyncio.run(scenario()), (1, False, True))
+
+    def test_metrics_are_logged_every_stats_interval(self):
+        async def handler(room_id, ctx):
+            return POLLED
+
+        async def scenario():
+            scheduler = DrawTickScheduler(handler, InMemoryRoomStore(), interval=1, resolution=1,
+                                          stats_interval=0.05,
+                                          stats_sources={"orchestrator_gate": lambda: {"llm_avoided": 3}})
+            await scheduler.schedule("r1", autostart=False)
+            await scheduler.tick()  # 주기 전 → 로그 없음
+            await asyncio.sleep(0.06)
+            await scheduler.tick()
+            await scheduler.drain()
+
+        with self.assertLogs("core.services.wars.draw_scheduler", level="INFO") as logs:
+            asyncio.run(scenario())
+        stats = [line for line in logs.output if "통계" in line]
+        self.assertEqual(len(stats), 1)
+        self.assertIn("'rooms': 1", stats[0])
+        self.assertIn("'orchestrator_gate': {'llm_avoided': 3}", stats[0])
+
+
+class PollTargetsTests(SimpleTestCase):
+    def test_unchanged_design_without_triggers_is_skipped(self):
+        state = DrawRoomState(room_id="r1", state=GameState.PLAYING)
+        state.mission_required = ["lb"]
+        state.update_design("a", [{"compId": "lb"}], [])
+        seen = {}
+
+        self.assertEqual(poll_targets(state, ["a"], seen), (["a"], False))
+        self.assertEqual(poll_targets(state, ["a"], seen), ([], False))
+
+        # 무조작 시간이 길어지면 Coach 조건 충족 → 설계 변경 없어도 대상
+        state.entered_at -= 60
+        state.player_designs["a"]["last_updated"] = time.time() - 30
+        seen["a"] = state.player_designs["a"]["last_updated"]
+        self.assertEqual(poll_targets(state, ["a"], seen), (["a"], False))
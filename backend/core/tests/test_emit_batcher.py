@@ -0,0 +1,44 @@
+import asyncio
+
+from django.test import SimpleTestCase
+
+from core.services.wars.emit_batcher import RoomEmitBatcher
+
+
+class RoomEmitBatcherTests(SimpleTestCase):
+    def setUp(self):
+        self.sent = []
+
+    async def emit(self, event, data, room=None, skip_sid=None):
+        self.sent.append((event, data, room, skip_sid))
+
+    def test_fever_burst_is_coalesced_into_frames(self):
+        async def scenario():
+            batcher = RoomEmitBatcher(self.emit, hz=50, frame_event="bubble_frame")
+            for i in range(30):
+                await batcher.supersede("r1", "a", "bubble_move_update", {"pos": i}, skip_sid="a")
+                await batcher.push("r1", "bubble_receive_fever", {"count": 3}, skip_sid="a")
+                await batcher.supersede("r1", None, "bubble_monster_sync", {"counts": {"a": i}})
+            await batcher._runner
+            return batcher
+
+        batcher = asyncio.run(scenario())
+
+        self.assertEqual(len(self.sent), 1)
+        event, frame, room, _ = self.sent[0]
+        self.assertEqual((event, room), ("bubble_frame", "r1"))
+        names = [e["e"] for e in frame["events"]]
+        self.assertEqual(names.count("bubble_receive_fever"), 30)
+        # 덮어쓴 항목은 최신 값이 마지막 적재 위치로 이동
+        self.assertEqual(names[-3:], ["bubble_move_update", "bubble_receive_fever", "bubble_monster_sync"])
+        self.assertEqual(frame["events"][-3]["d"], {"pos": 29})
+        self.assertEqual(frame["events"][-3]["skip"], "a")
+        self.assertEqual(batcher.stats["superseded"], 58)
+
+    def test_zero_hz_emits_immediately(self):
+        async def scenario():
+            batcher = RoomEmitBatcher(self.emit, hz=0)
+            await batcher.push("r1", "bubble_receive_fever", {"count": 3}, skip_sid="a")
+
+        asyncio.run(scenario())
+        self.assertEqual(self.sent, [("bubble_receive_fever", {"count": 3}, "r1", "a")])
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+import openai
+from django.test import SimpleTestCase
+
+from core.services.llm_client import CALL_SITE_HEADER, LLMClientPool
+from core.tests.fake_openai_server import FakeOpenAIServer
+
+
+def _chat(client, model="gpt-4o-mini"):
+    return client.chat.completions.create(model=model, messages=[{"role": "user", "content": "hi"}])
+
+
+class LLMClientPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.server = FakeOpenAIServer(delay=0.05).__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+    def make_pool(self, **kwargs):
+        return LLMClientPool(api_key="test", base_url=self.server.base_url, **kwargs)
+
+    def test_connections_are_reused_and_metrics_recorded(self):
+        pool = self.make_pool()
+
+        for _ in range(5):
+            self.assertEqual(_chat(pool.client("arch.evaluate")).choices[0].message.content, '{"ok": true}')
+        pool.client("job_planner.embed").embeddings.create(model="text-embedding-3-small", input=["a", "b"])
+
+        self.assertEqual(self.server.connections, 1)
+        self.assertNotIn(CALL_SITE_HEADER, {k.lower() for k in self.server.requests[0]["headers"]})
+        metrics = pool.metrics.snapshot()
+        self.assertEqual(metrics["arch.evaluate:gpt-4o-mini"]["calls"], 5)
+        self.assertEqual(metrics["arch.evaluate:gpt-4o-mini"]["prompt_tokens"], 55)
+        self.assertEqual(metrics["job_planner.embed:text-embedding-3-small"]["prompt_tokens"], 2)
+
+    def test_per_model_concurrency_limit(self):
+        pool = self.make_pool(model_limits={"gpt-4o": {"concurrency": 2, "rpm": 100000}})
+        threads = [threading.Thread(target=_chat, args=(pool.client(), "gpt-4o")) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(self.server.requests), 8)
+        self.assertLessEqual(self.server.max_in_flight, 2)
+
+    def test_retries_within_budget_then_fails_fast(self):
+        pool = self.make_pool(max_retries=3)
+        self.server.fail_next(2)
+
+        _chat(pool.client("retry"))
+        self.assertEqual(pool.metrics.snapshot()["retry:gpt-4o-mini"]["retries"], 2)
+
+        # 예산 소진 후에는 재시도 없이 429가 그대로 전달
+        pool.retry_budget._tokens = 0
+        self.server.fail_next(1)
+        with self.assertRaises(openai.RateLimitError):
+            _chat(pool.client("retry"))
+
+    def test_queue_timeout_returns_local_rate_limit(self):
+        pool = self.make_pool(model_limits={"gpt-4o": {"concurrency": 1, "rpm": 100000}}, queue_timeout=0.01)
+        self.server.delay = 0.3
+        blocker = threading.Thread(target=_chat, args=(pool.client(), "gpt-4o"))
+        blocker.start()
+        while pool.limiter("gpt-4o")._active == 0:
+            pass
+
+        with self.assertRaises(openai.RateLimitError):
+            _chat(pool.client(), "gpt-4o")
+        blocker.join()
+        self.assertEqual(pool.limiter("gpt-4o")._active, 0)
+
+    def test_async_client_streams_and_releases_slot(self):
+        pool = self.make_pool()
+
+        async def run():
+            client = pool.async_client("pseudocode.stream")
+            stream = await client.chat.completions.create(
+                model="gpt-4o", messages=[{"role": "user", "content": "hi"}], stream=True,
+            )
+            pieces = [chunk.choices[0].delta.content async for chunk in stream if chunk.choices]
+            results = await asyncio.gather(*[_achat(client) for _ in range(3)])
+            return "".join(pieces), results
+
+        async def _achat(client):
+            response = await client.chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": "x"}])
+            return response.choices[0].message.content
+
+        text, results = asyncio.run(run())
+
+        self.assertEqual(text, '{"ok": true}')
+        self.assertEqual(results, ['{"ok": true}'] * 3)
+        self.assertEqual(pool.limiter("gpt-4o")._active, 0)
+        self.assertEqual(pool.metrics.snapshot()["pseudocode.stream:gpt-4o"]["calls"], 4)
@@ -0,0 +1,78 @@
+import asyncio
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from core.services.wars import mission_catalog
+from core.services.wars.mission_catalog import MissionCatalog
+
+
+def _detail(pid, required, **extra):
+    return SimpleNamespace(id=pid, content_data={
+        'problem_id': pid,
+        'title': pid,
+        'rubric_functional': {'required_components': required},
+        **extra,
+    })
+
+
+class MissionCatalogTests(SimpleTestCase):
+    def setUp(self):
+        mission_catalog.generation_cache().delete(mission_catalog.GENERATION_CACHE_KEY)
+        self.rows = [
+            _detail('jr_001_url', ['Load Balancer', 'Web Server', 'RDBMS']),
+            _detail('adv_001_feed', ['Message Queue', 'Worker', 'Cache']),
+            _detail('adv_002_ledger', ['API Server', 'Database'], difficulty='Advanced', topic='Payments'),
+        ]
+        self.loads = 0
+
+        def loader():
+            self.loads += 1
+            return list(self.rows)
+
+        self.catalog = MissionCatalog(ttl=600, loader=loader)
+
+    def test_precomputed_palette_and_indexes(self):
+        snapshot = self.catalog.current()
+        self.assertEqual([e.difficulty for e in snapshot.entries], ['junior', 'advanced', 'advanced'])
+        self.assertEqual([e.id for e in snapshot.candidates(topic='queue')], ['adv_001_feed'])
+        self.assertEqual([e.id for e in snapshot.candidates(topic='payments')], ['adv_002_ledger'])
+        # 조건에 맞는 미션이 없으면 전체에서 출제
+        self.assertEqual(len(snapshot.candidates(difficulty='expert')), 3)
+
+        question = MissionCatalog.pick(snapshot, 2, difficulty='junior')
+        self.assertEqual(question['round'], 2)
+        self.assertEqual(question['palette_ids'][:3], ['lb', 'server', 'db'])
+        self.assertEqual(len(set(question['palette_ids'])), 7)
+        self.assertNotIn('palette_ids', snapshot.by_id['jr_001_url'].mission)
+
+    def test_no_repeat_until_all_used(self):
+        async def scenario():
+            used, picked = [], []
+            for round_no in range(1, 7):
+                question = await self.catalog.asample(round_no, exclude=used)
+                used = ([] if question['id'] in used else used) + [question['id']]
+                picked.append(question['id'])
+            return picked
+
+        picked = asyncio.run(scenario())
+        self.assertEqual(len(set(picked[:3])), 3)
+        self.assertEqual(len(set(picked[3:])), 3)
+        self.assertEqual(self.loads, 1)
+
+    def test_invalidation_reloads_and_failure_keeps_previous(self):
+        self.catalog.current()
+        self.rows.append(_detail('jr_002_paste', ['Cache']))
+        self.assertEqual(self.catalog.size, 3)
+
+        # 다른 워커가 세대 값을 올린 경우(이 프로세스의 카탈로그 객체는 그대로)에도 다음 조회 때 재구축
+        mission_catalog.generation_cache().set(mission_catalog.GENERATION_CACHE_KEY, 'other-worker', timeout=None)
+        self.assertEqual(len(self.catalog.current().entries), 4)
+
+        def broken():
+            raise RuntimeError('db down')
+
+        self.catalog.loader = broken
+        self.catalog.invalidate()
+        self.assertEqual(len(self.catalog.current().entries), 4)
+        self.assertEqual(self.loads, 2)
@@ -0,0 +1,72 @@
+import base64
+import tempfile
+
+import fitz
+from django.test import SimpleTestCase, override_settings
+
+from core.services import pdf_ingest
+from core.services.pdf_ingest import combine_partial_profiles, open_pdf
+
+
+def _pdf_base64(pages):
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text)
+        else:
+            page.draw_rect(fitz.Rect(50, 50, 300, 300), color=(0, 0, 0), fill=(0.5, 0.5, 0.5))
+    data = doc.tobytes()
+    doc.close()
+    return 'data:application/pdf;base64,' + base64.b64encode(data).decode()
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'documents': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pdf-ingest-tests'},
+})
+class PdfIngestTests(SimpleTestCase):
+    def setUp(self):
+        self.rendered = []
+        original = pdf_ingest._render_pages
+
+        def counting(pdf_bytes, indices):
+            self.rendered.extend(indices)
+            return original(pdf_bytes, indices)
+
+        self._original = original
+        pdf_ingest._render_pages = counting
+
+    def tearDown(self):
+        pdf_ingest._render_pages = self._original
+        from django.core.cache import caches
+        caches['documents'].clear()
+
+    def test_renders_only_text_poor_pages_with_size_cap(self):
+        data = _pdf_base64(['Experienced backend engineer. Python, Django, PostgreSQL, Redis. ' * 2, ''])
+        doc = open_pdf(data)
+
+        self.assertFalse(doc.pages[0].text_poor)
+        self.assertTrue(doc.pages[1].text_poor)
+        images = doc.render()
+        self.assertEqual([p.index for p in images], [1])
+        pix = fitz.Pixmap(images[0].image)
+        self.assertLessEqual(max(pix.width, pix.height), pdf_ingest.MAX_IMAGE_SIDE)
+        self.assertTrue(images[0].data_url().startswith('data:image/jpeg;base64,'))
+
+    def test_rendered_pages_are_cached_by_content(self):
+        data = _pdf_base64(['', ''])
+        open_pdf(data).render()
+        again = open_pdf(data).render()
+
+        self.assertEqual(self.rendered, [0, 1])
+        self.assertEqual(len(again), 2)
+
+    def test_combine_partial_profiles(self):
+        combined = combine_partial_profiles([
+            {'name': None, 'skills': ['Python', 'Django'], 'projects': [{'name': 'A'}]},
+            {'name': '홍길동', 'skills': ['Django', 'Redis'], 'projects': [{'name': 'A'}, {'name': 'B'}]},
+        ])
+        self.assertEqual(combined['name'], '홍길동')
+        self.assertEqual(combined['skills'], ['Python', 'Django', 'Redis'])
+        self.assertEqual(combined['projects'], [{'name': 'A'}, {'name': 'B'}])
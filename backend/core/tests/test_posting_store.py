@@ -0,0 +1,131 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from core.views.job_planner.collectors import posting_store
+from core.views.job_planner.collectors.posting_store import PostingStore, canonical_url
+from core.views.job_planner.job_planner_view import JobPlannerRecommendView
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class PostingStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clock = _Clock()
+        self.path = os.path.join(self.tmp.name, 'postings.sqlite3')
+        self.store = PostingStore(self.path,
+                                  posting_ttl=100, posting_stale=100, search_ttl=10, search_stale=10,
+                                  clock=self.clock, busy_timeout=0.05)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_canonical_url(self):
+        self.assertEqual(
+            canonical_url('https://www.saramin.co.kr/zf_user/jobs/relay/view?view_type=search&rec_idx=123&location=ts'),
+            'https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=123')
+        self.assertEqual(canonical_url('https://m.jobkorea.co.kr/Recruit/GI_Read/46495498?Oem_Code=C1'),
+                         'https://www.jobkorea.co.kr/Recruit/GI_Read/46495498')
+        self.assertEqual(canonical_url('HTTPS://Example.com/job/?b=2&utm_source=x&a=1#top'),
+                         'https://example.com/job?a=1&b=2')
+
+    def test_fresh_stale_expired(self):
+        relay = 'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=1&t=a'
+        self.store.put_postings({relay: {'skills': ['Python'], 'detail_text': 'x'}})
+        other = 'https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=1'
+        self.assertTrue(self.store.get_postings([other])[other].fresh)
+        self.clock.now += 150
+        self.assertFalse(self.store.get_postings([other])[other].fresh)
+        self.clock.now += 100
+        self.assertEqual(self.store.get_postings([other]), {})
+
+        self.store.put_search('  Python 개발자 ', [{'url': 'u'}])
+        self.assertEqual(self.store.get_search('python 개발자').value, [{'url': 'u'}])
+
+    def last_access(self, url):
+        with sqlite3.connect(self.path) as conn:
+            return conn.execute('SELECT last_access FROM postings WHERE key = ?', (canonical_url(url),)).fetchone()[0]
+
+    def test_reads_touch_last_access_only_after_interval(self):
+        url = 'https://example.com/job/1'
+        self.store.put_postings({url: {'skills': [], 'detail_text': ''}})
+        self.clock.now += 50
+        with mock.patch.object(posting_store, 'TOUCH_INTERVAL', 60):
+            self.store.get_postings([url])
+            self.assertEqual(self.last_access(url), 1000.0)
+            self.clock.now += 20
+            self.store.get_postings([url])
+            self.assertEqual(self.last_access(url), 1070.0)
+
+    def test_locked_database_degrades_to_miss_and_skipped_write(self):
+        url, new_url = 'https://example.com/job/1', 'https://example.com/job/2'
+        self.store.put_postings({url: {'skills': ['Go'], 'detail_text': ''}})
+        other = sqlite3.connect(self.path, isolation_level=None)
+        other.execute('BEGIN EXCLUSIVE')  # 다른 워커가 쓰기 잠금 보유
+        try:
+            with mock.patch.object(posting_store, 'TOUCH_INTERVAL', 0), \
+                    self.assertLogs(posting_store.logger, level='WARNING') as logs:
+                self.assertEqual(self.store.get_postings([url])[url].value['skills'], ['Go'])
+                self.store.put_postings({new_url: {'skills': [], 'detail_text': ''}})
+        finally:
+            other.execute('ROLLBACK')
+            other.close()
+        self.assertEqual(len(logs.output), 2)
+        self.assertEqual(self.store.get_postings([new_url]), {})
+
+        self.store._conn.close()  # 읽기 실패도 예외 대신 미스
+        self.assertEqual(self.store.get_postings([url]), {})
+
+    def test_schedule_refresh_skips_inflight_keys(self):
+        release = threading.Event()
+        calls = []
+
+        def refresh(keys):
+            calls.append(keys)
+            release.wait(5)
+
+        first = self.store.schedule_refresh(['a', 'b'], refresh)
+        self.assertIsNone(self.store.schedule_refresh(['a'], refresh))
+        second = self.store.schedule_refresh(['a', 'c'], refresh)
+        release.set()
+        first.result(5)
+        second.result(5)
+        self.assertEqual(calls, [['a', 'b'], ['c']])
+
+    def test_enrich_uses_cache_and_refreshes_stale(self):
+        view = JobPlannerRecommendView()
+        fetched = []
+
+        def fake_fetch(urls, store):
+            fetched.append(list(urls))
+            return {u: {'skills': ['Django'], 'detail_text': f'detail {u}'} for u in urls}
+
+        view._fetch_job_details = fake_fetch
+        posting_store._store = self.store
+        try:
+            self.store.put_postings({'https://a.example/1': {'skills': ['Python'], 'detail_text': 'cached'}})
+            jobs = view._enrich_jobs_with_detail([
+                {'url': 'https://a.example/1', 'skills': []},
+                {'url': 'https://a.example/2', 'skills': ['Python']},
+            ])
+            self.assertEqual(fetched, [['https://a.example/2']])
+            self.assertEqual(jobs[0]['detail_text'], 'cached')
+            self.assertEqual(jobs[1]['skills'], ['Python', 'Django'])
+
+            self.clock.now += 150
+            view._enrich_jobs_with_detail([{'url': 'https://a.example/1', 'skills': []}])
+            self.store._refresher.shutdown(wait=True)
+            self.assertEqual(fetched[-1], ['https://a.example/1'])
+        finally:
+            posting_store._store = None
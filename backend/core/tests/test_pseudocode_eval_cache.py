@@ -0,0 +1,207 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from core.services.pseudocode_eval_cache import (
+    EvaluationCache,
+    evaluation_fingerprint,
+    normalize_pseudocode,
+)
+from core.services.pseudocode_evaluator import (
+    LLMEvaluationEngine,
+    LLMEvaluationResult,
+    LLMTimeoutError,
+    RuleValidationResult,
+)
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'evaluations': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'eval-test'},
+}
+
+
+def _success(score=70):
+    return LLMEvaluationResult(model='gpt-4o', status='SUCCESS', raw_score=score, dimension_scores={})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class EvaluationCacheTests(SimpleTestCase):
+    def setUp(self):
+        caches['evaluations'].clear()
+        self.cache = EvaluationCache(LLMEvaluationResult)
+
+    def test_fingerprint_ignores_whitespace_and_case(self):
+        a = "1. train_test_split 으로 분리\r\n\r\n2.  Scaler를  X_train에만 fit  "
+        b = "1. TRAIN_TEST_SPLIT 으로 분리\n2. scaler를 x_train에만 fit"
+
+        self.assertEqual(normalize_pseudocode(a), normalize_pseudocode(b))
+        self.assertEqual(
+            evaluation_fingerprint('Quest 1', a, model='gpt-4o'),
+            evaluation_fingerprint('Quest 1', b, model='gpt-4o'),
+        )
+        self.assertNotEqual(
+            evaluation_fingerprint('Quest 1', a, tail_answer='A', model='gpt-4o'),
+            evaluation_fingerprint('Quest 1', a, tail_answer='B', model='gpt-4o'),
+        )
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return _success()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_compute('k', compute)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(hit for _, hit in results), [False, True, True, True, True])
+        # 호출자마다 독립된 복사본을 받아야 함
+        self.assertEqual(len({id(r) for r, _ in results}), 5)
+
+    def test_persistent_tier_survives_new_process_cache(self):
+        self.cache.get_or_compute('k', lambda: _success(77))
+
+        fresh = EvaluationCache(LLMEvaluationResult)
+        result, hit = fresh.get_or_compute('k', lambda: self.fail('LLM을 다시 호출하면 안 됨'))
+
+        self.assertTrue(hit)
+        self.assertEqual(result.raw_score, 77)
+        self.assertEqual(fresh.stats['persistent_hits'], 1)
+
+    def test_errors_are_not_cached(self):
+        self.cache.get_or_compute('k', lambda: LLMEvaluationResult(model='gpt-4o', status='ERROR'))
+        result, hit = self.cache.get_or_compute('k', _success)
+
+        self.assertFalse(hit)
+        self.assertEqual(result.status, 'SUCCESS')
+
+        with self.assertRaises(TimeoutError):
+            self.cache.get_or_compute('x', lambda: (_ for _ in ()).throw(TimeoutError()))
+        self.assertEqual(self.cache.get_or_compute('x', _success)[1], False)
+
+    def test_cancel_while_waiting_for_slot_returns_the_slot(self):
+        cache = EvaluationCache(LLMEvaluationResult, max_concurrency=1)
+
+        async def compute():
+            return _success()
+
+        async def scenario():
+            cache._llm_slots.acquire()  # 다른 평가가 슬롯 점유 중
+            waiting = asyncio.create_task(cache.aget_or_compute('a', compute))
+            await asyncio.sleep(0.1)
+            waiting.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiting
+            cache._llm_slots.release()
+            return await asyncio.wait_for(cache.aget_or_compute('b', compute), timeout=2)
+
+        result, hit = asyncio.run(scenario())
+
+        self.assertEqual((result.status, hit), ('SUCCESS', False))
+        self.assertTrue(cache._llm_slots.acquire(blocking=False))
+
+    def test_follower_recomputes_when_leader_is_cancelled(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(10)  # 첫 리더는 클라이언트 연결 끊김으로 취소됨
+            return _success(80)
+
+        async def scenario():
+            leader = asyncio.create_task(self.cache.aget_or_compute('k', compute))
+            await asyncio.sleep(0.05)
+            follower = asyncio.create_task(self.cache.aget_or_compute('k', compute))
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            return await asyncio.wait_for(follower, timeout=2)
+
+        result, hit = asyncio.run(scenario())
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual((result.raw_score, hit), (80, False))
+
+
+
+class _FakeStream:
+    """AsyncOpenAI 스트리밍 응답 흉내 — 조각 사이에 delay만큼 쉰다"""
+
+    def __init__(self, pieces, delay=0.0):
+        self.pieces = pieces
+        self.delay = delay
+        self.closed = False
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for piece in self.pieces:
+            await asyncio.sleep(self.delay)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncLLMEvaluationTests(SimpleTestCase):
+    def make_engine(self, stream):
+        engine = LLMEvaluationEngine()
+
+        async def create(**kwargs):
+            return stream
+
+        engine.client = object()
+        engine._async_client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        return engine
+
+    def rule_result(self):
+        return RuleValidationResult(passed=True, critical_error_count=0, warnings=[],
+                                    processing_time_ms=0, details={})
+
+    def test_dimensions_are_reported_while_streaming(self):
+        payload = json.dumps({
+            'overall_score': 60,
+            'dimensions': {
+                'design': {'score': 20, 'comment': '분리 "먼저"'},
+                'consistency': {'score': 15, 'comment': '좋음'},
+            },
+            'tail_question': None,
+        }, ensure_ascii=False)
+        stream = _FakeStream([payload[i:i + 7] for i in range(0, len(payload), 7)])
+        engine = self.make_engine(stream)
+        seen = []
+
+        result = asyncio.run(engine.aevaluate(
+            'pseudo', self.rule_result(), 'Quest 1',
+            on_dimension=lambda dim, score, comment: seen.append((dim, score, comment)),
+        ))
+
+        self.assertEqual(seen, [('design', 20.0, '분리 "먼저"'), ('consistency', 15.0, '좋음')])
+        self.assertEqual(result.status, 'SUCCESS')
+        self.assertEqual(result.raw_score, 60)
+        self.assertTrue(stream.closed)
+
+    def test_timeout_raises_and_closes_stream(self):
+        stream = _FakeStream(['{"total_score_85"', ': 60}'], delay=0.5)
+        engine = self.make_engine(stream)
+
+        with self.assertRaises(LLMTimeoutError):
+            asyncio.run(engine.aevaluate('pseudo', self.rule_result(), 'Quest 1', timeout=0.1))
+        self.assertTrue(stream.closed)
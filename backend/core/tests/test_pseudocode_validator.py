@@ -0,0 +1,41 @@
+from django.test import SimpleTestCase
+
+from core.utils.mission_rules import VALIDATION_RULES
+from core.utils.pseudocode_validator import PseudocodeValidator, compile_rules
+
+
+class PseudocodeValidatorTests(SimpleTestCase):
+    def test_rules_are_compiled_once_per_mission(self):
+        first = PseudocodeValidator(VALIDATION_RULES["1"]).compiled
+
+        self.assertIs(PseudocodeValidator(VALIDATION_RULES["QUEST_01"]).compiled, first)
+        self.assertIs(compile_rules(VALIDATION_RULES["1"]), first)
+        self.assertIsNot(compile_rules(VALIDATION_RULES["2"]), first)
+
+    def test_negative_patterns_suppress_critical_error(self):
+        validator = PseudocodeValidator(VALIDATION_RULES["1"])
+
+        leaky = validator.validate("1. 전체 데이터로 scaler를 fit 한다")
+        safe = validator.validate("1. 전체 데이터로 scaler를 fit 하지 않는다")
+
+        self.assertFalse(leaky["passed"])
+        self.assertEqual(leaky["criticalErrors"][0]["message"], "🚨 데이터 누수: 전체 데이터로 fit 금지")
+        self.assertTrue(safe["passed"])
+
+    def test_concepts_and_flow_order(self):
+        validator = PseudocodeValidator(VALIDATION_RULES["1"])
+        ordered = (
+            "1. train_test_split으로 데이터를 분리한다\n"
+            "2. StandardScaler 스케일러를 만든다\n"
+            "3. scaler.fit(X_train) 으로 학습 데이터에만 fit\n"
+            "4. scaler.transform(X_train) 변환\n"
+            "5. scaler.transform(X_test) 테스트 변환"
+        )
+        reversed_fit = "1. X_test를 transform 한다\n2. 그 다음 X_train으로 fit 한다"
+
+        result = validator.validate(ordered)
+        self.assertTrue({"data_split", "scaler_create", "fit_train", "transform_test"}
+                        <= set(result["details"]["concepts"]))
+        self.assertIn("✅ fit → transform(test) 정확", result["details"]["flow"]["feedback"])
+        self.assertIn("❌ fit → transform(test): 순서 오류 (필수)",
+                      validator.validate(reversed_fit)["details"]["flow"]["feedback"])
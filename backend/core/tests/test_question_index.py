@@ -0,0 +1,62 @@
+from django.test import TestCase
+
+from core.models import InterviewQuestion
+from core.services.interview import question_bank_service
+from core.services.interview import question_index
+from core.services.interview.question_index import get_question_index, invalidate_question_index
+
+
+class QuestionIndexTests(TestCase):
+    def setUp(self):
+        rows = [
+            ('technical', '카카오', '백엔드 개발자'),
+            ('technical', '카카오', '프론트엔드'),
+            ('technical', '', '백엔드'),
+            ('technical', '', ''),
+            ('technical', '네이버', '백엔드'),
+            ('motivation', '카카오', ''),
+            ('motivation', '', ''),
+        ]
+        self.ids = {}
+        for i, (slot, company, job) in enumerate(rows):
+            q = InterviewQuestion.objects.create(
+                question_text=f'질문 {i}번 입니다', slot_type=slot, company=company, job=job,
+            )
+            self.ids[(slot, company, job)] = q.id
+        invalidate_question_index()
+
+    def test_company_first_then_general_with_job_filter(self):
+        picked = get_question_index().sample(slot_type='technical', company='카카오', job='백엔드', limit=10)
+
+        self.assertEqual(picked[0], self.ids[('technical', '카카오', '백엔드 개발자')])
+        self.assertCountEqual(picked[1:], [self.ids[('technical', '', '백엔드')], self.ids[('technical', '', '')]])
+
+    def test_no_company_samples_all_companies(self):
+        picked = get_question_index().sample(slot_type='technical', limit=10)
+
+        self.assertEqual(len(picked), 5)
+        self.assertEqual(len(get_question_index().sample(limit=3)), 3)
+
+    def test_session_uses_single_pk_query_and_sees_new_imports(self):
+        get_question_index().sample()  # 인덱스 구축
+
+        with self.assertNumQueries(1):
+            bank = question_bank_service.get_questions_for_session(
+                company='카카오', job='백엔드', slot_types=['motivation', 'technical_depth', 'technical_depth_2'],
+            )
+        self.assertEqual(set(bank), {'motivation', 'technical'})
+        self.assertEqual(len(bank['technical']), 3)
+
+        InterviewQuestion.objects.create(question_text='새로 임포트된 질문', slot_type='growth')
+        invalidate_question_index()
+        self.assertEqual(question_bank_service.search_questions(slot_type='growth')[0]['question_text'],
+                         '새로 임포트된 질문')
+
+    def test_generation_bump_from_another_process_rebuilds(self):
+        get_question_index().sample()  # 인덱스 구축
+
+        # import_questions가 별도 프로세스에서 실행된 경우: 이 프로세스의 인덱스 객체는 건드리지 않고 세대 값만 바뀜
+        new = InterviewQuestion.objects.create(question_text='다른 프로세스에서 추가', slot_type='growth')
+        question_index.generation_cache().set(question_index.GENERATION_CACHE_KEY, 'other-process', timeout=None)
+
+        self.assertEqual(get_question_index().sample(slot_type='growth'), [new.id])
@@ -0,0 +1,119 @@
+import asyncio
+import unittest
+
+from django.test import SimpleTestCase
+
+from core.services.wars.room_store import InMemoryRoomStore, RedisRoomStore, RoomLockTimeout
+from core.services.wars.state_machine import DrawRoomState, GameState
+
+try:
+    import fakeredis
+    import lupa  # noqa: F401 - fakeredis의 EVAL(Lua) 지원
+except ImportError:  # pragma: no cover - 선택 의존성
+    fakeredis = None
+
+
+class RoomStoreContractMixin:
+    """두 백엔드가 공통으로 지켜야 하는 동작"""
+
+    def make_store(self):
+        raise NotImplementedError
+
+    def run_async(self, coro):
+        return asyncio.run(coro)
+
+    def test_read_modify_write_under_lock_is_serialized(self):
+        async def scenario():
+            store = self.make_store()
+            await store.set('draw', 'r1', {'players': []})
+
+            async def join(sid):
+                async with store.lock('draw', 'r1'):
+                    room = await store.get('draw', 'r1')
+                    await asyncio.sleep(0)
+                    room['players'].append(sid)
+                    await store.set('draw', 'r1', room)
+
+            await asyncio.gather(*(join(f'sid{i}') for i in range(10)))
+            return await store.get('draw', 'r1')
+
+        room = self.run_async(scenario())
+        self.assertEqual(sorted(room['players']), sorted(f'sid{i}' for i in range(10)))
+
+    def test_lease_has_single_owner_until_released(self):
+        async def scenario():
+            store = self.make_store()
+            first = await store.acquire_lease('draw_tick:r1', 'worker-a', 5)
+            second = await store.acquire_lease('draw_tick:r1', 'worker-b', 5)
+            renewed_by_other = await store.renew_lease('draw_tick:r1', 'worker-b', 5)
+            await store.release_lease('draw_tick:r1', 'worker-a')
+            after_release = await store.acquire_lease('draw_tick:r1', 'worker-b', 5)
+            return first, second, renewed_by_other, after_release
+
+        self.assertEqual(self.run_async(scenario()), (True, False, False, True))
+
+    def test_expired_owner_cannot_touch_new_owners_lease(self):
+        async def scenario():
+            store = self.make_store()
+            await store.acquire_lease('draw_tick:r1', 'worker-a', 0.05)
+            await asyncio.sleep(0.1)  # worker-a lease 만료 → worker-b가 가져감
+            taken = await store.acquire_lease('draw_tick:r1', 'worker-b', 5)
+            renewed_by_stale = await store.renew_lease('draw_tick:r1', 'worker-a', 5)
+            await store.release_lease('draw_tick:r1', 'worker-a')
+            still_owned = await store.renew_lease('draw_tick:r1', 'worker-b', 5)
+            return taken, renewed_by_stale, still_owned
+
+        self.assertEqual(self.run_async(scenario()), (True, False, True))
+
+    def test_lock_wait_times_out(self):
+        async def scenario():
+            store = self.make_store()
+            async with store.lock('draw', 'r1'):
+                with self.assertRaises(RoomLockTimeout):
+                    async with store.lock('draw', 'r1', timeout=0.1):
+                        pass
+            async with store.lock('draw', 'r1', timeout=0.1):  # 해제 후에는 바로 획득
+                return True
+
+        self.assertTrue(self.run_async(scenario()))
+
+    def test_draw_state_round_trip(self):
+        async def scenario():
+            store = self.make_store()
+            state = DrawRoomState(room_id='r1')
+            state.state = GameState.PLAYING
+            state.hint_history = {'sid1': [{'message': 'hint'}]}
+            state._last_agent_call_per_sid = {'sid1': 1.5}
+            await store.set('draw_state', 'r1', state)
+            return await store.get('draw_state', 'r1')
+
+        loaded = self.run_async(scenario())
+        self.assertIsInstance(loaded, DrawRoomState)
+        self.assertEqual(loaded.state, GameState.PLAYING)
+        self.assertEqual(loaded.hint_history, {'sid1': [{'message': 'hint'}]})
+        self.assertEqual(loaded._last_agent_call_per_sid, {'sid1': 1.5})
+
+
+class InMemoryRoomStoreTests(RoomStoreContractMixin, SimpleTestCase):
+    def make_store(self):
+        return InMemoryRoomStore()
+
+    def test_unused_room_locks_are_dropped(self):
+        async def scenario():
+            store = self.make_store()
+            for i in range(5):
+                async with store.lock('draw', f'r{i}'):
+                    await store.delete('draw', f'r{i}')
+            with self.assertRaises(RoomLockTimeout):
+                async with store.lock('draw', 'busy'):
+                    async with store.lock('draw', 'busy', timeout=0.01):
+                        pass
+            return store._locks
+
+        self.assertEqual(self.run_async(scenario()), {})
+
+
+@unittest.skipUnless(fakeredis, 'fakeredis(lupa 포함) 미설치')
+class RedisRoomStoreTests(RoomStoreContractMixin, SimpleTestCase):
+    def make_store(self):
+        return RedisRoomStore(fakeredis.FakeAsyncRedis())
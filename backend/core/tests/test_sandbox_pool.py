@@ -0,0 +1,180 @@
+import importlib.util
+import threading
+import time
+
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from core.services.code_jobs import CodeJob, CodeJobManager, CodeJobQueueFull
+from core.services.sandbox_pool import LocalSandboxWorker, SandboxPool, SandboxPoolBusy
+from core.views.pseudocode.pseudocode_execution import generate_runner_script
+
+
+class SandboxPoolTests(SimpleTestCase):
+    def make_pool(self, **kwargs):
+        pool = SandboxPool(lambda: LocalSandboxWorker(memory_limit="512m"), **kwargs).start()
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_runs_code_and_reports_exit_code(self):
+        pool = self.make_pool(size=1)
+
+        ok = pool.run("print('hello')", timeout=5)
+        failed = pool.run("import sys\nprint('oops', file=sys.stderr)\nsys.exit(3)", timeout=5)
+
+        self.assertEqual((ok["stdout"], ok["exit_code"], ok["timed_out"]), ("hello\n", 0, False))
+        self.assertEqual((failed["stderr"], failed["exit_code"]), ("oops\n", 3))
+
+    def test_uncaught_exception_returns_traceback(self):
+        pool = self.make_pool(size=1)
+
+        result = pool.run("1 / 0", timeout=5)
+
+        self.assertEqual(result["exit_code"], 1)
+        self.assertIn("ZeroDivisionError", result["stderr"])
+
+    def test_timeout_kills_run_but_keeps_worker(self):
+        pool = self.make_pool(size=1)
+
+        result = pool.run("while True: pass", timeout=0.5)
+        after = pool.run("print('alive')", timeout=5)
+
+        self.assertTrue(result["timed_out"])
+        self.assertEqual(after["stdout"], "alive\n")
+
+    def test_workdir_is_reset_between_runs(self):
+        pool = self.make_pool(size=1)
+
+        pool.run("open('leftover.txt', 'w').write('x')", timeout=5)
+        result = pool.run("import os\nprint(os.path.exists('leftover.txt'))", timeout=5)
+
+        self.assertEqual(result["stdout"], "False\n")
+
+    def test_detached_process_does_not_survive_into_next_run(self):
+        pool = self.make_pool(size=1)
+        leak = (
+            "import os, time\n"
+            "if os.fork() == 0:\n"
+            "    os.setsid()\n"
+            "    if os.fork() == 0:\n"
+            "        cwd = os.getcwd()\n"
+            "        for _ in range(300):\n"
+            "            open(os.path.join(cwd, 'leak'), 'w').close()\n"
+            "            time.sleep(0.1)\n"
+            "    os._exit(0)\n"
+            "time.sleep(0.3)\n"
+        )
+
+        first = pool.run(leak, timeout=5)
+        second = pool.run("import os, time\ntime.sleep(0.3)\nprint(os.path.exists('leak'))", timeout=5)
+
+        self.assertEqual(first["exit_code"], 0)
+        self.assertNotIn("clean", first)
+        self.assertEqual(second["stdout"], "False\n")
+
+    def test_worker_is_replaced_when_strays_remain(self):
+        pool = self.make_pool(size=1)
+        worker_run = LocalSandboxWorker.run
+
+        def unclean_run(worker, *args, **kwargs):
+            result = worker_run(worker, *args, **kwargs)
+            result["clean"] = False
+            return result
+
+        first = pool.run("import os\nprint(os.getppid())", timeout=5)["stdout"]
+        with patch.object(LocalSandboxWorker, "run", unclean_run):
+            pool.run("pass", timeout=5)
+        second = pool.run("import os\nprint(os.getppid())", timeout=5)["stdout"]
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(pool.stats["recycled"], 1)
+
+    def test_worker_is_recycled_after_max_runs(self):
+        pool = self.make_pool(size=1, max_runs_per_worker=2)
+
+        pids = [pool.run("import os\nprint(os.getppid())", timeout=5)["stdout"] for _ in range(4)]
+
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+        self.assertEqual(pool.stats["recycled"], 2)
+
+    def test_rejects_when_queue_is_full(self):
+        pool = self.make_pool(size=1, max_queue=0)
+        started = threading.Event()
+
+        def occupy():
+            started.set()
+            pool.run("import time\ntime.sleep(1)", timeout=5)
+
+        thread = threading.Thread(target=occupy)
+        thread.start()
+        started.wait()
+        # 첫 실행이 유일한 슬롯을 잡을 때까지 대기
+        while pool._slots._value:
+            time.sleep(0.01)
+        with self.assertRaises(SandboxPoolBusy):
+            pool.run("print(1)", timeout=5)
+        thread.join()
+
+    def test_streams_output_before_run_finishes(self):
+        pool = self.make_pool(size=1)
+        chunks = []
+
+        def on_output(stream, data):
+            chunks.append((stream, data, time.monotonic()))
+
+        code = "import sys, time\nprint('first', flush=True)\ntime.sleep(0.5)\nprint('second', file=sys.stderr)"
+        result = pool.run(code, timeout=5, on_output=on_output)
+        finished = time.monotonic()
+
+        self.assertEqual(result["stdout"], "first\n")
+        self.assertEqual([(s, d) for s, d, _ in chunks], [("stdout", "first\n"), ("stderr", "second\n")])
+        self.assertLess(chunks[0][2], finished - 0.3)
+
+    def test_structured_result_is_separate_from_stdout(self):
+        pool = self.make_pool(size=1)
+
+        result = pool.run("print('noise')\n__sandbox_result__({'passed': 2})", timeout=5)
+        plain = pool.run("print(1)", timeout=5)
+
+        self.assertEqual(result["result"], {"passed": 2})
+        self.assertEqual(result["stdout"], "noise\n")
+        self.assertIsNone(plain["result"])
+
+    @skipUnless(importlib.util.find_spec("sklearn") and importlib.util.find_spec("pandas"), "needs sandbox image libs")
+    def test_pseudocode_harness_runs_cases_with_per_case_timeout(self):
+        pool = self.make_pool(size=1)
+        code = "def solve(x):\n    while x < 0:\n        pass\n    print('debug')\n    return x * 2"
+        cases = [{"input": [2], "expected": 4}, {"input": [-1], "expected": None}, {"input": [3], "expected": 6}]
+
+        result = pool.run(generate_runner_script(code, "solve", cases, case_timeout=0.3), timeout=10)["result"]
+
+        self.assertEqual(result["passed_count"], 2)
+        self.assertEqual([r["passed"] for r in result["results"]], [True, False, True])
+        self.assertEqual(result["results"][1]["error"], "timeout")
+
+
+@override_settings(SANDBOX_BACKEND='local')
+class CodeJobManagerTests(SimpleTestCase):
+    def test_submit_returns_immediately_and_collects_output(self):
+        manager = CodeJobManager(max_workers=1, max_pending=5)
+
+        job = manager.submit("print('hi')", "bench-local:jobs", "512m", "0.5", timeout=5)
+        self.assertIn(job.status, (CodeJob.QUEUED, CodeJob.RUNNING))
+        deadline = time.monotonic() + 10
+        while job.status != CodeJob.DONE and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        self.assertEqual(job.result["stdout"], "hi\n")
+        self.assertTrue(job.result["success"])
+        self.assertEqual(job.events, [{"type": "output", "stream": "stdout", "data": "hi\n"}])
+        self.assertIs(manager.get(job.id), job)
+
+    def test_rejects_when_too_many_pending(self):
+        manager = CodeJobManager(max_workers=1, max_pending=1)
+
+        manager.submit("import time\ntime.sleep(0.5)", "bench-local:jobs", "512m", "0.5", timeout=5)
+        with self.assertRaises(CodeJobQueueFull):
+            manager.submit("print(1)", "bench-local:jobs", "512m", "0.5", timeout=5)
@@ -0,0 +1,41 @@
+import random
+import re
+
+from django.test import SimpleTestCase
+
+from core.views.job_planner.job_planner_view import JobPlannerAnalyzeView
+from core.views.job_planner.skill_dictionary import (
+    DETAIL_SKILL_MATCHER, DETAIL_TECH_KEYWORDS, REQUIREMENT_SKILL_MATCHER, REQUIREMENT_TECH_KEYWORDS,
+    normalize_skill,
+)
+
+
+def _per_keyword(keywords, text, left, right):
+    return [kw for kw in keywords if re.search(left + re.escape(kw) + right, text, re.IGNORECASE)]
+
+
+class KeywordMatcherTests(SimpleTestCase):
+    def test_prefix_keywords_share_a_match(self):
+        text = 'Spring Boot 기반 API, GitHub Actions CI, SpringBoot/C++ 경험, R 언어 우대'
+        self.assertEqual(DETAIL_SKILL_MATCHER.find(text),
+                         ['C++', 'R', 'Spring', 'SpringBoot', 'Spring Boot', 'GitHub Actions'])
+        self.assertEqual(DETAIL_SKILL_MATCHER.find('JavaScript, Gitlab'), ['JavaScript', 'GitLab'])
+
+    def test_matches_per_keyword_search(self):
+        rng = random.Random(7)
+        pieces = DETAIL_TECH_KEYWORDS + REQUIREMENT_TECH_KEYWORDS + [
+            ' ', '.', '/', '+', '#', '_', '1', 'a', 's', '가', ' Boot', 'Lab', 'CI', '\n']
+        for _ in range(3000):
+            text = ''.join(rng.choice(pieces) for _ in range(rng.randint(1, 10)))
+            if rng.random() < 0.3:
+                text = text.upper()
+            self.assertEqual(DETAIL_SKILL_MATCHER.find(text),
+                             _per_keyword(DETAIL_TECH_KEYWORDS, text, r'(?<![a-zA-Z])', r'(?![a-zA-Z])'), text)
+            self.assertEqual(REQUIREMENT_SKILL_MATCHER.find(text),
+                             _per_keyword(REQUIREMENT_TECH_KEYWORDS, text, r'\b', r'\b'), text)
+
+    def test_extract_skills_from_text(self):
+        result = JobPlannerAnalyzeView()._extract_skills_from_text(
+            'Python, 파이썬, Django 필수', 'Docker 우대', 'Kafka 파이프라인 운영')
+        self.assertEqual(result, {'required': ['Python', 'Django', 'Kafka'], 'preferred': ['Docker']})
+        self.assertEqual(normalize_skill(' 장고 '), 'django')
@@ -0,0 +1,68 @@
+import asyncio
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from core.services.stt.streaming import SpeechSegmenter, StreamingTranscription
+from core.services.stt.vad import SAMPLE_RATE, StreamingVAD
+
+
+def _pcm(seconds, amplitude):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 220 * t) * amplitude * 32767).astype('<i2').tobytes()
+
+
+def _chunks(pcm, size=3200):
+    return [pcm[i:i + size] for i in range(0, len(pcm), size)]
+
+
+class StreamingTranscriptionTests(SimpleTestCase):
+    def _session(self, calls, partials):
+        def transcribe(samples, sample_rate):
+            calls.append(len(samples) / sample_rate)
+            return {"transcript": f"seg{len(calls)}", "confidence": 0.9, "language": "ko", "error": None}
+
+        async def on_partial(index, result, text):
+            partials.append((index, text))
+
+        segmenter = SpeechSegmenter(vad=StreamingVAD(use_silero=False), max_segment_sec=5)
+        return StreamingTranscription(on_partial=on_partial, transcribe=transcribe, segmenter=segmenter)
+
+    def test_segments_are_transcribed_while_streaming(self):
+        calls, partials = [], []
+
+        async def scenario():
+            session = self._session(calls, partials)
+            audio = _pcm(1, 0.3) + _pcm(1, 0) + _pcm(1.5, 0.3) + _pcm(1, 0) + _pcm(0.5, 0.3)
+            for chunk in _chunks(audio, 3201):  # 홀수 크기 청크도 이어 붙여야 함
+                await session.feed(chunk)
+            await asyncio.sleep(0.05)
+            before_stop = len(calls)
+            return before_stop, await session.finish()
+
+        before_stop, result = asyncio.run(scenario())
+        self.assertEqual(before_stop, 2)  # 닫힌 두 구간은 stop 전에 이미 변환
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(result["transcript"], "seg1 seg2 seg3")
+        self.assertTrue(result["has_speech"])
+        self.assertEqual(partials[1], (1, "seg1 seg2"))
+        self.assertAlmostEqual(calls[1], 1.5, delta=0.7)
+
+    def test_silence_is_rejected_without_transcription_and_long_speech_is_split(self):
+        calls, partials = [], []
+
+        async def scenario():
+            silent = self._session(calls, partials)
+            for chunk in _chunks(_pcm(3, 0.001)):
+                await silent.feed(chunk)
+            rejected = await silent.finish()
+
+            talker = self._session(calls, partials)
+            for chunk in _chunks(_pcm(12, 0.3)):
+                await talker.feed(chunk)
+            return rejected, await talker.finish()
+
+        rejected, long_answer = asyncio.run(scenario())
+        self.assertFalse(rejected["has_speech"])
+        self.assertEqual(long_answer["segments"], 3)
+        self.assertTrue(all(d <= 5.1 for d in calls))
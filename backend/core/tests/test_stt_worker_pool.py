@@ -0,0 +1,76 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase
+
+from core.services.stt.worker_pool import SttPoolBusy, SttWorkerError, SttWorkerPool
+
+
+def fake_engine(config):
+    """모델 대신 입력을 그대로 돌려주는 엔진 (워커 프로세스 안에서 로드)"""
+    time.sleep(0.2)  # 모델 로드 시간 흉내 → 요청 전에 끝나 있어야 함
+
+    def transcribe(audio):
+        if audio == b'crash':
+            os._exit(1)
+        time.sleep(0.05)
+        return {"transcript": audio.decode(), "confidence": 1.0, "language": "ko",
+                "error": None, "pid": os.getpid(), "threads": config["cpu_threads"]}
+    return transcribe
+
+
+class SttWorkerPoolTests(SimpleTestCase):
+    def _pool(self, **kwargs):
+        pool = SttWorkerPool(engine_factory=fake_engine, start_method='fork', request_timeout=10, **kwargs).start()
+        self.addCleanup(pool.close)
+        self.assertTrue(pool.wait_ready(10))
+        deadline = time.monotonic() + 10
+        while pool.metrics()["ready"] < pool.size and time.monotonic() < deadline:
+            time.sleep(0.01)  # 워커가 모두 로드를 마친 뒤 요청 (분배 검증용)
+        return pool
+
+    def test_preloaded_workers_batch_queued_requests(self):
+        pool = self._pool(size=2, batch_max=4, cpu_threads=1)
+        with ThreadPoolExecutor(12) as executor:
+            results = list(executor.map(lambda i: pool.transcribe(f"answer {i}".encode()), range(12)))
+
+        self.assertEqual([r["transcript"] for r in results], [f"answer {i}" for i in range(12)])
+        self.assertEqual(len({r["pid"] for r in results}), 2)
+        metrics = pool.metrics()
+        self.assertEqual(metrics["completed"], 12)
+        self.assertGreater(metrics["avg_batch"], 1)  # 워커가 모두 바쁜 동안 쌓인 요청은 묶여서 전달
+
+    def test_idle_workers_each_get_one_request(self):
+        pool = self._pool(size=2, batch_max=4, cpu_threads=1)
+        futures = [pool.submit(f"answer {i}".encode()) for i in range(2)]
+
+        pids = {f.result(timeout=10)["pid"] for f in futures}
+
+        self.assertEqual(len(pids), 2)
+        self.assertEqual(pool.metrics()["batches"], 2)
+
+    def test_crash_is_detected_while_other_worker_keeps_returning_results(self):
+        pool = self._pool(size=2, batch_max=1, cpu_threads=1)
+        crashed = pool.submit(b'crash')
+        time.sleep(0.02)
+        busy = [pool.submit(f"answer {i}".encode()) for i in range(40)]  # 다른 워커가 50ms마다 결과 반환
+
+        with self.assertRaises(SttWorkerError):
+            crashed.result(timeout=1.5)
+        self.assertEqual([f.result(timeout=10)["transcript"] for f in busy], [f"answer {i}" for i in range(40)])
+        self.assertEqual(pool.metrics()["restarts"], 1)
+
+    def test_full_queue_is_rejected_and_crashed_worker_is_replaced(self):
+        pool = self._pool(size=1, batch_max=1, max_queue=1)
+        crashed = pool.submit(b'crash')
+        time.sleep(0.02)
+        queued = pool.submit(b'queued')
+        with self.assertRaises(SttPoolBusy):
+            pool.transcribe(b'overflow')
+
+        with self.assertRaises(SttWorkerError):
+            crashed.result(timeout=10)
+        self.assertEqual(queued.result(timeout=10)["transcript"], 'queued')  # 재시작된 워커가 이어서 처리
+        self.assertEqual(pool.transcribe(b'after restart')["transcript"], 'after restart')
+        self.assertEqual(pool.metrics()["restarts"], 1)
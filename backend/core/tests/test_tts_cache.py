@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+import time
+
+from django.test import RequestFactory, SimpleTestCase
+
+from core.services.interview.tts_cache import TTSCache, tts_cache_key
+from core.views.interview.tts_view import _audio_response
+
+
+class TTSCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = TTSCache(self.tmp.name, max_bytes=1000)
+        self.calls = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _synth(self, payload=b'x' * 300):
+        def synthesize():
+            self.calls += 1
+            time.sleep(0.05)
+            return payload
+        return synthesize
+
+    def test_same_text_synthesized_once(self):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                self.cache.get_or_synthesize('안녕하세요  면접을\n시작합니다', 'nova', 'mp3', self._synth())))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual({key for key, _, _ in results}, {tts_cache_key('안녕하세요 면접을 시작합니다', 'nova', 'mp3')})
+        self.assertEqual(sum(1 for _, _, hit in results if not hit), 1)
+        # 음성/형식이 다르면 다른 키
+        self.assertNotEqual(tts_cache_key('a', 'nova', 'mp3'), tts_cache_key('a', 'alloy', 'mp3'))
+
+    def test_failed_synthesis_releases_key_lock(self):
+        def fail():
+            raise RuntimeError('TTS 실패')
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_synthesize('실패 문장', 'nova', 'mp3', fail)
+        self.assertEqual(self.cache._key_locks, {})
+        _, _, hit = self.cache.get_or_synthesize('실패 문장', 'nova', 'mp3', self._synth())
+        self.assertFalse(hit)
+
+    def test_lru_eviction_keeps_recent(self):
+        old_key, old_path, _ = self.cache.get_or_synthesize('첫 번째', 'nova', 'mp3', self._synth())
+        keep_key, keep_path, _ = self.cache.get_or_synthesize('두 번째', 'nova', 'mp3', self._synth())
+        os.utime(old_path, (1, 1))
+        os.utime(keep_path, (2, 2))
+        self.cache.lookup(keep_key, 'mp3')  # 최근 사용
+        self.cache.get_or_synthesize('세 번째', 'nova', 'mp3', self._synth(b'y' * 500))
+        self.assertIsNone(self.cache.lookup(old_key, 'mp3'))
+        self.assertIsNotNone(self.cache.lookup(keep_key, 'mp3'))
+        self.assertLessEqual(self.cache.metrics()['bytes'], 900)
+
+
+class TTSAudioResponseTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'a.mp3')
+        with open(self.path, 'wb') as f:
+            f.write(bytes(range(100)))
+        self.key = 'a' * 64
+        self.factory = RequestFactory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_etag_and_range(self):
+        response = _audio_response(self.factory.get('/'), self.path, self.key, 'mp3', 'hit')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], f'"{self.key}"')
+        response.close()
+
+        response = _audio_response(self.factory.get('/', HTTP_IF_NONE_MATCH=f'"{self.key}"'),
+                                   self.path, self.key, 'mp3', 'hit')
+        self.assertEqual(response.status_code, 304)
+
+        response = _audio_response(self.factory.get('/', HTTP_RANGE='bytes=10-19'), self.path, self.key, 'mp3', 'hit')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, bytes(range(10, 20)))
+        self.assertEqual(response['Content-Range'], 'bytes 10-19/100')
+
+        response = _audio_response(self.factory.get('/', HTTP_RANGE='bytes=500-'), self.path, self.key, 'mp3', 'hit')
+        self.assertEqual(response.status_code, 416)
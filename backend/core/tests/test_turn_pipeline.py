@@ -0,0 +1,136 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from core.models import InterviewSession
+from core.services.interview import turn_pipeline
+from core.services.interview.turn_pipeline import TurnPipeline, advance
+
+
+def _session(attempt_count=0, consecutive_no_gain=0, current_turn=1):
+    evidence = {'role': False, 'action': False, 'result': False}
+    return InterviewSession(
+        current_slot='collaboration',
+        current_turn=current_turn,
+        max_turns=10,
+        question_history=[],
+        interview_plan={'slots': [
+            {'slot': 'collaboration', 'topic': '협업', 'max_attempts': 3},
+            {'slot': 'growth', 'topic': '성장', 'max_attempts': 3},
+        ]},
+        slot_states={
+            'collaboration': {
+                'status': 'UNKNOWN', 'evidence': evidence, 'required': ['role', 'action', 'result'],
+                'missing_required': ['role', 'action', 'result'], 'confirmed_required': [],
+                'attempt_count': attempt_count, 'consecutive_no_gain': consecutive_no_gain,
+            },
+            'growth': {
+                'status': 'UNKNOWN', 'evidence': {'challenge': False}, 'required': ['challenge'],
+                'missing_required': ['challenge'], 'confirmed_required': [], 'attempt_count': 0,
+            },
+        },
+    )
+
+
+class TurnPipelineTests(SimpleTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.evidence_executor = ThreadPoolExecutor(max_workers=2)
+        self.evidence_gate = threading.Event()
+        self.evidence = {'role': False, 'action': False, 'result': False}
+        self.generated = []
+
+        def fake_extract(answer, keys):
+            self.evidence_gate.wait(5)
+            return dict(self.evidence)
+
+        def fake_generate(intent, ctx, previous_answer='', conversation_history=None):
+            self.generated.append(intent)
+            yield f'[{ctx["slot"]}] '
+            yield intent
+
+        patches = [
+            mock.patch.object(turn_pipeline, 'extract_evidence', fake_extract),
+            mock.patch.object(turn_pipeline, 'generate_question', fake_generate),
+            mock.patch.object(turn_pipeline, 'build_context', lambda session, plan: {'slot': session.current_slot}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        self.evidence_gate.set()
+        self.executor.shutdown(wait=True)
+        self.evidence_executor.shutdown(wait=True)
+
+    def test_advance_does_not_mutate_session(self):
+        session = _session()
+        outcome = advance(session, {'role': True, 'action': True, 'result': True})
+        self.assertEqual(outcome.action, 'move_slot')
+        self.assertEqual(outcome.state.current_slot, 'growth')
+        self.assertEqual(session.current_slot, 'collaboration')
+        self.assertEqual(session.slot_states['collaboration']['attempt_count'], 0)
+
+    def test_decided_move_slot_streams_before_evidence(self):
+        # 마지막 시도 → 증거와 무관하게 다음 슬롯으로 이동
+        session = _session(attempt_count=2)
+        pipeline = TurnPipeline(session, '답변', [], executor=self.executor,
+                                evidence_executor=self.evidence_executor).start()
+        self.assertIsNotNone(pipeline.decided)
+        tokens = ''.join(pipeline.question_tokens(pipeline.decided))
+        self.assertTrue(tokens.startswith('[growth]'))
+        self.assertFalse(self.evidence_gate.is_set())  # L1이 끝나기 전에 질문 완성
+
+        self.evidence_gate.set()
+        outcome = pipeline.outcome()
+        self.assertEqual(outcome.key, pipeline.decided.key)
+        self.assertEqual(outcome.state.slot_states['collaboration']['status'], 'UNCERTAIN')
+        self.executor.shutdown(wait=True)
+        self.assertEqual(len(self.generated), 1)
+
+    def test_draft_adopted_after_evidence(self):
+        session = _session()
+        pipeline = TurnPipeline(session, '답변', [], executor=self.executor,
+                                evidence_executor=self.evidence_executor).start()
+        self.assertIsNone(pipeline.decided)
+        self.evidence_gate.set()
+        outcome = pipeline.outcome()  # 새 증거 없음 → continue, 의도 그대로
+        self.assertEqual(outcome.action, 'continue')
+        tokens = ''.join(pipeline.question_tokens(outcome))
+        self.assertEqual(tokens, f'[collaboration] {outcome.intent}')
+        # no_gain / clear 초안 2개만 생성, 새 호출 없음
+        self.executor.shutdown(wait=True)
+        self.assertEqual(len(self.generated), 2)
+
+    def test_unmatched_outcome_generates_fresh_question(self):
+        self.evidence = {'role': True, 'action': False, 'result': False}
+        pipeline = TurnPipeline(_session(), '답변', [], executor=self.executor,
+                                evidence_executor=self.evidence_executor).start()
+        self.evidence_gate.set()
+        outcome = pipeline.outcome()
+        self.assertEqual(outcome.slot_status_after, 'PARTIAL')
+        tokens = ''.join(pipeline.question_tokens(outcome))
+        self.assertEqual(tokens, f'[collaboration] {outcome.intent}')
+        self.executor.shutdown(wait=True)
+        self.assertEqual(len(self.generated), 3)
+
+    def test_max_turns_finish_is_decided(self):
+        pipeline = TurnPipeline(_session(current_turn=10), '답변', [], executor=self.executor,
+                                evidence_executor=self.evidence_executor).start()
+        self.assertEqual(pipeline.decided.action, 'finish')
+        self.assertEqual(self.generated, [])
+
+    def test_evidence_is_not_queued_behind_drafts(self):
+        # 초안 풀이 다른 세션의 초안으로 꽉 차 있어도 증거 추출은 전용 풀에서 바로 실행
+        busy = threading.Event()
+        self.addCleanup(busy.set)
+        for _ in range(4):
+            self.executor.submit(busy.wait, 5)
+        pipeline = TurnPipeline(_session(), '답변', [], executor=self.executor,
+                                evidence_executor=self.evidence_executor).start()
+        self.evidence_gate.set()
+        self.assertEqual(pipeline._evidence.result(timeout=2), self.evidence)
+        pipeline.close()
+        busy.set()
@@ -0,0 +1,58 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from core.services.wars.orchestrator import WarsOrchestrator
+from core.services.wars.state_machine import DrawRoomState, GameState
+
+
+class _FakeGraph:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, state):
+        self.calls += 1
+        return {**state, "dispatched": False, "action_plan": [{"agent": "none"}]}
+
+
+class OrchestratorPreGateTests(SimpleTestCase):
+    def setUp(self):
+        self.graph = _FakeGraph()
+        patcher = patch("core.services.wars.orchestrator.get_orchestrator_graph", return_value=self.graph)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.orchestrator = WarsOrchestrator()
+        self.room = DrawRoomState(room_id="r1", state=GameState.PLAYING)
+        self.room.mission_required = ["lb", "server"]
+
+    def update(self, sid, nodes):
+        self.room._last_agent_call_per_sid = {}  # 쿨다운 무시
+        return asyncio.run(self.orchestrator.on_canvas_update(self.room, sid, nodes, []))
+
+    def test_no_graph_run_during_grace_period(self):
+        self.update("a", [{"compId": "lb"}])
+
+        self.assertEqual(self.graph.calls, 0)
+        self.assertEqual(self.orchestrator.gate_metrics()["skipped_grace"], 1)
+
+    def test_graph_runs_only_when_intervention_possible_and_situation_changed(self):
+        self.room.entered_at = time.time() - 60
+        self.room.chaos_triggered_at = time.time()  # 이번 라운드 Chaos 발동 완료
+
+        self.update("a", [{"compId": "lb"}, {"compId": "server"}])  # 필수 충족 + 방금 조작 → Coach 불가
+        self.assertEqual(self.graph.calls, 0)
+
+        self.update("a", [{"compId": "lb"}])  # 노드 1개 → Coach 조건 충족
+        self.update("a", [{"compId": "lb"}])  # 같은 상황 → 재질의 생략
+        self.assertEqual(self.graph.calls, 1)
+
+        self.update("a", [{"compId": "db"}])
+        self.assertEqual(self.graph.calls, 2)
+
+        metrics = self.orchestrator.gate_metrics()
+        self.assertEqual(metrics["graph_runs"], 2)
+        self.assertEqual(metrics["skipped_no_trigger"], 1)
+        self.assertEqual(metrics["skipped_unchanged"], 1)
+        self.assertEqual(metrics["llm_avoided"], 2)
@@ -7,11 +7,107 @@
   이 클래스는 더 이상 무성의 입력 판단을 하지 않습니다.
 - validate() 반환값에서 is_low_effort 필드 제거
 - 역할: 치명적 오류 감지 + 개념/구조 점수 산출만 담당
+
+[수정일: 2026-10-18] 규칙 사전 컴파일 (CompiledRules)
+- 제출마다 패턴 문자열을 순회하며 re.search를 호출하던 방식 →
+  미션 규칙 1개당 1회 컴파일 (개념별 패턴은 alternation 하나로 결합)
+- 흐름 분석: 의존성마다 줄 × 패턴을 다시 훑던 방식 →
+  개념별로 전체 텍스트를 한 번 search(MULTILINE)하고 매칭 위치로 줄 번호 계산
 """
 
 import re
+import threading
 from typing import Set, List, Dict, Any
 
+_WS_RE = re.compile(r'\s+')
+_DISALLOWED_RE = re.compile(r'[^a-z0-9가-힣\s\.\,\(\)\_\-\:\;\=\>\<\!\?\/]')
+_HSPACE_RE = re.compile(r'[ \t\r\f\v]+')
+_NEWLINES_RE = re.compile(r'\n+')
+_NUMBERED_RE = re.compile(r'^\d+[\.\):]')
+
+
+def _any_of(patterns: List[str]) -> str:
+    return '|'.join(f'(?:{p})' for p in patterns) or '(?!)'
+
+
+class CompiledRules:
+    """
+    미션 규칙(VALIDATION_RULES 항목)을 한 번만 컴파일한 결과.
+    compile_rules()로 얻으며 같은 규칙 dict에 대해서는 캐시된 객체를 재사용한다.
+    """
+
+    def __init__(self, rules: Dict[str, Any]):
+        self.rules = rules
+
+        # 치명적 오류: (규칙, positive, negatives)
+        self.errors = []
+        for p in rules.get('criticalPatterns', []):
+            if p.get('severity') in ('PRAISE', 'INFO'):
+                continue
+            pattern = p.get('pattern')
+            if isinstance(pattern, str):
+                positive, negatives = pattern, []
+            elif isinstance(pattern, dict) and pattern.get('positive'):
+                positive, negatives = pattern['positive'], pattern.get('negatives', [])
+            else:
+                continue
+            self.errors.append((
+                p,
+                re.compile(positive, re.IGNORECASE),
+                [re.compile(n, re.IGNORECASE) for n in negatives],
+            ))
+
+        # 개념: [2026-02-23] re.DOTALL — 개행이 포함된 soft 텍스트에서도 패턴 매칭
+        self.concepts = [
+            (c['id'], re.compile(_any_of(c.get('patterns', [])), re.IGNORECASE | re.DOTALL))
+            for c in rules.get('requiredConcepts', [])
+        ]
+
+        # 흐름: 줄 단위 탐색과 같도록 DOTALL 없이(줄을 넘지 않음) + MULTILINE(^/$는 줄 경계)
+        self.line_patterns = {
+            c['id']: re.compile(_any_of(c.get('patterns', [])), re.IGNORECASE | re.MULTILINE)
+            for c in rules.get('requiredConcepts', [])
+        }
+
+    def critical_errors(self, normalized: str) -> List[Dict[str, Any]]:
+        errors = []
+        for p, positive, negatives in self.errors:
+            if positive.search(normalized) and not any(n.search(normalized) for n in negatives):
+                errors.append({
+                    'severity': p.get('severity', 'CRITICAL'),
+                    'message': p.get('message'),
+                    'example': p.get('correctExample'),
+                    'why': p.get('explanation'),
+                })
+        return errors
+
+    def concepts_in(self, soft: str) -> Set[str]:
+        return {cid for cid, pattern in self.concepts if pattern.search(soft)}
+
+    def first_line(self, soft: str, concept_id: str) -> int:
+        """개념 패턴이 처음 등장하는 줄 번호 (없으면 -1)"""
+        pattern = self.line_patterns.get(concept_id)
+        if pattern is None:
+            return -1
+        m = pattern.search(soft)
+        return soft.count('\n', 0, m.start()) if m else -1
+
+
+_compiled: Dict[int, "tuple[Dict[str, Any], CompiledRules]"] = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_rules(rules: Dict[str, Any]) -> CompiledRules:
+    """규칙 dict별 컴파일 결과 캐시 (VALIDATION_RULES의 '1'/'QUEST_01'처럼 같은 dict는 공유)"""
+    entry = _compiled.get(id(rules))
+    if entry is not None and entry[0] is rules:
+        return entry[1]
+    compiled = CompiledRules(rules)
+    with _compiled_lock:
+        # dict 자체를 함께 보관해 id가 재사용되지 않도록 함
+        _compiled[id(rules)] = (rules, compiled)
+    return compiled
+
 
 class PseudocodeValidator:
     """
@@ -21,6 +117,7 @@ class PseudocodeValidator:
 
     def __init__(self, rules: Dict[str, Any]):
         self.rules = rules or self._default_rules()
+        self.compiled = compile_rules(self.rules)
 
     def validate(self, pseudocode: str) -> Dict[str, Any]:
         normalized = self._normalize(pseudocode)
@@ -48,8 +145,8 @@ class PseudocodeValidator:
         if not text:
             return ""
         text = text.lower()
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^a-z0-9가-힣\s\.\,\(\)\_\-\:\;\=\>\<\!\?\/]', ' ', text)
+        text = _WS_RE.sub(' ', text)
+        text = _DISALLOWED_RE.sub(' ', text)
         return text.strip()
 
     def _soft_normalize(self, text: str) -> str:
@@ -58,52 +155,19 @@ class PseudocodeValidator:
         # [2026-02-23 수정] \s+ 대신 가로 공백만 처리하여 \n(개행)을 보존함. 
         # 이를 통해 _analyze_flow에서 줄 단위 분석이 가능하게 함.
         text = text.lower()
-        text = re.sub(r'[ \t\r\f\v]+', ' ', text)
-        text = re.sub(r'\n+', '\n', text)
+        text = _HSPACE_RE.sub(' ', text)
+        text = _NEWLINES_RE.sub('\n', text)
         return text.strip()
 
     # ── 치명적 오류 체크 ──────────────────────────────────────────
 
     def _check_critical_errors(self, normalized: str) -> List[Dict[str, Any]]:
-        errors = []
-        for p in self.rules.get('criticalPatterns', []):
-            if p.get('severity') in ('PRAISE', 'INFO'):
-                continue
-
-            pattern = p.get('pattern')
-            is_error = False
-
-            if isinstance(pattern, str):
-                if re.search(pattern, normalized, re.IGNORECASE):
-                    is_error = True
-            elif isinstance(pattern, dict):
-                positive = pattern.get('positive')
-                negatives = pattern.get('negatives', [])
-                if positive and re.search(positive, normalized, re.IGNORECASE):
-                    has_neg = any(re.search(n, normalized, re.IGNORECASE) for n in negatives)
-                    if not has_neg:
-                        is_error = True
-
-            if is_error:
-                errors.append({
-                    'severity': p.get('severity', 'CRITICAL'),
-                    'message': p.get('message'),
-                    'example': p.get('correctExample'),
-                    'why': p.get('explanation'),
-                })
-        return errors
+        return self.compiled.critical_errors(normalized)
 
     # ── 개념 추출 ────────────────────────────────────────────────
 
     def _extract_concepts(self, soft: str) -> Set[str]:
-        found: Set[str] = set()
-        for concept in self.rules.get('requiredConcepts', []):
-            for pattern in concept.get('patterns', []):
-                # [2026-02-23] re.DOTALL 추가: 개행이 포함된 soft 텍스트에서도 패턴 매칭 원활하게 함
-                if re.search(pattern, soft, re.IGNORECASE | re.DOTALL):
-                    found.add(concept['id'])
-                    break
-        return found
+        return self.compiled.concepts_in(soft)
 
     # ── 구조 분석 ────────────────────────────────────────────────
 
@@ -126,7 +190,7 @@ class PseudocodeValidator:
         else:
             feedback.append(f"⚠️ {'너무 짧음' if len(lines) < min_lines else '너무 김'}")
 
-        if any(re.match(r'^\d+[\.\):]', l) for l in lines):
+        if any(_NUMBERED_RE.match(l) for l in lines):
             score += scoring['structure'] / 2
             feedback.append('✅ 번호 매기기 사용')
 
@@ -168,9 +232,13 @@ class PseudocodeValidator:
 
         score = 0.0
         feedback: List[str] = []
+        first_lines: Dict[str, int] = {}
         for dep in deps:
-            before = self._find_concept_line(lines, dep['before'])
-            after = self._find_concept_line(lines, dep['after'])
+            for cid in (dep['before'], dep['after']):
+                if cid not in first_lines:
+                    first_lines[cid] = self.compiled.first_line(soft, cid)
+            before = first_lines[dep['before']]
+            after = first_lines[dep['after']]
             if before == -1 or after == -1:
                 continue
             pts = dep.get('points', 0)
@@ -185,19 +253,6 @@ class PseudocodeValidator:
 
         return {'score': round(score), 'feedback': feedback}
 
-    def _find_concept_line(self, lines: List[str], concept_id: str) -> int:
-        concept = next(
-            (c for c in self.rules.get('requiredConcepts', []) if c['id'] == concept_id),
-            None,
-        )
-        if not concept:
-            return -1
-        for i, line in enumerate(lines):
-            for p in concept.get('patterns', []):
-                if re.search(p, line, re.IGNORECASE):
-                    return i
-        return -1
-
     def _default_rules(self) -> Dict[str, Any]:
         return {
             'criticalPatterns': [],
@@ -11,6 +11,7 @@ youtube_helper.py
 import requests
 import logging
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
@@ -44,13 +45,12 @@ def generate_llm_search_queries(
         검색어 리스트 3개
     """
     try:
-        import openai
         api_key = getattr(settings, 'OPENAI_API_KEY', None)
         if not api_key:
             logger.warning("[LLM Search] OPENAI_API_KEY 없음 → 폴백 쿼리 사용")
             return _fallback_queries(quest_title, weak_dimensions)
 
-        client = openai.OpenAI(api_key=api_key)
+        client = get_openai_client('youtube.keywords')
 
         dim_labels = {
             'design':         '설계력 (ML 파이프라인 구조화)',
@@ -7,7 +7,13 @@ from .practice_view import PracticeViewSet, PracticeDetailViewSet
 from .auth_view import LoginView, LogoutView, SessionCheckView
 from .bughunt.bughunt_evaluation_view import BugHuntEvaluationView
 from .bughunt.bughunt_interview_view import BugHuntInterviewView
-from .code_execution_view import CodeExecutionView, BehaviorVerificationView
+from .code_execution_view import (
+    CodeExecutionView,
+    CodeExecutionJobView,
+    CodeExecutionJobDetailView,
+    CodeExecutionJobStreamView,
+    BehaviorVerificationView,
+)
 from .management_view import OverallProgressView, UserAnswersView
 from . import activity_view
 from .ai_proxy_view import AIProxyView
@@ -39,7 +39,21 @@ class LeaderboardView(APIView):
         leaderboard_data = []
         # 페이징 시작 번호를 기반으로 절대 순위 계산
         start_rank = (page_obj.number - 1) * page_size + 1
-        
+
+        # [수정일: 2026-10-18] 유닛 마스터 정보를 행마다 집계하던 N+1 쿼리 제거
+        # - UserProgress의 비정규화 필드(solved_count, perfect_count)를 페이지 단위 1회 조회로 읽음
+        # - 유닛별 전체 문제 수(PROBLEM)도 group-by 1회로 계산
+        page_users = [activity.user_id for activity in page_obj]
+        progresses_by_user = {}
+        for p in UserProgress.objects.filter(user_id__in=page_users).select_related('practice'):
+            progresses_by_user.setdefault(p.user_id, []).append(p)
+        problem_totals = dict(
+            PracticeDetail.objects.filter(detail_type='PROBLEM')
+            .values('practice')
+            .annotate(total=Count('id'))
+            .values_list('practice', 'total')
+        )
+
         for i, activity in enumerate(page_obj, start_rank):
             # [수정일: 2026-02-09] 닉네임 폴백 로직 강화
             user_nickname = getattr(activity.user, 'user_nickname', None) or str(activity.user.username)
@@ -50,32 +64,20 @@ class LeaderboardView(APIView):
 
             # [2026-02-19 추가] 유닛 마스터 정보 집계 (Antigravity)
             # - UserProgress에서 각 유닛의 진행률(100%) 확인
-            # - UserSolvedProblem에서 모든 문제의 최고 점수가 90점 이상인지 확인
+            # - 모든 문제의 최고 점수가 90점 이상인지 확인 (solved_count == perfect_count)
             mastered_units = []
-            user_progresses = UserProgress.objects.filter(user=activity.user).select_related('practice')
-            
-            for p in user_progresses:
+            for p in progresses_by_user.get(activity.user_id, []):
                 # 해당 유닛의 전체 문제수
-                total_count = PracticeDetail.objects.filter(practice=p.practice, detail_type='PROBLEM').count()
-                
+                total_count = problem_totals.get(p.practice_id, 0)
+
                 # 유저가 한 번이라도 풀어서 점수가 있는 문제수 (고유 문제 개수)
-                solved_count = UserSolvedProblem.objects.filter(
-                    user=activity.user, 
-                    practice_detail__practice=p.practice
-                ).values('practice_detail').distinct().count()
+                solved_count = p.solved_count
+
+                # 유저가 90점 이상으로 완벽하게 풀어낸 고유 문제 개수
+                perfect_count = p.perfect_count
 
-                # 해당 유닛의 모든 문제가 90점 이상인지 체크
-                # 1. 유저가 푼 문제들 중 90점 미만인 문제가 하나라도 있는지 확인
-                has_subpar_score = UserSolvedProblem.objects.filter(
-                    user=activity.user, 
-                    practice_detail__practice=p.practice
-                ).values('practice_detail').annotate(max_score=Max('score')).filter(max_score__lt=90).exists()
-                
-                # 2. 유저가 90점 이상으로 완벽하게 풀어낸 고유 문제 개수
-                perfect_count = UserSolvedProblem.objects.filter(
-                    user=activity.user, 
-                    practice_detail__practice=p.practice
-                ).values('practice_detail').annotate(max_score=Max('score')).filter(max_score__gte=90).count()
+                # 유저가 푼 문제들 중 최고점이 90점 미만인 문제가 하나라도 있는지 확인
+                has_subpar_score = solved_count > perfect_count
 
                 is_perfect_master = (not has_subpar_score) and (perfect_count == total_count) and (total_count > 0)
 
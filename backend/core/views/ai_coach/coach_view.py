@@ -21,6 +21,7 @@ from rest_framework.throttling import ScopedRateThrottle  # [수정일: 2026-03-
 from rest_framework.views import APIView
 
 from core.models import UserProfile, CoachConversation, CoachMessage
+from core.services.llm_client import get_async_openai_client
 from .coach_prompt import is_off_topic, GUARDRAIL_MESSAGE, INTENT_ANALYSIS_PROMPT, RESPONSE_STRATEGIES
 from .coach_tools import (
     COACH_TOOLS,
@@ -185,7 +186,7 @@ class AICoachView(APIView):
         #    asyncio 이벤트 루프를 멈춰 SSE 청크가 버퍼에 쌓이는 문제 해결 ──
         async def event_stream():
             called_tools_cache = {}  # ← 도구 결과 캐싱
-            async_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            async_client = get_async_openai_client('coach.chat')
             try:
                 # ── SSE 첫 이벤트: conversation_id 전달 ──
                 yield _sse({"type": "conversation_id", "conversation_id": conv_pk})
@@ -2,6 +2,7 @@ import sys
 import traceback
 import openai
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -42,7 +43,7 @@ class AIProxyView(APIView):
                 print("[AIProxy] Error: OPENAI_API_KEY is missing in settings.", flush=True)
                 return Response({"error": "OpenAI API Key is missing on server"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('ai_proxy')
 
             # 3. OpenAI API 호출
             # [2026-02-13] 프론트엔드 전달 파라미터 및 response_format 통합 적용
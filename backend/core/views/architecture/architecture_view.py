@@ -1,6 +1,6 @@
 # [작성일: 2026-02-20] Architecture Practice 평가 및 질문 생성 View
-import openai
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -496,7 +496,7 @@ class ArchitectureEvaluationView(APIView):
                 deep_dive_qna
             )
 
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('architecture.evaluate')
 
             # Step 2: LLM 호출 (gpt-4o-mini 사용)
             print(f"[DEBUG] Calling AI for Evaluation with gpt-4o-mini...", flush=True)
@@ -600,7 +600,7 @@ class ArchitectureQuestionGeneratorView(APIView):
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
 
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('architecture.questions')
             print(f"[DEBUG] OpenAI Client Initialized", flush=True)
 
             # 컴포넌트 분류
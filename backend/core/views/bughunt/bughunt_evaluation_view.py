@@ -3,8 +3,8 @@
 import json
 import re
 
-import openai
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
@@ -47,7 +47,7 @@ class BugHuntEvaluationView(APIView):
             if not api_key:
                 return Response({"error": "API Key not configured"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('bughunt.evaluate')
 
             # Step별 컨텍스트 구성
             step_context_parts = []
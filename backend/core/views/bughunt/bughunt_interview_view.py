@@ -4,8 +4,8 @@ import json
 import os
 import re
 
-import openai
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 from django.http import StreamingHttpResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
@@ -64,7 +64,7 @@ class BugHuntInterviewView(APIView):
             api_key = getattr(settings, "OPENAI_API_KEY", "") or os.getenv("OPENAI_API_KEY", "")
             if not api_key:
                 return Response({"error": "OPENAI_API_KEY not configured"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('bughunt.interview')
 
             rubric = step_context.get('interview_rubric', {})
             is_final_turn = (turn > self.MAX_TURNS)
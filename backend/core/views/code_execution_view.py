@@ -1,6 +1,9 @@
 # 수정일: 2026-02-06
 # 수정내용: On-demand Docker 기반 코드 실행 샌드박스 뷰
+# [수정일: 2026-10-18] CodeExecutionView는 요청마다 docker run 대신 웜 샌드박스 풀(core.services.sandbox_pool) 사용
 
+import asyncio
+import json
 import subprocess
 import tempfile
 import os
@@ -11,6 +14,9 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.http import StreamingHttpResponse
+from core.services.sandbox_pool import get_sandbox_pool, SandboxPoolBusy
+from core.services.code_jobs import get_code_job_manager, CodeJobQueueFull
 
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -21,7 +27,8 @@ class CodeExecutionView(APIView):
     사용자가 제출한 Python 코드를 격리된 Docker 컨테이너에서 실행하고
     stdout/stderr 결과를 반환합니다.
 
-    - 컨테이너는 요청 시 자동 생성되고 실행 후 자동 삭제됩니다
+    - [수정일: 2026-10-18] 미리 띄워 둔 컨테이너 풀에서 실행하고, N회 실행 후 컨테이너를 교체합니다
+      (실행마다 /tmp 초기화, 대기열 초과 시 503 busy 응답)
     - 리소스 제한: CPU 0.5, 메모리 256MB, 타임아웃 30초
     - 네트워크 비활성화로 외부 접근 차단
     """
@@ -39,16 +46,14 @@ class CodeExecutionView(APIView):
         "pytorch": "pytorch-sandbox:latest"  # 커스텀 PyTorch 이미지
     }
 
-    def post(self, request):
+    def _build_full_code(self, request):
+        """요청에서 실행할 전체 코드와 Docker 이미지를 구성 (코드 없으면 None)"""
         code = request.data.get('code', '')
         test_code = request.data.get('test_code', '')  # 검증용 테스트 코드
         image_type = request.data.get('image', 'basic')  # basic 또는 pytorch
 
         if not code:
-            return Response(
-                {"error": "코드가 필요합니다"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+            return None, None
 
         # 이미지 타입 검증
         if image_type not in self.SUPPORTED_IMAGES:
@@ -58,10 +63,20 @@ class CodeExecutionView(APIView):
         full_code = code
         if test_code:
             full_code = f"{code}\n\n# === 자동 검증 코드 ===\n{test_code}"
+        return full_code, self.SUPPORTED_IMAGES[image_type]
+
+    def post(self, request):
+        full_code, docker_image = self._build_full_code(request)
+        if not full_code:
+            return Response(
+                {"error": "코드가 필요합니다"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         try:
-            docker_image = self.SUPPORTED_IMAGES[image_type]
             result = self._execute_in_docker(full_code, docker_image)
+            if result.get("error_type") == "busy":
+                return Response(result, status=status.HTTP_503_SERVICE_UNAVAILABLE)
             return Response(result, status=status.HTTP_200_OK)
 
         except subprocess.TimeoutExpired:
@@ -84,55 +99,20 @@ class CodeExecutionView(APIView):
 
     def _execute_in_docker(self, code: str, docker_image: str = "python:3.10-slim") -> dict:
         """
-        Docker 컨테이너에서 코드를 실행합니다.
+        Docker 샌드박스 풀에서 코드를 실행합니다.
 
-        Windows에서는 docker run의 stdin으로 코드를 전달하고,
-        컨테이너 내부에서 python -c로 실행합니다.
+        [수정일: 2026-10-18] 기존: 요청마다 `docker run --rm` (컨테이너 콜드 스타트 매번 발생)
+        변경: 이미지별 웜 컨테이너 풀의 러너에 코드를 전달 → 컨테이너 생성 비용 없이 즉시 실행
+        격리 옵션(--network none, --read-only, tmpfs /tmp, 메모리/CPU 제한)은 풀 컨테이너에 동일하게 적용됩니다.
         """
         start_time = time.time()
 
         # PyTorch 이미지는 더 큰 메모리가 필요
         memory_limit = "512m" if "pytorch" in docker_image else self.MEMORY_LIMIT
 
-        # Docker 명령어 구성
-        # --rm: 컨테이너 자동 삭제
-        # --network none: 네트워크 비활성화 (보안)
-        # --memory: 메모리 제한
-        # --cpus: CPU 제한
-        # --read-only: 파일시스템 읽기 전용 (임시 디렉토리 제외)
-        docker_cmd = [
-            "docker", "run",
-            "--rm",
-            "--network", "none",
-            "--memory", memory_limit,
-            "--cpus", self.CPU_LIMIT,
-            "--read-only",
-            "--tmpfs", "/tmp:rw,noexec,nosuid,size=128m",
-            "-i",  # stdin 사용
-            docker_image,
-            "python", "-c", code
-        ]
-
         try:
-            # 프로세스 실행
-            result = subprocess.run(
-                docker_cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.TIMEOUT_SECONDS
-            )
-
-            execution_time = time.time() - start_time
-
-            return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "exit_code": result.returncode,
-                "execution_time": round(execution_time, 2),
-                "error_type": None if result.returncode == 0 else "runtime"
-            }
-
+            pool = get_sandbox_pool(docker_image, memory_limit=memory_limit, cpu_limit=self.CPU_LIMIT)
+            result = pool.run(code, timeout=self.TIMEOUT_SECONDS)
         except FileNotFoundError:
             # Docker가 설치되어 있지 않은 경우
             return {
@@ -142,6 +122,120 @@ class CodeExecutionView(APIView):
                 "exit_code": -1,
                 "error_type": "docker_not_found"
             }
+        except SandboxPoolBusy:
+            # 실행 대기열 초과 (백프레셔)
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": "실행 요청이 많아 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.",
+                "exit_code": -1,
+                "error_type": "busy"
+            }
+
+        if result["timed_out"]:
+            raise subprocess.TimeoutExpired(docker_image, self.TIMEOUT_SECONDS)
+
+        execution_time = time.time() - start_time
+        return {
+            "success": result["exit_code"] == 0,
+            "stdout": result["stdout"],
+            "stderr": result["stderr"],
+            "exit_code": result["exit_code"],
+            "execution_time": round(execution_time, 2),
+            "error_type": None if result["exit_code"] == 0 else "runtime"
+        }
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class CodeExecutionJobView(CodeExecutionView):
+    """
+    [수정일: 2026-10-18] 비동기 코드 실행 제출
+
+    실행 완료를 기다리지 않고 job_id를 즉시 반환(202)합니다.
+    결과는 CodeExecutionJobDetailView(폴링) 또는 CodeExecutionJobStreamView(SSE)로 받습니다.
+    긴 PyTorch 실행이 API 워커 스레드를 점유하지 않도록 하기 위함입니다.
+    """
+
+    def post(self, request):
+        full_code, docker_image = self._build_full_code(request)
+        if not full_code:
+            return Response(
+                {"error": "코드가 필요합니다"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        memory_limit = "512m" if "pytorch" in docker_image else self.MEMORY_LIMIT
+        try:
+            job = get_code_job_manager().submit(
+                full_code, docker_image, memory_limit, self.CPU_LIMIT, self.TIMEOUT_SECONDS
+            )
+        except CodeJobQueueFull as e:
+            return Response({"error": str(e), "error_type": "busy"}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        return Response({
+            "job_id": job.id,
+            "status": job.status,
+            "stream_url": f"{request.path.rstrip('/')}/{job.id}/stream/",
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class CodeExecutionJobDetailView(APIView):
+    """[수정일: 2026-10-18] 비동기 실행 작업 상태/결과 조회"""
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request, job_id):
+        job = get_code_job_manager().get(job_id)
+        if not job:
+            return Response({"error": "작업을 찾을 수 없습니다"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(job.to_dict(), status=status.HTTP_200_OK)
+
+
+class CodeExecutionJobStreamView(APIView):
+    """
+    [수정일: 2026-10-18] 비동기 실행 작업 출력 SSE 스트림
+
+    이벤트:
+        {"type": "output", "stream": "stdout"|"stderr", "data": "..."}  실행 중 출력 조각
+        {"type": "result", ...}                                         최종 결과 (CodeExecutionView 응답과 동일 형식)
+        [DONE]
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    # 출력 확인 주기 (초) — async generator가 이벤트 루프를 막지 않도록 sleep으로 대기
+    POLL_INTERVAL = 0.05
+
+    def get(self, request, job_id):
+        job = get_code_job_manager().get(job_id)
+        if not job:
+            return Response({"error": "작업을 찾을 수 없습니다"}, status=status.HTTP_404_NOT_FOUND)
+
+        def _sse(data):
+            return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+        async def event_stream():
+            offset = 0
+            while True:
+                # 종료 여부를 먼저 확인한 뒤 남은 조각을 모두 보내야 마지막 출력이 누락되지 않음
+                finished = job.status == job.DONE
+                events = job.events_since(offset)
+                offset += len(events)
+                for event in events:
+                    yield _sse(event)
+                if finished:
+                    break
+                await asyncio.sleep(self.POLL_INTERVAL)
+            yield _sse({"type": "result", **job.result})
+            yield "data: [DONE]\n\n"
+
+        resp = StreamingHttpResponse(
+            event_stream(),
+            content_type="text/event-stream; charset=utf-8",
+        )
+        resp["Cache-Control"] = "no-cache, no-transform"
+        resp["X-Accel-Buffering"] = "no"
+        return resp
 
 
 @method_decorator(csrf_exempt, name='dispatch')
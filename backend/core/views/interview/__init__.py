@@ -2,7 +2,7 @@ from .job_posting_view import InterviewJobPostingView, InterviewJobPostingDetail
 from .session_view import InterviewSessionView, InterviewSessionDetailView, InterviewVisionView
 from .answer_view import InterviewAnswerView
 from .stt_view import STTTranscribeView
-from .tts_view import TTSSynthesizeView
+from .tts_view import TTSSynthesizeView, TTSAudioView
 # 2026-03-01 면접 질문 뱅크 검색 API 추가
 from .question_bank_view import InterviewQuestionSearchView
 __all__ = [
@@ -14,5 +14,6 @@ __all__ = [
     'InterviewAnswerView',
     'STTTranscribeView',
     'TTSSynthesizeView',
+    'TTSAudioView',
     'InterviewQuestionSearchView',  # 2026-03-01 면접 질문 뱅크 검색 API 추가
 ]
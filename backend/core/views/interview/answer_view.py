@@ -3,7 +3,7 @@ answer_view.py — 모의면접 답변 처리 + SSE 스트리밍
 POST /api/core/interview/sessions/<pk>/answer/
 
 한 턴 처리 흐름:
-1. L1 Analyst → evidence_map
+1. L1 Analyst → evidence_map  (다음 질문 초안 생성과 병렬, core/services/interview/turn_pipeline.py)
 2. L2 Engine → update_slot + decide_action
 3. if finish → feedback_generator → SSE final_feedback → [DONE]
 4. if move_slot → 다음 슬롯 이동
@@ -23,15 +23,9 @@ from rest_framework.permissions import AllowAny
 from rest_framework.throttling import ScopedRateThrottle  # [수정일: 2026-03-06] AI throttle
 
 from core.models import UserProfile, InterviewSession, InterviewTurn, InterviewFeedback
-from core.services.interview.analyst import extract_evidence
-from core.services.interview.state_engine import StateEngine
-from core.services.interview.planner import decide_intent
-from core.services.interview.humanizer import build_context
-from core.services.interview.interviewer import generate_question
+from core.services.interview.turn_pipeline import TurnPipeline
 from core.services.interview.feedback_generator import generate_feedback
-
-engine = StateEngine()
-
+from core.services.interview.constants import CLOSING_MESSAGE
 
 def _get_user(request):
     """세션에서 UserProfile을 가져온다. 없으면 None."""
@@ -50,161 +44,97 @@ def _sse(payload: dict) -> str:
     return f'data: {json.dumps(payload, ensure_ascii=False)}\n\n'
 
 
+def _finish_feedback(session):
+    """최종 피드백 생성 + 저장 → SSE 이벤트"""
+    try:
+        feedback_data = generate_feedback(session)
+        InterviewFeedback.objects.create(
+            session=session,
+            slot_summary=feedback_data.get('slot_summary', {}),
+            overall_summary=feedback_data.get('overall_summary', '면접이 완료됐습니다.'),
+            top_strengths=feedback_data.get('top_strengths', []),
+            top_improvements=feedback_data.get('top_improvements', []),
+            recommendation=feedback_data.get('recommendation', ''),
+        )
+        return _sse({'type': 'final_feedback', **feedback_data})
+    except Exception as e:
+        print(f'[AnswerView] 피드백 생성 오류: {e}')
+        return _sse({'type': 'final_feedback', 'overall_summary': '면접이 완료됐습니다.', 'error': True})
+
+
 def _stream_answer(session, answer: str, old_turn: InterviewTurn):
     """
     한 턴 처리 + SSE 스트리밍 제너레이터.
     DB 저장은 [DONE] 이후에 수행.
+
+    [수정일: 2026-10-18] L1 증거 추출과 다음 질문 초안 생성을 병렬 실행 (core/services/interview/turn_pipeline.py)
+    - action이 증거와 무관하게 확정되면 증거 추출을 기다리지 않고 바로 전송
+    - 아니면 증거 추출 완료 시점에 이미 생성 중인 초안을 채택 (첫 토큰 대기 ≈ max(L1, L4 첫 토큰))
     """
-    current_slot = session.current_slot
-    slot_states = session.slot_states
-
-    # ── Phase 1: 분석 (비스트리밍) ──────────────────────────
-    # 현재 슬롯의 모든 evidence 키
-    current_slot_state = slot_states.get(current_slot, {})
-    all_evidence_keys = list(current_slot_state.get('evidence', {}).keys())
-    required = session.get_slot_required(current_slot)
-
-    slot_status_before = current_slot_state.get('status', 'UNKNOWN')
-
-    # L1 Analyst: 답변에서 evidence 추출
-    evidence_map = extract_evidence(answer, all_evidence_keys)
-
-    # 기존 evidence와 병합 (True는 유지, False는 덮어쓰기 안 함)
-    existing_evidence = current_slot_state.get('evidence', {})
-    merged_evidence = {k: existing_evidence.get(k, False) or evidence_map.get(k, False)
-                       for k in set(existing_evidence) | set(evidence_map)}
-
-    # 새 required evidence 증가 여부 감지
-    existing_confirmed_count = sum(1 for k in required if existing_evidence.get(k))
-    new_confirmed_count = sum(1 for k in required if merged_evidence.get(k))
-    no_gain = (new_confirmed_count <= existing_confirmed_count)
-    prev_no_gain = current_slot_state.get('consecutive_no_gain', 0)
-    consecutive_no_gain = prev_no_gain + 1 if no_gain else 0
-
-    # slot_states 업데이트
-    slot_states[current_slot]['evidence'] = merged_evidence
-    slot_states[current_slot]['attempt_count'] = current_slot_state.get('attempt_count', 0) + 1
-    slot_states[current_slot]['consecutive_no_gain'] = consecutive_no_gain
-
-    # L2 Engine: 슬롯 상태 갱신
-    update_result = engine.update_slot(current_slot, merged_evidence, required)
-    slot_states[current_slot]['status'] = update_result['status']
-    slot_states[current_slot]['confirmed_required'] = update_result['confirmed_required']
-    slot_states[current_slot]['missing_required'] = update_result['missing_required']
-    session.slot_states = slot_states
-
-    slot_status_after = update_result['status']
-
-    # L2 Engine: 행동 결정
-    action = engine.decide_action(session)
-
-    # ── Phase 2: FINISH 처리 ─────────────────────────────────
-    if action == 'finish':
-        # 현재 슬롯 uncertain 처리 (CLEAR가 아닌 경우)
-        if slot_status_after != 'CLEAR':
-            engine.mark_uncertain(session, current_slot)
-
-        # 세션 완료 처리
-        session.status = 'completed'
-        session.finished_at = timezone.now()
-        session.save()
-
-        # 이전 턴(old_turn) 완성
+    slot_status_before = session.slot_states.get(session.current_slot, {}).get('status', 'UNKNOWN')
+
+    # 대화 히스토리 조립 (answer가 있는 턴만, 전체) — 현재 답변은 아직 저장 전이므로 결과와 무관
+    past_turns = session.turns.exclude(answer='').order_by('turn_number').values('question', 'answer')
+    conversation_history = [{"q": t['question'], "a": t['answer']} for t in past_turns]
+
+    pipeline = TurnPipeline(session, answer, conversation_history).start()
+    try:
+        # ── Phase 1: 확정된 action은 L1 완료 전에 먼저 전송 ─────
+        closing_sent = False
+        full_question = ''
+        if pipeline.decided is not None:
+            if pipeline.decided.action == 'finish':
+                yield _sse({'type': 'question', 'token': CLOSING_MESSAGE})
+                closing_sent = True
+            else:
+                for token in pipeline.question_tokens(pipeline.decided):
+                    full_question += token
+                    yield _sse({'type': 'question', 'token': token})
+
+        # ── Phase 2: L1 Analyst 결과로 L2 Engine 확정 ────────────
+        outcome = pipeline.outcome()
+        evidence_map = outcome.evidence_map
+        slot_status_after = outcome.slot_status_after
+        action = outcome.action
+        session.slot_states = outcome.state.slot_states
+
         old_turn.answer = answer
         old_turn.evidence_map = evidence_map
         old_turn.slot_status_before = slot_status_before
         old_turn.slot_status_after = slot_status_after
-        old_turn.engine_action = 'finish'
-        old_turn.save()
+        old_turn.engine_action = action
 
-        # 면접 종료 인사말 (한 번에 전송)
-        closing_msg = "오늘 면접은 여기까지입니다. 시간 내주셔서 감사합니다. 수고하셨습니다."
-        yield _sse({'type': 'question', 'token': closing_msg})
-
-        # 최종 피드백 생성 (LLM 호출이므로 자연스러운 딜레이 발생)
-        try:
-            feedback_data = generate_feedback(session)
-            InterviewFeedback.objects.create(
-                session=session,
-                slot_summary=feedback_data.get('slot_summary', {}),
-                overall_summary=feedback_data.get('overall_summary', '면접이 완료됐습니다.'),
-                top_strengths=feedback_data.get('top_strengths', []),
-                top_improvements=feedback_data.get('top_improvements', []),
-                recommendation=feedback_data.get('recommendation', ''),
-            )
-            yield _sse({'type': 'final_feedback', **feedback_data})
-        except Exception as e:
-            print(f'[AnswerView] 피드백 생성 오류: {e}')
-            yield _sse({'type': 'final_feedback', 'overall_summary': '면접이 완료됐습니다.', 'error': True})
-
-        yield 'data: [DONE]\n\n'
-        return
-
-    # ── Phase 3: MOVE_SLOT 처리 ──────────────────────────────
-    if action == 'move_slot':
-        if slot_status_after != 'CLEAR':
-            engine.mark_uncertain(session, current_slot)
-        next_slot = engine.move_to_next_slot(session)
-        if not next_slot:
-            # 이동할 슬롯 없음 → finish로 재처리
+        # ── Phase 3: FINISH 처리 (이동할 슬롯이 없는 move_slot 포함) ──
+        if action == 'finish':
             session.status = 'completed'
             session.finished_at = timezone.now()
             session.save()
-
-            old_turn.answer = answer
-            old_turn.evidence_map = evidence_map
-            old_turn.slot_status_before = slot_status_before
-            old_turn.slot_status_after = slot_status_after
-            old_turn.engine_action = 'finish'
             old_turn.save()
 
             # 면접 종료 인사말 (한 번에 전송)
-            closing_msg = "오늘 면접은 여기까지입니다. 시간 내주셔서 감사합니다. 수고하셨습니다."
-            yield _sse({'type': 'question', 'token': closing_msg})
-
-            try:
-                feedback_data = generate_feedback(session)
-                InterviewFeedback.objects.create(
-                    session=session,
-                    slot_summary=feedback_data.get('slot_summary', {}),
-                    overall_summary=feedback_data.get('overall_summary', '면접이 완료됐습니다.'),
-                    top_strengths=feedback_data.get('top_strengths', []),
-                    top_improvements=feedback_data.get('top_improvements', []),
-                    recommendation=feedback_data.get('recommendation', ''),
-                )
-                yield _sse({'type': 'final_feedback', **feedback_data})
-            except Exception as e:
-                print(f'[AnswerView] 피드백 생성 오류: {e}')
-                yield _sse({'type': 'final_feedback', 'overall_summary': '면접이 완료됐습니다.', 'error': True})
+            if not closing_sent:
+                yield _sse({'type': 'question', 'token': CLOSING_MESSAGE})
+
+            # 최종 피드백 생성 (LLM 호출이므로 자연스러운 딜레이 발생)
+            yield _finish_feedback(session)
             yield 'data: [DONE]\n\n'
             return
 
-        session.current_slot = next_slot
-        session.just_moved_slot = True
-    else:
-        # continue
-        session.just_moved_slot = False
-
-    # ── Phase 4: 다음 질문 생성 (L3 → L5 → L4 stream) ──────
-    new_slot = session.current_slot
-    new_slot_states = session.slot_states
-    missing_required = new_slot_states.get(new_slot, {}).get('missing_required', [])
-
-    intent_data = decide_intent(missing_required, session.question_history)
-    intent = intent_data['intent']
-
-    plan_slot = session.get_current_slot_plan()
-    ctx = build_context(session, plan_slot)
-
-    # 대화 히스토리 조립 (answer가 있는 턴만, 전체)
-    past_turns = session.turns.exclude(answer='').order_by('turn_number').values('question', 'answer')
-    conversation_history = [{"q": t['question'], "a": t['answer']} for t in past_turns]
-
-    # ── Phase 5: L4 Interviewer SSE 스트리밍 ────────────────
-    full_question = ''
-    for token in generate_question(intent, ctx, previous_answer=answer, conversation_history=conversation_history):
-        full_question += token
-        yield _sse({'type': 'question', 'token': token})
+        # ── Phase 4: MOVE_SLOT / CONTINUE ───────────────────────
+        session.current_slot = outcome.state.current_slot
+        session.just_moved_slot = outcome.state.just_moved_slot
+        new_slot = session.current_slot
+        new_slot_states = session.slot_states
+        intent = outcome.intent
+        plan_slot = session.get_current_slot_plan()
+
+        # ── Phase 5: L4 Interviewer SSE 스트리밍 (초안 채택 또는 새로 생성) ──
+        if pipeline.decided is None:
+            for token in pipeline.question_tokens(outcome):
+                full_question += token
+                yield _sse({'type': 'question', 'token': token})
+    finally:
+        pipeline.close()
 
     # ── Phase 6: Meta SSE 전송 ───────────────────────────────
     new_turn_number = session.current_turn + 1
@@ -229,11 +159,6 @@ def _stream_answer(session, answer: str, old_turn: InterviewTurn):
     yield 'data: [DONE]\n\n'
 
     # ── Phase 7: DB 저장 (스트리밍 완료 후) ─────────────────
-    old_turn.answer = answer
-    old_turn.evidence_map = evidence_map
-    old_turn.slot_status_before = slot_status_before
-    old_turn.slot_status_after = slot_status_after
-    old_turn.engine_action = action
     old_turn.intent = intent
     old_turn.save()
 
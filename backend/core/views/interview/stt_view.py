@@ -13,6 +13,7 @@ from rest_framework.throttling import ScopedRateThrottle  # [수정일: 2026-03-
 
 from core.models import UserProfile
 from core.services.stt.stt_service import process_audio
+from core.services.stt.worker_pool import SttPoolBusy
 
 
 def _get_user(request):
@@ -77,6 +78,12 @@ class STTTranscribeView(APIView):
         try:
             result = process_audio(audio_bytes)
             return Response(result, status=status.HTTP_200_OK)
+        # [수정일: 2026-10-18] 로컬 STT 워커 풀 대기열 초과 → 클라이언트는 Web Speech 결과로 폴백
+        except SttPoolBusy as e:
+            return Response(
+                {'error': f'음성 변환 요청이 많습니다. 잠시 후 다시 시도해주세요. ({e})'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
         except Exception as e:
             return Response(
                 {'error': f'음성 변환 중 오류가 발생했습니다: {str(e)}'},
@@ -2,10 +2,15 @@
 TTS API 엔드포인트
 POST /api/core/tts/synthesize/
 텍스트 → 음성(mp3) 변환 (OpenAI TTS)
+
+[수정일: 2026-10-18] 내용 주소 캐시(core/services/interview/tts_cache.py) 경유
+GET /api/core/tts/audio/<key>.<format>/
+캐시된 음성 파일 (ETag / Range 지원 — <audio> 스트리밍 재생, 브라우저 캐시)
 """
 import os
+import re
 
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, Http404
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from rest_framework.views import APIView
@@ -15,16 +20,51 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.throttling import ScopedRateThrottle  # [수정일: 2026-03-06] AI throttle
 from core.views.user_view import CsrfExemptSessionAuthentication  # [수정일: 2026-03-06] CSRF 우회 세션 인증
 
-from openai import OpenAI
+from core.services.interview.tts_cache import (
+    CONTENT_TYPES, KEY_PATTERN, get_tts_cache, synthesize_speech,
+)
 
-_client = None
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
 
 
-def _get_client() -> OpenAI:
-    global _client
-    if _client is None:
-        _client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-    return _client
+def _audio_response(request, path, key, fmt, cache_status=None):
+    """
+    [추가 2026-10-18] 캐시 파일 응답. 키가 내용 해시이므로 ETag로 그대로 사용.
+    If-None-Match 일치 → 304, 단일 Range 요청 → 206 (다중 범위는 전체 응답)
+    """
+    etag = f'"{key}"'
+    if etag in request.headers.get("If-None-Match", ""):
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        return response
+
+    size = os.path.getsize(path)
+    match = _RANGE_PATTERN.match(request.headers.get("Range", "").strip())
+    if match and any(match.groups()):
+        first, last = match.groups()
+        if first:
+            start, end = int(first), min(int(last), size - 1) if last else size - 1
+        else:
+            start, end = max(size - int(last), 0), size - 1  # bytes=-N (마지막 N바이트)
+        if start > end or start >= size:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+        with open(path, "rb") as f:
+            f.seek(start)
+            response = HttpResponse(f.read(end - start + 1), content_type=CONTENT_TYPES[fmt], status=206)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    else:
+        response = FileResponse(open(path, "rb"), content_type=CONTENT_TYPES[fmt])
+        response["Content-Length"] = size
+
+    response["ETag"] = etag
+    response["Accept-Ranges"] = "bytes"
+    response["Cache-Control"] = "private, max-age=31536000, immutable"
+    response["X-TTS-Key"] = key
+    if cache_status:
+        response["X-TTS-Cache"] = cache_status
+    return response
 
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -78,22 +118,11 @@ class TTSSynthesizeView(APIView):
             fmt = "mp3"
 
         try:
-            client = _get_client()
-            response = client.audio.speech.create(
-                model="tts-1",
-                voice=voice,
-                input=text,
-                response_format=fmt,
-            )
-
-            audio_bytes = response.content
-            content_type = "audio/wav" if fmt == "wav" else "audio/mpeg"
-
-            return HttpResponse(
-                audio_bytes,
-                content_type=content_type,
-                status=200,
+            # [수정일: 2026-10-18] 같은 (text, voice, format)은 한 번만 합성 (면접 종료 인사말 등 고정 멘트)
+            key, path, hit = get_tts_cache().get_or_synthesize(
+                text, voice, fmt, lambda: synthesize_speech(text, voice, fmt)
             )
+            return _audio_response(request, path, key, fmt, cache_status="hit" if hit else "miss")
 
         except Exception as e:
             print(f"[TTS] OpenAI TTS 오류: {e}")
@@ -101,3 +130,22 @@ class TTSSynthesizeView(APIView):
                 {"error": f"음성 변환 중 오류가 발생했습니다: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class TTSAudioView(APIView):
+    """
+    [추가 2026-10-18] GET /api/core/tts/audio/<key>.<format>/
+
+    synthesize 응답의 X-TTS-Key 또는 prerender_tts 커맨드로 미리 만든 음성을 키로 조회.
+    합성은 하지 않음 (캐시에 없으면 404)
+    """
+    authentication_classes = [CsrfExemptSessionAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, key, fmt):
+        if not KEY_PATTERN.match(key) or fmt not in CONTENT_TYPES:
+            raise Http404
+        path = get_tts_cache().lookup(key, fmt)
+        if not path:
+            raise Http404
+        return _audio_response(request, path, key, fmt)
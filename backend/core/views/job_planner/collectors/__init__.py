@@ -6,15 +6,19 @@ Job Posting Data Collectors
 Phase 1: BaseCollector, StaticCollector
 Phase 2: BrowserCollector, CollectorRouter with fallback
 Phase 3: SaraminCollector, JobkoreaCollector, WantedCollector (사이트별 최적화)
+[수정일: 2026-10-18] CrawlEngine: 모든 Collector가 공유하는 asyncio HTTP 크롤 엔진
+[수정일: 2026-10-18] PostingStore: 공고 상세/검색 결과 영속 캐시 (TTL + stale-while-revalidate)
 """
 
 from .base import BaseCollector
+from .crawl_engine import CrawlEngine, CrawlError, CrawlResponse, get_crawl_engine
 from .static_collector import StaticCollector
 from .browser_collector import BrowserCollector
 from .saramin_collector import SaraminCollector
 from .jobkorea_collector import JobkoreaCollector
 from .wanted_collector import WantedCollector
 from .router import CollectorRouter
+from .posting_store import PostingStore, canonical_url, get_posting_store
 
 __all__ = [
     'BaseCollector',
@@ -23,5 +27,12 @@ __all__ = [
     'SaraminCollector',
     'JobkoreaCollector',
     'WantedCollector',
-    'CollectorRouter'
+    'CollectorRouter',
+    'CrawlEngine',
+    'CrawlError',
+    'CrawlResponse',
+    'get_crawl_engine',
+    'PostingStore',
+    'canonical_url',
+    'get_posting_store',
 ]
@@ -7,10 +7,10 @@ Jobkorea-optimized Collector
 """
 
 import re
-import requests
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 from .base import BaseCollector
+from .crawl_engine import get_crawl_engine
 
 
 class JobkoreaCollector(BaseCollector):
@@ -87,7 +87,7 @@ class JobkoreaCollector(BaseCollector):
                 except Exception as e:
                     print(f"[WARN] 잡코리아 iframe 추출 실패: {e}")
 
-                # 3. iframe을 못 찾았으면 requests로 직접 가져오기
+                # 3. iframe을 못 찾았으면 크롤 엔진으로 직접 가져오기
                 if len(extracted_parts) < 2:
                     iframe_text = self._fetch_iframe_content(url)
                     if iframe_text:
@@ -113,7 +113,7 @@ class JobkoreaCollector(BaseCollector):
 
     def _fetch_iframe_content(self, url: str) -> str:
         """
-        잡코리아 iframe URL을 직접 requests로 가져옵니다.
+        잡코리아 iframe URL을 공유 크롤 엔진으로 직접 가져옵니다.
         URL에서 공고번호(Gno)를 추출하여 iframe URL을 구성합니다.
         """
         try:
@@ -125,14 +125,7 @@ class JobkoreaCollector(BaseCollector):
             gno = match.group(1)
             iframe_url = f"https://www.jobkorea.co.kr/Recruit/GI_Read_Comt_Ifrm?Gno={gno}"
 
-            headers = {
-                'User-Agent': (
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                    'AppleWebKit/537.36 (KHTML, like Gecko) '
-                    'Chrome/120.0.0.0 Safari/537.36'
-                ),
-            }
-            resp = requests.get(iframe_url, headers=headers, timeout=10)
+            resp = get_crawl_engine().fetch(iframe_url, timeout=10)
             resp.raise_for_status()
 
             soup = BeautifulSoup(resp.text, 'html.parser')
@@ -0,0 +1,258 @@
+"""
+Posting Store
+
+채용공고 상세 / 사람인 검색 결과 영속 캐시입니다.
+생성일: 2026-10-18
+
+[배경]
+JobPlannerRecommendView.post는 몇 분 전 다른 사용자가 같은 직무로 추천을 받았어도
+검색 페이지와 상세 공고 페이지를 매번 다시 크롤링했다.
+
+[저장]  SQLite (POSTING_CACHE_PATH) — 같은 호스트의 워커 프로세스가 공유, 재시작 후에도 유지
+  postings : 정규화 URL → 상세에서 추출한 스킬 + detail_text   (사용자/검색어와 무관하게 1건)
+  searches : 정규화 검색어 → 검색 결과 공고 목록
+
+[신선도]
+  나이 < TTL            : fresh — 그대로 사용
+  TTL ≤ 나이 < TTL+STALE : stale — 캐시 결과를 바로 쓰고 schedule_refresh()로 백그라운드 재수집
+  그 이후               : 없는 것으로 취급 (동기 수집)
+  같은 키의 재수집은 진행 중인 작업이 있으면 다시 예약하지 않는다.
+
+[장애 처리]
+  여러 워커가 같은 파일에 쓰므로 "database is locked" 등 sqlite3.Error가 날 수 있다.
+  조회 실패는 미스, 저장 실패는 건너뜀으로 처리하고 경고만 남긴다 (추천 요청은 계속 진행).
+  조회 시 last_access 갱신(쓰기 잠금)은 마지막 갱신 후 TOUCH_INTERVAL초가 지난 행만 한다.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from ..config import (
+    POSTING_CACHE_MAX_ENTRIES,
+    POSTING_CACHE_PATH,
+    POSTING_CACHE_STALE,
+    POSTING_CACHE_TTL,
+    SEARCH_CACHE_STALE,
+    SEARCH_CACHE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+TRACKING_PARAM = re.compile(r'^(utm_|fbclid$|gclid$)')
+TOUCH_INTERVAL = 5 * 60  # 조회 시 last_access 갱신 최소 간격 (초, 축출 순서에만 쓰이므로 대략이면 충분)
+
+
+def canonical_url(url: str) -> str:
+    """
+    같은 공고를 가리키는 URL을 하나로 정규화.
+    - 사람인 relay/view, view: rec_idx만 남김
+    - 잡코리아 GI_Read/<번호>: 쿼리 제거
+    - 원티드 /wd/<번호>: 쿼리 제거
+    - 그 외: 소문자 호스트, fragment/추적 파라미터 제거, 쿼리 정렬
+    """
+    if not url:
+        return ''
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith('m.'):
+        host = 'www.' + host[2:]
+    query = parse_qsl(parsed.query, keep_blank_values=True)
+
+    if 'saramin.co.kr' in host and '/jobs/' in parsed.path:
+        rec_idx = dict(query).get('rec_idx')
+        if rec_idx:
+            return f'https://www.saramin.co.kr/zf_user/jobs/view?rec_idx={rec_idx}'
+    match = re.search(r'/GI_Read/(\d+)', parsed.path)
+    if 'jobkorea.co.kr' in host and match:
+        return f'https://www.jobkorea.co.kr/Recruit/GI_Read/{match.group(1)}'
+    match = re.search(r'/wd/(\d+)', parsed.path)
+    if 'wanted.co.kr' in host and match:
+        return f'https://www.wanted.co.kr/wd/{match.group(1)}'
+
+    query = sorted((k, v) for k, v in query if not TRACKING_PARAM.match(k))
+    return urlunparse(('https', host, parsed.path.rstrip('/') or '/', '', urlencode(query), ''))
+
+
+def normalize_keyword(keyword: str) -> str:
+    return ' '.join((keyword or '').lower().split())
+
+
+@dataclass
+class CacheEntry:
+    value: object
+    fetched_at: float
+    fresh: bool
+
+
+class PostingStore:
+    def __init__(self, path: str = POSTING_CACHE_PATH, max_entries: int = POSTING_CACHE_MAX_ENTRIES,
+                 posting_ttl: int = POSTING_CACHE_TTL, posting_stale: int = POSTING_CACHE_STALE,
+                 search_ttl: int = SEARCH_CACHE_TTL, search_stale: int = SEARCH_CACHE_STALE,
+                 clock: Callable[[], float] = time.time, busy_timeout: float = 1.0):
+        self.max_entries = max_entries
+        self.ttl = {'postings': posting_ttl, 'searches': search_ttl}
+        self.stale = {'postings': posting_stale, 'searches': search_stale}
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._inflight = set()
+        self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix='posting-refresh')
+        # 다른 워커의 쓰기 잠금은 busy_timeout초까지만 기다림 (캐시 때문에 요청이 오래 멈추지 않도록)
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")  # 여러 워커 프로세스 동시 읽기
+        for table in ('postings', 'searches'):
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_access ON {table}(last_access)")
+        self._conn.commit()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    # ── 공고 상세 ──────────────────────────────────────────────────
+
+    def get_postings(self, urls: Iterable[str]) -> Dict[str, CacheEntry]:
+        """
+        Returns:
+            {입력 URL: CacheEntry(value={'skills', 'detail_text'})} — 만료된 항목은 제외
+        """
+        urls = [u for u in urls if u]
+        found = self._get_many('postings', {u: canonical_url(u) for u in urls})
+        return {u: found[canonical_url(u)] for u in urls if canonical_url(u) in found}
+
+    def put_postings(self, details: Dict[str, dict]):
+        """{URL: {'skills': [...], 'detail_text': str}} 저장 (정규화 URL 기준)"""
+        self._put_many('postings', {canonical_url(u): d for u, d in details.items() if u})
+
+    # ── 검색 결과 ──────────────────────────────────────────────────
+
+    def get_search(self, keyword: str) -> Optional[CacheEntry]:
+        key = normalize_keyword(keyword)
+        return self._get_many('searches', {key: key}).get(key)
+
+    def put_search(self, keyword: str, jobs: List[dict]):
+        self._put_many('searches', {normalize_keyword(keyword): jobs})
+
+    # ── 백그라운드 재수집 ──────────────────────────────────────────
+
+    def schedule_refresh(self, keys: List[str], refresh: Callable[[List[str]], None]):
+        """
+        stale 항목 재수집 예약. 이미 재수집 중인 키는 빼고 refresh(남은 키)를 한 번 실행한다.
+        """
+        with self._lock:
+            claimed = [k for k in dict.fromkeys(keys) if k not in self._inflight]
+            self._inflight.update(claimed)
+        if not claimed:
+            return None
+
+        def run():
+            try:
+                refresh(claimed)
+            except Exception as e:
+                logger.warning(f'[PostingStore] 백그라운드 재수집 실패: {e}')
+            finally:
+                with self._lock:
+                    self._inflight.difference_update(claimed)
+
+        return self._refresher.submit(run)
+
+    # ── SQLite ─────────────────────────────────────────────────────
+
+    def _get_many(self, table: str, keys: Dict[str, str]) -> Dict[str, CacheEntry]:
+        wanted = list(dict.fromkeys(keys.values()))
+        if not wanted:
+            return {}
+        now = self.clock()
+        rows = []
+        try:
+            with self._lock:
+                for i in range(0, len(wanted), 500):
+                    chunk = wanted[i:i + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows.extend(self._conn.execute(
+                        f"SELECT key, value, fetched_at, last_access FROM {table} WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall())
+                live = [row for row in rows if now - row[2] < self.ttl[table] + self.stale[table]]
+                touch = [(now, k) for k, _, _, accessed in live if now - accessed >= TOUCH_INTERVAL]
+                if touch:
+                    self._touch(table, touch)
+        except sqlite3.Error as e:
+            logger.warning(f'[PostingStore] 캐시 조회 실패: {e}')
+            self.misses += len(wanted)
+            return {}
+
+        found = {}
+        for key, value, fetched_at, _ in live:
+            fresh = now - fetched_at < self.ttl[table]
+            found[key] = CacheEntry(json.loads(value), fetched_at, fresh)
+        fresh_count = sum(1 for e in found.values() if e.fresh)
+        self.hits += fresh_count
+        self.stale_hits += len(found) - fresh_count
+        self.misses += len(wanted) - len(found)
+        return found
+
+    def _touch(self, table: str, touch: List[tuple]):
+        """last_access 갱신 (락 보유 상태에서 호출). 다른 워커가 쓰기 중이면 이번 갱신만 포기"""
+        try:
+            self._conn.executemany(f"UPDATE {table} SET last_access = ? WHERE key = ?", touch)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            self._conn.rollback()
+            logger.warning(f'[PostingStore] last_access 갱신 생략: {e}')
+
+    def _put_many(self, table: str, values: Dict[str, object]):
+        if not values:
+            return
+        now = self.clock()
+        records = [(k, json.dumps(v, ensure_ascii=False), now, now) for k, v in values.items()]
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} (key, value, fetched_at, last_access) VALUES (?, ?, ?, ?)",
+                    records,
+                )
+                self._evict(table)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.warning(f'[PostingStore] 캐시 저장 실패: {e}')
+
+    def _evict(self, table: str):
+        """항목 수가 max_entries를 넘으면 last_access가 오래된 순으로 제거 (락 보유 상태에서 호출)"""
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                f"DELETE FROM {table} WHERE key IN ("
+                f" SELECT key FROM {table} ORDER BY last_access ASC LIMIT ?)",
+                (excess,),
+            )
+
+    def metrics(self) -> dict:
+        return {'hits': self.hits, 'stale_hits': self.stale_hits, 'misses': self.misses,
+                'refreshing': len(self._inflight)}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_posting_store() -> PostingStore:
+    """프로세스 전역 공고 캐시"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PostingStore()
+    return _store
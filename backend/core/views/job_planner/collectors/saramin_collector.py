@@ -2,14 +2,14 @@
 Saramin-optimized Collector
 
 사람인 채용공고 전용 최적화 Collector입니다.
-사람인은 SSR 기반으로 requests + BeautifulSoup으로 충분히 추출 가능합니다.
+사람인은 SSR 기반으로 HTTP 요청 + BeautifulSoup으로 충분히 추출 가능합니다.
 (Playwright는 사람인에서 차단됨)
 """
 
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs
 from .base import BaseCollector
+from .crawl_engine import CrawlError, get_crawl_engine
 
 
 class SaraminCollector(BaseCollector):
@@ -17,26 +17,17 @@ class SaraminCollector(BaseCollector):
     사람인 전용 최적화 Collector
 
     사람인은 SSR(Server-Side Rendering) 사이트로,
-    Playwright 없이 requests + BeautifulSoup으로 본문 추출이 가능합니다.
+    Playwright 없이 HTTP 요청 + BeautifulSoup으로 본문 추출이 가능합니다.
     (Playwright/headless 브라우저는 사람인에서 차단됨)
     """
 
     def __init__(self, timeout: int = 15):
         self.timeout = timeout
-        self.headers = {
-            'User-Agent': (
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                'AppleWebKit/537.36 (KHTML, like Gecko) '
-                'Chrome/120.0.0.0 Safari/537.36'
-            ),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        }
 
     def collect(self, url: str) -> str:
         """
         사람인 채용공고 페이지에서 본문을 추출합니다.
-        requests + BeautifulSoup 사용 (SSR 사이트).
+        공유 크롤 엔진 + BeautifulSoup 사용 (SSR 사이트).
         """
         try:
             # relay URL → 직접 view URL 변환
@@ -46,7 +37,7 @@ class SaraminCollector(BaseCollector):
 
             # HTTP 요청
             print(f"[SARAMIN] SaraminCollector: 페이지 요청 중... ({actual_url})")
-            resp = requests.get(actual_url, headers=self.headers, timeout=self.timeout)
+            resp = get_crawl_engine().fetch(actual_url, timeout=self.timeout)
             resp.raise_for_status()
 
             soup = BeautifulSoup(resp.text, 'html.parser')
@@ -115,7 +106,7 @@ class SaraminCollector(BaseCollector):
             print(f"[WARN] SaraminCollector: 전체 body fallback ({len(extracted_text)}자)")
             return extracted_text
 
-        except requests.RequestException as e:
+        except CrawlError as e:
             print(f"[FAIL] SaraminCollector 요청 실패: {e}")
             return ""
         except Exception as e:
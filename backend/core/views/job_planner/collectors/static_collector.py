@@ -1,20 +1,20 @@
 """
 Static HTML Collector
 
-requests + BeautifulSoup를 사용하는 기본 수집기입니다.
+공유 크롤 엔진(crawl_engine) + BeautifulSoup을 사용하는 기본 수집기입니다.
 정적 HTML 페이지에서 텍스트를 추출합니다.
 """
 
-import requests
 from bs4 import BeautifulSoup
 from .base import BaseCollector
+from .crawl_engine import CrawlError, get_crawl_engine
 
 
 class StaticCollector(BaseCollector):
     """
     정적 HTML 수집기
 
-    requests 라이브러리로 HTML을 가져오고,
+    공유 크롤 엔진으로 HTML을 가져오고 (연결 재사용, 조건부 GET),
     BeautifulSoup으로 텍스트를 추출합니다.
 
     장점:
@@ -33,9 +33,6 @@ class StaticCollector(BaseCollector):
             timeout (int): 요청 타임아웃 (초). 기본값 10초.
         """
         self.timeout = timeout
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
 
     def collect(self, url: str) -> str:
         """
@@ -48,11 +45,11 @@ class StaticCollector(BaseCollector):
             str: 추출된 텍스트 (실패 시 빈 문자열)
 
         Raises:
-            requests.RequestException: HTTP 요청 실패 시
+            CrawlError: HTTP 요청 실패 시
         """
         try:
-            # 1. HTTP 요청
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            # 1. HTTP 요청 (공유 크롤 엔진)
+            response = get_crawl_engine().fetch(url, timeout=self.timeout)
             response.raise_for_status()
 
             # 2. HTML 파싱
@@ -90,7 +87,7 @@ class StaticCollector(BaseCollector):
             print(f"[OK] StaticCollector: {len(text)} 문자 추출 (full body)")
             return text
 
-        except requests.RequestException as e:
+        except CrawlError as e:
             print(f"[FAIL] StaticCollector 실패: {e}")
             return ""
 
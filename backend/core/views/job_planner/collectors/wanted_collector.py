@@ -3,10 +3,25 @@ Wanted-optimized Collector
 
 원티드 채용공고 전용 최적화 Collector입니다.
 Playwright를 사용하되, 원티드의 HTML 구조에 맞춰 정확한 본문만 추출합니다.
+
+[수정일: 2026-10-18] 먼저 크롤 엔진으로 SSR HTML의 __NEXT_DATA__(공고 상세 JSON)를 읽고,
+본문이 충분하면 브라우저를 띄우지 않는다. 부족하면 기존 Playwright 경로로 진행.
 """
 
+import json
+from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 from .base import BaseCollector
+from .crawl_engine import CrawlError, get_crawl_engine
+
+# __NEXT_DATA__ 공고 상세 필드 → 섹션 제목
+NEXT_DATA_SECTIONS = [
+    ('intro', ''),
+    ('main_tasks', '주요업무'),
+    ('requirements', '자격요건'),
+    ('preferred_points', '우대사항'),
+    ('benefits', '혜택 및 복지'),
+]
 
 
 class WantedCollector(BaseCollector):
@@ -57,6 +72,11 @@ class WantedCollector(BaseCollector):
         Returns:
             str: 추출된 텍스트 (실패 시 빈 문자열)
         """
+        static_text = self._collect_static(url)
+        if len(static_text) >= 300:
+            print(f"[OK] WantedCollector: __NEXT_DATA__에서 {len(static_text)} 문자 추출 (브라우저 생략)")
+            return static_text
+
         try:
             with sync_playwright() as p:
                 # 1. 브라우저 실행 (봇 감지 우회 설정)
@@ -165,6 +185,50 @@ class WantedCollector(BaseCollector):
             print(f"[FAIL] WantedCollector 실패: {e}")
             return ""
 
+    def _collect_static(self, url: str) -> str:
+        """SSR HTML에 포함된 __NEXT_DATA__에서 공고 본문 추출 (실패 시 빈 문자열)"""
+        try:
+            resp = get_crawl_engine().fetch(url, timeout=10)
+            resp.raise_for_status()
+        except CrawlError as e:
+            print(f"[WARN] 원티드 정적 요청 실패: {e}")
+            return ""
+        script = BeautifulSoup(resp.text, 'html.parser').select_one('script#__NEXT_DATA__')
+        if not script or not script.string:
+            return ""
+        try:
+            detail = self._find_job_detail(json.loads(script.string))
+        except ValueError:
+            return ""
+        if not detail:
+            return ""
+        parts = []
+        position = detail.get('position')
+        if isinstance(position, str) and position:
+            parts.append(position)
+        for key, title in NEXT_DATA_SECTIONS:
+            value = detail.get(key)
+            if isinstance(value, str) and value.strip():
+                parts.append(f"{title}\n{value.strip()}" if title else value.strip())
+        return '\n\n'.join(parts)
+
+    @classmethod
+    def _find_job_detail(cls, node):
+        """JSON 트리에서 공고 상세(main_tasks/requirements 필드를 가진 dict)를 찾는다"""
+        if isinstance(node, dict):
+            if 'main_tasks' in node or 'requirements' in node:
+                return node
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            return None
+        for child in children:
+            found = cls._find_job_detail(child)
+            if found:
+                return found
+        return None
+
     def can_handle(self, url: str) -> bool:
         """
         원티드 URL만 처리 가능합니다.
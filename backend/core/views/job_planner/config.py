@@ -3,6 +3,8 @@
 전역 설정
 원본 v3.1 섹션 4.1 기반
 """
+import os
+import tempfile
 
 # 임계값 (섹션 4.1)
 SKILL_MATCH_THRESHOLD = 0.65  # MVP 기본값. 배포 전 실측으로 조정.
@@ -11,3 +13,15 @@ SKILL_MATCH_THRESHOLD = 0.65  # MVP 기본값. 배포 전 실측으로 조정.
 WEIGHT_REQUIRED_SKILLS = 0.6
 WEIGHT_PREFERRED_SKILLS = 0.2
 WEIGHT_EXPERIENCE = 0.2
+
+# 채용공고 상세/검색 결과 캐시 (collectors/posting_store.py)
+# TTL 안: 그대로 사용 / TTL ~ TTL+STALE: 캐시 결과를 바로 쓰고 백그라운드에서 재수집 / 그 이후: 만료
+POSTING_CACHE_PATH = os.environ.get(
+    "POSTING_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), "job_planner_postings.sqlite3"),
+)
+POSTING_CACHE_TTL = int(os.environ.get("POSTING_CACHE_TTL", str(6 * 60 * 60)))
+POSTING_CACHE_STALE = int(os.environ.get("POSTING_CACHE_STALE", str(24 * 60 * 60)))
+SEARCH_CACHE_TTL = int(os.environ.get("SEARCH_CACHE_TTL", str(30 * 60)))
+SEARCH_CACHE_STALE = int(os.environ.get("SEARCH_CACHE_STALE", str(6 * 60 * 60)))
+POSTING_CACHE_MAX_ENTRIES = int(os.environ.get("POSTING_CACHE_MAX_ENTRIES", "20000"))
@@ -8,6 +8,11 @@ import json
 import base64
 import traceback
 from django.conf import settings
+from core.services.llm_client import get_openai_client
+from core.services.pdf_ingest import combine_partial_profiles, open_pdf, vision_extract
+from core.views.job_planner.skill_dictionary import (
+    DETAIL_SKILL_MATCHER, REQUIREMENT_SKILL_MATCHER, SKILL_SYNONYMS, normalize_skill,
+)
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -26,40 +31,6 @@ try:
 except ImportError:
     CRAWLER_AVAILABLE = False
 
-def _embed_texts(texts: list):
-    """
-    텍스트 리스트를 OpenAI 임베딩 벡터로 변환 후 L2 정규화하여 반환.
-
-    Args:
-        texts (list): 임베딩할 문자열 리스트
-
-    Returns:
-        np.ndarray: shape (n, dim) — L2 정규화된 float32 벡터 행렬.
-                    코사인 유사도를 내적(dot product)으로 계산할 수 있게 단위 벡터로 변환됨.
-    """
-    import numpy as np
-    import openai as _openai
-
-    # 환경변수에서 OpenAI API 키를 읽어 클라이언트 생성
-    client = _openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-
-    # text-embedding-3-small 모델로 배치 임베딩 요청
-    # 여러 텍스트를 한 번의 API 호출로 처리 (비용·속도 효율)
-    response = client.embeddings.create(model="text-embedding-3-small", input=texts)
-
-    # API 응답은 순서가 보장되지 않을 수 있으므로 index 기준으로 정렬 후 벡터 추출
-    vectors = [item.embedding for item in sorted(response.data, key=lambda x: x.index)]
-
-    # Python list -> float32 numpy 배열로 변환 (shape: n x dim)
-    arr = np.array(vectors, dtype=np.float32)
-
-    # 각 벡터의 L2 norm(크기) 계산, keepdims=True로 브로드캐스팅 가능하게 유지 (shape: n x 1)
-    norms = np.linalg.norm(arr, axis=1, keepdims=True)
-
-    # 각 벡터를 norm으로 나눠 단위 벡터로 정규화
-    # np.maximum(norms, 1e-8): norm이 0인 제로 벡터일 때 division by zero 방지
-    return arr / np.maximum(norms, 1e-8)
-
 
 @method_decorator(csrf_exempt, name='dispatch')
 class JobPlannerParseView(APIView):
@@ -168,7 +139,7 @@ class JobPlannerParseView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
         try:
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('job_planner.parse_image')
 
             # Vision API 호출
             response = client.chat.completions.create(
@@ -397,7 +368,7 @@ class JobPlannerParseView(APIView):
             }
 
         try:
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('job_planner.parse_job')
 
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
@@ -495,118 +466,8 @@ class JobPlannerAnalyzeView(APIView):
     throttle_classes = [ScopedRateThrottle]
     throttle_scope = 'ai'
 
-    # 한영 스킬 동의어 사전
-    # 다양한 표기를 통일된 형태로 정규화하기 위한 매핑 테이블
-    # 예: "파이썬", "Python", "python" -> 모두 "python"으로 통일
-    # 참고: 'python': 'python' 같은 중복은 불필요 (_normalize_skill에서 자동 처리)
-    SKILL_SYNONYMS = {
-        # 프로그래밍 언어
-        '파이썬': 'python',
-        '자바': 'java',
-        '자바스크립트': 'javascript', 'js': 'javascript',
-        '타입스크립트': 'typescript', 'ts': 'typescript',
-        'c++': 'cpp', '씨쁠쁠': 'cpp',
-        'c#': 'csharp', '씨샵': 'csharp', '씨샤프': 'csharp',
-        '고': 'go', 'golang': 'go',
-        '코틀린': 'kotlin',
-        '스위프트': 'swift',
-        '루비': 'ruby',
-        '러스트': 'rust',
-        '스칼라': 'scala',
-        'php': 'php', '피에이치피': 'php',
-        '다트': 'dart',
-        '펄': 'perl',
-
-        # 웹 프레임워크
-        '장고': 'django',
-        '플라스크': 'flask',
-        '패스트에이피아이': 'fastapi', 'fast api': 'fastapi',
-        '스프링': 'spring',
-        '스프링부트': 'springboot', 'spring boot': 'springboot', '스프링 부트': 'springboot',
-        '리액트': 'react', 'reactjs': 'react', 'react.js': 'react',
-        '뷰': 'vue', 'vuejs': 'vue', 'vue.js': 'vue',
-        '앵귤러': 'angular', 'angularjs': 'angular',
-        '노드': 'node', 'nodejs': 'node', 'node.js': 'node',
-        '익스프레스': 'express', 'expressjs': 'express', 'express.js': 'express',
-        '넥스트': 'next', 'nextjs': 'next', 'next.js': 'next',
-        '넥스트제이에스': 'next', '넥스트js': 'next',
-        '네스트': 'nestjs', 'nestjs': 'nestjs', 'nest.js': 'nestjs', '네스트제이에스': 'nestjs',
-        '넉스트': 'nuxtjs', 'nuxtjs': 'nuxtjs', 'nuxt.js': 'nuxtjs',
-        '스벨트': 'svelte',
-        '플러터': 'flutter',
-        '라라벨': 'laravel',
-        '레일즈': 'rails', 'ruby on rails': 'rails',
-        '하이버네이트': 'hibernate',
-        '마이바티스': 'mybatis',
-
-        # 데이터 분석/과학 라이브러리
-        '판다스': 'pandas',
-        '넘파이': 'numpy',
-        '맷플롯립': 'matplotlib',
-        '사이킷런': 'sklearn', 'scikit-learn': 'sklearn',
-        '엑스지부스트': 'xgboost',
-        '라이트지비엠': 'lightgbm',
-        '오픈cv': 'opencv', 'open cv': 'opencv',
-        '엔엘티케이': 'nltk',
-        '스페이시': 'spacy',
-
-        # 데이터베이스
-        '마이에스큐엘': 'mysql',
-        '포스트그레': 'postgresql', 'postgres': 'postgresql', 'postgre sql': 'postgresql',
-        '몽고디비': 'mongodb', 'mongo': 'mongodb',
-        '레디스': 'redis',
-        '오라클': 'oracle',
-        '마리아디비': 'mariadb',
-        '에스큐엘서버': 'mssql', 'sql server': 'mssql', 'sqlserver': 'mssql',
-        '에스큐엘라이트': 'sqlite',
-        '엘라스틱서치': 'elasticsearch', '엘라스틱': 'elasticsearch',
-        '크로마': 'chromadb', 'chroma': 'chromadb', 'chroma db': 'chromadb',
-        '파인콘': 'pinecone',
-        '카산드라': 'cassandra',
-        '다이나모디비': 'dynamodb', 'dynamo db': 'dynamodb',
-        '파이어베이스': 'firebase',
-        '수파베이스': 'supabase',
-
-        # 클라우드/인프라
-        '아마존웹서비스': 'aws', 'amazon web services': 'aws',
-        '애저': 'azure', 'microsoft azure': 'azure',
-        '구글클라우드': 'gcp', 'google cloud': 'gcp', 'google cloud platform': 'gcp',
-        '도커': 'docker',
-        '쿠버네티스': 'kubernetes', 'k8s': 'kubernetes',
-        '테라폼': 'terraform',
-        '앤서블': 'ansible',
-        '젠킨스': 'jenkins',
-        '깃허브액션스': 'githubactions', 'github actions': 'githubactions',
-        '엔진엑스': 'nginx',
-        '아파치': 'apache',
-        '리눅스': 'linux',
-        '우분투': 'ubuntu',
-        '카프카': 'kafka', 'apache kafka': 'kafka',
-        '래빗엠큐': 'rabbitmq', 'rabbit mq': 'rabbitmq',
-
-        # AI/ML
-        '텐서플로': 'tensorflow', '텐서플로우': 'tensorflow',
-        '파이토치': 'pytorch',
-        '케라스': 'keras',
-        '랭체인': 'langchain',
-        '허깅페이스': 'huggingface', 'hugging face': 'huggingface',
-        '트랜스포머': 'transformers',
-
-        # 도구
-        '깃': 'git',
-        '깃허브': 'github',
-        '깃랩': 'gitlab',
-        '지라': 'jira',
-        '컨플루언스': 'confluence',
-        '노션': 'notion',
-        '슬랙': 'slack',
-        '포스트맨': 'postman',
-        '피그마': 'figma',
-        '태블로': 'tableau',
-        '파워비아이': 'powerbi', 'power bi': 'powerbi',
-        '그라파나': 'grafana',
-        '키바나': 'kibana',
-    }
+    # 한영 스킬 동의어 사전 ([수정일: 2026-10-18] skill_dictionary.py로 이동, 추천 뷰와 공유)
+    SKILL_SYNONYMS = SKILL_SYNONYMS
 
     def _normalize_skill(self, skill):
         """
@@ -621,80 +482,38 @@ class JobPlannerAnalyzeView(APIView):
         Returns:
             str: 정규화된 스킬명 (소문자)
         """
-        skill_lower = skill.lower().strip()
-        return self.SKILL_SYNONYMS.get(skill_lower, skill_lower)
+        return normalize_skill(skill)
 
     def _extract_skills_from_text(self, required_text, preferred_text, responsibilities_text):
         """
         필수/우대 요건 및 업무 텍스트에서 기술 스택과 역량을 추출
         - 정규식 패턴 매칭으로 빠르게 추출
         - LLM 없이도 작동하도록 구현
+        - [수정일: 2026-10-18] 키워드별 re.search 대신 사전 컴파일된 단일 패스 추출기 사용
         """
-        import re
-
         # 전체 텍스트 결합
         full_text = f"{required_text} {preferred_text} {responsibilities_text}"
 
-        # 알려진 기술 스택 키워드 (대소문자 구분 없이)
-        tech_keywords = [
-            # 언어
-            'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Kotlin',
-            'Swift', 'Ruby', 'PHP', 'Rust', 'Scala', 'R',
-            '파이썬', '자바', '자바스크립트', '타입스크립트', '코틀린',
-
-            # 프레임워크
-            'Django', 'Flask', 'FastAPI', 'Spring', 'SpringBoot', 'React', 'Vue',
-            'Angular', 'Next.js', 'Nuxt', 'Express', 'Node.js', 'Nest.js',
-            '장고', '플라스크', '스프링', '리액트', '뷰', '앵귤러', '노드',
-
-            # 데이터베이스
-            'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'MariaDB',
-            'SQLite', 'Elasticsearch', 'DynamoDB', 'Cassandra',
-            '마이에스큐엘', '몽고디비', '레디스', '오라클',
-
-            # 클라우드/인프라
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'GitLab CI',
-            'Terraform', 'Ansible', 'Linux', 'Nginx', 'Apache',
-            '도커', '쿠버네티스', '리눅스',
-
-            # AI/ML/Data
-            'TensorFlow', 'PyTorch', 'Keras', 'scikit-learn', 'Pandas', 'NumPy',
-            'Spark', 'Hadoop', 'Airflow', 'Kafka',
-            '텐서플로', '파이토치',
-
-            # 도구
-            'Git', 'GitHub', 'GitLab', 'Jira', 'Confluence', 'Slack', 'Notion',
-            'Figma', 'Postman', 'Swagger',
-            '깃', '깃허브', '지라',
-
-            # 방법론/개념
-            'Agile', 'Scrum', 'Kanban', 'CI/CD', 'DevOps', 'TDD', 'DDD',
-            'Microservices', 'REST', 'GraphQL', 'gRPC', 'WebSocket',
-            '애자일', '스크럼', '칸반', '마이크로서비스'
-        ]
-
+        # 알려진 기술 스택 키워드 (대소문자 구분 없이, 단어 경계 고려) — 정규화 기준 중복 제거
         found_skills = []
-
-        # 각 키워드가 텍스트에 있는지 확인 (단어 경계 고려)
-        for keyword in tech_keywords:
-            # 대소문자 구분 없이, 단어 경계를 고려한 검색
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, full_text, re.IGNORECASE):
-                # 이미 추가되지 않았으면 추가
-                normalized = self._normalize_skill(keyword)
-                if normalized not in [self._normalize_skill(s) for s in found_skills]:
-                    found_skills.append(keyword)
+        seen = set()
+        for keyword in REQUIREMENT_SKILL_MATCHER.find(full_text):
+            normalized = self._normalize_skill(keyword)
+            if normalized not in seen:
+                seen.add(normalized)
+                found_skills.append(keyword)
 
         # 필수와 우대 구분 (간단한 휴리스틱)
+        in_required = REQUIREMENT_SKILL_MATCHER.matched_literals(required_text)
+        in_preferred = REQUIREMENT_SKILL_MATCHER.matched_literals(preferred_text)
         required_found = []
         preferred_found = []
 
         for skill in found_skills:
             # 필수 요건 텍스트에 있으면 필수로 분류
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, required_text, re.IGNORECASE):
+            if skill.lower() in in_required:
                 required_found.append(skill)
-            elif re.search(pattern, preferred_text, re.IGNORECASE):
+            elif skill.lower() in in_preferred:
                 preferred_found.append(skill)
             else:
                 # 업무 내용에만 있으면 필수로 간주
@@ -906,7 +725,7 @@ class JobPlannerAnalyzeView(APIView):
             return self._match_skills_fallback(required_skills, user_skills)
 
         try:
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('job_planner.skill_match')
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{
@@ -1267,7 +1086,7 @@ class JobPlannerAgentReportView(APIView):
             }
 
         try:
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('job_planner.report')
 
             # 준비 기간에 따른 전략 기간 레이블 생성
             print(f"[DEBUG] available_prep_days = {available_prep_days}, type = {type(available_prep_days)}")
@@ -1516,8 +1335,7 @@ class JobPlannerRecommendView(APIView):
         Returns:
             str: 정규화된 스킬명 (소문자)
         """
-        skill_lower = skill.lower().strip()
-        return self.SKILL_SYNONYMS.get(skill_lower, skill_lower)
+        return normalize_skill(skill)
 
     def post(self, request):
         try:
@@ -1580,9 +1398,10 @@ class JobPlannerRecommendView(APIView):
                     search_keywords.append(f"{skill} 개발자")
                     break
 
+            print(f"🔍 사람인 크롤링: {search_keywords} 검색")
+            saramin_results = self._crawl_saramin_keywords(search_keywords, limit=60)
             for kw in search_keywords:
-                print(f"🔍 사람인 크롤링: '{kw}' 검색")
-                saramin_jobs = self._crawl_saramin(kw, limit=60)
+                saramin_jobs = saramin_results[kw]
                 for job in saramin_jobs:
                     if job['url'] not in seen_urls:
                         seen_urls.add(job['url'])
@@ -1886,96 +1705,135 @@ class JobPlannerRecommendView(APIView):
 
         return simplified.strip() if simplified.strip() else '개발자'
 
+    SARAMIN_SEARCH_PAGES = 3
+
     def _crawl_saramin(self, job_position, limit=60):
         """
         사람인 검색 결과 다중 페이지 크롤링 (병렬).
         페이지당 약 20개 × 3페이지 = 최대 60개 수집 후 상세 크롤링.
         """
+        return self._crawl_saramin_keywords([job_position], limit=limit)[job_position]
+
+    def _crawl_saramin_keywords(self, keywords, limit=60):
+        """
+        [수정일: 2026-10-18] 여러 검색어의 검색 페이지를 공유 크롤 엔진으로 한 번에 요청.
+        (검색어 × 3페이지를 호스트별 동시성 상한 안에서 동시에 가져옴, 연결 재사용)
+        [수정일: 2026-10-18] 검색어별 결과는 공고 캐시(posting_store)에서 먼저 찾고,
+        stale이면 캐시 결과를 바로 쓰면서 백그라운드에서 다시 수집.
+
+        Returns:
+            dict: {검색어: URL 중복 제거된 공고 목록 (최대 limit개)}
+        """
+        from .collectors.posting_store import get_posting_store
+
+        store = get_posting_store()
+        results, pending, stale = {}, [], []
+        for kw in dict.fromkeys(keywords):
+            entry = store.get_search(kw)
+            if entry is None:
+                pending.append(kw)
+                continue
+            results[kw] = entry.value
+            if not entry.fresh:
+                stale.append(kw)
+            print(f'  사람인 검색 캐시 {"적중" if entry.fresh else "적중(stale)"}: \'{kw}\' {len(entry.value)}개')
+        if pending:
+            results.update(self._fetch_saramin_searches(pending, store))
+        if stale:
+            store.schedule_refresh(stale, lambda kws: self._fetch_saramin_searches(kws, store))
+        return {kw: results.get(kw, [])[:limit] for kw in keywords}
+
+    def _fetch_saramin_searches(self, keywords, store):
+        """검색어별 사람인 검색 페이지 수집 → 캐시 저장 (모든 페이지가 실패한 검색어는 저장하지 않음)"""
         import urllib.parse
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from .collectors.crawl_engine import get_crawl_engine
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        encoded = urllib.parse.quote(job_position)
-        base_url = f"https://www.saramin.co.kr/zf_user/search?searchType=search&searchword={encoded}"
+        urls = []
+        for kw in keywords:
+            base_url = f"https://www.saramin.co.kr/zf_user/search?searchType=search&searchword={urllib.parse.quote(kw)}"
+            urls += [base_url if page == 1 else f"{base_url}&recruitPage={page}"
+                     for page in range(1, self.SARAMIN_SEARCH_PAGES + 1)]
+        try:
+            responses = get_crawl_engine().fetch_many(urls, timeout=15)
+        except Exception as e:
+            print(f'⚠️ 사람인 검색 크롤링 실패: {e}')
+            return {kw: [] for kw in keywords}
 
-        def fetch_page(page):
-            url = base_url if page == 1 else f"{base_url}&recruitPage={page}"
+        results = {}
+        for i, kw in enumerate(keywords):
+            seen_urls = set()
+            unique_jobs = []
+            pages = responses[i * self.SARAMIN_SEARCH_PAGES:(i + 1) * self.SARAMIN_SEARCH_PAGES]
+            for page, resp in enumerate(pages, start=1):
+                if not resp.ok:
+                    print(f'⚠️ 사람인 {page}페이지 크롤링 실패: {resp.error}')
+                    continue
+                for job in self._parse_saramin_search(resp.text, page):
+                    if job['url'] and job['url'] not in seen_urls:
+                        seen_urls.add(job['url'])
+                        unique_jobs.append(job)
+            print(f'  사람인 크롤링 \'{kw}\' 총 {len(unique_jobs)}개 수집')
+            results[kw] = unique_jobs
+            if any(resp.ok for resp in pages):
+                store.put_search(kw, unique_jobs)
+        return results
+
+    def _parse_saramin_search(self, html, page):
+        """사람인 검색 결과 HTML → 공고 목록"""
+        soup = BeautifulSoup(html, 'html.parser')
+        page_jobs = []
+        for item in soup.select('.item_recruit'):
             try:
-                resp = requests.get(url, headers=headers, timeout=15)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                items = soup.select('.item_recruit')
-                page_jobs = []
-                for item in items:
-                    try:
-                        company_elem = item.select_one('.corp_name a')
-                        company_name = company_elem.get_text(strip=True) if company_elem else '알 수 없음'
-
-                        title_elem = item.select_one('.job_tit a')
-                        if not title_elem:
-                            continue
-                        title = title_elem.get_text(strip=True)
-                        job_url = 'https://www.saramin.co.kr' + title_elem['href'] if title_elem.get('href') else ''
-
-                        skills_elem = item.select('.job_sector a')
-                        skills = [s.get_text(strip=True) for s in skills_elem]
-
-                        conditions = item.select('.job_condition span')
-                        conditions_text = [c.get_text(strip=True) for c in conditions]
-
-                        location_elem = item.select_one('.job_condition span:first-child')
-                        location = location_elem.get_text(strip=True) if location_elem else ''
-
-                        print(f'  [사람인 p{page}] {company_name} - 스킬: {skills if skills else "없음"}')
-                        page_jobs.append({
-                            'source': '사람인',
-                            'company_name': company_name,
-                            'title': title,
-                            'url': job_url,
-                            'skills': skills,
-                            'location': location,
-                            'conditions': conditions_text,
-                            'description': f'{title} - {company_name}',
-                        })
-                    except Exception:
-                        continue
-                return page_jobs
-            except Exception as e:
-                print(f'⚠️ 사람인 {page}페이지 크롤링 실패: {e}')
-                return []
-
-        # 3페이지 병렬 요청
-        jobs = []
-        with ThreadPoolExecutor(max_workers=3) as ex:
-            futures = [ex.submit(fetch_page, p) for p in range(1, 4)]
-            for f in as_completed(futures):
-                jobs.extend(f.result())
-
-        # URL 중복 제거
-        seen_urls = set()
-        unique_jobs = []
-        for job in jobs:
-            if job['url'] and job['url'] not in seen_urls:
-                seen_urls.add(job['url'])
-                unique_jobs.append(job)
-
-        print(f'  사람인 크롤링 총 {len(unique_jobs)}개 수집')
-        return unique_jobs[:limit]
+                company_elem = item.select_one('.corp_name a')
+                company_name = company_elem.get_text(strip=True) if company_elem else '알 수 없음'
+
+                title_elem = item.select_one('.job_tit a')
+                if not title_elem:
+                    continue
+                title = title_elem.get_text(strip=True)
+                job_url = 'https://www.saramin.co.kr' + title_elem['href'] if title_elem.get('href') else ''
+
+                skills_elem = item.select('.job_sector a')
+                skills = [s.get_text(strip=True) for s in skills_elem]
+
+                conditions = item.select('.job_condition span')
+                conditions_text = [c.get_text(strip=True) for c in conditions]
+
+                location_elem = item.select_one('.job_condition span:first-child')
+                location = location_elem.get_text(strip=True) if location_elem else ''
+
+                print(f'  [사람인 p{page}] {company_name} - 스킬: {skills if skills else "없음"}')
+                page_jobs.append({
+                    'source': '사람인',
+                    'company_name': company_name,
+                    'title': title,
+                    'url': job_url,
+                    'skills': skills,
+                    'location': location,
+                    'conditions': conditions_text,
+                    'description': f'{title} - {company_name}',
+                })
+            except Exception:
+                continue
+        return page_jobs
 
     def _fetch_job_detail(self, url):
         """개별 공고 페이지에서 기술 키워드 + 상세 텍스트 추출"""
-        import re
+        from .collectors.crawl_engine import get_crawl_engine
+
         if not url:
             return {'skills': [], 'detail_text': ''}
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=8)
+            response = get_crawl_engine().fetch(url, timeout=8)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return self._parse_job_detail(response.text)
+        except Exception:
+            return {'skills': [], 'detail_text': ''}
+
+    def _parse_job_detail(self, html):
+        """공고 상세 HTML → 기술 키워드 + 상세 텍스트"""
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
 
             # 상세 텍스트 추출 (공고 본문 영역)
             detail_text = ''
@@ -1988,51 +1846,38 @@ class JobPlannerRecommendView(APIView):
             if len(detail_text) > 2000:
                 detail_text = detail_text[:2000]
 
-            # 기술 키워드 추출
-            text = soup.get_text()
-            tech_keywords = [
-                # 언어
-                'Python', 'Java', 'JavaScript', 'TypeScript', 'C\\+\\+', 'C#', 'Go', 'Kotlin',
-                'Swift', 'Ruby', 'PHP', 'Rust', 'Scala', 'Dart', 'Perl', 'R',
-                # 웹 프레임워크
-                'Django', 'Flask', 'FastAPI', 'Spring', 'SpringBoot', 'Spring Boot',
-                'React', 'Vue', 'Angular', 'Next\\.js', 'Nuxt', 'Express', 'Node\\.js',
-                'Nest\\.js', 'Svelte', 'Flutter', 'Laravel', 'Rails',
-                # 데이터/ML
-                'pandas', 'NumPy', 'scikit-learn', 'TensorFlow', 'PyTorch', 'Keras',
-                'OpenCV', 'Matplotlib', 'XGBoost', 'LightGBM', 'Spark', 'Hadoop',
-                'Airflow', 'dbt', 'Tableau', 'Power BI',
-                # AI/LLM
-                'LangChain', 'HuggingFace', 'Hugging Face', 'OpenAI', 'GPT',
-                'LLM', 'RAG', 'Transformers',
-                # DB
-                'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'MariaDB',
-                'Elasticsearch', 'DynamoDB', 'Cassandra', 'SQLite', 'Firebase',
-                'Supabase', 'Pinecone', 'ChromaDB',
-                # 인프라/DevOps
-                'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins',
-                'Terraform', 'Ansible', 'Nginx', 'Apache',
-                'GitHub Actions', 'GitLab', 'ArgoCD', 'Prometheus', 'Grafana',
-                # 메시징/통신
-                'Kafka', 'RabbitMQ', 'gRPC', 'GraphQL', 'REST',
-                # 기타
-                'Git', 'Linux', 'Selenium', 'Celery', 'Jira', 'Figma',
-            ]
-            found = []
-            for kw in tech_keywords:
-                display = kw.replace('\\+\\+', '++').replace('\\.', '.')
-                if re.search(r'(?<![a-zA-Z])' + kw + r'(?![a-zA-Z])', text, re.IGNORECASE):
-                    found.append(display)
+            # 기술 키워드 추출 ([수정일: 2026-10-18] 사전 컴파일된 단일 패스 추출기)
+            found = DETAIL_SKILL_MATCHER.find(soup.get_text())
             return {'skills': found, 'detail_text': detail_text}
         except Exception:
             return {'skills': [], 'detail_text': ''}
 
     def _enrich_jobs_with_detail(self, jobs):
-        """개별 공고 페이지를 5개씩 병렬 파싱하여 스킬 + 상세 텍스트 보완"""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        def enrich_one(job):
-            detail = self._fetch_job_detail(job.get('url', ''))
+        """
+        개별 공고 페이지로 스킬 + 상세 텍스트 보완.
+        [수정일: 2026-10-18] 5-스레드 풀 → 공유 크롤 엔진으로 전체 URL 동시 요청 (호스트별 상한/지연 적용)
+        [수정일: 2026-10-18] 정규화 URL 기준 공고 캐시(posting_store) 우선 — 캐시에 없는 공고만 요청,
+        stale 공고는 캐시 결과를 쓰고 백그라운드에서 재수집
+        """
+        from .collectors.posting_store import get_posting_store
+
+        store = get_posting_store()
+        urls = [job.get('url', '') for job in jobs]
+        cached = store.get_postings(urls)
+        details = {url: entry.value for url, entry in cached.items()}
+        missing = [u for u in dict.fromkeys(urls) if u and u not in cached]
+        if cached:
+            print(f'  공고 캐시 적중 {len(cached)}개, 요청 {len(missing)}개')
+        details.update(self._fetch_job_details(missing, store))
+        stale = [url for url, entry in cached.items() if not entry.fresh]
+        if stale:
+            store.schedule_refresh(stale, lambda stale_urls: self._fetch_job_details(stale_urls, store))
+
+        for job, url in zip(jobs, urls):
+            detail = details.get(url)
+            if detail is None:
+                job['detail_text'] = ''
+                continue
             # 스킬 보완
             if detail['skills']:
                 existing_lower = {s.lower() for s in job.get('skills', [])}
@@ -2040,17 +1885,22 @@ class JobPlannerRecommendView(APIView):
                 job['skills'] = job.get('skills', []) + new_skills
             # 상세 텍스트 저장
             job['detail_text'] = detail['detail_text']
-            return job
+        return jobs
 
-        enriched = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(enrich_one, job): job for job in jobs}
-            for future in as_completed(futures):
-                try:
-                    enriched.append(future.result())
-                except Exception:
-                    enriched.append(futures[future])
-        return enriched
+    def _fetch_job_details(self, urls, store):
+        """상세 공고 페이지 동시 요청 → 파싱 → 캐시 저장. Returns: {URL: {'skills', 'detail_text'}}"""
+        from .collectors.crawl_engine import get_crawl_engine
+
+        if not urls:
+            return {}
+        try:
+            responses = get_crawl_engine().fetch_many(urls, timeout=8)
+        except Exception as e:
+            print(f'⚠️ 상세 공고 크롤링 실패: {e}')
+            return {}
+        details = {resp.url: self._parse_job_detail(resp.text) for resp in responses if resp.ok}
+        store.put_postings({url: d for url, d in details.items() if d['detail_text']})
+        return details
 
 
     def _match_jobs_with_skills(self, job_listings, user_skills, skill_levels, readiness_score, current_job_text=''):
@@ -2130,7 +1980,7 @@ class JobPlannerRecommendView(APIView):
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
         api_key = os.environ.get("OPENAI_API_KEY")
-        llm_client = openai.OpenAI(api_key=api_key)
+        llm_client = get_openai_client('job_planner.recommend')
 
         def evaluate_one(candidate):
             # 기술 매칭 점수: 객관적 계산 (40점 만점)
@@ -2274,13 +2124,11 @@ class JobPlannerCompanyAnalyzeView(APIView):
         if not url:
             raise Exception("URL이 필요합니다.")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
-        # 채용 사이트 -> BeautifulSoup 방식
+        # 채용 사이트 -> BeautifulSoup 방식 ([수정일: 2026-10-18] 공유 크롤 엔진)
         if any(domain in url for domain in JOB_SITE_DOMAINS):
-            response = requests.get(url, headers=headers, timeout=10)
+            from .collectors.crawl_engine import get_crawl_engine
+
+            response = get_crawl_engine().fetch(url, timeout=10)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             for tag in soup(["script", "style"]):
@@ -2347,7 +2195,7 @@ class JobPlannerCompanyAnalyzeView(APIView):
 }}"""
 
         try:
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('job_planner.company')
             use_web_search = not company_info or len(company_info.strip()) < 200
 
             if use_web_search:
@@ -2431,6 +2279,11 @@ class JobPlannerParseResumeView(APIView):
     - 이력서: PDF->이미지 변환 -> Vision API (표 형식 대응)
     - 포트폴리오: PDF->이미지 변환 -> Vision API
     세 작업을 ThreadPoolExecutor로 병렬 실행 후 LLM으로 결과 병합.
+
+    [수정일: 2026-10-18] 서류 수집은 core/services/pdf_ingest.py 파이프라인 사용
+    - 서류당 base64 디코드 1회, 텍스트는 PyMuPDF로 페이지별 추출 (pdfplumber 재디코드 제거)
+    - 텍스트가 부족한 페이지만 렌더링 (해상도 자동 조정, 페이지가 많으면 프로세스 풀)
+    - Vision은 페이지별 호출을 동시에 실행, 페이지 단위 결과는 PDF 해시로 캐시
     """
     authentication_classes = []
     permission_classes = [AllowAny]
@@ -2513,35 +2366,16 @@ class JobPlannerParseResumeView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _pdf_to_images(self, pdf_base64, max_pages=10):
-        """PDF를 JPEG 이미지 base64 리스트로 변환 (PyMuPDF)"""
-        import fitz
-
-        raw = pdf_base64.split(',')[-1]
-        pdf_bytes = base64.b64decode(raw)
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-
-        images = []
-        for i, page in enumerate(doc):
-            if i >= max_pages:
-                break
-            mat = fitz.Matrix(2, 2)  # 2배 해상도
-            pix = page.get_pixmap(matrix=mat)
-            img_b64 = base64.b64encode(pix.tobytes("jpeg")).decode()
-            images.append(f"data:image/jpeg;base64,{img_b64}")
-
-        doc.close()
-        return images
-
     def _extract_pdf_text(self, pdf_base64):
-        """PDF에서 텍스트 추출 (pdfplumber)"""
-        import pdfplumber, io
+        """PDF에서 텍스트 추출 ([수정일: 2026-10-18] PyMuPDF 페이지별 추출 + 캐시)"""
+        return open_pdf(pdf_base64).text
 
-        raw = pdf_base64.split(',')[-1]
-        pdf_bytes = base64.b64decode(raw)
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-        return text.strip()
+    def _vision_profile(self, doc, pages, prompt, call_site, tag):
+        """텍스트가 부족한 페이지들: 페이지별 Vision 호출(동시 실행) 결과를 하나로 합침"""
+        images = doc.render(pages)
+        if not images:
+            return {}
+        return combine_partial_profiles(vision_extract(doc, images, prompt, call_site, tag))
 
     def _parse_resume(self, pdf_base64, api_key):
         """이력서: 텍스트 추출 우선 -> 부족하면 Vision API fallback"""
@@ -2568,13 +2402,14 @@ JSON 형식:
   "portfolio_url": "포트폴리오 사이트 URL 또는 null"
 }}"""
 
-        # 1차: pdfplumber 텍스트 추출
-        text = self._extract_pdf_text(pdf_base64)
+        # 1차: 텍스트 추출 (디코드 1회, Vision fallback 시 같은 문서 재사용)
+        doc = open_pdf(pdf_base64)
+        text = doc.text
 
         if len(text) >= 100:
             # 텍스트 충분 -> gpt-4o-mini로 빠르게 처리
             print("📄 이력서: 텍스트 추출 성공 -> gpt-4o-mini 사용")
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('job_planner.resume')
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{
@@ -2587,26 +2422,11 @@ JSON 형식:
             return json.loads(response.choices[0].message.content)
         else:
             # 텍스트 부족 (스캔본/이미지 PDF) -> Vision API fallback
+            # [수정일: 2026-10-18] 전체 페이지를 렌더링해 페이지별로 동시 호출
+            #   문서 전체 텍스트가 100자 미만이면 짧은 텍스트가 있는 페이지도 내용은 이미지에 있으므로
+            #   text_poor 페이지만 고르지 않는다 (이름/머리글 한 줄만 추출된 페이지가 빠지는 문제)
             print("🖼️ 이력서: 텍스트 부족 -> Vision API fallback")
-            images = self._pdf_to_images(pdf_base64)
-            if not images:
-                return {}
-            client = openai.OpenAI(api_key=api_key)
-            content = [{"type": "text", "text": RESUME_PROMPT}]
-            for img in images:
-                content.append({"type": "image_url", "image_url": {"url": img}})
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": content}],
-                max_tokens=2000,
-                temperature=0.1
-            )
-            raw = response.choices[0].message.content
-            if '```json' in raw:
-                raw = raw.split('```json')[1].split('```')[0].strip()
-            elif '```' in raw:
-                raw = raw.split('```')[1].split('```')[0].strip()
-            return json.loads(raw)
+            return self._vision_profile(doc, doc.pages, RESUME_PROMPT, 'job_planner.resume_vision', 'resume-v1')
 
     def _parse_cover_letter(self, pdf_base64, api_key):
         """자기소개서: 텍스트 추출 후 GPT로 구조화"""
@@ -2614,7 +2434,7 @@ JSON 형식:
         if not text:
             return {}
 
-        client = openai.OpenAI(api_key=api_key)
+        client = get_openai_client('job_planner.cover_letter')
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{
@@ -2661,7 +2481,7 @@ JSON 형식:
         if not text:
             return {}
 
-        client = openai.OpenAI(api_key=api_key)
+        client = get_openai_client('job_planner.career')
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{
@@ -2703,9 +2523,14 @@ JSON 형식:
         return json.loads(response.choices[0].message.content)
 
     def _parse_with_vision(self, pdf_base64, api_key, doc_type):
-        """이력서/포트폴리오: Vision API로 파싱"""
-        images = self._pdf_to_images(pdf_base64)
-        if not images:
+        """
+        이력서/포트폴리오: Vision API로 파싱
+
+        [수정일: 2026-10-18] 텍스트가 충분한 페이지는 텍스트로 한 번에(gpt-4o-mini),
+        텍스트가 부족한 페이지만 이미지로 렌더링해 페이지별 Vision 호출을 동시에 실행한 뒤 합친다.
+        """
+        doc = open_pdf(pdf_base64)
+        if not doc.pages:
             return {}
 
         prompts = {
@@ -2759,29 +2584,28 @@ JSON 형식:
 }"""
         }
 
-        content = [{"type": "text", "text": prompts[doc_type]}]
-        for img in images:
-            content.append({"type": "image_url", "image_url": {"url": img}})
-
-        client = openai.OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": content}],
-            max_tokens=2000,
-            temperature=0.1
-        )
-
-        raw = response.choices[0].message.content
-        if '```json' in raw:
-            raw = raw.split('```json')[1].split('```')[0].strip()
-        elif '```' in raw:
-            raw = raw.split('```')[1].split('```')[0].strip()
-
-        return json.loads(raw)
+        text_pages = [page for page in doc.pages if not page.text_poor]
+        image_pages = [page for page in doc.pages if page.text_poor]
+        parts = []
+        if text_pages:
+            client = get_openai_client('job_planner.document_text')
+            page_text = "\n\n".join(page.text for page in text_pages)
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": f"{prompts[doc_type]}\n\n문서 텍스트:\n{page_text}"}],
+                response_format={"type": "json_object"},
+                temperature=0.1
+            )
+            parts.append(json.loads(response.choices[0].message.content))
+        if image_pages:
+            parts.append(self._vision_profile(
+                doc, image_pages, prompts[doc_type], 'job_planner.document_vision', f'{doc_type}-v1'
+            ))
+        return combine_partial_profiles(parts)
 
     def _merge_results(self, results, api_key):
         """여러 서류 결과를 LLM으로 병합하여 최종 프로필 생성"""
-        client = openai.OpenAI(api_key=api_key)
+        client = get_openai_client('job_planner.resume_merge')
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{
@@ -2869,7 +2693,7 @@ class JobPlannerReviewPortfolioView(APIView):
             return Response({"error": "OPENAI_API_KEY가 설정되지 않았습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
         try:
-            client = openai.OpenAI(api_key=api_key)
+            client = get_openai_client('job_planner.portfolio')
 
             # 파싱된 포트폴리오 데이터를 텍스트로 구성
             portfolio_content = json.dumps(portfolio_parsed, ensure_ascii=False, indent=2)
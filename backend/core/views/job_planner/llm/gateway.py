@@ -4,12 +4,14 @@ LLM Gateway
 원본 v3.1 기반
 """
 from openai import OpenAI
-import os
 import json
 
+from core.services.llm_client import get_openai_client
+
 class LLMGateway:
     def __init__(self, api_key: str = None):
-        self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+        # 별도 키를 넘긴 경우만 전용 클라이언트, 기본은 공용 클라이언트
+        self.client = OpenAI(api_key=api_key) if api_key else get_openai_client("job_planner.gateway")
 
     def call(self, prompt: str, model: str = "gpt-4o-mini") -> str:
         response = self.client.chat.completions.create(
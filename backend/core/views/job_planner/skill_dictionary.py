@@ -0,0 +1,282 @@
+"""
+skill_dictionary.py — 스킬 사전 + 단일 패스 키워드 추출기
+생성일: 2026-10-18
+
+[배경]
+_fetch_job_detail은 공고 페이지마다 키워드 ~90개의 패턴을 새로 만들어 페이지 전체 텍스트에
+re.search를 ~90번 실행했고, _extract_skills_from_text도 키워드마다 re.search + 정규화 목록을
+다시 만들었다. 추천 1회에 상세 페이지 최대 60개라 동시 요청이 몰리면 CPU 비용이 보인다.
+
+[KeywordMatcher]
+  - 키워드 목록을 import 시 1회, 공통 접두사를 묶은 트라이 정규식 하나로 컴파일
+      예) spring, springboot, spring boot → spring(?:(?:boot| boot))?
+  - 텍스트를 한 번 훑으며 위치마다 경계 조건을 만족하는 가장 긴 키워드를 찾고,
+    그 키워드의 접두사이면서 경계 조건도 만족하는 짧은 키워드(spring boot → spring)는
+    사전 계산한 목록으로 함께 기록 → 키워드별 re.search 결과와 동일
+  - 결과는 사전 순서(표시명)로 반환
+  경계:
+    'ascii' : 앞뒤가 영문자가 아님 (_fetch_job_detail 기존 규칙)
+    'word'  : 앞뒤 단어 경계 (_extract_skills_from_text 기존 규칙)
+
+[SKILL_SYNONYMS / normalize_skill]
+  한영 동의어 정규화. JobPlannerAnalyzeView / JobPlannerRecommendView가 공유.
+"""
+import re
+from typing import Dict, Iterable, List
+
+# 한영 스킬 동의어 사전
+# 다양한 표기를 통일된 형태로 정규화하기 위한 매핑 테이블
+# 예: "파이썬", "Python", "python" -> 모두 "python"으로 통일
+# 참고: 'python': 'python' 같은 중복은 불필요 (normalize_skill에서 자동 처리)
+SKILL_SYNONYMS = {
+    # 프로그래밍 언어
+    '파이썬': 'python',
+    '자바': 'java',
+    '자바스크립트': 'javascript', 'js': 'javascript',
+    '타입스크립트': 'typescript', 'ts': 'typescript',
+    'c++': 'cpp', '씨쁠쁠': 'cpp',
+    'c#': 'csharp', '씨샵': 'csharp', '씨샤프': 'csharp',
+    '고': 'go', 'golang': 'go',
+    '코틀린': 'kotlin',
+    '스위프트': 'swift',
+    '루비': 'ruby',
+    '러스트': 'rust',
+    '스칼라': 'scala',
+    'php': 'php', '피에이치피': 'php',
+    '다트': 'dart',
+    '펄': 'perl',
+
+    # 웹 프레임워크
+    '장고': 'django',
+    '플라스크': 'flask',
+    '패스트에이피아이': 'fastapi', 'fast api': 'fastapi',
+    '스프링': 'spring',
+    '스프링부트': 'springboot', 'spring boot': 'springboot', '스프링 부트': 'springboot',
+    '리액트': 'react', 'reactjs': 'react', 'react.js': 'react',
+    '뷰': 'vue', 'vuejs': 'vue', 'vue.js': 'vue',
+    '앵귤러': 'angular', 'angularjs': 'angular',
+    '노드': 'node', 'nodejs': 'node', 'node.js': 'node',
+    '익스프레스': 'express', 'expressjs': 'express', 'express.js': 'express',
+    '넥스트': 'next', 'nextjs': 'next', 'next.js': 'next',
+    '넥스트제이에스': 'next', '넥스트js': 'next',
+    '네스트': 'nestjs', 'nestjs': 'nestjs', 'nest.js': 'nestjs', '네스트제이에스': 'nestjs',
+    '넉스트': 'nuxtjs', 'nuxtjs': 'nuxtjs', 'nuxt.js': 'nuxtjs',
+    '스벨트': 'svelte',
+    '플러터': 'flutter',
+    '라라벨': 'laravel',
+    '레일즈': 'rails', 'ruby on rails': 'rails',
+    '하이버네이트': 'hibernate',
+    '마이바티스': 'mybatis',
+
+    # 데이터 분석/과학 라이브러리
+    '판다스': 'pandas',
+    '넘파이': 'numpy',
+    '맷플롯립': 'matplotlib',
+    '사이킷런': 'sklearn', 'scikit-learn': 'sklearn',
+    '엑스지부스트': 'xgboost',
+    '라이트지비엠': 'lightgbm',
+    '오픈cv': 'opencv', 'open cv': 'opencv',
+    '엔엘티케이': 'nltk',
+    '스페이시': 'spacy',
+
+    # 데이터베이스
+    '마이에스큐엘': 'mysql',
+    '포스트그레': 'postgresql', 'postgres': 'postgresql', 'postgre sql': 'postgresql',
+    '몽고디비': 'mongodb', 'mongo': 'mongodb',
+    '레디스': 'redis',
+    '오라클': 'oracle',
+    '마리아디비': 'mariadb',
+    '에스큐엘서버': 'mssql', 'sql server': 'mssql', 'sqlserver': 'mssql',
+    '에스큐엘라이트': 'sqlite',
+    '엘라스틱서치': 'elasticsearch', '엘라스틱': 'elasticsearch',
+    '크로마': 'chromadb', 'chroma': 'chromadb', 'chroma db': 'chromadb',
+    '파인콘': 'pinecone',
+    '카산드라': 'cassandra',
+    '다이나모디비': 'dynamodb', 'dynamo db': 'dynamodb',
+    '파이어베이스': 'firebase',
+    '수파베이스': 'supabase',
+
+    # 클라우드/인프라
+    '아마존웹서비스': 'aws', 'amazon web services': 'aws',
+    '애저': 'azure', 'microsoft azure': 'azure',
+    '구글클라우드': 'gcp', 'google cloud': 'gcp', 'google cloud platform': 'gcp',
+    '도커': 'docker',
+    '쿠버네티스': 'kubernetes', 'k8s': 'kubernetes',
+    '테라폼': 'terraform',
+    '앤서블': 'ansible',
+    '젠킨스': 'jenkins',
+    '깃허브액션스': 'githubactions', 'github actions': 'githubactions',
+    '엔진엑스': 'nginx',
+    '아파치': 'apache',
+    '리눅스': 'linux',
+    '우분투': 'ubuntu',
+    '카프카': 'kafka', 'apache kafka': 'kafka',
+    '래빗엠큐': 'rabbitmq', 'rabbit mq': 'rabbitmq',
+
+    # AI/ML
+    '텐서플로': 'tensorflow', '텐서플로우': 'tensorflow',
+    '파이토치': 'pytorch',
+    '케라스': 'keras',
+    '랭체인': 'langchain',
+    '허깅페이스': 'huggingface', 'hugging face': 'huggingface',
+    '트랜스포머': 'transformers',
+
+    # 도구
+    '깃': 'git',
+    '깃허브': 'github',
+    '깃랩': 'gitlab',
+    '지라': 'jira',
+    '컨플루언스': 'confluence',
+    '노션': 'notion',
+    '슬랙': 'slack',
+    '포스트맨': 'postman',
+    '피그마': 'figma',
+    '태블로': 'tableau',
+    '파워비아이': 'powerbi', 'power bi': 'powerbi',
+    '그라파나': 'grafana',
+    '키바나': 'kibana',
+}
+
+
+def normalize_skill(skill: str) -> str:
+    """스킬명 정규화 (한글->영어, 소문자). 예: '파이썬' -> 'python', 'JS' -> 'javascript'"""
+    skill_lower = skill.lower().strip()
+    return SKILL_SYNONYMS.get(skill_lower, skill_lower)
+
+
+# 공고 상세 페이지 기술 키워드 (_fetch_job_detail)
+DETAIL_TECH_KEYWORDS = [
+    # 언어
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Kotlin',
+    'Swift', 'Ruby', 'PHP', 'Rust', 'Scala', 'Dart', 'Perl', 'R',
+    # 웹 프레임워크
+    'Django', 'Flask', 'FastAPI', 'Spring', 'SpringBoot', 'Spring Boot',
+    'React', 'Vue', 'Angular', 'Next.js', 'Nuxt', 'Express', 'Node.js',
+    'Nest.js', 'Svelte', 'Flutter', 'Laravel', 'Rails',
+    # 데이터/ML
+    'pandas', 'NumPy', 'scikit-learn', 'TensorFlow', 'PyTorch', 'Keras',
+    'OpenCV', 'Matplotlib', 'XGBoost', 'LightGBM', 'Spark', 'Hadoop',
+    'Airflow', 'dbt', 'Tableau', 'Power BI',
+    # AI/LLM
+    'LangChain', 'HuggingFace', 'Hugging Face', 'OpenAI', 'GPT',
+    'LLM', 'RAG', 'Transformers',
+    # DB
+    'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'MariaDB',
+    'Elasticsearch', 'DynamoDB', 'Cassandra', 'SQLite', 'Firebase',
+    'Supabase', 'Pinecone', 'ChromaDB',
+    # 인프라/DevOps
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins',
+    'Terraform', 'Ansible', 'Nginx', 'Apache',
+    'GitHub Actions', 'GitLab', 'ArgoCD', 'Prometheus', 'Grafana',
+    # 메시징/통신
+    'Kafka', 'RabbitMQ', 'gRPC', 'GraphQL', 'REST',
+    # 기타
+    'Git', 'Linux', 'Selenium', 'Celery', 'Jira', 'Figma',
+]
+
+# 공고 요건 텍스트 기술 스택/역량 키워드 (_extract_skills_from_text)
+REQUIREMENT_TECH_KEYWORDS = [
+    # 언어
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Kotlin',
+    'Swift', 'Ruby', 'PHP', 'Rust', 'Scala', 'R',
+    '파이썬', '자바', '자바스크립트', '타입스크립트', '코틀린',
+
+    # 프레임워크
+    'Django', 'Flask', 'FastAPI', 'Spring', 'SpringBoot', 'React', 'Vue',
+    'Angular', 'Next.js', 'Nuxt', 'Express', 'Node.js', 'Nest.js',
+    '장고', '플라스크', '스프링', '리액트', '뷰', '앵귤러', '노드',
+
+    # 데이터베이스
+    'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'MariaDB',
+    'SQLite', 'Elasticsearch', 'DynamoDB', 'Cassandra',
+    '마이에스큐엘', '몽고디비', '레디스', '오라클',
+
+    # 클라우드/인프라
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'GitLab CI',
+    'Terraform', 'Ansible', 'Linux', 'Nginx', 'Apache',
+    '도커', '쿠버네티스', '리눅스',
+
+    # AI/ML/Data
+    'TensorFlow', 'PyTorch', 'Keras', 'scikit-learn', 'Pandas', 'NumPy',
+    'Spark', 'Hadoop', 'Airflow', 'Kafka',
+    '텐서플로', '파이토치',
+
+    # 도구
+    'Git', 'GitHub', 'GitLab', 'Jira', 'Confluence', 'Slack', 'Notion',
+    'Figma', 'Postman', 'Swagger',
+    '깃', '깃허브', '지라',
+
+    # 방법론/개념
+    'Agile', 'Scrum', 'Kanban', 'CI/CD', 'DevOps', 'TDD', 'DDD',
+    'Microservices', 'REST', 'GraphQL', 'gRPC', 'WebSocket',
+    '애자일', '스크럼', '칸반', '마이크로서비스'
+]
+
+_WORD = re.compile(r'\w')
+_ASCII_LETTER = re.compile(r'[a-zA-Z]')
+BOUNDARIES = {
+    # 경계: (앞 조건 정규식, 뒤 조건 정규식, 키워드 안에서 "다음 글자 c가 끝 경계를 만족하는가")
+    'ascii': (r'(?<![a-zA-Z])', r'(?![a-zA-Z])',
+              lambda last, c: not _ASCII_LETTER.match(c)),
+    'word': (r'\b', r'\b',
+             lambda last, c: bool(_WORD.match(last)) != bool(_WORD.match(c))),
+}
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """공통 접두사를 묶은 정규식 (같은 위치에서는 긴 단어를 먼저 시도)"""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """키워드 목록 전체를 텍스트 한 번 훑기로 찾는 추출기 (대소문자 무시)"""
+
+    def __init__(self, keywords: Iterable[str], boundary: str = 'ascii'):
+        self.keywords = list(keywords)
+        left, right, ends_at = BOUNDARIES[boundary]
+        literals = {kw.lower() for kw in self.keywords}
+        self._pattern = re.compile(f'{left}({_trie_pattern(literals)}){right}', re.IGNORECASE)
+        # 긴 키워드가 매칭되면 함께 매칭된 것으로 보는 짧은 키워드 (접두사 + 끝 경계 만족)
+        self._implied = {
+            lit: [short for short in literals
+                  if len(short) < len(lit) and lit.startswith(short) and ends_at(short[-1], lit[len(short)])]
+            for lit in literals
+        }
+
+    def matched_literals(self, text: str) -> set:
+        found = set()
+        if not text:
+            return found
+        search = self._pattern.search
+        pos = 0
+        while True:
+            m = search(text, pos)
+            if m is None:
+                return found
+            lit = m.group(1).lower()
+            found.add(lit)
+            found.update(self._implied.get(lit, ()))
+            pos = m.start() + 1  # 다른 키워드가 매칭 안쪽에서 시작할 수 있음
+
+    def find(self, text: str) -> List[str]:
+        """텍스트에 나오는 키워드 (사전 순서의 표시명)"""
+        found = self.matched_literals(text)
+        return [kw for kw in self.keywords if kw.lower() in found]
+
+
+DETAIL_SKILL_MATCHER = KeywordMatcher(DETAIL_TECH_KEYWORDS, boundary='ascii')
+REQUIREMENT_SKILL_MATCHER = KeywordMatcher(REQUIREMENT_TECH_KEYWORDS, boundary='word')
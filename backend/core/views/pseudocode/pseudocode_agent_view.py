@@ -22,6 +22,7 @@ except ImportError:
     openai = None
 
 from django.conf import settings
+from core.services.llm_client import get_openai_client
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 
@@ -67,7 +68,7 @@ class PseudocodeAgentView(APIView):
             )
 
         try:
-            client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+            client = get_openai_client('pseudocode.agent')
 
             hint_instructions = {
                 1: "정답은 주지 말고, 학생이 스스로 생각할 수 있도록 방향만 제시하세요. 질문 형태로 유도해도 좋습니다.",
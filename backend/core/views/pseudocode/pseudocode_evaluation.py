@@ -8,10 +8,20 @@
   · LLM 성공 여부와 관계없이 항상 recommended_videos 반환
   · 프론트는 이 값을 우선 사용, 없으면 로컬 learningResources.js 폴백
 - 꼬리질문 context 필드 프론트 전달 추가
+
+[수정일: 2026-10-18]
+- PseudocodeEvaluator를 요청마다 새로 만들지 않고 모듈 단위로 재사용
+- SSE 버전(evaluate-5d/stream/) 추가: rule 검증 결과는 즉시, 차원 점수는 LLM이 생성하는 대로 전송
+  (비동기 평가 aevaluate 사용 → ASGI 이벤트 루프에서 동기 워커를 점유하지 않음)
 """
 
+import asyncio
+import json
 import logging
 import re
+import threading
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
 from rest_framework.decorators import api_view, permission_classes, throttle_classes as throttle_classes_decorator
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.throttling import UserRateThrottle  # [수정일: 2026-03-06] AI throttle
@@ -36,6 +46,18 @@ from core.services.pseudocode_evaluator import (
 
 logger = logging.getLogger(__name__)
 
+_evaluator = None
+_evaluator_lock = threading.Lock()
+
+
+def _get_evaluator() -> PseudocodeEvaluator:
+    """[수정일: 2026-10-18] 평가기(LLM 클라이언트/엔진 포함)를 요청 간 재사용"""
+    global _evaluator
+    with _evaluator_lock:
+        if _evaluator is None:
+            _evaluator = PseudocodeEvaluator()
+        return _evaluator
+
 
 # ============================================================================
 # Quest ID 정규화
@@ -109,7 +131,7 @@ def evaluate_pseudocode_5d(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    evaluator = PseudocodeEvaluator()
+    evaluator = _get_evaluator()
     eval_request = EvaluationRequest(
         user_id=str(user_id),
         detail_id=str(quest_id),
@@ -126,23 +148,7 @@ def evaluate_pseudocode_5d(request):
 
         # DB 자동 기록 (최종 제출 1회만)
         if is_final_submission:
-            try:
-                profile = UserProfile.objects.get(email=request.user.email)
-                normalized_id = normalize_quest_id(quest_id)
-                str_quest_id = str(quest_id)
-                target_detail_id = (
-                    str_quest_id
-                    if (str_quest_id.startswith('unit') and '_' in str_quest_id)
-                    else f"unit01_{normalized_id.zfill(2)}"
-                )
-                save_user_problem_record(
-                    profile,
-                    target_detail_id,
-                    result.final_score,
-                    {'pseudocode': pseudocode, 'evaluation': result.feedback, 'is_auto_saved': True},
-                )
-            except Exception as save_error:
-                logger.error(f"[Evaluate] Failed to auto-save: {save_error}")
+            _auto_save(request.user.email, quest_id, pseudocode, result)
         else:
             logger.info(f"[Evaluate] DB 저장 스킵 (is_final_submission=False) user={user_id}")
 
@@ -175,6 +181,133 @@ def evaluate_pseudocode_5d(request):
         )
 
 
+# [수정일: 2026-10-18] SSE 에러 이벤트 (동기 뷰의 503/500 응답 본문과 동일)
+_STREAM_ERRORS = {
+    LLMTimeoutError: {"error": "AI_TIMEOUT", "error_message": "AI 응답 시간이 초과되었습니다. 잠시 후 다시 시도해 주세요.", "retryable": True},
+    LLMUnavailableError: {"error": "LLM_UNAVAILABLE", "error_message": "AI 서비스에 연결할 수 없습니다.", "retryable": False},
+}
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+@throttle_classes_decorator([AIRateThrottle])
+def evaluate_pseudocode_5d_stream(request):
+    """
+    [POST] /api/core/pseudocode/evaluate-5d/stream/
+    [수정일: 2026-10-18] 5차원 평가 SSE 버전. 요청 본문은 evaluate-5d와 같다.
+
+    이벤트 순서:
+        {"type": "rule_validation", ...}   규칙 검증 결과 (LLM 호출 전, 즉시)
+        {"type": "dimension", ...}         차원 점수 (LLM 스트림에서 완성되는 대로)
+        {"type": "result", ...}            evaluate-5d 응답과 동일한 최종 결과
+        {"type": "error", "error": ...}    AI_TIMEOUT / LLM_UNAVAILABLE / SERVER_ERROR
+        [DONE]
+    클라이언트 연결이 끊기면 진행 중인 LLM 호출도 취소된다.
+    """
+    user_id = request.user.id
+    user_email = request.user.email
+    quest_id = request.data.get('quest_id', '1')
+    quest_title = request.data.get('quest_title', '데이터 전처리 미션')
+    pseudocode = request.data.get('pseudocode', '').strip()
+    tail_answer = request.data.get('tail_answer', '').strip()
+    deep_answer = request.data.get('deep_answer', '').strip()
+    is_final_submission = request.data.get('is_final_submission', False)
+
+    if not pseudocode:
+        return Response(
+            {"error": "pseudocode 필드가 비어 있습니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    eval_request = EvaluationRequest(
+        user_id=str(user_id),
+        detail_id=str(quest_id),
+        pseudocode=pseudocode,
+        quest_title=quest_title,
+        tail_answer=tail_answer,
+        deep_answer=deep_answer,
+        mode=EvaluationMode.OPTION2_GPTONLY,
+    )
+
+    def _sse(data):
+        return f"data: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+    async def event_stream():
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def on_event(kind, payload):
+            if kind == 'rule_validation':
+                payload = {
+                    'passed': payload.passed,
+                    'critical_error_count': payload.critical_error_count,
+                    'warnings': payload.warnings,
+                    'raw_score_100': payload.raw_score_100,
+                }
+            queue.put_nowait({'type': kind, **payload})
+
+        async def run():
+            try:
+                result = await _get_evaluator().aevaluate(eval_request, on_event=on_event)
+                if is_final_submission:
+                    await sync_to_async(_auto_save)(user_email, quest_id, pseudocode, result)
+                response = await asyncio.to_thread(_build_success_response, result, result.llm_result, quest_id)
+                queue.put_nowait({'type': 'result', **response})
+            except LowEffortError as e:
+                logger.info(f"[EvaluateStream] LowEffort user={user_id}: {e.reason}")
+                response = await asyncio.to_thread(_build_low_effort_response, quest_id, e.reason)
+                queue.put_nowait({'type': 'result', **response})
+            except (LLMTimeoutError, LLMUnavailableError) as e:
+                logger.warning(f"[EvaluateStream] LLM error user={user_id}: {e}")
+                queue.put_nowait({'type': 'error', **_STREAM_ERRORS[type(e)]})
+            except Exception as e:
+                logger.error(f"[EvaluateStream] Unexpected error user={user_id}: {e}", exc_info=True)
+                queue.put_nowait({'type': 'error', 'error': 'SERVER_ERROR', 'error_message': '서버 내부 오류가 발생했습니다.'})
+            finally:
+                queue.put_nowait(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield _sse(event)
+            yield "data: [DONE]\n\n"
+        finally:
+            # 연결 종료(제너레이터 close) 시 LLM 호출 취소
+            if not task.done():
+                task.cancel()
+
+    resp = StreamingHttpResponse(
+        event_stream(),
+        content_type="text/event-stream; charset=utf-8",
+    )
+    resp["Cache-Control"] = "no-cache, no-transform"
+    resp["X-Accel-Buffering"] = "no"
+    return resp
+
+
+def _auto_save(email, quest_id, pseudocode, result):
+    """최종 제출 결과를 UserProblemRecord에 기록 (실패해도 평가 응답은 그대로 반환)"""
+    try:
+        profile = UserProfile.objects.get(email=email)
+        normalized_id = normalize_quest_id(quest_id)
+        str_quest_id = str(quest_id)
+        target_detail_id = (
+            str_quest_id
+            if (str_quest_id.startswith('unit') and '_' in str_quest_id)
+            else f"unit01_{normalized_id.zfill(2)}"
+        )
+        save_user_problem_record(
+            profile,
+            target_detail_id,
+            result.final_score,
+            {'pseudocode': pseudocode, 'evaluation': result.feedback, 'is_auto_saved': True},
+        )
+    except Exception as save_error:
+        logger.error(f"[Evaluate] Failed to auto-save: {save_error}")
+
+
 def _build_success_response(result, llm, quest_id='1') -> dict:
     """정상 평가 완료 응답 — 영상 큐레이션 포함."""
     dimensions = result.feedback.get('dimensions', {})
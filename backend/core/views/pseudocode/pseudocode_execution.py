@@ -3,21 +3,29 @@
 Python 코드 실행 및 검증 엔드포인트 (Docker Sandbox 기반)
 보안: Docker 컨테이너를 사용하여 격리된 환경에서 코드 실행
 수정일: 2026-02-08
+
+[수정일: 2026-10-18] 요청마다 `docker run --rm` 대신 이미지별 웜 샌드박스 풀(core.services.sandbox_pool) 사용
+- 러너가 numpy/pandas/sklearn을 미리 import → fork된 실행 프로세스가 import 비용 없이 시작
+- 테스트 결과는 __sandbox_result__ 통로로 구조화해서 받음 (stdout 마지막 줄 JSON 파싱 제거)
+- 테스트 케이스마다 CASE_TIMEOUT_SECONDS 제한 (무한 루프 케이스만 실패 처리, 나머지 케이스는 계속)
 """
 
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
-import subprocess
 import json
-import time
+
+from core.services.sandbox_pool import get_sandbox_pool, SandboxPoolBusy
 
 # Docker 실행 설정
 TIMEOUT_SECONDS = 10 # Relaxed timeout for Windows environment
 MEMORY_LIMIT = "512m"
 CPU_LIMIT = "1.0"
 DOCKER_IMAGE = "coduck-sandbox:latest"
+CASE_TIMEOUT_SECONDS = 5
+# 러너 프로세스가 미리 import할 모듈 (하네스 상단 import와 동일)
+HARNESS_PRELOAD = ("numpy", "pandas", "sklearn.preprocessing")
 
 def check_security(user_code):
     """
@@ -32,14 +40,16 @@ def check_security(user_code):
             }
     return None
 
-def generate_runner_script(user_code, function_name, test_cases):
+def generate_runner_script(user_code, function_name, test_cases, case_timeout=CASE_TIMEOUT_SECONDS):
     """
     컨테이너 내부에서 실행될 파이썬 스크립트를 생성합니다.
+    샌드박스 러너에서는 __sandbox_result__로, 단독 실행(python -)에서는 stdout JSON 한 줄로 결과를 냅니다.
     """
     # JSON 직렬화를 위한 헬퍼 함수 포함
     runner_script = f"""
 import sys
 import json
+import signal
 import traceback
 # 의존성 설치가 완료된 이미지 사용으로 즉시 임포트 가능
 import numpy as np
@@ -48,15 +58,28 @@ from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
 import random
 import re
 
+def _emit(payload):
+    # [수정일: 2026-10-18] 샌드박스 러너의 결과 통로 우선 (사용자 print 출력과 분리)
+    if '__sandbox_result__' in globals():
+        __sandbox_result__(payload)
+    else:
+        print(json.dumps(payload))
+
+class _CaseTimeout(BaseException):
+    pass
+
+def _on_case_timeout(signum, frame):
+    raise _CaseTimeout()
+
 # === 사용자 코드 영역 ===
 try:
 {_indent_code(user_code, 4)}
 except Exception as e:
-    print(json.dumps({{
+    _emit({{
         "error": f"코드 정의 중 에러 발생: {{str(e)}}",
         "traceback": traceback.format_exc(),
         "success": False
-    }}))
+    }})
     sys.exit(1)
 
 # === 테스트 실행 영역 ===
@@ -65,17 +88,20 @@ def run_tests():
     passed_count = 0
     total_count = 0
     
-    test_cases = {json.dumps(test_cases)}
+    test_cases = json.loads({json.dumps(test_cases)!r})  # JSON true/null도 안전하게
     
-    # 함수 존재 여부 확인
-    if '{function_name}' not in locals():
-        print(json.dumps({{
+    # 함수 존재 여부 확인 (사용자 코드는 모듈 전역에 정의됨)
+    if '{function_name}' not in globals():
+        _emit({{
             "error": "함수 '{function_name}'를 찾을 수 없습니다.",
             "success": False
-        }}))
+        }})
         return
 
-    target_func = locals()['{function_name}']
+    target_func = globals()['{function_name}']
+    use_alarm = hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_case_timeout)
     
     for idx, test in enumerate(test_cases):
         total_count += 1
@@ -91,12 +117,18 @@ def run_tests():
         try:
             # 입력값 준비
             inputs = test.get('input')
-            if isinstance(inputs, dict):
-                actual = target_func(**inputs)
-            elif isinstance(inputs, list):
-                actual = target_func(*inputs)
-            else:
-                actual = target_func(inputs)
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, {float(case_timeout)})
+            try:
+                if isinstance(inputs, dict):
+                    actual = target_func(**inputs)
+                elif isinstance(inputs, list):
+                    actual = target_func(*inputs)
+                else:
+                    actual = target_func(inputs)
+            finally:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
             
             # 결과 변환 (NumPy/Pandas -> Python Native)
             if isinstance(actual, (np.ndarray, np.generic)):
@@ -142,6 +174,10 @@ def run_tests():
                     case_result['passed'] = False
                     case_result['message'] = f"결과 불일치"
                     
+        except _CaseTimeout:
+            case_result['passed'] = False
+            case_result['message'] = "시간 초과 ({case_timeout}초)"
+            case_result['error'] = "timeout"
         except Exception as e:
             if test.get('expected_error'):
                 case_result['passed'] = True
@@ -156,13 +192,13 @@ def run_tests():
         results.append(case_result)
 
     # 최종 결과 출력
-    print(json.dumps({{
+    _emit({{
         "success": True,
         "all_passed": passed_count == total_count,
         "passed_count": passed_count,
         "total_count": total_count,
         "results": results
-    }}))
+    }})
 
 def compare_values(actual, expected, tolerance=1e-5):
     # 타입 불일치 허용 (리스트 vs 튜플)
@@ -187,71 +223,59 @@ def _indent_code(code, spaces):
 
 def _execute_in_docker(script_code):
     """
-    Docker 컨테이너에서 스크립트를 실행합니다.
-    """
-    docker_cmd = [
-        "docker", "run",
-        "--rm",             # 실행 후 컨테이너 삭제
-        "--network", "none", # 네트워크 격리 (이미지 내부에 라이브러리가 있으므로 외부 통신 불필요)
-        "--memory", MEMORY_LIMIT,
-        "--cpus", CPU_LIMIT,
-        "-i",               # stdin 개방
-        DOCKER_IMAGE,
-        "python", "-"       # stdin에서 코드를 읽어 실행 (sh -c 제거해도 됨)
-    ]
+    Docker 샌드박스 풀에서 스크립트를 실행합니다.
 
+    [수정일: 2026-10-18] 기존: 요청마다 `docker run --rm` + stdout 마지막 줄 JSON 파싱
+    변경: 웜 컨테이너 러너에서 실행하고 하네스가 넘긴 구조화된 결과(result)를 그대로 반환
+    격리 옵션(--network none, 메모리/CPU 제한)은 풀 컨테이너에 동일하게 적용됩니다.
+    """
     try:
-        # Docker 실행
-        process = subprocess.Popen(
-            docker_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        try:
-            stdout, stderr = process.communicate(input=script_code, timeout=TIMEOUT_SECONDS)
-        except subprocess.TimeoutExpired:
-            process.kill()
-            return {
-                "error": f"Execution timed out ({TIMEOUT_SECONDS}s)",
-                "success": False
-            }
-
-        if process.returncode != 0:
-            return {
-                "error": f"Runtime Error: {stderr}",
-                "success": False,
-                "details": stderr
-            }
-
-        # 결과 파싱 (마지막 줄에 JSON이 있다고 가정)
-        try:
-            # stdout에 다른 출력이 섞여있을 수 있으므로 뒤에서부터 탐색
-            lines = stdout.strip().split('\n')
-            last_line = lines[-1] if lines else ""
-            return json.loads(last_line)
-        except json.JSONDecodeError:
-            # SyntaxError 등으로 JSON 출력이 안된 경우
-            return {
-                "success": False,
-                "error": f"Execution Error (Syntax/Runtime): {stdout.strip()}",
-                "results": [],
-                "output": stdout.strip()
-            }
-
+        pool = get_sandbox_pool(DOCKER_IMAGE, memory_limit=MEMORY_LIMIT, cpu_limit=CPU_LIMIT,
+                                preload=HARNESS_PRELOAD)
+        result = pool.run(script_code, timeout=TIMEOUT_SECONDS)
     except FileNotFoundError:
         return {
             "error": "Docker not found on server",
             "success": False
         }
+    except SandboxPoolBusy:
+        # 실행 대기열 초과 (백프레셔)
+        return {
+            "error": "실행 요청이 많아 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.",
+            "success": False,
+            "error_type": "busy"
+        }
     except Exception as e:
         return {
             "error": f"Server Error: {str(e)}",
             "success": False
         }
 
+    if result["timed_out"]:
+        return {
+            "error": f"Execution timed out ({TIMEOUT_SECONDS}s)",
+            "success": False
+        }
+
+    # 하네스가 결과를 넘긴 경우 (정상 실행, 코드 정의 에러, 함수 없음)
+    if result.get("result") is not None:
+        return result["result"]
+
+    stdout = result["stdout"].strip()
+    if result["exit_code"] != 0:
+        return {
+            "error": f"Runtime Error: {result['stderr']}",
+            "success": False,
+            "details": result["stderr"]
+        }
+    # SyntaxError 등으로 결과를 넘기지 못한 경우
+    return {
+        "success": False,
+        "error": f"Execution Error (Syntax/Runtime): {stdout}",
+        "results": [],
+        "output": stdout
+    }
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def execute_python_code(request):
@@ -280,7 +304,9 @@ def execute_python_code(request):
         
         # 3. Docker에서 실행
         result = _execute_in_docker(runner_script)
-        
+        if result.get("error_type") == "busy":
+            return Response(result, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
         return Response(result, status=status.HTTP_200_OK)
 
     except Exception as e:
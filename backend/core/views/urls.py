@@ -14,6 +14,9 @@ from core.views import (
     BugHuntEvaluationView,
     BugHuntInterviewView,
     CodeExecutionView,
+    CodeExecutionJobView,
+    CodeExecutionJobDetailView,
+    CodeExecutionJobStreamView,
     BehaviorVerificationView,
     OverallProgressView,
     UserAnswersView,
@@ -46,7 +49,7 @@ from core.views.interview import (
     InterviewJobPostingView, InterviewJobPostingDetailView,
     InterviewSessionView, InterviewSessionDetailView, InterviewAnswerView,
     STTTranscribeView,
-    TTSSynthesizeView,
+    TTSSynthesizeView, TTSAudioView,
     InterviewQuestionSearchView,    # 2026-03-01 면접 질문 뱅크 검색 API 추가
 )
 
@@ -81,6 +84,10 @@ urlpatterns = [
 
     # 6. 코드 실행 샌드박스 API
     path('execute-code/', CodeExecutionView.as_view(), name='execute_code'),
+    # [수정일: 2026-10-18] 비동기 실행: job_id 즉시 반환 → 폴링 또는 SSE 스트림으로 결과 수신
+    path('execute-code/jobs/', CodeExecutionJobView.as_view(), name='execute_code_job'),
+    path('execute-code/jobs/<str:job_id>/', CodeExecutionJobDetailView.as_view(), name='execute_code_job_detail'),
+    path('execute-code/jobs/<str:job_id>/stream/', CodeExecutionJobStreamView.as_view(), name='execute_code_job_stream'),
     path('verify-behavior/', BehaviorVerificationView.as_view(), name='verify_behavior'),
 
     # 7. 관리 및 기록 조회 API
@@ -93,6 +100,7 @@ urlpatterns = [
     path('pseudocode/execute/', execute_python_code, name='pseudocode_execute'),
     path('pseudo-agent/', PseudocodeAgentView.as_view(), name='pseudo_agent'),
     path('pseudocode/evaluate-5d/', pseudocode_evaluation.evaluate_pseudocode_5d),
+    path('pseudocode/evaluate-5d/stream/', pseudocode_evaluation.evaluate_pseudocode_5d_stream),  # [수정일: 2026-10-18] SSE
     path('youtube/recommendations/', youtube_recommendation.get_youtube_recommendations),
 
     # 9. Architecture API
@@ -121,6 +129,7 @@ urlpatterns = [
     path('interview/questions/search/', InterviewQuestionSearchView.as_view(), name='interview_question_search'),
     path('stt/transcribe/', STTTranscribeView.as_view(), name='stt_transcribe'),
     path('tts/synthesize/', TTSSynthesizeView.as_view(), name='tts_synthesize'),
+    path('tts/audio/<str:key>.<str:fmt>/', TTSAudioView.as_view(), name='tts_audio'),
 
     # 12. Job Planner API
     path('job-planner/parse/', JobPlannerParseView.as_view(), name='job_planner_parse'),
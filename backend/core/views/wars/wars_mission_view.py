@@ -14,7 +14,6 @@ from rest_framework.permissions import AllowAny
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 
-from core.models import PracticeDetail
 
 logger = logging.getLogger(__name__)
 
@@ -142,18 +141,15 @@ class WarsMissionsView(APIView):
 
     def get(self, request):
         try:
-            details = (
-                PracticeDetail.objects
-                .filter(practice_id='unit03', detail_type='PROBLEM', is_active=True)
-                .order_by('display_order')
-            )
-            if not details.exists():
+            # [수정 2026-10-18] 소켓 서버와 같은 미션 카탈로그 사용 (요청마다 조회/변환하지 않음)
+            from core.services.wars.mission_catalog import get_mission_catalog
+            missions = get_mission_catalog().missions()
+            if not missions:
                 logger.warning('[WarsMissions] unit03 PracticeDetail 없음')
                 return Response(
                     {'error': 'No missions found.'},
                     status=status.HTTP_404_NOT_FOUND
                 )
-            missions = [_transform_to_wars_mission(d) for d in details]
             logger.info(f'[WarsMissions] {len(missions)}개 미션 반환')
             return Response({'missions': missions}, status=status.HTTP_200_OK)
 
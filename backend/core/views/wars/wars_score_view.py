@@ -4,8 +4,6 @@
 # - UserActivity.total_points에 Wars 최고 점수를 합산하여 리더보드 반영
 
 import logging
-from django.db import transaction
-from django.db.models import Sum, Max
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from rest_framework.views import APIView
@@ -13,7 +11,8 @@ from rest_framework.response import Response
 from rest_framework import status, permissions
 from django.shortcuts import get_object_or_404
 
-from core.models import UserProfile, UserActivity, UserSolvedProblem, UserWarsScore
+from core.models import UserProfile
+from core.services.activity_service import save_user_wars_score
 
 logger = logging.getLogger(__name__)
 
@@ -52,54 +51,16 @@ class WarsScoreSubmitView(APIView):
         score = max(0, min(100, int(score)))
 
         try:
-            with transaction.atomic():
-                # 1. Wars 점수 기록 저장
-                UserWarsScore.objects.create(
-                    user=profile,
-                    game_type=game_type,
-                    score=score,
-                    submitted_data=submitted_data,
-                    is_perfect=score >= 90,
-                )
-
-                # 2. total_points 재계산: Practice 최고점 + Wars 최고점
-                # 2-a. Practice 문제별 최고점 합산 (기존 로직)
-                practice_points_data = UserSolvedProblem.objects.filter(user=profile) \
-                    .values('practice_detail') \
-                    .annotate(max_score=Max('score')) \
-                    .aggregate(total=Sum('max_score'))
-                practice_points = practice_points_data['total'] or 0
-
-                # 2-b. Wars game_type별 최고점 합산
-                wars_points_data = UserWarsScore.objects.filter(user=profile) \
-                    .values('game_type') \
-                    .annotate(max_score=Max('score')) \
-                    .aggregate(total=Sum('max_score'))
-                wars_points = wars_points_data['total'] or 0
-
-                total_points = practice_points + wars_points
-
-                # 3. UserActivity 갱신
-                activity, _ = UserActivity.objects.get_or_create(user=profile)
-                activity.total_points = total_points
-
-                if total_points > 3000:
-                    activity.current_rank = 'ENGINEER'
-                elif total_points > 1000:
-                    activity.current_rank = 'GOLD'
-                elif total_points > 500:
-                    activity.current_rank = 'SILVER'
-                else:
-                    activity.current_rank = 'BRONZE'
-
-                activity.save()
+            # [수정일: 2026-10-18] 기록 저장 + 포인트 증분 갱신을 공통 서비스로 위임
+            # - 전체 이력 재집계 대신 game_type별 최고 점수(UserWarsBest) 상승분만 반영
+            result = save_user_wars_score(profile, game_type, score, submitted_data)
 
             return Response({
                 'message': 'Wars score saved successfully',
-                'total_points': total_points,
-                'current_rank': activity.current_rank,
-                'wars_points': wars_points,
-                'practice_points': practice_points,
+                'total_points': result['total_points'],
+                'current_rank': result['current_rank'],
+                'wars_points': result['wars_points'],
+                'practice_points': result['practice_points'],
             }, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -0,0 +1,127 @@
+"""
+리더보드 조회 벤치마크 (1회성 유틸리티).
+
+임시 테스트 DB에 N명의 유저/제출 이력을 생성한 뒤
+LeaderboardView 페이지 1..P 조회의 쿼리 수와 응답 시간(p50/p95)을 측정한다.
+비교를 위해 기존 방식(행마다 유닛별 4회 집계)의 쿼리 수도 함께 출력한다.
+
+사용법:
+    python scripts/bench_leaderboard.py --users 10000 --pages 50
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+import django
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Max
+from django.test.utils import CaptureQueriesContext, setup_test_environment
+from rest_framework.test import APIRequestFactory
+
+from core.models import (
+    Practice, PracticeDetail, UserProfile, UserActivity, UserProgress, UserSolvedProblem,
+)
+from core.views.activity_view import LeaderboardView
+
+UNITS = 3
+PROBLEMS_PER_UNIT = 10
+
+
+def seed(user_count, submissions_per_user, rng):
+    practices = [
+        Practice(id=f'unit0{u}', unit_number=u, level=u * 10, title=f'Unit {u}', subtitle='bench')
+        for u in range(1, UNITS + 1)
+    ]
+    Practice.objects.bulk_create(practices)
+    details = [
+        PracticeDetail(id=f'{p.id}{i:02d}', practice=p, detail_title=f'{p.id}-{i}', content_data={})
+        for p in practices for i in range(1, PROBLEMS_PER_UNIT + 1)
+    ]
+    PracticeDetail.objects.bulk_create(details)
+
+    profiles = UserProfile.objects.bulk_create([
+        UserProfile(username=f'bench{i}', user_name=f'bench{i}', email=f'bench{i}@example.com', password='x')
+        for i in range(user_count)
+    ], batch_size=2000)
+    UserActivity.objects.bulk_create([
+        UserActivity(user=p, total_points=rng.randint(0, 5000)) for p in profiles
+    ], batch_size=2000)
+
+    solved = []
+    for p in profiles:
+        for _ in range(submissions_per_user):
+            detail = rng.choice(details)
+            solved.append(UserSolvedProblem(user=p, practice_detail=detail, score=rng.randint(40, 100)))
+    UserSolvedProblem.objects.bulk_create(solved, batch_size=5000)
+
+    # UserProgress 행 생성 및 집계 필드 채우기 (백필 커맨드 경로 검증 겸용)
+    call_command('backfill_unit_mastery', stdout=open(os.devnull, 'w'))
+
+
+def legacy_query_count(page_activities):
+    """기존 LeaderboardView의 행별 유닛 집계가 발생시키던 쿼리 수 재현"""
+    with CaptureQueriesContext(connection) as ctx:
+        for activity in page_activities:
+            for p in UserProgress.objects.filter(user=activity.user).select_related('practice'):
+                PracticeDetail.objects.filter(practice=p.practice, detail_type='PROBLEM').count()
+                base = UserSolvedProblem.objects.filter(user=activity.user, practice_detail__practice=p.practice)
+                base.values('practice_detail').distinct().count()
+                base.values('practice_detail').annotate(m=Max('score')).filter(m__lt=90).exists()
+                base.values('practice_detail').annotate(m=Max('score')).filter(m__gte=90).count()
+    return len(ctx.captured_queries)
+
+
+def run(user_count, pages, submissions_per_user):
+    rng = random.Random(42)
+    print(f'🌱 시드 생성: 유저 {user_count}명, 유저당 제출 {submissions_per_user}건')
+    seed(user_count, submissions_per_user, rng)
+
+    view = LeaderboardView.as_view(throttle_classes=[])
+    factory = APIRequestFactory()
+    timings, query_counts = [], []
+
+    for page in range(1, pages + 1):
+        request = factory.get('/api/core/leaderboard/', {'page': page})
+        with CaptureQueriesContext(connection) as ctx:
+            started = time.perf_counter()
+            response = view(request)
+            timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.data
+        query_counts.append(len(ctx.captured_queries))
+
+    page_activities = list(
+        UserActivity.objects.select_related('user').order_by('-total_points')[:5]
+    )
+    legacy = legacy_query_count(page_activities)
+
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(f'\n📈 LeaderboardView 페이지 1..{pages}')
+    print(f'  쿼리 수/페이지: min={min(query_counts)} max={max(query_counts)}')
+    print(f'  응답 시간: p50={statistics.median(timings):.1f}ms p95={p95:.1f}ms')
+    print(f'  (비교) 기존 행별 집계 방식 쿼리 수/페이지: {legacy + 2}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--submissions', type=int, default=8, help='유저당 제출 수')
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        run(args.users, args.pages, args.submissions)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
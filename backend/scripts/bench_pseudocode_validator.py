@@ -0,0 +1,163 @@
+"""
+의사코드 Rule 검증 벤치마크 (1회성 유틸리티).
+
+실제 제출 의사코드 코퍼스에 대해 PseudocodeValidator.validate()의 처리량을
+기존 방식(제출마다 패턴 목록을 순회하며 re.search)과 사전 컴파일 방식으로 비교한다.
+두 방식의 결과가 모든 샘플에서 같은지도 함께 확인한다.
+
+코퍼스:
+    기본값은 프론트 LLM 검증용 샘플(validation_samples.json, 미션 1~6 × 품질 5단계).
+    --from-db 를 주면 UserSolvedProblem.submitted_data['pseudocode'] 를 사용한다.
+
+사용법:
+    python scripts/bench_pseudocode_validator.py --repeat 200
+    python scripts/bench_pseudocode_validator.py --from-db --limit 5000
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+
+import django
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from core.utils.mission_rules import VALIDATION_RULES
+from core.utils.pseudocode_validator import PseudocodeValidator
+
+DEFAULT_CORPUS = os.path.join(
+    os.path.dirname(BASE_DIR),
+    'frontend/src/features/practice/pseudocode/evaluation/llm_validation/test_data/data/validation_samples.json',
+)
+
+
+class LegacyPseudocodeValidator(PseudocodeValidator):
+    """사전 컴파일 이전 구현 (비교용)"""
+
+    def _check_critical_errors(self, normalized):
+        errors = []
+        for p in self.rules.get('criticalPatterns', []):
+            if p.get('severity') in ('PRAISE', 'INFO'):
+                continue
+            pattern = p.get('pattern')
+            is_error = False
+            if isinstance(pattern, str):
+                if re.search(pattern, normalized, re.IGNORECASE):
+                    is_error = True
+            elif isinstance(pattern, dict):
+                positive = pattern.get('positive')
+                negatives = pattern.get('negatives', [])
+                if positive and re.search(positive, normalized, re.IGNORECASE):
+                    if not any(re.search(n, normalized, re.IGNORECASE) for n in negatives):
+                        is_error = True
+            if is_error:
+                errors.append({
+                    'severity': p.get('severity', 'CRITICAL'),
+                    'message': p.get('message'),
+                    'example': p.get('correctExample'),
+                    'why': p.get('explanation'),
+                })
+        return errors
+
+    def _extract_concepts(self, soft):
+        found = set()
+        for concept in self.rules.get('requiredConcepts', []):
+            for pattern in concept.get('patterns', []):
+                if re.search(pattern, soft, re.IGNORECASE | re.DOTALL):
+                    found.add(concept['id'])
+                    break
+        return found
+
+    def _analyze_flow(self, soft, max_score):
+        lines = soft.split('\n')
+        deps = self.rules.get('dependencies', [])
+        total_pts = sum(d.get('points', 0) for d in deps)
+        if not deps or total_pts == 0:
+            return {'score': max_score, 'feedback': []}
+        score, feedback = 0.0, []
+        for dep in deps:
+            before = self._find_concept_line(lines, dep['before'])
+            after = self._find_concept_line(lines, dep['after'])
+            if before == -1 or after == -1:
+                continue
+            pts = dep.get('points', 0)
+            if before < after:
+                score += (pts / total_pts) * max_score
+                feedback.append(f"✅ {dep.get('name', '순서')} 정확")
+            elif dep.get('strictness') == 'REQUIRED':
+                feedback.append(f"❌ {dep.get('name', '순서')}: 순서 오류 (필수)")
+            else:
+                score += (pts / 2 / total_pts) * max_score
+                feedback.append(f"⚠️ {dep.get('name', '순서')}: 순서 권장됨")
+        return {'score': round(score), 'feedback': feedback}
+
+    def _find_concept_line(self, lines, concept_id):
+        concept = next((c for c in self.rules.get('requiredConcepts', []) if c['id'] == concept_id), None)
+        if not concept:
+            return -1
+        for i, line in enumerate(lines):
+            for p in concept.get('patterns', []):
+                if re.search(p, line, re.IGNORECASE):
+                    return i
+        return -1
+
+
+def load_corpus(args):
+    if args.from_db:
+        from core.models import UserSolvedProblem
+        corpus = []
+        rows = UserSolvedProblem.objects.select_related('practice_detail').exclude(submitted_data=None)
+        for row in rows.order_by('-id')[:args.limit].iterator():
+            code = (row.submitted_data or {}).get('pseudocode')
+            if code:
+                quest = re.findall(r'\d+', str(row.practice_detail_id))
+                corpus.append((str(int(quest[-1])) if quest else '1', code))
+        return corpus
+    with open(args.corpus, encoding='utf-8') as f:
+        return [(str(s['quest_id']), s['pseudocode']) for s in json.load(f)]
+
+
+def measure(validator_cls, corpus, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for quest_id, code in corpus:
+            # 실서비스와 같이 제출마다 검증기를 새로 생성
+            validator_cls(VALIDATION_RULES.get(quest_id, VALIDATION_RULES['1'])).validate(code)
+    return time.perf_counter() - started
+
+
+def run(args):
+    corpus = load_corpus(args)
+    if not corpus:
+        print('코퍼스가 비어 있습니다.')
+        return
+    avg_len = sum(len(c) for _, c in corpus) / len(corpus)
+    print(f'📚 코퍼스 {len(corpus)}건 (평균 {avg_len:.0f}자) × {args.repeat}회')
+
+    mismatches = 0
+    for quest_id, code in corpus:
+        rules = VALIDATION_RULES.get(quest_id, VALIDATION_RULES['1'])
+        if LegacyPseudocodeValidator(rules).validate(code) != PseudocodeValidator(rules).validate(code):
+            mismatches += 1
+    print(f'🔍 결과 일치: {len(corpus) - mismatches}/{len(corpus)}')
+
+    total = len(corpus) * args.repeat
+    legacy = measure(LegacyPseudocodeValidator, corpus, args.repeat)
+    compiled = measure(PseudocodeValidator, corpus, args.repeat)
+    print(f'\n📈 기존 방식:    {total / legacy:8.0f} validations/s ({legacy / total * 1e6:.0f}µs/건)')
+    print(f'   사전 컴파일:  {total / compiled:8.0f} validations/s ({compiled / total * 1e6:.0f}µs/건)')
+    print(f'   → {legacy / compiled:.2f}배')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--from-db', action='store_true')
+    parser.add_argument('--limit', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=100)
+    run(parser.parse_args())
@@ -0,0 +1,97 @@
+"""
+코드 실행 샌드박스 풀 벤치마크 (1회성 유틸리티).
+
+동시 사용자 N명이 각각 R번씩 코드를 실행할 때
+워커 확보(dispatch) 지연과 전체 응답 시간(p50/p95)을 측정한다.
+비교를 위해 요청마다 프로세스/컨테이너를 새로 띄우는 기존 방식의 응답 시간도 함께 출력한다.
+
+사용법:
+    python scripts/bench_sandbox_pool.py --backend local --users 50 --requests 5
+    python scripts/bench_sandbox_pool.py --backend docker --image python:3.10-slim --pool-size 8
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from core.services.sandbox_pool import (
+    DockerSandboxWorker, LocalSandboxWorker, SandboxPool,
+)
+
+SAMPLE_CODE = "total = sum(i * i for i in range(10000))\nprint(total)"
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[max(0, int(len(values) * pct) - 1)]
+
+
+def cold_run(backend, image):
+    """기존 방식: 요청마다 새 프로세스(local) 또는 docker run --rm(docker)"""
+    if backend == 'local':
+        cmd = [sys.executable, '-c', SAMPLE_CODE]
+    else:
+        cmd = ['docker', 'run', '--rm', '--network', 'none', '-i', image, 'python', '-c', SAMPLE_CODE]
+    started = time.perf_counter()
+    subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+    return (time.perf_counter() - started) * 1000
+
+
+def run(args):
+    if args.backend == 'local':
+        factory = lambda: LocalSandboxWorker(memory_limit='512m')
+    else:
+        factory = lambda: DockerSandboxWorker(args.image)
+    pool = SandboxPool(factory, size=args.pool_size, max_queue=args.users * args.requests)
+    pool.start()
+
+    # 워밍업: 풀의 모든 워커가 준비될 때까지 대기
+    with ThreadPoolExecutor(max_workers=args.pool_size) as ex:
+        list(ex.map(lambda _: pool.run('pass', timeout=10), range(args.pool_size)))
+
+    dispatch, latency = [], []
+
+    def user_session(_):
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            result = pool.run(SAMPLE_CODE, timeout=10)
+            latency.append((time.perf_counter() - started) * 1000)
+            dispatch.append(result['dispatch_ms'])
+            assert result['exit_code'] == 0, result['stderr']
+
+    print(f'🚀 {args.backend} 풀 (워커 {args.pool_size}개) | 동시 사용자 {args.users}명 x {args.requests}회')
+    wall = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as ex:
+        list(ex.map(user_session, range(args.users)))
+    wall = time.perf_counter() - wall
+    pool.close()
+
+    cold = [cold_run(args.backend, args.image) for _ in range(args.cold_samples)]
+
+    total = args.users * args.requests
+    print(f'\n📈 풀 실행 {total}건 ({total / wall:.1f} runs/s)')
+    print(f'  dispatch(워커 확보): p50={statistics.median(dispatch):.1f}ms p95={percentile(dispatch, 0.95):.1f}ms')
+    print(f'  응답 시간:           p50={statistics.median(latency):.1f}ms p95={percentile(latency, 0.95):.1f}ms')
+    print(f'  (비교) 요청마다 새로 실행: p50={statistics.median(cold):.1f}ms ({args.cold_samples}회)')
+    print(f'  풀 통계: {pool.stats}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--backend', choices=['local', 'docker'], default='local')
+    parser.add_argument('--image', default='python:3.10-slim')
+    parser.add_argument('--pool-size', type=int, default=8)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=5, help='사용자당 실행 수')
+    parser.add_argument('--cold-samples', type=int, default=10)
+    run(parser.parse_args())
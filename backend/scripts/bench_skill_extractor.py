@@ -0,0 +1,134 @@
+"""
+공고 스킬 키워드 추출 벤치마크 (1회성 유틸리티).
+
+저장된 공고 텍스트 코퍼스에 대해 기존 방식(키워드마다 패턴을 새로 만들어 re.search)과
+skill_dictionary.KeywordMatcher(트라이 정규식 1개, 단일 패스)의 처리량을 비교한다.
+두 방식의 결과가 모든 문서에서 같은지도 함께 확인한다.
+
+코퍼스 (앞에서부터 있는 것을 사용):
+    --html-dir : 저장해 둔 공고 페이지(.html/.htm → 본문 텍스트, .txt → 그대로)
+    공고 캐시  : collectors/posting_store.py SQLite의 detail_text (추천 API가 쌓은 공고)
+    합성 코퍼스: 위 둘 다 없을 때 키워드를 섞은 한국어 공고 문장 (--synthetic 건)
+
+사용법:
+    python scripts/bench_skill_extractor.py --repeat 20
+    python scripts/bench_skill_extractor.py --html-dir ./saved_postings
+"""
+import os
+import re
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+
+import django
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from core.views.job_planner.config import POSTING_CACHE_PATH
+from core.views.job_planner.skill_dictionary import (
+    DETAIL_SKILL_MATCHER, DETAIL_TECH_KEYWORDS, REQUIREMENT_SKILL_MATCHER, REQUIREMENT_TECH_KEYWORDS,
+)
+
+FILLER = (
+    '주요업무 서비스 백엔드 개발 및 운영 자격요건 관련 경력 3년 이상 우대사항 대용량 트래픽 처리 경험 '
+    '혜택 및 복지 유연근무 점심 식대 지원 채용절차 서류전형 1차 면접 최종합격 근무지 서울 강남구 '
+    'experience with distributed systems and collaboration across teams'
+).split()
+
+
+def legacy_detail(text):
+    """사전 컴파일 이전 _fetch_job_detail 구현 (비교용)"""
+    found = []
+    for kw in DETAIL_TECH_KEYWORDS:
+        if re.search(r'(?<![a-zA-Z])' + re.escape(kw) + r'(?![a-zA-Z])', text, re.IGNORECASE):
+            found.append(kw)
+    return found
+
+
+def legacy_requirement(text):
+    """사전 컴파일 이전 _extract_skills_from_text 구현의 키워드 탐색 부분 (비교용)"""
+    return [kw for kw in REQUIREMENT_TECH_KEYWORDS
+            if re.search(r'\b' + re.escape(kw) + r'\b', text, re.IGNORECASE)]
+
+
+def load_corpus(args):
+    if args.html_dir:
+        from bs4 import BeautifulSoup
+        corpus = []
+        for name in sorted(os.listdir(args.html_dir)):
+            path = os.path.join(args.html_dir, name)
+            with open(path, encoding='utf-8', errors='ignore') as f:
+                raw = f.read()
+            if name.endswith(('.html', '.htm')):
+                corpus.append(BeautifulSoup(raw, 'html.parser').get_text())
+            elif name.endswith('.txt'):
+                corpus.append(raw)
+        return corpus, f'{args.html_dir} 저장 페이지'
+
+    if os.path.exists(args.store):
+        try:
+            with sqlite3.connect(args.store) as conn:
+                rows = conn.execute('SELECT value FROM postings LIMIT ?', (args.limit,)).fetchall()
+            corpus = [json.loads(v).get('detail_text', '') for (v,) in rows]
+            corpus = [t for t in corpus if t]
+            if corpus:
+                return corpus, f'공고 캐시 {args.store}'
+        except sqlite3.Error:
+            pass
+
+    rng = random.Random(0)
+    keywords = DETAIL_TECH_KEYWORDS + REQUIREMENT_TECH_KEYWORDS
+    corpus = []
+    for _ in range(args.synthetic):
+        words = [rng.choice(keywords) if rng.random() < 0.03 else rng.choice(FILLER)
+                 for _ in range(rng.randint(800, 3000))]
+        corpus.append(' '.join(words))
+    return corpus, '합성 코퍼스'
+
+
+def measure(fn, corpus, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            fn(text)
+    return time.perf_counter() - started
+
+
+def run(args):
+    corpus, source = load_corpus(args)
+    if not corpus:
+        print('코퍼스가 비어 있습니다.')
+        return
+    avg_len = sum(len(t) for t in corpus) / len(corpus)
+    print(f'📚 {source}: {len(corpus)}건 (평균 {avg_len:.0f}자) × {args.repeat}회')
+
+    cases = [
+        ('상세 페이지 (_fetch_job_detail)', legacy_detail, DETAIL_SKILL_MATCHER.find),
+        ('요건 텍스트 (_extract_skills_from_text)', legacy_requirement, REQUIREMENT_SKILL_MATCHER.find),
+    ]
+    total = len(corpus) * args.repeat
+    for name, legacy, compiled in cases:
+        mismatches = sum(1 for text in corpus if legacy(text) != compiled(text))
+        legacy_time = measure(legacy, corpus, args.repeat)
+        compiled_time = measure(compiled, corpus, args.repeat)
+        print(f'\n🔍 {name} — 결과 일치: {len(corpus) - mismatches}/{len(corpus)}')
+        print(f'📈 기존 방식:   {total / legacy_time:8.0f} docs/s ({legacy_time / total * 1e3:.2f}ms/건)')
+        print(f'   단일 패스:   {total / compiled_time:8.0f} docs/s ({compiled_time / total * 1e3:.2f}ms/건)')
+        print(f'   → {legacy_time / compiled_time:.2f}배 (추천 1회 상세 60건 기준 '
+              f'{legacy_time / total * 60e3:.0f}ms → {compiled_time / total * 60e3:.0f}ms)')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--html-dir')
+    parser.add_argument('--store', default=POSTING_CACHE_PATH)
+    parser.add_argument('--limit', type=int, default=2000)
+    parser.add_argument('--synthetic', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=10)
+    run(parser.parse_args())
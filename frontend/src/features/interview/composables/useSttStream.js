@@ -0,0 +1,127 @@
+/**
+ * [수정일: 2026-10-18] 스트리밍 STT 컴포저블
+ * 녹음 중 마이크 입력을 16kHz mono PCM16 청크로 Socket.IO에 흘려보내고
+ * 서버가 발화 구간마다 돌려주는 부분 인식 결과(stt_partial)를 받는다.
+ * 녹음 종료 시 stop()이 최종 결과(stt_final)를 돌려준다. (마지막 구간만 기다림)
+ *
+ * 서버: backend/core/socket_server.py 의 stt_stream_* 이벤트
+ */
+import { ref } from 'vue';
+import { io } from 'socket.io-client';
+
+const SAMPLE_RATE = 16000;
+const FINAL_TIMEOUT_MS = 30000;
+
+export function useSttStream() {
+    const active = ref(false);
+    const partialText = ref('');
+
+    let socket = null;
+    let audioContext = null;
+    let processor = null;
+    let ready = false;
+    let queued = [];
+
+    function toPcm16(float32) {
+        const pcm = new Int16Array(float32.length);
+        for (let i = 0; i < float32.length; i++) {
+            const s = Math.max(-1, Math.min(1, float32[i]));
+            pcm[i] = s < 0 ? s * 0x8000 : s * 0x7fff;
+        }
+        return pcm.buffer;
+    }
+
+    function sendChunk(buffer) {
+        if (ready) socket.emit('stt_stream_chunk', buffer);
+        else queued.push(buffer);
+    }
+
+    function releaseAudio() {
+        if (processor) {
+            processor.onaudioprocess = null;
+            try { processor.disconnect(); } catch (_) {}
+            processor = null;
+        }
+        if (audioContext) {
+            audioContext.close();
+            audioContext = null;
+        }
+    }
+
+    function releaseSocket() {
+        if (socket) {
+            socket.removeAllListeners();
+            socket.disconnect();
+            socket = null;
+        }
+        ready = false;
+        queued = [];
+        active.value = false;
+    }
+
+    /** 마이크 스트림을 받아 스트리밍 시작. 실패하면 false (호출측은 기존 업로드 방식으로 폴백) */
+    function start(mediaStream) {
+        cancel();
+        partialText.value = '';
+        try {
+            socket = io(import.meta.env.VITE_SOCKET_URL || '', {
+                path: '/api/socket.io',
+                transports: ['websocket'],
+                withCredentials: true,
+                forceNew: true,
+            });
+            socket.on('connect', () => socket.emit('stt_stream_start', {}));
+            socket.on('stt_stream_ready', () => {
+                ready = true;
+                queued.forEach(buffer => socket.emit('stt_stream_chunk', buffer));
+                queued = [];
+            });
+            socket.on('stt_partial', (data) => { partialText.value = data.text || ''; });
+            socket.on('stt_error', (data) => {
+                console.warn('[STT Stream]', data.error);
+                cancel();
+            });
+
+            // 브라우저가 마이크 입력을 16kHz로 리샘플링
+            audioContext = new AudioContext({ sampleRate: SAMPLE_RATE });
+            const source = audioContext.createMediaStreamSource(mediaStream);
+            processor = audioContext.createScriptProcessor(4096, 1, 1);
+            processor.onaudioprocess = (e) => sendChunk(toPcm16(e.inputBuffer.getChannelData(0)));
+            source.connect(processor);
+            processor.connect(audioContext.destination);
+            active.value = true;
+            return true;
+        } catch (err) {
+            console.warn('[STT Stream] 시작 실패:', err.message);
+            cancel();
+            return false;
+        }
+    }
+
+    /** 녹음 종료 → 최종 결과 {transcript, confidence, language, has_speech}. 스트리밍 불가 시 null */
+    function stop() {
+        releaseAudio();
+        if (!socket || !active.value || !ready) {
+            releaseSocket();
+            return Promise.resolve(null);
+        }
+        const current = socket;
+        return new Promise((resolve) => {
+            const timer = setTimeout(() => { releaseSocket(); resolve(null); }, FINAL_TIMEOUT_MS);
+            current.once('stt_final', (result) => {
+                clearTimeout(timer);
+                releaseSocket();
+                resolve(result);
+            });
+            current.emit('stt_stream_stop', {});
+        });
+    }
+
+    /** 결과 없이 중단 (녹음 강제 종료/언마운트) */
+    function cancel() {
+        releaseAudio();
+        releaseSocket();
+    }
+
+    return { active, partialText, start, stop, cancel };
+}
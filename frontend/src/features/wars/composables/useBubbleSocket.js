@@ -60,16 +60,26 @@ export function useBubbleSocket() {
             if (onGameStart.value) onGameStart.value(data)
         })
 
-        socket.value.on('bubble_receive_monster', (data) => {
-            if (onReceiveMonster.value) onReceiveMonster.value(data)
-        })
-
-        socket.value.on('bubble_receive_fever', (data) => {
-            if (onReceiveFever.value) onReceiveFever.value(data)
-        })
-
-        socket.value.on('bubble_monster_sync', (data) => {
-            if (onMonsterSync.value) onMonsterSync.value(data)
+        const frameHandlers = {
+            bubble_receive_monster: (data) => {
+                if (onReceiveMonster.value) onReceiveMonster.value(data)
+            },
+            bubble_receive_fever: (data) => {
+                if (onReceiveFever.value) onReceiveFever.value(data)
+            },
+            bubble_monster_sync: (data) => {
+                if (onMonsterSync.value) onMonsterSync.value(data)
+            },
+        }
+        Object.entries(frameHandlers).forEach(([event, handler]) => socket.value.on(event, handler))
+
+        // [2026-10-18] 서버가 고정 주기로 묶어 보내는 프레임 (backend emit_batcher.py)
+        // skip이 내 sid인 항목은 내가 보낸 이벤트이므로 무시
+        socket.value.on('bubble_frame', (frame) => {
+            for (const { e, d, skip } of frame.events || []) {
+                if (skip && skip === socket.value.id) continue
+                frameHandlers[e]?.(d)
+            }
         })
 
         socket.value.on('bubble_end', (data) => {
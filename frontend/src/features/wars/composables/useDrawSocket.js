@@ -1,6 +1,53 @@
 ﻿import { ref, onUnmounted } from 'vue'
 import { io } from 'socket.io-client'
 
+// [수정일: 2026-10-18] 캔버스 델타 동기화 (backend/core/services/wars/canvas_delta.py 프로토콜)
+// 변경분(add/move/remove)만 seq와 함께 보내고, SNAPSHOT_EVERY번째마다 / 서버 요청 시 전체 스냅샷 전송
+const SNAPSHOT_EVERY = 30
+const POSITION_FIELDS = { node: ['x', 'y'], arrow: ['x1', 'y1', 'x2', 'y2'] }
+
+function toMap(items) {
+  return new Map(items.map(item => [item.id, item]))
+}
+
+function diffItems(kind, prev, next, ops) {
+  const posFields = POSITION_FIELDS[kind]
+  for (const [id, item] of next) {
+    const old = prev.get(id)
+    if (!old || Object.keys(item).some(f => !posFields.includes(f) && item[f] !== old[f])) {
+      ops.push({ op: 'add', kind, item })
+    } else if (posFields.some(f => item[f] !== old[f])) {
+      const op = { op: 'move', kind, id }
+      posFields.forEach(f => { op[f] = item[f] })
+      ops.push(op)
+    }
+  }
+  for (const id of prev.keys()) {
+    if (!next.has(id)) ops.push({ op: 'remove', kind, id })
+  }
+}
+
+function applyOps(canvas, ops) {
+  const nodes = [...canvas.nodes]
+  const arrows = [...canvas.arrows]
+  for (const op of ops) {
+    const items = op.kind === 'node' ? nodes : arrows
+    const id = op.op === 'add' ? op.item.id : op.id
+    const idx = items.findIndex(item => item.id === id)
+    if (op.op === 'add') {
+      if (idx >= 0) items[idx] = op.item
+      else items.push(op.item)
+    } else if (op.op === 'move' && idx >= 0) {
+      const moved = { ...items[idx] }
+      POSITION_FIELDS[op.kind].forEach(f => { if (f in op) moved[f] = op[f] })
+      items[idx] = moved
+    } else if (op.op === 'remove' && idx >= 0) {
+      items.splice(idx, 1)
+    }
+  }
+  return { nodes, arrows }
+}
+
 /**
  * 캐치마인드(Arch Draw) 전용 소켓 composable
  * [수정일: 2026-02-24] 2vs2 팀 모드 지원: myTeam, teammate, onTeamSync 추가
@@ -27,8 +74,26 @@ export function useDrawSocket() {
   const onChaosRecovered = ref(null) // [추가 2026-03-03] 장애 복구 알림
   const onGameOver = ref(null)
 
+  // 델타 동기화 상태
+  let currentRoomId = null
+  let syncSeq = 0
+  let lastSent = null          // 마지막으로 보낸 { nodes: Map, arrows: Map }
+  let needSnapshot = true
+  let lastSyncArgs = null      // 서버가 재동기화를 요청하면 즉시 스냅샷 재전송
+  const opponentSeq = {}       // sender_sid → 마지막으로 반영한 seq
+  const pendingFetch = new Set()
+
+  function resetCanvasSync() {
+    syncSeq = 0
+    lastSent = null
+    needSnapshot = true
+    Object.keys(opponentSeq).forEach(k => delete opponentSeq[k])
+    pendingFetch.clear()
+  }
+
   function connect(roomId, userName, userId, avatarUrl) {
     if (socket.value) return
+    currentRoomId = roomId
 
     // [수정일: 2026-03-01] 소켓 URL 결정 로직 수정
     // 기존: HTTPS이면 "" → io("")가 프론트 도메인으로 연결해서 AWS 배포 시 항상 실패
@@ -74,6 +139,7 @@ export function useDrawSocket() {
     socket.value.on('draw_round_start', (data) => {
       roundQuestion.value = data.question
       opponentCanvas.value = { nodes: [], arrows: [] }
+      resetCanvasSync()
       opponentSubmitted.value = false
       roundResults.value = null
       if (onRoundStart.value) onRoundStart.value(data)
@@ -84,6 +150,31 @@ export function useDrawSocket() {
     socket.value.on('draw_canvas_update', (data) => {
       opponentName.value = data.sender_name || ''
       opponentCanvas.value = { nodes: data.nodes || [], arrows: data.arrows || [] }
+      if (data.seq != null) opponentSeq[data.sender_sid] = data.seq
+      pendingFetch.delete(data.sender_sid)
+    })
+
+    // [추가 2026-10-18] 상대 캔버스 변경분 — seq가 건너뛰면 전체 상태 재요청
+    socket.value.on('draw_canvas_patch', (data) => {
+      const last = opponentSeq[data.sender_sid]
+      if (last != null && data.seq <= last) return
+      if (last == null || data.seq !== last + 1) {
+        if (!pendingFetch.has(data.sender_sid)) {
+          pendingFetch.add(data.sender_sid)
+          socket.value.emit('draw_canvas_fetch', { room_id: currentRoomId, sid: data.sender_sid })
+        }
+        return
+      }
+      opponentSeq[data.sender_sid] = data.seq
+      opponentName.value = data.sender_name || ''
+      opponentCanvas.value = applyOps(opponentCanvas.value, data.ops || [])
+    })
+
+    // [추가 2026-10-18] 서버가 내 캔버스 버전을 놓침 → 다음 전송을 스냅샷으로
+    socket.value.on('draw_canvas_resync', (data) => {
+      syncSeq = data?.seq ?? syncSeq
+      needSnapshot = true
+      if (lastSyncArgs) emitCanvasSync(...lastSyncArgs)
     })
 
     // 아이템 효과 수신
@@ -144,13 +235,28 @@ export function useDrawSocket() {
   }
 
   // 내 캔버스 실시간 동기화
+  // [수정일: 2026-10-18] 전체 배열 대신 직전 전송분과의 차이(ops)만 전송
   function emitCanvasSync(roomId, userName, nodes, arrows) {
-    socket.value?.emit('draw_canvas_sync', {
-      room_id: roomId,
-      user_name: userName,
-      nodes: nodes.map(n => ({ compId: n.compId, name: n.name, icon: n.icon, x: n.x, y: n.y })),
-      arrows: arrows.map(a => ({ fc: a.fc, tc: a.tc, x1: a.x1, y1: a.y1, x2: a.x2, y2: a.y2 }))
-    })
+    if (!socket.value) return
+    lastSyncArgs = [roomId, userName, nodes, arrows]
+    const next = {
+      nodes: toMap(nodes.map(n => ({ id: n.id, compId: n.compId, name: n.name, icon: n.icon, x: n.x, y: n.y }))),
+      arrows: toMap(arrows.map(a => ({ id: `${a.fid}-${a.tid}`, fid: a.fid, tid: a.tid, fc: a.fc, tc: a.tc, x1: a.x1, y1: a.y1, x2: a.x2, y2: a.y2 })))
+    }
+    const payload = { room_id: roomId, user_name: userName, seq: syncSeq + 1 }
+    if (needSnapshot || !lastSent || payload.seq % SNAPSHOT_EVERY === 0) {
+      payload.snapshot = { nodes: [...next.nodes.values()], arrows: [...next.arrows.values()] }
+      needSnapshot = false
+    } else {
+      const ops = []
+      diffItems('node', lastSent.nodes, next.nodes, ops)
+      diffItems('arrow', lastSent.arrows, next.arrows, ops)
+      if (!ops.length) return
+      payload.ops = ops
+    }
+    syncSeq = payload.seq
+    lastSent = next
+    socket.value.emit('draw_canvas_sync', payload)
   }
 
   // 제출 — time_left, combo 추가 (서버 점수 검증에 필요)